@@ -135,6 +135,8 @@ enum KokkosViewDataType {
   Float64,
   ComplexFloat32,
   ComplexFloat64,
+  Float16,
+  BFloat16,
   ViewDataTypesEnd
 };
 
@@ -89,6 +89,42 @@ VIEW_DATA_TYPE(Kokkos::complex<float>, ComplexFloat32, "complex_float32_dtype",
                "complex_float_dtype")
 VIEW_DATA_TYPE(Kokkos::complex<double>, ComplexFloat64, "complex_float64_dtype",
                "complex_double_dtype")
+VIEW_DATA_TYPE(Kokkos::Experimental::half_t, Float16, "float16", "half")
+VIEW_DATA_TYPE(Kokkos::Experimental::bhalf_t, BFloat16, "bfloat16")
+
+//----------------------------------------------------------------------------//
+//  Kokkos' 16-bit floating point types. On backends without them, they
+//  are 4-byte wrappers around (or aliases of) float.
+//
+template <typename Tp>
+struct is_reduced_precision
+    : std::integral_constant<
+          bool,
+          !std::is_arithmetic<Tp>::value &&
+              (std::is_same<Tp, Kokkos::Experimental::half_t>::value ||
+               std::is_same<Tp, Kokkos::Experimental::bhalf_t>::value)> {};
+
+// convert them from and to python floats through float, which holds
+// every value of both types exactly
+namespace pybind11 {
+namespace detail {
+template <typename Tp>
+struct type_caster<Tp, enable_if_t<is_reduced_precision<Tp>::value, void>> {
+  PYBIND11_TYPE_CASTER(Tp, _("float"));
+
+  bool load(handle src, bool convert) {
+    make_caster<float> _caster;
+    if (!_caster.load(src, convert)) return false;
+    value = Tp(cast_op<float>(_caster));
+    return true;
+  }
+
+  static handle cast(Tp src, return_value_policy, handle) {
+    return PyFloat_FromDouble(static_cast<float>(src));
+  }
+};
+}  // namespace detail
+}  // namespace pybind11
 
 //----------------------------------------------------------------------------//
 // <data-type> <enum> <string identifiers>
@@ -59,7 +59,11 @@ namespace SpaceDim {
 // Helper to convert values to string, with specialization for complex types
 template <typename T>
 std::string value_to_string(const T &val) {
-  return std::to_string(val);
+  if constexpr (is_reduced_precision<T>::value) {
+    return std::to_string(static_cast<float>(val));
+  } else {
+    return std::to_string(val);
+  }
 }
 
 template <typename T>
@@ -70,7 +70,14 @@ constexpr auto get_stride(Tp &m);
 
 template <typename Tp>
 inline std::string get_format() {
-  return py::format_descriptor<Tp>::format();
+  if constexpr (is_reduced_precision<Tp>::value) {
+    // numpy has no bfloat16, so its raw bits are exposed instead, and
+    // the 4-byte fallbacks hold floats
+    if (sizeof(Tp) != 2) return "f";
+    return std::is_same<Tp, Kokkos::Experimental::bhalf_t>::value ? "H" : "e";
+  } else {
+    return py::format_descriptor<Tp>::format();
+  }
 }
 
 template <>
@@ -214,6 +221,13 @@ auto get_init(const std::string &lbl, const Up &arr,
   return new ViewT{lbl, static_cast<size_t>(std::get<Idx>(arr))...};
 }
 //
+template <typename ViewT, typename Up, size_t... Idx>
+auto get_uninitialized_init(const std::string &lbl, const Up &arr,
+                            std::index_sequence<Idx...>) {
+  return new ViewT{Kokkos::view_alloc(Kokkos::WithoutInitializing, lbl),
+                   static_cast<size_t>(std::get<Idx>(arr))...};
+}
+//
 template <typename ViewT, typename Up, typename Tp, size_t... Idx>
 auto get_unmanaged_init(const Up &arr, const Tp data,
                         std::index_sequence<Idx...>) {
@@ -229,6 +243,16 @@ auto get_init() {
   };
 }
 
+template <typename ViewT, size_t Idx>
+auto get_uninitialized_init() {
+  return [](std::string lbl, std::array<size_t, Idx> arr, bool initialize) {
+    if (initialize)
+      return Impl::get_init<ViewT>(lbl, arr, std::make_index_sequence<Idx>{});
+    return Impl::get_uninitialized_init<ViewT>(
+        lbl, arr, std::make_index_sequence<Idx>{});
+  };
+}
+
 template <typename ViewT, size_t Idx, typename Tp>
 auto get_unmanaged_init() {
   return [](py::buffer buf, std::array<size_t, Idx> arr) {
@@ -244,6 +268,8 @@ auto get_init(
     enable_if_t<!ViewT::traits::memory_traits::is_unmanaged, int> = 0) {
   // define managed init
   _view.def(py::init(get_init<ViewT, Idx>()));
+  // define managed init that may skip the initial fill
+  _view.def(py::init(get_uninitialized_init<ViewT, Idx>()));
   // define unmanaged init
   _view.def(py::init(get_unmanaged_init<ViewT, Idx, Tp>()));
 }
@@ -311,6 +337,78 @@ void generate_view_access(py::class_<ViewT> &_view, std::index_sequence<Idx...>,
       "Set the element");
 }
 
+// parallel fill with a scalar, run by the execution space of the view
+// so that the pages are first touched by the threads that use them
+template <typename Tp, typename ViewT>
+void generate_view_fill(
+    py::class_<ViewT> &_view,
+    enable_if_t<!ViewT::traits::memory_traits::is_atomic, int> = 0) {
+  _view.def(
+      "fill", [](ViewT &_obj, Tp _val) { Kokkos::deep_copy(_obj, _val); },
+      "Set every element to a value in parallel (Kokkos::deep_copy)",
+      py::call_guard<py::gil_scoped_release>());
+}
+
+template <typename Tp, typename ViewT>
+void generate_view_fill(
+    py::class_<ViewT> &,
+    enable_if_t<ViewT::traits::memory_traits::is_atomic, int> = 0) {}
+
+namespace Impl {
+//
+template <typename ViewT, typename Tp, size_t... Idx>
+void copy_from(ViewT &_obj, py::buffer _buf, std::index_sequence<Idx...>) {
+  py::buffer_info _info = _buf.request();
+  if (_info.ndim != static_cast<ssize_t>(sizeof...(Idx)) ||
+      _info.itemsize != static_cast<ssize_t>(sizeof(Tp)))
+    throw std::runtime_error("copy_from: buffer does not match the view");
+
+  std::array<size_t, sizeof...(Idx)> _extents = {
+      static_cast<size_t>(_info.shape[Idx])...};
+  std::array<size_t, sizeof...(Idx)> _view_extents = {_obj.extent(Idx)...};
+  if (_extents != _view_extents)
+    throw std::runtime_error("copy_from: buffer does not match the view");
+
+  // the buffer is expected to be contiguous in the layout of the view
+  using host_view_t =
+      Kokkos::View<typename ViewT::non_const_data_type,
+                   typename ViewT::array_layout, Kokkos::HostSpace,
+                   Kokkos::MemoryTraits<Kokkos::Unmanaged>>;
+  host_view_t _src{static_cast<Tp *>(_info.ptr), std::get<Idx>(_extents)...};
+
+  py::gil_scoped_release _release;
+  Kokkos::deep_copy(_obj, _src);
+}
+//
+}  // namespace Impl
+
+// parallel copy from a host buffer, run by the execution space of the view
+template <typename Tp, typename ViewT, size_t... Idx>
+void generate_view_copy(
+    py::class_<ViewT> &_view, std::index_sequence<Idx...>,
+    enable_if_t<!Kokkos::is_dyn_rank_view<ViewT>::value &&
+                    !ViewT::traits::memory_traits::is_atomic &&
+                    !std::is_same<typename ViewT::array_layout,
+                                  Kokkos::LayoutStride>::value,
+                int> = 0) {
+  _view.def(
+      "copy_from",
+      [](ViewT &_obj, py::buffer _buf) {
+        Impl::copy_from<ViewT, Tp>(_obj, _buf, std::index_sequence<Idx...>{});
+      },
+      "Copy a host buffer with the same shape and layout in parallel "
+      "(Kokkos::deep_copy)");
+}
+
+template <typename Tp, typename ViewT, size_t... Idx>
+void generate_view_copy(
+    py::class_<ViewT> &, std::index_sequence<Idx...>,
+    enable_if_t<Kokkos::is_dyn_rank_view<ViewT>::value ||
+                    ViewT::traits::memory_traits::is_atomic ||
+                    std::is_same<typename ViewT::array_layout,
+                                 Kokkos::LayoutStride>::value,
+                int> = 0) {}
+
 //----------------------------------------------------------------------------//
 //
 //                          Primary View generation function
@@ -322,8 +420,14 @@ template <typename ViewT, typename Sp, typename Tp, typename Lp, typename Mp,
           size_t DimIdx, size_t... Idx>
 void generate_view(py::module &_mod, const std::string &_name,
                    const std::string &_msg, size_t _ndim = DimIdx + 1) {
-  // some mirror views will instantiate types that were added already
-  if (!add_pyclass<ViewT>()) return;
+  // some mirror views will instantiate types that were added already,
+  // as do data types that are aliases of each other (e.g. half_t and
+  // bhalf_t on backends without them), which get their name as well
+  if (!add_pyclass<ViewT>()) {
+    if (!py::hasattr(_mod, _name.c_str()))
+      _mod.attr(_name.c_str()) = py::type::of<ViewT>();
+    return;
+  }
 
   if (debug_output())
     std::cerr << "Registering " << _msg << " as python class '" << _name
@@ -386,6 +490,10 @@ void generate_view(py::module &_mod, const std::string &_name,
 
   deep_copy<ViewT>{_view}(view_type_list_t{});
 
+  // parallel fill and copy from host buffers
+  generate_view_fill<Tp>(_view);
+  generate_view_copy<Tp>(_view, std::make_index_sequence<DimIdx + 1>{});
+
   // shape property
   _view.def_property_readonly(
       "shape",
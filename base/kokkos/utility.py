@@ -41,6 +41,8 @@
 #
 
 from __future__ import absolute_import
+import functools
+
 from . import libpykokkos as lib
 
 __author__ = "Jonathan R. Madsen"
@@ -110,6 +112,8 @@ def read_dtype(_dtype):
             return lib.float32
         elif _dtype == np.float64:
             return lib.float64
+        elif _dtype == np.float16:
+            return lib.float16
         elif _dtype == np.complex64:
             return lib.complex_float32_dtype
         elif _dtype == np.complex128:
@@ -151,47 +155,40 @@ def _determine_array_input(_inp, shape, label, array, dtype, layout):
     return [shape, label, array, dtype, layout]
 
 
-def array(
-    shape_label_or_array,
-    shape=None,
-    label=None,
-    array=None,
+@functools.lru_cache(maxsize=None)
+def get_array_type(
+    ndim,
     dtype=lib.double,
     space=lib.HostSpace,
     layout=lib.LayoutRight,
     trait=lib.Managed,
     dynamic=False,
-    order=None,
 ):
-    [shape, label, array, dtype, layout] = _determine_array_input(
-        shape_label_or_array, shape, label, array, dtype, layout
-    )
+    """Get the view class with the given template arguments. Calling
+    the class directly with (label, shape) skips the argument handling
+    of array() when many views of the same type are created"""
+    return _get_array_type(ndim, dtype, space, layout, trait, dynamic)[0]
 
-    # layout was specified via numpy "order" field
-    if order is not None and layout == lib.LayoutRight and isinstance(order, str):
-        if order.upper() == "C":
-            layout = lib.LayoutRight
-        elif order.upper() == "F":
-            layout = lib.LayoutLeft
 
+def _get_array_type(ndim, dtype, space, layout, trait, dynamic):
+    """Get the view class and its default label"""
     _prefix = "KokkosView" if not dynamic else "KokkosDynRankView"
     _space = lib.get_memory_space(space)
     _dtype = lib.get_dtype(dtype)
     _layout = lib.get_layout(layout)
     _name = None
     _label = None
-    _ndim = len(shape)
 
     if dynamic:
         _dtype_str = "{}".format(_dtype)
     else:
-        if _ndim > lib.max_concrete_rank:
+        if ndim > lib.max_concrete_rank:
             raise ValueError(
                 "pykokkos-base build only supports {} ranks. Requested {} ranks".format(
-                    lib.max_concrete_rank, _ndim
+                    lib.max_concrete_rank, ndim
                 )
             )
-        _dtype_str = "{}{}".format(_dtype, "*" * _ndim)
+        _dtype_str = "{}{}".format(_dtype, "*" * ndim)
 
     _name = f"{_prefix}_{_dtype}_{_space}_{_layout}"
     _label = f"{_prefix}<{_dtype_str}, {_layout}, {_space}"
@@ -205,13 +202,46 @@ def array(
 
     # if fixed view
     if not dynamic:
-        _name = f"{_name}_{_ndim}"
+        _name = f"{_name}_{ndim}"
+
+    return getattr(lib, _name), f"{_label}>"
+
+
+def array(
+    shape_label_or_array,
+    shape=None,
+    label=None,
+    array=None,
+    dtype=lib.double,
+    space=lib.HostSpace,
+    layout=lib.LayoutRight,
+    trait=lib.Managed,
+    dynamic=False,
+    order=None,
+    initialize=True,
+):
+    [shape, label, array, dtype, layout] = _determine_array_input(
+        shape_label_or_array, shape, label, array, dtype, layout
+    )
+
+    # layout was specified via numpy "order" field
+    if order is not None and layout == lib.LayoutRight and isinstance(order, str):
+        if order.upper() == "C":
+            layout = lib.LayoutRight
+        elif order.upper() == "F":
+            layout = lib.LayoutLeft
+
+    _cls, _label = _get_array_type(len(shape), dtype, space, layout, trait, dynamic)
 
     # if a label was not provided
     if label is None:
-        label = f"{_label}>"
+        label = _label
+
+    if array is None and not initialize:
+        # allocate with Kokkos::WithoutInitializing
+        return _cls(label, shape, False)
 
-    return getattr(lib, _name)(label if array is None else array, shape)
+    return _cls(label if array is None else array, shape)
 
 
 def unmanaged_array(*_args, **_kwargs):
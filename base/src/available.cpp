@@ -179,6 +179,8 @@ void generate_available(py::module &kokkos) {
   //
   //----------------------------------------------------------------------------//
   kokkos.attr("max_concrete_rank") = ViewDataMaxDimensions;
+  kokkos.attr("float16_itemsize") = sizeof(Kokkos::Experimental::half_t);
+  kokkos.attr("bfloat16_itemsize") = sizeof(Kokkos::Experimental::bhalf_t);
 
   //----------------------------------------------------------------------------//
   //
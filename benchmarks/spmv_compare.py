@@ -0,0 +1,74 @@
+"""
+Compare sparse matrix-vector (SpMV) and sparse matrix-matrix (SpGEMM)
+multiplication performance with SciPy
+"""
+
+import pykokkos as pk
+from pykokkos.sparse import CsrMatrix, spgemm, spmv
+
+import numpy as np
+import scipy.sparse
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import pandas as pd
+
+
+if __name__ == "__main__":
+    import timeit
+    num_repeats = 50
+    rng = np.random.default_rng(0)
+    results = {"PyKokkos SpMV (row)": {},
+               "PyKokkos SpMV (team)": {},
+               "SciPy SpMV": {},
+               "PyKokkos SpGEMM": {},
+               "SciPy SpGEMM": {}}
+    # (rows, nonzeros per row): the team variant pays off on long rows
+    system_sizes = {"small": (1_000, 8),
+                    "medium": (100_000, 8),
+                    "large": (100_000, 64)}
+    for system_size, (n, row_length) in system_sizes.items():
+        print("-" * 20)
+        print(f"system size: {system_size}")
+
+        a = scipy.sparse.random(n, n, density=row_length / n, format="csr",
+                                dtype=np.float64, random_state=rng)
+        x = rng.random(n)
+
+        view_a = CsrMatrix.from_scipy(a)
+        view_x = pk.array(x)
+        view_y = pk.View([n], dtype=pk.float64)
+
+        for algorithm in ["row", "team"]:
+            pk_time_sec = timeit.timeit("spmv(view_a, view_x, view_y, algorithm=algorithm)",
+                                        globals=globals(),
+                                        number=num_repeats)
+            results[f"PyKokkos SpMV ({algorithm})"][system_size] = pk_time_sec
+            print(f"PyKokkos SpMV ({algorithm}) execution time (s) for {num_repeats} repeats: {pk_time_sec}")
+        scipy_time_sec = timeit.timeit("a @ x",
+                                       globals=globals(),
+                                       number=num_repeats)
+        results["SciPy SpMV"][system_size] = scipy_time_sec
+        print(f"SciPy SpMV execution time (s) for {num_repeats} repeats: {scipy_time_sec}")
+
+        pk_time_sec = timeit.timeit("spgemm(view_a, view_a)",
+                                    globals=globals(),
+                                    number=num_repeats)
+        results["PyKokkos SpGEMM"][system_size] = pk_time_sec
+        print(f"PyKokkos SpGEMM execution time (s) for {num_repeats} repeats: {pk_time_sec}")
+        scipy_time_sec = timeit.timeit("a @ a",
+                                       globals=globals(),
+                                       number=num_repeats)
+        results["SciPy SpGEMM"][system_size] = scipy_time_sec
+        print(f"SciPy SpGEMM execution time (s) for {num_repeats} repeats: {scipy_time_sec}")
+        print("-" * 20)
+    df = pd.DataFrame.from_dict(results)
+    print("df:\n", df)
+    fig, ax = plt.subplots()
+    df.plot.bar(ax=ax,
+                rot=0,
+                logy=True,
+                xlabel="Problem Size",
+                ylabel=f"log of time (s) for {num_repeats} repeats",
+                title="Sparse Performance Comparison with timeit")
+    fig.savefig("SpMV_perf_compare.png", dpi=300)
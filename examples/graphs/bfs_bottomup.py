@@ -44,10 +44,11 @@ class Workload:
     @pk.callback
     def results(self):  
         print(f"\ndistance of every cell:\n")
-        for i in range(self.element):
-            print(f"val ({self.val[i]})  ", end="")
-            if (i+1)% self.M == 0:
-                print(f"\n")
+        with self.val.host_access(readonly=True) as val:
+            for i in range(self.element):
+                print(f"val ({val[i]})  ", end="")
+                if (i+1)% self.M == 0:
+                    print(f"\n")
         print(f"The farthest distance is {self.max_arr[0]}")
 
 
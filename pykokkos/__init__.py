@@ -45,13 +45,16 @@ from pykokkos.lib.ufuncs import (reciprocal,
                                  logical_or,
                                  logical_xor,
                                  logical_not,
+                                 where,
                                  fmax,
                                  fmin,
                                  exp,
                                  exp2,
                                  argmax,
+                                 argmin,
                                  unique,
                                  var,
+                                 std,
                                  in1d,
                                  mean,
                                  hstack,
@@ -66,15 +69,19 @@ from pykokkos.lib.ufuncs import (reciprocal,
                                  ceil,
                                  floor,
                                  broadcast_view)
+from pykokkos.lib.bitset import BitView
+from pykokkos.lib.ufunc_engine import LazyArray, enable_lazy_ufuncs, disable_lazy_ufuncs, lazy_ufuncs
 from pykokkos.lib.info import iinfo, finfo
-from pykokkos.lib.create import (zeros,
+from pykokkos.lib.create import (empty,
+                                 empty_like,
+                                 zeros,
                                  zeros_like,
                                  ones,
                                  ones_like,
                                  full,
                                  full_like)
 from pykokkos.lib.manipulate import reshape, ravel, expand_dims
-from pykokkos.lib.util import all, any, sum, find_max, searchsorted, col, linspace, logspace
+from pykokkos.lib.util import all, any, sum, max, min, minmax, find_max, searchsorted, col, linspace, logspace
 from pykokkos.lib.constants import e, pi, inf, nan
 from pykokkos.interface.views import astype
 
@@ -84,8 +91,7 @@ __all__ = ["__array_api_version__"]
 
 runtime_singleton.runtime = Runtime()
 
-import weakref
-_view_registry: weakref.WeakSet = weakref.WeakSet()
+from pykokkos.interface.views import _view_registry
 
 def cleanup():
     """
@@ -6,6 +6,7 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 from pykokkos.core.type_inference import UpdatedTypes, UpdatedDecorator, get_type_str
 
 from pykokkos.interface import Decorator
+from pykokkos.interface.reducers import reducers
 
 class PyKokkosStyles(Enum):
     """
@@ -256,13 +257,13 @@ class Parser:
                 ctx = ast.Load()
             )
 
-        elif "Acc:" in type:
-            dtype = type.split(":")[1]
+        elif type.split(":")[0] in ("Acc", *reducers):
+            acc_type, dtype = type.split(":")
 
             annotation_node = ast.Subscript(
                     value = ast.Attribute(
                         value = ast.Name(id=self.pk_import, ctx=ast.Load()),
-                        attr = "Acc",
+                        attr = acc_type,
                         ctx = ast.Load()
                 ),
                 slice = ast.Attribute(
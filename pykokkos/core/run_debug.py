@@ -1,11 +1,11 @@
 import ast
 import inspect
 import itertools
-from typing import Callable, Dict, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union, get_origin
 
 from pykokkos.interface import (
     Acc, Decorator, ExecutionPolicy, ExecutionSpace,
-    MDRangePolicy, TeamMember, TeamPolicy,
+    MDRangePolicy, Reducer, TeamMember, TeamPolicy,
     TeamThreadRange, ThreadVectorRange
 )
 import pykokkos.kokkos_manager as km
@@ -54,7 +54,7 @@ def call_workunit(
     operation: str,
     workunit: Callable[..., None],
     index: Union[int, Tuple[int, int], TeamMember],
-    acc: Acc,
+    accs: List[Acc],
     **kwargs
 ) -> None:
     """
@@ -63,7 +63,8 @@ def call_workunit(
     :param operation: the name of the operation "for", "reduce", or "scan"
     :param workunit: the workunit function object
     :param index: the thread ID value of the current iteration
-    :param acc: the accumulator variable (unused by "for")
+    :param accs: the accumulator variables (unused by "for"), of
+        which scans have one
     :param kwargs: the keyword arguments passed to the workunit
     """
 
@@ -77,14 +78,14 @@ def call_workunit(
 
     elif operation == "reduce":
         if is_md:
-            workunit(*index, acc, **kwargs)
+            workunit(*index, *accs, **kwargs)
         else:
-            workunit(index, acc, **kwargs)
+            workunit(index, *accs, **kwargs)
     elif operation == "scan":
         if is_md:
-            workunit(*index, acc, True, **kwargs)
+            workunit(*index, accs[0], True, **kwargs)
         else:
-            workunit(index, acc, True, **kwargs)
+            workunit(index, accs[0], True, **kwargs)
 
 
 def run_workunit_debug(
@@ -92,6 +93,7 @@ def run_workunit_debug(
     workunit: Callable[..., None],
     operation: str,
     initial_value = 0,
+    reducer: Optional[type] = None,
     **kwargs
 ) -> Optional[Union[float, int]]:
     """
@@ -101,29 +103,47 @@ def run_workunit_debug(
     :param policy: the execution policy of the operation
     :param workunit: the workunit function object
     :param initial_value: the initial value of the accumulator
+    :param reducer: the reducer passed to parallel_reduce, if any
     :param kwargs: the keyword arguments passed to the workunit
     :returns: the result of the operation (None for parallel_for)
     """
 
-    acc = Acc(initial_value)
+    # the accumulator of a reducer is assigned to, which Python cannot
+    # pass back to the caller
+    annotations = [get_origin(a) for a in getattr(workunit, "__annotations__", {}).values()]
+    if reducer is not None or any(isinstance(a, type) and issubclass(a, Reducer) for a in annotations):
+        raise RuntimeError("ERROR: reducers other than pk.Acc are not supported in Debug")
+
+    # the parameters following the thread ID that are not passed are
+    # the accumulators of a reduction
+    accumulators: int = 1
+    if operation == "reduce":
+        index_params: int = policy.rank if isinstance(policy, MDRangePolicy) else 1
+        params: List[str] = list(inspect.signature(workunit).parameters)[index_params:]
+        accumulators = max(len(list(itertools.takewhile(lambda p: p not in kwargs, params))), 1)
+
+    accs: List[Acc] = [Acc(initial_value) for _ in range(accumulators)]
     if policy.space is ExecutionSpace.Default:
         policy.space = km.get_default_space()
 
     if isinstance(policy, TeamPolicy):
         for i in range(policy.league_size):
-            call_workunit(operation, workunit, TeamMember(i, 0), acc, **kwargs)
+            call_workunit(operation, workunit, TeamMember(i, 0), accs, **kwargs)
 
     elif isinstance(policy, TeamThreadRange) or isinstance(policy, ThreadVectorRange):
         for i in range(policy.count):
-            call_workunit(operation, workunit, TeamMember(i, 0), acc, **kwargs)
+            call_workunit(operation, workunit, TeamMember(i, 0), accs, **kwargs)
 
     else:
         if isinstance(policy, MDRangePolicy):
             if policy.rank > 1:
                 for idx in itertools.product(*[range(*interval) for interval in zip(policy.begin, policy.end)]):
-                    call_workunit(operation, workunit, idx, acc, **kwargs)
+                    call_workunit(operation, workunit, idx, accs, **kwargs)
         else:
             for i in range(policy.begin, policy.end):
-                call_workunit(operation, workunit, i, acc, **kwargs)
+                call_workunit(operation, workunit, i, accs, **kwargs)
 
-    return acc.val
+    if len(accs) > 1:
+        return tuple(a.val for a in accs)
+
+    return accs[0].val
@@ -113,6 +113,7 @@ class Runtime:
         workunit: Union[Callable[..., None], List[Callable[..., None]]],
         operation: str,
         initial_value: Union[float, int] = 0,
+        reducer: Optional[type] = None,
         **kwargs
     ) -> Optional[Union[float, int]]:
         """
@@ -124,13 +125,15 @@ class Runtime:
         :param kwargs: the keyword arguments passed to the workunit
         :param operation: the name of the operation "for", "reduce", or "scan"
         :param initial_value: the initial value of the accumulator
+        :param reducer: the reducer selected at the call site for an
+            unannotated accumulator
         :returns: the result of the operation (None for parallel_for)
         """
 
         if self.is_debug(policy.space):
             if operation is None:
                 raise RuntimeError("ERROR: operation cannot be None for Debug")
-            return run_workunit_debug(policy, workunit, operation, initial_value, **kwargs)
+            return run_workunit_debug(policy, workunit, operation, initial_value, reducer, **kwargs)
 
         metadata: EntityMetadata
         parser: Union[Parser, List[Parser]]
@@ -146,11 +149,16 @@ class Runtime:
             parser = self.compiler.get_parser(metadata.path)
 
         if self.fusion_strategy is not None:
-            future = Future()
-            self.tracer.log_operation(future, name, policy, workunit, operation, parser, metadata.name, **kwargs)
-            return future
+            if reducer is None:
+                future = Future()
+                self.tracer.log_operation(future, name, policy, workunit, operation, parser, metadata.name, **kwargs)
+                return future
 
-        return self.execute_workunit(name, policy, workunit, operation, parser, **kwargs)
+            # the fused kernels only sum, so run the traced operations
+            # before this one
+            self.flush_trace()
+
+        return self.execute_workunit(name, policy, workunit, operation, parser, reducer, **kwargs)
 
 
     def execute_workunit(
@@ -160,6 +168,7 @@ class Runtime:
         workunit: Union[Callable[..., None], List[Callable[..., None]]],
         operation: str,
         parser: Union[Parser, List[Parser]],
+        reducer: Optional[type] = None,
         **kwargs
     ) -> Optional[Union[float, int]]:
         """
@@ -170,6 +179,7 @@ class Runtime:
         :param workunit: the workunit function object
         :param operation: the name of the operation "for", "reduce", or "scan"
         :param parser: the parser containing the AST of the workunit
+        :param reducer: the reducer selected at the call site, if any
         :param kwargs: the keyword arguments passed to the workunit
         :returns: the result of the operation (None for parallel_for)
         """
@@ -178,7 +188,7 @@ class Runtime:
         updated_decorator: Optional[UpdatedDecorator]
         types_signature: Optional[str]
 
-        updated_types, updated_decorator, types_signature = get_type_info(operation, parser, policy, workunit, kwargs)
+        updated_types, updated_decorator, types_signature = get_type_info(operation, parser, policy, workunit, kwargs, reducer)
         restrict_views: Set[str] = set()
         restrict_signature: Optional[str] = None
 
@@ -6,6 +6,7 @@ from pykokkos.core import cppast
 from pykokkos.core.keywords import Keywords
 from pykokkos.core.visitors import cpp_view_type, KokkosMainVisitor, visitors_util
 from pykokkos.interface.data_types import DataType
+from pykokkos.interface.reducers import reducers
 
 from .members import PyKokkosMembers
 
@@ -20,9 +21,10 @@ def is_hierarchical(workunit: Optional[cppast.MethodDecl]) -> bool:
     if workunit is None:
         return False
 
-    # Iterate over each parameter (skipping the tag)
+    # Iterate over each parameter (skipping the tag), other class types
+    # being accumulators, e.g. of MinLoc reducers
     for p in workunit.params[1:]:
-        if isinstance(p.decltype, cppast.ClassType):
+        if isinstance(p.decltype, cppast.ClassType) and p.decltype.typename.endswith("member_type"):
             return True
 
     return False
@@ -228,28 +230,129 @@ def generate_copy_back(members: PyKokkosMembers) -> str:
 
     return generate_copy_back_from_dict(members,device_views)
 
-def get_return_type(operation: str, workunit: cppast.MethodDecl) -> str:
+def get_reducer_fields(reducer: Optional[Tuple[str, str]]) -> Tuple[str, ...]:
+    """
+    Get the members of the value type of a reducer
+
+    :param reducer: the name and Kokkos type of the reducer, or None for a sum
+    :returns: the members, returned as a tuple, or () if the value is a scalar
+    """
+
+    if reducer is None:
+        return ()
+
+    return reducers[reducer[0]].fields
+
+def get_accumulator_names(count: int) -> List[str]:
+    """
+    Get the names of the variables holding the results of a reduction
+
+    :param count: the number of accumulators of the workunit
+    :returns: the list of names
+    """
+
+    if count == 1:
+        return [Keywords.Accumulator.value]
+
+    return [f"{Keywords.Accumulator.value}{i}" for i in range(count)]
+
+def get_accumulators(
+    operation: str,
+    workunit: cppast.MethodDecl,
+    reducers: Optional[List[Optional[Tuple[str, str]]]] = None
+) -> List[Tuple[str, cppast.ParmVarDecl, Optional[Tuple[str, str]]]]:
+    """
+    Get the accumulators of a reduction or scan, several accumulators
+    being joined by a single Kokkos reduction
+
+    :param operation: the type of the operation (for, reduce, scan, or workload)
+    :param workunit: the workunit for which the binding is being generated
+    :param reducers: the name and Kokkos type of the reducer of each
+        accumulator of the workunit, None for the ones that sum
+    :returns: the name of the variable holding the result, the
+        parameter of the workunit, and the reducer of each accumulator
+    """
+
+    if operation == "scan":
+        return [(Keywords.Accumulator.value, workunit.params[-2], None)]
+    if operation != "reduce":
+        return []
+
+    if reducers is None:
+        reducers = [None]
+
+    names: List[str] = get_accumulator_names(len(reducers))
+    params: List[cppast.ParmVarDecl] = workunit.params[len(workunit.params) - len(reducers):]
+
+    return list(zip(names, params, reducers))
+
+def get_value_type(acc_decl: cppast.ParmVarDecl, reducer: Optional[Tuple[str, str]]) -> str:
+    """
+    Get the type of the result of an accumulator
+
+    :param acc_decl: the accumulator parameter of the workunit
+    :param reducer: the name and Kokkos type of the reducer, or None for a sum
+    :returns: the type as a string
+    """
+
+    fields: Tuple[str, ...] = get_reducer_fields(reducer)
+    if fields:
+        # the members of the value type are returned as a tuple
+        dtype: str = cppast.Serializer().serialize(acc_decl.decltype.template_params[0])
+        member_types: List[str] = [cppast.BuiltinType.INT64.value if f.endswith("loc") else dtype for f in fields]
+        return f"std::tuple<{','.join(member_types)}>"
+
+    typename = acc_decl.decltype.typename
+    return typename.value if isinstance(typename, cppast.BuiltinType) else typename
+
+def get_return_type(
+    operation: str,
+    workunit: cppast.MethodDecl,
+    reducers: Optional[List[Optional[Tuple[str, str]]]] = None
+) -> str:
     """
     Get the return type of a binding
 
     :param operation: the type of the operation (for, reduce, scan, or workload)
     :param workunit: the workunit for which the binding is being generated
+    :param reducers: the reducer of each accumulator of the workunit, if any
     :returns: the return type as a string
     """ 
 
-    acc_decl: Optional[cppast.ParmVarDecl] = None
-    if operation == "reduce":
-        acc_decl = workunit.params[-1]
-    elif operation == "scan":
-        acc_decl = workunit.params[-2]
+    value_types: List[str] = [get_value_type(d, r) for _, d, r in get_accumulators(operation, workunit, reducers)]
 
-    return_type: str
-    if acc_decl is None:
-        return_type = "void"
-    else:
-        return_type = acc_decl.decltype.typename.value
+    if len(value_types) == 0:
+        return "void"
+    if len(value_types) == 1:
+        return value_types[0]
+
+    return f"std::tuple<{','.join(value_types)}>"
+
+def generate_acc_decl(
+    operation: str,
+    workunit: cppast.MethodDecl,
+    reducers: Optional[List[Optional[Tuple[str, str]]]] = None
+) -> str:
+    """
+    Generate the declarations of the variables holding the result of a
+    reduction or scan
+
+    :param operation: the type of the operation (reduce or scan)
+    :param workunit: the workunit for which the binding is being generated
+    :param reducers: the reducer of each accumulator of the workunit, if any
+    :returns: the declarations
+    """
 
-    return return_type
+    decls: List[str] = []
+    for name, acc_decl, reducer in get_accumulators(operation, workunit, reducers):
+        if get_reducer_fields(reducer):
+            # the value type is initialized by the reducer
+            value_type: str = cppast.Serializer().serialize(acc_decl.decltype).rstrip("&")
+            decls.append(f"{value_type} {name};")
+        else:
+            decls.append(f"{get_value_type(acc_decl, reducer)} {name} = 0;")
+
+    return "".join(decls)
 
 def generate_kernel_signature(return_type: str, kernel: str, params: Dict[str, str]) -> str:
     """
@@ -276,7 +379,14 @@ def generate_fence_call() -> str:
 
     return f"{Keywords.DefaultExecSpaceInstance.value}.fence();"
 
-def generate_call(operation: str, functor: str, members: PyKokkosMembers, tag: cppast.DeclRefExpr, is_hierarchical: bool) -> str:
+def generate_call(
+    operation: str,
+    functor: str,
+    members: PyKokkosMembers,
+    tag: cppast.DeclRefExpr,
+    is_hierarchical: bool,
+    reducers: Optional[List[Optional[Tuple[str, str]]]] = None
+) -> str:
     """
     Generate the calls to the operation
 
@@ -285,6 +395,7 @@ def generate_call(operation: str, functor: str, members: PyKokkosMembers, tag: c
     :param members: an object containing the fields and views
     :param tag: the name of the workunit
     :param is_hierarchical: is the workunit used with hierarchical parallelism
+    :param reducers: the reducer of each accumulator of the workunit, if any
     :returns: the source code for creating the subviews
     """
 
@@ -319,8 +430,15 @@ def generate_call(operation: str, functor: str, members: PyKokkosMembers, tag: c
 
     args.append(Keywords.Instance.value)
 
-    if operation in ("reduce", "scan"):
-        args.append(Keywords.Accumulator.value)
+    acc_reducers: List[Optional[Tuple[str, str]]] = []
+    if operation == "scan" or (operation == "reduce" and reducers is None):
+        acc_reducers = [None]
+    elif operation == "reduce":
+        acc_reducers = reducers
+    acc_names: List[str] = get_accumulator_names(len(acc_reducers))
+
+    for name, reducer in zip(acc_names, acc_reducers):
+        args.append(name if reducer is None else f"{reducer[1]}({name})")
 
     call += ",".join(args)
     call += ");"
@@ -331,8 +449,18 @@ def generate_call(operation: str, functor: str, members: PyKokkosMembers, tag: c
     call += generate_fence_call()
     call += generate_copy_back(members)
 
-    if operation in ("reduce", "scan"):
-        call += f"return {Keywords.Accumulator.value};"
+    results: List[str] = []
+    for name, reducer in zip(acc_names, acc_reducers):
+        fields: Tuple[str, ...] = get_reducer_fields(reducer)
+        if fields:
+            results.append(f"std::make_tuple({','.join(f'{name}.{f}' for f in fields)})")
+        else:
+            results.append(name)
+
+    if len(results) == 1:
+        call += f"return {results[0]};"
+    elif len(results) > 1:
+        call += f"return std::make_tuple({','.join(results)});"
 
     return call
 
@@ -342,7 +470,8 @@ def generate_wrapper(
     workunit: cppast.MethodDecl,
     wrapper: str,
     kernel: str,
-    real: Optional[str]
+    real: Optional[str],
+    reducers: Optional[List[Optional[Tuple[str, str]]]] = None
 ) -> str:
     """
     Generate the wrapper that calls the kernel and its binding
@@ -353,25 +482,34 @@ def generate_wrapper(
     :param wrapper: the name of the wrapper
     :param kernel: the name of the kernel
     :param real: the precision for which to generate a binding
+    :param reducers: the reducer of each accumulator of the workunit, if any
     :returns: the wrapper source
     """
 
     is_workload: bool = True if operation == "workload" else False
     params: Dict[str, str] = get_kernel_params(members, is_hierarchical(workunit), is_workload, real)
-    return_type: str = get_return_type(operation, workunit)
+    return_type: str = get_return_type(operation, workunit, reducers)
 
+    # The arguments are converted while holding the GIL, after which
+    # it is released for the duration of the kernel so that other
+    # Python threads (e.g. ones prefetching the next input) can run
+    casts: List[str] = []
     args: List[str] = []
     for name, param_type in params.items():
+        arg: str = f"pk_arg_{name}"
         if param_type == "const std::string&":
-            args.append(f"kwargs[\"{name}\"].cast<std::string>()")
+            casts.append(f"std::string {arg} = kwargs[\"{name}\"].cast<std::string>();")
         else:
-            args.append(f"kwargs[\"{name}\"].cast<{param_type}>()")
+            casts.append(f"{param_type} {arg} = kwargs[\"{name}\"].cast<{param_type}>();")
+        args.append(arg)
 
     kernel_call: str = f"{kernel}("
     kernel_call += ",".join(args)
     kernel_call += ");"
 
     definition: str = f"{return_type} {wrapper}(pybind11::kwargs kwargs) {{"
+    definition += "".join(casts)
+    definition += "pybind11::gil_scoped_release pk_release;"
     if return_type != "void":
         definition += f"return {kernel_call};"
     else:
@@ -404,12 +542,13 @@ def generate_kernel(
 
     hierarchical: bool = is_hierarchical(workunit)
     params: Dict[str, str] = get_kernel_params(members, hierarchical, False, real)
-    return_type: str = get_return_type(operation, workunit)
+    reducers: Optional[List[Optional[Tuple[str, str]]]] = members.reducers.get(tag)
+    return_type: str = get_return_type(operation, workunit, reducers)
     signature: str = generate_kernel_signature(return_type, kernel, params)
 
     acc: str = ""
     if operation in ("reduce", "scan"):
-        acc = f"{return_type} {Keywords.Accumulator.value} = 0;"
+        acc = generate_acc_decl(operation, workunit, reducers)
 
     if members.has_real:
         functor += f"<{Keywords.DefaultExecSpace.value},{real}>"
@@ -417,7 +556,7 @@ def generate_kernel(
         functor += f"<{Keywords.DefaultExecSpace.value}>"
 
     instance: str = generate_functor_instance(functor, members)
-    call: str = generate_call(operation, functor, members, tag, hierarchical)
+    call: str = generate_call(operation, functor, members, tag, hierarchical, reducers)
 
     kernel: str = f"{signature} {{ {acc} {instance} {call} }}"
 
@@ -478,7 +617,7 @@ def bind_workunits_single(
         workunit: cppast.MethodDecl = t[1]
 
         kernel: str = generate_kernel(functor, members, operation, workunit, n, kernel_name, real)
-        wrapper: str = generate_wrapper(members, operation, workunit, wrapper_name, kernel_name, real)
+        wrapper: str = generate_wrapper(members, operation, workunit, wrapper_name, kernel_name, real, members.reducers.get(n))
 
         bindings.extend([kernel, wrapper])
 
@@ -589,7 +728,7 @@ def bind_main_single(
 
     for element in source[0]:
         # TODO: support more types
-        if "pk.Acc" in element:
+        if "pk.Acc" in element or any(f"pk.{r}[" in element for r in reducers):
             if "pk.int64" in element:
                 acc_type = "int64_t"
             elif "pk.double" in element:
@@ -28,6 +28,11 @@ class PyKokkosMembers:
 
         self.classtype_methods: Dict[cppast.DeclRefExpr, List[cppast.DeclRefExpr]] = {}
 
+        # Maps from workunit name to the name and Kokkos type of the
+        # reducer selected by each of its accumulators, None for the
+        # ones that sum
+        self.reducers: Dict[cppast.DeclRefExpr, List[Optional[Tuple[str, str]]]] = {}
+
         self.random_pool: Optional[Tuple[cppast.DeclRefExpr, cppast.ClassType]] = None
 
         self.reduction_result_queue: List[str] = []
@@ -66,11 +71,14 @@ class PyKokkosMembers:
             # check for accumulator
             args: List[ast.arg] = AST.args.args
             for i, arg in enumerate(args):
-                if isinstance(arg.annotation, ast.Subscript) and arg.annotation.value.attr == "Acc":
+                if visitors_util.is_accumulator(arg.annotation):
+                    # skip the other accumulators of a reduction
                     param_begin = i + 1
+                    while param_begin < len(args) and visitors_util.is_accumulator(args[param_begin].annotation):
+                        param_begin += 1
                     # handle last_pass param for parallel_scan
-                    if i + 1 <= len(args) and isinstance(args[i+1].annotation, ast.Name) and \
-                            args[i+1].annotation.id == "bool":
+                    if param_begin < len(args) and isinstance(args[param_begin].annotation, ast.Name) and \
+                            args[param_begin].annotation.id == "bool":
                         param_begin += 1
                     break
 
@@ -94,6 +102,7 @@ class PyKokkosMembers:
             self.pk_functions = self.get_decorated_functions(entity.full_AST, Decorator.KokkosFunction)
 
         self.classtype_methods = self.get_classtype_methods(classtypes)
+        self.reducers = self.get_reducers(self.pk_workunits, pk_import)
 
         if entity.style is PyKokkosStyles.workload:
             name: str = f"pk_functor_{entity.name}"
@@ -240,6 +249,16 @@ class PyKokkosMembers:
 
         return functions
 
+    def get_reducers(self, workunits: Dict[cppast.DeclRefExpr, ast.FunctionDef], pk_import: str) -> Dict[cppast.DeclRefExpr, List[Optional[Tuple[str, str]]]]:
+        reducers: Dict[cppast.DeclRefExpr, List[Optional[Tuple[str, str]]]] = {}
+
+        for name, workunit in workunits.items():
+            accumulators: List[ast.arg] = [a for a in workunit.args.args if visitors_util.is_accumulator(a.annotation)]
+            if accumulators:
+                reducers[name] = [visitors_util.get_reducer(a.annotation, pk_import) for a in accumulators]
+
+        return reducers
+
     def get_classtype_methods(self, classtypes: List[PyKokkosEntity]) -> Dict[cppast.DeclRefExpr, List[cppast.DeclRefExpr]]:
         classtype_methods: Dict[
             cppast.DeclRefExpr, List[cppast.DeclRefExpr]] = {}
@@ -12,6 +12,7 @@ from pykokkos.interface import (
     View, ViewType,
     DataType, DataTypeClass
 )
+from pykokkos.interface.reducers import reducers
 
 
 @dataclass
@@ -57,7 +58,13 @@ def check_missing_annotations(param_list: List[ast.arg]) -> bool:
             break
     return missing
 
-def get_annotations(parallel_type: str, workunit_trees: Union[Tuple[Callable, ast.AST], List[Tuple[Callable, ast.AST]]], policy: Union[ExecutionPolicy, int], passed_kwargs) -> Optional[UpdatedTypes]:
+def get_annotations(
+    parallel_type: str,
+    workunit_trees: Union[Tuple[Callable, ast.AST], List[Tuple[Callable, ast.AST]]],
+    policy: Union[ExecutionPolicy, int],
+    passed_kwargs,
+    reducer: Optional[type] = None
+) -> Optional[UpdatedTypes]:
     '''
     Infer the datatypes for arguments passed against workunit parameters
 
@@ -65,6 +72,7 @@ def get_annotations(parallel_type: str, workunit_trees: Union[Tuple[Callable, as
     :param workunit_trees: workunit object and its tree in tuples. Can be a list or standalone
     :param policy: The execution policy for this parallel dispatch - used to handle policy args
     :param passed_kwargs: raw keyword arguments passed to the dispatch
+    :param reducer: the reducer passed to parallel_reduce, which replaces the annotation of the accumulator
     :returns: UpdateTypes object or None if there are no annotations to be inferred
     '''
     # x.arg is param identifier (name) and x.annotation is the annotation object .id is the annotated type
@@ -90,17 +98,28 @@ def get_annotations(parallel_type: str, workunit_trees: Union[Tuple[Callable, as
 
     # check if all annotations are already provided
     missing = check_missing_annotations(param_list)
-    if not missing: return None
+    if not missing and reducer is None: return None
 
-    # accumulator 
+    # accumulators
+    accumulators: int = 0
     if parallel_type == "parallel_reduce":
-        policy_params += 1
+        accumulators = count_accumulators(param_list, policy_params, passed_kwargs)
+        policy_params += accumulators
     # accumulator + lass_pass
     if parallel_type == "parallel_scan":
         policy_params += 2
 
     # Handling policy parameters
-    updated_types = infer_policy_args(param_list, policy_params, policy, parallel_type, updated_types)
+    updated_types = infer_policy_args(param_list, policy_params, policy, parallel_type, updated_types, accumulators)
+
+    if reducer is not None:
+        acc_params: List[ast.arg] = param_list[policy_params - accumulators:policy_params]
+        acc_reducers: Tuple[type, ...] = reducer if isinstance(reducer, tuple) else (reducer,)
+        if len(acc_reducers) != len(acc_params):
+            raise TypeError(f"ERROR: {len(acc_reducers)} reducers passed for {len(acc_params)} accumulators")
+
+        for param, acc_reducer in zip(acc_params, acc_reducers):
+            updated_types = infer_reducer(param, acc_reducer, updated_types)
 
     # Policy parameters are the only parameters
     if not len(passed_kwargs):
@@ -166,7 +185,8 @@ def infer_policy_args(
     policy_params: int,
     policy: ExecutionPolicy,
     parallel_type: str,
-    updated_types: UpdatedTypes
+    updated_types: UpdatedTypes,
+    accumulators: int = 1
     ) -> UpdatedTypes:
     '''
     Infer the types of policy arguments
@@ -176,6 +196,7 @@ def infer_policy_args(
     :param policy: the pykokkos execution policy for workunit
     :param parallel_type: "parallel_for" or "parallel_reduce" or "parallel_scan"
     :param updated_types: UpdatedTypes object to store inferred types information
+    :param accumulators: the number of accumulators of a parallel_reduce, which are the last policy params
     :returns: Updated UpdatedTypes object with inferred types
     '''
 
@@ -202,8 +223,8 @@ def infer_policy_args(
         else:
             raise ValueError("Automatic annotations not supported for this policy")
 
-        # last policy param for parallel reduce and second last for parallel_scan is always the accumulator; the default type is double
-        if i == policy_params - 1 and parallel_type == "parallel_reduce" or i == policy_params - 2 and parallel_type == "parallel_scan":
+        # last policy params for parallel reduce and second last for parallel_scan are always the accumulators; the default type is double
+        if i >= policy_params - accumulators and parallel_type == "parallel_reduce" or i == policy_params - 2 and parallel_type == "parallel_scan":
             updated_types.inferred_types[param.arg] = "Acc:double"
 
         if i == policy_params - 1 and parallel_type == "parallel_scan":
@@ -212,6 +233,73 @@ def infer_policy_args(
     return updated_types
 
 
+def count_accumulators(param_list: List[ast.arg], begin: int, passed_kwargs) -> int:
+    '''
+    Count the accumulators of a reduction, which are the parameters following the
+    policy parameters that are not passed as keyword arguments
+
+    :param param_list: list of parameter objects that are present in the workunit signature
+    :param begin: the index of the first accumulator
+    :param passed_kwargs: raw keyword arguments passed to the dispatch
+    :returns: the number of accumulators, at least one
+    '''
+
+    count: int = 0
+    for param in param_list[begin:]:
+        if param.arg in passed_kwargs:
+            break
+
+        annotation = param.annotation
+        if annotation is not None and not (
+                isinstance(annotation, ast.Subscript) and isinstance(annotation.value, ast.Attribute)
+                and annotation.value.attr in ("Acc", *reducers)):
+            break
+
+        count += 1
+
+    return max(count, 1)
+
+
+def infer_reducer(param: ast.arg, reducer: type, updated_types: UpdatedTypes) -> UpdatedTypes:
+    '''
+    Annotate the accumulator of a reduction with the reducer passed to parallel_reduce.
+    Each accumulator starts at the identity of the reducer, so the body of the
+    workunit has to update it as the reducer does, e.g. as a max, which an
+    accumulator annotated with pk.Acc does not
+
+    :param param: the accumulator parameter
+    :param reducer: the reducer, e.g. pk.Max
+    :param updated_types: UpdatedTypes object to store inferred types information
+    :returns: Updated UpdatedTypes object with inferred types
+    '''
+
+    dtype: str = "double"
+    annotation = param.annotation
+    if annotation is not None:
+        if not isinstance(annotation, ast.Subscript) or not isinstance(annotation.value, ast.Attribute):
+            raise TypeError(f"ERROR: the accumulator {param.arg} must be annotated with pk.Acc or a reducer")
+
+        name: str = annotation.value.attr
+        if name == "Acc" and reducer.__name__ != "Acc":
+            raise TypeError(f"ERROR: the accumulator {param.arg} is annotated with pk.Acc, which sums, so it cannot be joined with pk.{reducer.__name__}")
+        if name != reducer.__name__:
+            raise TypeError(f"ERROR: the accumulator {param.arg} is annotated with pk.{name} but reducer is pk.{reducer.__name__}")
+
+        dtype_node = annotation.slice
+        if isinstance(dtype_node, ast.Index):
+            dtype_node = dtype_node.value
+
+        if isinstance(dtype_node, ast.Attribute):
+            dtype = dtype_node.attr
+        elif isinstance(dtype_node, ast.Name):
+            # the builtin float is a double, as for other parameters
+            dtype = "double" if dtype_node.id == "float" else dtype_node.id
+
+    updated_types.inferred_types[param.arg] = f"{reducer.__name__}:{dtype}"
+
+    return updated_types
+
+
 def infer_other_args(
     param_list: List[inspect.Parameter],
     passed_kwargs,
@@ -255,6 +343,8 @@ def infer_other_args(
 
             if param_type == "float64": param_type = "double"
             if param_type == "float32": param_type = "float"
+            # 16-bit scalars are passed as floats, which hold them exactly
+            if param_type in ("float16", "bfloat16"): param_type = "float"
             # numpy:<type>, Will switch to pk.<type> in parser.fix_types
             param_type = pckg_name +":"+ param_type
 
@@ -263,7 +353,8 @@ def infer_other_args(
             if not view_dtype:
                 raise TypeError("Cannot infer datatype for view:", param.arg)
 
-            param_type = "View"+str(len(value.shape))+"D:"+view_dtype
+            # 0-D views are passed to workunits as single element 1D views
+            param_type = "View"+str(max(1, len(value.shape)))+"D:"+view_dtype
 
         updated_types.inferred_types[param.arg] = param_type 
 
@@ -342,6 +433,8 @@ def get_type_str(inspect_type: inspect.Parameter.annotation) -> str:
         t_str = t_str.replace("pykokkos.interface.views.", "")
         if ".Acc[" in t_str:
             basic_type = "Acc"
+        elif ".reducers." in t_str:
+            basic_type = t_str.split(".reducers.")[1].split("[")[0]
         elif "TeamMember" in t_str:
             basic_type = "TeamMember"
         elif "View" in t_str:
@@ -356,6 +449,12 @@ def get_type_str(inspect_type: inspect.Parameter.annotation) -> str:
     if basic_type == "Acc":
         return "Acc:double"
 
+    if basic_type in reducers:
+        dtype: str = t_str.split("[")[1].rstrip("]")
+        if dtype == "float64": dtype = "double"
+        if dtype == "float32": dtype = "float"
+        return basic_type + ":" + dtype
+
     if basic_type == "TeamMember":
         return "TeamMember"
 
@@ -383,7 +482,8 @@ def get_type_info(
         parser,
         policy: ExecutionPolicy,
         workunit: Union[List[Callable], Callable],
-        passed_kwargs
+        passed_kwargs,
+        reducer: Optional[type] = None
         ) -> Tuple[Optional[UpdatedTypes], Optional[UpdatedDecorator], Optional[str]]:
     '''
     Process arg nodes for each workunit received: 
@@ -395,6 +495,7 @@ def get_type_info(
     :param policy: the execution policy of the dispatch
     :param workunit: list of workunits to be fused or singular workunit not to be fused,
     :param passed_kwargs: original kwargs passed to the parallel dispatch
+    :param reducer: the reducer passed to parallel_reduce, if any
     :returns: Tuple of: 
         1) UpdatedTypes object if type inference is supported 
         2) UpdatedDecorator object if decorator inference is supported
@@ -428,6 +529,9 @@ def get_type_info(
         is_missing_annotations: bool = (
             workunit_str in ORIGINAL_PARAMS
             or
+            # the annotation of the accumulator is replaced
+            reducer is not None
+            or
             check_missing_annotations(this_tree.args.args)
             )
 
@@ -444,7 +548,7 @@ def get_type_info(
     types_signature: Optional[str] = None
 
     if is_standalone_workunit:
-        updated_types = get_annotations(f"parallel_{operation}", workunit_trees, policy, passed_kwargs)
+        updated_types = get_annotations(f"parallel_{operation}", workunit_trees, policy, passed_kwargs, reducer)
         updated_decorator = get_views_decorator(f"parallel_{operation}", workunit_trees, passed_kwargs)
         types_signature = get_types_signature(updated_types, updated_decorator, execution_space)
 
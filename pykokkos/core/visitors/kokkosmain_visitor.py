@@ -1,10 +1,11 @@
 import ast
-from typing import List, Dict, Optional, Set, Union
+from typing import List, Dict, Optional, Set, Tuple, Union
 from ast import FunctionDef
 
 from pykokkos.core import cppast
 from pykokkos.core.keywords import Keywords
 from pykokkos.interface import BinOp, BinSort, View, Iterate, TeamPolicy
+from pykokkos.interface.reducers import reducers
 
 from . import visitors_util
 from .pykokkos_visitor import PyKokkosVisitor
@@ -367,7 +368,22 @@ class KokkosMainVisitor(PyKokkosVisitor):
                 work_unit: str = args[arg_start + 1].declname
                 policy = self.add_workunit_to_policy(policy, work_unit)
 
-                call_args: List[cppast.Expr] = [policy, cppast.DeclRefExpr("pk_f"), acc_decl]
+                result: cppast.Expr = acc_decl
+                workunit_def: Optional[ast.FunctionDef] = self.work_units.get(cppast.DeclRefExpr(work_unit))
+                if workunit_def is not None:
+                    if sum(visitors_util.is_accumulator(a.annotation) for a in workunit_def.args.args) > 1:
+                        self.error(node, "Several accumulators are not supported in workloads, whose results are scalars")
+
+                    for a in workunit_def.args.args:
+                        reducer: Optional[Tuple[str, str]] = visitors_util.get_reducer(a.annotation, self.pk_import)
+                        if reducer is None:
+                            continue
+                        if reducers[reducer[0]].fields:
+                            self.error(node, f"{reducer[0]} is not supported in workloads, whose results are scalars")
+                        result = cppast.CallExpr(cppast.DeclRefExpr(reducer[1]), [acc_decl])
+                        break
+
+                call_args: List[cppast.Expr] = [policy, cppast.DeclRefExpr("pk_f"), result]
                 if kernel_name is not None:
                     call_args.insert(0, kernel_name)
 
@@ -43,6 +43,10 @@ class PyKokkosVisitor(ast.NodeVisitor):
         # Maps from nested work unit name to definition
         self.nested_work_units: Dict[str, cppast.LambdaExpr] = {}
 
+        # Maps from nested work unit name to the Kokkos reducer selected
+        # by the annotation of its accumulator
+        self.nested_reducers: Dict[str, str] = {}
+
     def visit_arguments(self, node: ast.arguments) -> List[cppast.ParmVarDecl]:
         args: List[cppast.ParmVarDecl] = [self.visit(a) for a in node.args if a.arg != "self"]
 
@@ -2,12 +2,13 @@ import ast
 import os
 import re
 import sys
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from pykokkos import kokkos_manager as km
 from pykokkos.core import cppast
 from pykokkos.core.keywords import Keywords
 from pykokkos.interface import Layout, MemorySpace, Trait
+from pykokkos.interface.reducers import reducers
 
 def pretty_print(node):
     print(ast.dump(node, indent=4))
@@ -21,7 +22,9 @@ allowed_types: Dict[str, str] = {
     "TeamMember": f"Kokkos::TeamPolicy<{Keywords.DefaultExecSpace.value}>::member_type",
     "cpp_auto": "auto",
     "complex64": "Kokkos::complex<float>",
-    "complex128": "Kokkos::complex<double>"
+    "complex128": "Kokkos::complex<double>",
+    "float16": "Kokkos::Experimental::half_t",
+    "bfloat16": "Kokkos::Experimental::bhalf_t"
 }
 
 # Maps from the DataType enum to cppast
@@ -91,6 +94,7 @@ math_functions: Set = {
     "erf",
     "erfc",
     "exp",
+    "exp2",
     "expm1",
     "fabs",
     "floor",
@@ -261,6 +265,9 @@ def get_type(annotation: Union[ast.Attribute, ast.Name, ast.Subscript], pk_impor
             if type_name == "Acc":
                 return get_type(dtype_node, pk_import)
 
+            if type_name in reducers:
+                return get_reducer_value_type(type_name, get_type(dtype_node, pk_import))
+
             dtype: cppast.PrimitiveType = get_type(dtype_node, pk_import)
             if dtype is None:
                 return None
@@ -272,6 +279,60 @@ def get_type(annotation: Union[ast.Attribute, ast.Name, ast.Subscript], pk_impor
 
     return None
 
+def get_reducer_value_type(name: str, dtype: cppast.Type) -> cppast.Type:
+    """
+    Get the type of the accumulator of a Kokkos reducer
+
+    :param name: the name of the reducer, e.g. "MinLoc"
+    :param dtype: the type of the reduced values
+    :returns: dtype, or the Kokkos value type holding several of them,
+        e.g. Kokkos::ValLocScalar<double,int64_t>
+    """
+
+    reducer = reducers[name]
+    if not reducer.value_type:
+        return dtype
+
+    value_type = cppast.ClassType(f"Kokkos::{reducer.value_type}")
+    value_type.add_template_param(dtype)
+    if reducer.indexed:
+        value_type.add_template_param(cppast.PrimitiveType(cppast.BuiltinType.INT64))
+
+    return value_type
+
+
+def get_reducer(annotation: ast.AST, pk_import: str) -> Optional[Tuple[str, str]]:
+    """
+    Get the Kokkos reducer selected by the annotation of an accumulator
+
+    :param annotation: the annotation, e.g. pk.Max[pk.double]
+    :param pk_import: the pykokkos import alias
+    :returns: the name of the reducer and its Kokkos type, e.g.
+        ("Max", "Kokkos::Max<double>"), or None for pk.Acc, which sums
+    """
+
+    if not isinstance(annotation, ast.Subscript):
+        return None
+
+    name: str = get_node_name(annotation.value)
+    if name not in reducers:
+        return None
+
+    dtype_node = annotation.slice
+    if isinstance(dtype_node, ast.Index):
+        dtype_node = dtype_node.value
+
+    dtype: Optional[cppast.Type] = get_type(dtype_node, pk_import)
+    if dtype is None:
+        return None
+
+    template_params: str = cppast.Serializer().serialize(dtype)
+    if reducers[name].indexed:
+        template_params += f",{cppast.BuiltinType.INT64.value}"
+
+    return name, f"Kokkos::{name}<{template_params}>"
+
+
 def parse_view_template_params(
     view_type: cppast.ClassType,
     rank: Optional[int] = None,
@@ -314,7 +375,8 @@ def parse_view_template_params(
         if parameter in ("int", "double", "float",
                             "int8_t", "int16_t", "int32_t", "int64_t",
                             "uint8_t", "uint16_t", "uint32_t", "uint64_t",
-                            "Kokkos::complex<float>", "Kokkos::complex<double>"):
+                            "Kokkos::complex<float>", "Kokkos::complex<double>",
+                            "Kokkos::Experimental::half_t", "Kokkos::Experimental::bhalf_t"):
             datatype: str = parameter + "*" * rank
             params["dtype"] = datatype
 
@@ -392,3 +454,17 @@ def cpp_view_type(
     cpp_type += ",".join(params_ordered) + ">"
 
     return cpp_type
+
+
+def is_accumulator(annotation: Optional[ast.AST]) -> bool:
+    """
+    Check if an annotation is that of an accumulator
+
+    :param annotation: the annotation, e.g. pk.Acc[pk.double] or pk.Max[pk.double]
+    :returns: true if the annotation is pk.Acc or a reducer
+    """
+
+    if not isinstance(annotation, ast.Subscript):
+        return False
+
+    return get_node_name(annotation.value) in ("Acc", *reducers)
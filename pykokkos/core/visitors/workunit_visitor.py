@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Set, Tuple, Union
 from pykokkos.core import cppast
 from pykokkos.core.keywords import Keywords
 from pykokkos.interface import TeamMember
+from pykokkos.interface.reducers import reducers
 
 from . import visitors_util
 from .pykokkos_visitor import PyKokkosVisitor
@@ -22,12 +23,21 @@ class WorkunitVisitor(PyKokkosVisitor):
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> Union[str, Tuple[str, cppast.MethodDecl]]:
         if self.is_nested_call(node):
+            # the result of a nested reduction is assigned to a single variable
+            if sum(visitors_util.is_accumulator(a.annotation) for a in node.args.args) > 1:
+                self.error(node, "Nested reductions with several accumulators are not supported")
+
             params: List[cppast.ParmVarDecl] = [a for a in self.visit(node.args)]
             body = cppast.CompoundStmt([self.visit(b) for b in node.body])
 
             workunit = cppast.LambdaExpr("[&]", params, body)
             self.nested_work_units[node.name] = workunit
 
+            for a in node.args.args:
+                reducer: Optional[Tuple[str, str]] = visitors_util.get_reducer(a.annotation, self.pk_import)
+                if reducer is not None:
+                    self.nested_reducers[node.name] = reducer[1]
+
             return ""
 
         else:
@@ -89,7 +99,7 @@ class WorkunitVisitor(PyKokkosVisitor):
 
         if isinstance(annotation, ast.Subscript):
             name: str = visitors_util.get_node_name(annotation.value)
-            if name == "Acc":
+            if name == "Acc" or name in reducers:
                 return "reduce"
 
         return None
@@ -113,9 +123,13 @@ class WorkunitVisitor(PyKokkosVisitor):
                 args: List[cppast.Expr] = [
                     self.visit(a) for a in node.value.args]
 
-                initial_value: cppast.Expr
+                initial_value: Optional[cppast.Expr]
                 if len(args) == 3:
                     initial_value = args[2]
+                elif isinstance(decltype, cppast.ClassType):
+                    # the value types of reducers such as MinLoc are
+                    # initialized by the reduction
+                    initial_value = None
                 else:
                     initial_value = cppast.IntegerLiteral(0)
 
@@ -125,11 +139,15 @@ class WorkunitVisitor(PyKokkosVisitor):
                 work_unit: str = args[1].declname
                 function = cppast.DeclRefExpr(f"Kokkos::{function_name}")
 
+                result: cppast.Expr = declname
+                if work_unit in self.nested_reducers:
+                    result = cppast.CallExpr(cppast.DeclRefExpr(self.nested_reducers[work_unit]), [declname])
+
                 call: cppast.CallExpr
                 if work_unit in self.nested_work_units:
-                    call = cppast.CallExpr(function, [args[0], self.nested_work_units[work_unit], declname])
+                    call = cppast.CallExpr(function, [args[0], self.nested_work_units[work_unit], result])
                 else:
-                    call = cppast.CallExpr(function, [args[0], f"pk_id_{work_unit}", declname])
+                    call = cppast.CallExpr(function, [args[0], f"pk_id_{work_unit}", result])
 
                 callstmt = cppast.CallStmt(call)
 
@@ -186,17 +204,21 @@ class WorkunitVisitor(PyKokkosVisitor):
 
             cpp_args.append(self.visit_arg(a))
 
-        acc_arg: ast.arg
+        acc_args: List[ast.arg] = []
         last_arg: ast.arg
 
         operation: str = self.get_operation_type(node.parent)
         if operation == "scan":
             last_arg: ast.arg = args[acc_arg_index + 1]
-            acc_arg = args[acc_arg_index]
+            acc_args.append(args[acc_arg_index])
         if operation == "reduce":
-            acc_arg = args[acc_arg_index]
+            # consecutive accumulators are joined in a single reduction
+            for a in args[acc_arg_index:]:
+                if not visitors_util.is_accumulator(a.annotation):
+                    break
+                acc_args.append(a)
 
-        if operation in ("scan", "reduce"):
+        for acc_arg in acc_args:
             acc: cppast.ParmVarDecl = self.visit_arg(acc_arg)
             acc.decltype.is_reference = True
             cpp_args.append(acc)
@@ -17,13 +17,14 @@ from .data_types import (
     uint8,
     uint16, uint32, uint64,
     float, double, real,
-    float32, float64, bool,
+    float32, float64, float16, bfloat16, bool,
     complex64, complex128
 )
 from .decorators import (
     callback, classtype, Decorator, function, functor, main,
     workload, workunit
 )
+from .dual_view import DualView
 from .execution_policy import (
     ExecutionPolicy, RangePolicy, MDRangePolicy, TeamPolicy,
     TeamThreadRange, ThreadVectorRange, TeamThreadMDRange, Iterate, Rank
@@ -37,13 +38,22 @@ from .mathematical_special_functions import (
     cyl_bessel_j0, cyl_bessel_j1
 )
 from .memory_space import MemorySpace, get_default_memory_space
+from .memory_stats import (
+    AllocationDiff, AllocationStat, MemorySnapshot,
+    disable_memory_tracking, enable_memory_tracking, memory_snapshot,
+    memory_stats, reset_peak_memory
+)
 from .parallel_dispatch import (
     execute, flush,
     parallel_for, parallel_reduce, parallel_scan,
 )
+from .reducers import (
+    Reducer, Prod, Min, Max, LAnd, LOr, MinMax, MinLoc, MaxLoc, MinMaxLoc
+)
 from .random import (
     rand, RandomPool, Random_XorShift64_Pool, Random_XorShift1024_Pool
 )
+from .streaming import ChunkStream, stream_for, stream_map, stream_reduce
 from .timer import Timer
 from .views import (
     Subview, Trait,
@@ -53,7 +63,7 @@ from .views import (
     ScratchView, ScratchView1D, ScratchView2D,
     ScratchView3D, ScratchView4D, ScratchView5D,
     ScratchView6D, ScratchView7D, ScratchView8D,
-    array, asarray, result_type,
+    array, asarray, from_dlpack, memmap, result_type,
 )
 
 from .ext_module import compile_into_module
@@ -1,6 +1,8 @@
 from typing import Generic, TypeVar
 
-class Acc(Generic[TypeVar("T")]):
+T = TypeVar("T")
+
+class Acc(Generic[T]):
     def __init__(self, val):
         self.val = val
     
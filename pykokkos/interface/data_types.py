@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Type
 from builtins import float as builtin_float
 
 from pykokkos.bindings import kokkos
@@ -18,6 +19,8 @@ class DataType(Enum):
     uint64 = kokkos.uint64
     float = kokkos.float
     double = kokkos.double
+    float16 = kokkos.float16
+    bfloat16 = kokkos.bfloat16
     # https://data-apis.org/array-api/2021.12/API_specification/data_types.html
     # A conforming implementation of the array API standard
     # must provide and support the dtypes listed above; for
@@ -81,6 +84,30 @@ class double(DataTypeClass):
     np_equiv = np.float64
 
 
+# Kokkos only has 16-bit floating point types on backends supporting
+# them, and otherwise stores them as floats. NumPy has no bfloat16, so
+# its raw bits are used unless ml_dtypes provides one.
+BFLOAT16_NP_EQUIV: Type[np.generic]
+if kokkos.bfloat16_itemsize != 2:
+    BFLOAT16_NP_EQUIV = np.float32
+else:
+    try:
+        import ml_dtypes
+        BFLOAT16_NP_EQUIV = ml_dtypes.bfloat16
+    except ImportError:
+        BFLOAT16_NP_EQUIV = np.uint16
+
+
+class float16(DataTypeClass):
+    value = kokkos.float16
+    np_equiv = np.float16 if kokkos.float16_itemsize == 2 else np.float32
+
+
+class bfloat16(DataTypeClass):
+    value = kokkos.bfloat16
+    np_equiv = BFLOAT16_NP_EQUIV
+
+
 class real(DataTypeClass):
     value = None
     np_equiv = None
@@ -0,0 +1,310 @@
+import ast
+import contextlib
+import os
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Set, Tuple, Union
+
+import numpy as np
+
+import pykokkos.kokkos_manager as km
+from pykokkos.runtime import runtime_singleton
+
+from .data_types import DataTypeClass, real
+from .layout import Layout
+from .memory_space import get_default_memory_space, MemorySpace
+from .views import View, ViewType, from_array
+
+# memory spaces whose allocations are not accessible from the host
+DEVICE_ONLY_SPACES: Set[MemorySpace] = {MemorySpace.CudaSpace, MemorySpace.HIPSpace}
+
+# maps (path, workunit, DualView arguments) to the arguments written to
+written_cache: Dict[Tuple[str, str, FrozenSet[str]], Set[str]] = {}
+
+
+class DualView:
+    """
+    A pair of Views holding the same data in host memory and in the
+    memory space of the execution space, modeled on Kokkos::DualView.
+    Each side records whether it was modified since the last sync, so
+    that data is only copied when the other side is about to be used.
+    If the execution space can access host memory, both sides are the
+    same View and syncing never copies.
+    """
+
+    def __init__(
+        self,
+        shape: Union[List[int], Tuple[int]],
+        dtype: Union[DataTypeClass, type] = real,
+        space: MemorySpace = MemorySpace.MemorySpaceDefault,
+        layout: Layout = Layout.LayoutDefault
+    ):
+        """
+        DualView constructor.
+
+        :param shape: the shape of the view as a list or tuple of integers
+        :param dtype: the data type of the view
+        :param space: the memory space of the device side. Will be set
+            to the memory space of the default execution space by default.
+        :param layout: the layout of both sides
+        """
+
+        if space is MemorySpace.MemorySpaceDefault:
+            space = get_default_memory_space(km.get_default_space())
+
+        self.h_view: View = View(shape, dtype, space=MemorySpace.HostSpace, layout=layout)
+        self.d_view: ViewType
+
+        # the cupy array backing d_view, None when both sides are shared
+        self.d_array: Any = None
+
+        if space in DEVICE_ONLY_SPACES:
+            import cupy as cp
+            order: str = "F" if self.h_view.layout is Layout.LayoutLeft else "C"
+            self.d_array = cp.zeros(shape, dtype=self.h_view.data.dtype, order=order)
+            self.d_view = from_array(self.d_array)
+        else:
+            self.d_view = self.h_view
+
+        self.modified_host: bool = False
+        self.modified_device: bool = False
+
+    @property
+    def shape(self) -> Tuple[int]:
+        return self.h_view.shape
+
+    @property
+    def dtype(self):
+        return self.h_view.dtype
+
+    @property
+    def ndim(self) -> int:
+        return self.h_view.ndim
+
+    def extent(self, dimension: int) -> int:
+        """
+        The length of a specific dimension
+
+        :param dimension: the dimension for which the length is needed
+        :returns: an int representing the length of the specified dimension
+        """
+
+        return self.h_view.extent(dimension)
+
+    def is_shared(self) -> bool:
+        """
+        Whether the host and device sides are the same View
+
+        :returns: True if syncing never copies
+        """
+
+        return self.d_view is self.h_view
+
+    def view_host(self) -> View:
+        """
+        Get the host side without syncing it
+
+        :returns: the host View
+        """
+
+        return self.h_view
+
+    def view_device(self) -> ViewType:
+        """
+        Get the device side without syncing it
+
+        :returns: the device View
+        """
+
+        return self.d_view
+
+    def modify_host(self) -> None:
+        """
+        Mark the host side as modified
+        """
+
+        self.modified_host = True
+
+    def modify_device(self) -> None:
+        """
+        Mark the device side as modified
+        """
+
+        self.modified_device = True
+
+    def need_sync_host(self) -> bool:
+        """
+        Whether the device side was modified since the last sync
+
+        :returns: True if sync_host() would copy
+        """
+
+        return self.modified_device
+
+    def need_sync_device(self) -> bool:
+        """
+        Whether the host side was modified since the last sync
+
+        :returns: True if sync_device() would copy
+        """
+
+        return self.modified_host
+
+    def clear_sync_state(self) -> None:
+        """
+        Mark both sides as up to date without copying
+        """
+
+        self.modified_host = False
+        self.modified_device = False
+
+    def sync_host(self) -> None:
+        """
+        Copy the device side to the host side if the device side was
+        modified since the last sync
+        """
+
+        if "PK_FUSION" in os.environ:
+            runtime = runtime_singleton.runtime
+            assert runtime is not None
+            runtime.flush_data(self.d_view)
+
+        if self.modified_device and not self.is_shared():
+            self.h_view.data[...] = self.d_array.get()
+
+        self.modified_device = False
+
+    def sync_device(self) -> None:
+        """
+        Copy the host side to the device side if the host side was
+        modified since the last sync
+        """
+
+        if self.modified_host and not self.is_shared():
+            self.d_array.set(self.h_view.data)
+
+        self.modified_host = False
+
+    def __getitem__(self, key):
+        """
+        Read from the host side, syncing it first if needed
+
+        :param key: any key accepted by View
+        :returns: the value or Subview of the host side
+        """
+
+        self.sync_host()
+
+        return self.h_view[key]
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Write to the host side, syncing it first if needed, and mark it
+        as modified
+
+        :param key: any key accepted by View
+        :param value: the new value
+        """
+
+        self.sync_host()
+        self.h_view[key] = value
+        self.modify_host()
+
+    @contextlib.contextmanager
+    def host_access(self, readonly: bool = False) -> Iterator[np.ndarray]:
+        """
+        Access the host side as a numpy array, syncing it once on
+        entry and marking it as modified on exit
+
+        :param readonly: whether the array is only read, which makes it
+            non-writeable and leaves the host side unmodified
+        :returns: a context manager yielding the numpy array
+        """
+
+        self.sync_host()
+        try:
+            with self.h_view.host_access(readonly) as host:
+                yield host
+        finally:
+            if not readonly:
+                self.modify_host()
+
+    def __len__(self) -> int:
+        return len(self.h_view)
+
+    def __array__(self, dtype=None):
+        self.sync_host()
+
+        return np.asarray(self.h_view.data, dtype=dtype)
+
+    def __str__(self) -> str:
+        self.sync_host()
+
+        return str(self.h_view)
+
+
+def get_written_args(workunit: Union[Callable, List[Callable]], args: Set[str]) -> Set[str]:
+    """
+    Get the view arguments a workunit writes to, using the same
+    analysis as kernel fusion
+
+    :param workunit: the workunit or list of fused workunits
+    :param args: the names of the arguments of interest
+    :returns: the names of the arguments written to
+    """
+
+    # avoid circular import with scoped import
+    from pykokkos.core.fusion.access_modes import AccessMode, get_view_access_modes
+    from pykokkos.core.module_setup import get_metadata
+
+    runtime = runtime_singleton.runtime
+    assert runtime is not None
+
+    workunits: List[Callable] = workunit if isinstance(workunit, list) else [workunit]
+    written: Set[str] = set()
+
+    for w in workunits:
+        if hasattr(w, "__self__"):
+            # functor workunits access their views through members,
+            # so the arguments cannot be traced and are assumed written
+            written |= args
+            continue
+
+        metadata = get_metadata(w)
+        cache_key: Tuple[str, str, FrozenSet[str]] = (metadata.path, metadata.name, frozenset(args))
+
+        if cache_key not in written_cache:
+            parser = runtime.compiler.get_parser(metadata.path)
+            node = parser.get_entity(metadata.name).AST
+            assert isinstance(node, ast.FunctionDef)
+            access_modes = get_view_access_modes(node, args)
+            written_cache[cache_key] = {
+                arg for arg, mode in access_modes.items()
+                if mode in {AccessMode.Write, AccessMode.ReadWrite}
+            }
+
+        written |= written_cache[cache_key]
+
+    return written
+
+
+def sync_dual_views(workunit: Union[Callable, List[Callable]], kwargs: Dict) -> List[DualView]:
+    """
+    Replace the DualViews passed to a workunit by their device sides,
+    syncing those first
+
+    :param workunit: the workunit being launched
+    :param kwargs: the keyword arguments passed to the workunit, updated in place
+    :returns: the DualViews the workunit writes to, to be marked as
+        modified on the device once it is launched
+    """
+
+    dual_views: Dict[str, DualView] = {k: v for k, v in kwargs.items() if isinstance(v, DualView)}
+    if len(dual_views) == 0:
+        return []
+
+    for k, v in dual_views.items():
+        v.sync_device()
+        kwargs[k] = v.d_view
+
+    written: Set[str] = get_written_args(workunit, set(dual_views))
+
+    return [v for k, v in dual_views.items() if k in written]
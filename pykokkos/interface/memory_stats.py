@@ -0,0 +1,317 @@
+import collections
+import os
+import sys
+import threading
+import weakref
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+# (memory space, dtype, label, call site) of an allocation
+AllocationKey = Tuple[str, str, str, Optional[str]]
+
+# files whose frames are skipped when looking for the allocating call site
+INTERNAL_FILES: Tuple[str, ...] = (
+    os.path.join("pykokkos", "interface", "views.py"),
+    os.path.join("pykokkos", "interface", "memory_stats.py"),
+)
+
+
+class MemoryTracker:
+    """
+    Records the allocations and frees of View memory while enabled
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.record_sites: bool = False
+        self.lock = threading.Lock()
+        # the ids of the native views freed since the counters were
+        # last updated. Frees run in weakref finalizers, which garbage
+        # collection can call on a thread already holding the lock, so
+        # they are queued without taking it.
+        self.pending_frees: collections.deque = collections.deque()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget all recorded allocations and counters
+        """
+
+        self.live: Dict[int, Tuple[AllocationKey, int]] = {}
+        self.current_bytes: int = 0
+        self.peak_bytes: int = 0
+        self.num_allocations: int = 0
+        self.num_frees: int = 0
+        self.pending_frees.clear()
+
+    def record_allocation(self, native: Any, nbytes: int, space: str, dtype: str, label: str) -> None:
+        """
+        Record an allocation, and its free once the native view is
+        garbage collected
+
+        :param native: the native view owning the memory
+        :param nbytes: the size of the allocation in bytes
+        :param space: the name of the memory space
+        :param dtype: the name of the data type
+        :param label: the label of the View
+        """
+
+        site: Optional[str] = get_call_site() if self.record_sites else None
+        key: AllocationKey = (space, dtype, label, site)
+
+        with self.lock:
+            # a freed native view's id can be reused by this one
+            self.apply_frees()
+            self.live[id(native)] = (key, nbytes)
+            self.current_bytes += nbytes
+            self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+            self.num_allocations += 1
+
+        weakref.finalize(native, self.record_free, id(native))
+
+    def record_free(self, native_id: int) -> None:
+        """
+        Record that the memory of a native view was released. The
+        counters are updated by the next call holding the lock.
+
+        :param native_id: the id of the native view
+        """
+
+        self.pending_frees.append(native_id)
+
+    def apply_frees(self) -> None:
+        """
+        Update the counters with the queued frees. The lock must be
+        held.
+        """
+
+        while len(self.pending_frees) > 0:
+            entry: Optional[Tuple[AllocationKey, int]] = self.live.pop(self.pending_frees.popleft(), None)
+            if entry is None:
+                # allocated before the last reset
+                continue
+
+            self.current_bytes -= entry[1]
+            self.num_frees += 1
+
+
+tracker = MemoryTracker()
+
+
+def get_dtype_name(dtype: Any) -> str:
+    """
+    Get the name of a View data type
+
+    :param dtype: a DataTypeClass subclass or DataType member
+    :returns: the name
+    """
+
+    return dtype.__name__ if isinstance(dtype, type) else dtype.name
+
+
+def get_call_site() -> Optional[str]:
+    """
+    Get the first frame outside of the View implementation
+
+    :returns: a "file:line (function)" string
+    """
+
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.endswith(INTERNAL_FILES):
+        frame = frame.f_back
+
+    if frame is None:
+        return None
+
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def enable_memory_tracking(record_sites: bool = False) -> None:
+    """
+    Start recording View allocations and frees, which memory_stats()
+    uses to report peak usage and allocation counts
+
+    :param record_sites: whether to also record the call site of each
+        allocation, which makes allocating noticeably slower
+    """
+
+    tracker.enabled = True
+    tracker.record_sites = record_sites
+
+
+def disable_memory_tracking() -> None:
+    """
+    Stop recording allocations and forget the recorded ones
+    """
+
+    tracker.enabled = False
+    tracker.record_sites = False
+    with tracker.lock:
+        tracker.reset()
+
+
+def reset_peak_memory() -> None:
+    """
+    Set the peak to the current number of bytes
+    """
+
+    with tracker.lock:
+        tracker.apply_frees()
+        tracker.peak_bytes = tracker.current_bytes
+
+
+@dataclass(frozen=True)
+class AllocationStat:
+    """
+    The live allocations sharing a memory space, dtype, label and site
+    """
+
+    space: str
+    dtype: str
+    label: str
+    site: Optional[str]
+    count: int
+    nbytes: int
+
+
+@dataclass(frozen=True)
+class AllocationDiff:
+    """
+    The change in live allocations between two snapshots
+    """
+
+    space: str
+    dtype: str
+    label: str
+    site: Optional[str]
+    count_diff: int
+    nbytes_diff: int
+
+
+class MemorySnapshot:
+    """
+    The live View allocations at one point in time
+    """
+
+    def __init__(self, groups: Dict[AllocationKey, Tuple[int, int]]):
+        """
+        MemorySnapshot constructor
+
+        :param groups: maps allocation keys to their count and bytes
+        """
+
+        self.groups: Dict[AllocationKey, Tuple[int, int]] = groups
+
+    @property
+    def nbytes(self) -> int:
+        return sum(nbytes for _, nbytes in self.groups.values())
+
+    def statistics(self) -> List[AllocationStat]:
+        """
+        Get the live allocations, largest first
+
+        :returns: a list of AllocationStat
+        """
+
+        stats = [AllocationStat(*key, count, nbytes) for key, (count, nbytes) in self.groups.items()]
+
+        return sorted(stats, key=lambda s: s.nbytes, reverse=True)
+
+    def diff(self, old: "MemorySnapshot") -> List[AllocationDiff]:
+        """
+        Compare to an older snapshot, e.g. to find leaked temporaries
+
+        :param old: the snapshot taken earlier
+        :returns: the groups that changed, largest change first
+        """
+
+        diffs: List[AllocationDiff] = []
+        for key in self.groups.keys() | old.groups.keys():
+            count, nbytes = self.groups.get(key, (0, 0))
+            old_count, old_nbytes = old.groups.get(key, (0, 0))
+            if count != old_count or nbytes != old_nbytes:
+                diffs.append(AllocationDiff(*key, count - old_count, nbytes - old_nbytes))
+
+        return sorted(diffs, key=lambda d: abs(d.nbytes_diff), reverse=True)
+
+
+def get_live_allocations() -> List[Tuple[AllocationKey, int]]:
+    """
+    Get the key and size of every live allocation, from the tracker if
+    it is enabled and from the live Views otherwise
+
+    :returns: a list of (key, bytes) tuples
+    """
+
+    if tracker.enabled:
+        with tracker.lock:
+            tracker.apply_frees()
+            return list(tracker.live.values())
+
+    # avoid circular import with scoped import
+    from .views import _view_registry, Trait
+
+    allocations: List[Tuple[AllocationKey, int]] = []
+    for view in list(_view_registry):
+        # unmanaged Views wrap memory owned by someone else
+        if view.trait is Trait.Unmanaged or getattr(view, "_storage_data", None) is None:
+            continue
+
+        key: AllocationKey = (view.space.name, get_dtype_name(view.dtype), view.label, None)
+        allocations.append((key, view._storage_data.nbytes))
+
+    return allocations
+
+
+def memory_snapshot() -> MemorySnapshot:
+    """
+    Take a snapshot of the live View allocations. Call sites are only
+    known if tracking was enabled with record_sites=True before the
+    allocations were made.
+
+    :returns: the snapshot
+    """
+
+    groups: Dict[AllocationKey, Tuple[int, int]] = {}
+    for key, nbytes in get_live_allocations():
+        count, total = groups.get(key, (0, 0))
+        groups[key] = (count + 1, total + nbytes)
+
+    return MemorySnapshot(groups)
+
+
+def memory_stats() -> Dict[str, Any]:
+    """
+    Get the memory held by Views. Peak usage and allocation counts are
+    only available while tracking is enabled (see
+    enable_memory_tracking()), otherwise they are None.
+
+    :returns: a dict with the current and peak bytes, the number of
+        live allocations, the number of allocations and frees, and the
+        current bytes by memory space, dtype and label (and call site
+        when recorded)
+    """
+
+    allocations: List[Tuple[AllocationKey, int]] = get_live_allocations()
+
+    breakdowns: Dict[str, Dict[Optional[str], int]] = {
+        "by_space": {}, "by_dtype": {}, "by_label": {}, "by_site": {}
+    }
+    for key, nbytes in allocations:
+        for breakdown, field in zip(breakdowns.values(), key):
+            breakdown[field] = breakdown.get(field, 0) + nbytes
+
+    if not (tracker.enabled and tracker.record_sites):
+        del breakdowns["by_site"]
+
+    stats: Dict[str, Any] = {
+        "current_bytes": sum(nbytes for _, nbytes in allocations),
+        "current_count": len(allocations),
+        "peak_bytes": tracker.peak_bytes if tracker.enabled else None,
+        "num_allocations": tracker.num_allocations if tracker.enabled else None,
+        "num_frees": tracker.num_frees if tracker.enabled else None,
+    }
+    stats.update(breakdowns)
+
+    return stats
@@ -7,9 +7,12 @@ import numpy as np
 from pykokkos.runtime import runtime_singleton
 import pykokkos.kokkos_manager as km
 
+from .accumulator import Acc
+from .dual_view import DualView, sync_dual_views
 from .execution_policy import ExecutionPolicy, RangePolicy
 from .execution_space import ExecutionSpace
-from .views import ViewType, array
+from .reducers import Reducer
+from .views import ViewType, array, from_dlpack
 
 from .interface_util import generic_error, get_filename, get_lineno
 
@@ -119,7 +122,9 @@ def check_workunit(workunit: Any) -> None:
 
 def convert_arrays(kwargs: Dict[str, Any]) -> None:
     """
-    Convert all numpy, cupy and pytorch ndarray objects into pk Views
+    Convert all numpy, cupy and pytorch ndarray objects into pk Views,
+    BitViews into the Views of their words, and LazyArrays into the
+    Views they evaluate to
 
     :param kwargs: the list of keyword arguments passed to the workunit
     """
@@ -139,21 +144,32 @@ def convert_arrays(kwargs: Dict[str, Any]) -> None:
     except ImportError:
         torch_available = False
 
+    # avoid circular import with scoped import
+    from pykokkos.lib.bitset import BitView
+    from pykokkos.lib.ufunc_engine import LazyArray
+
     for k, v in kwargs.items():
-        if isinstance(v, ViewType) or isinstance(v, np.generic):
+        if isinstance(v, (ViewType, DualView)) or isinstance(v, np.generic):
             continue
+        elif isinstance(v, BitView):
+            # workunits receive the packed words
+            kwargs[k] = v.words
+        elif isinstance(v, LazyArray):
+            kwargs[k] = v.compute()
         elif isinstance(v, np.ndarray):
             kwargs[k] = array(v)
         elif cp_available and isinstance(v, cp.ndarray):
             kwargs[k] = array(v)
         elif torch_available and torch.is_tensor(v):
-            kwargs[k] = array(v)
+            kwargs[k] = from_dlpack(v.detach())
+        elif hasattr(v, '__dlpack__'):
+            kwargs[k] = from_dlpack(v)
         elif hasattr(v, '__array__') or hasattr(v, '__cuda_array_interface__') or hasattr(v, '__array_interface__'):
             # This is some array-like object we don't support
             caller_frame = inspect.currentframe().f_back.f_back
             filename = get_filename(caller_frame)
             lineno = get_lineno(caller_frame)
-            msg = f"Type {type(v)} is not supported. Only numpy arrays, cupy arrays, and torch tensors are supported."
+            msg = f"Type {type(v)} is not supported. Only numpy arrays, cupy arrays, torch tensors and DLPack objects are supported."
             generic_error(filename, lineno, msg, "Conversion failed")
 
 
@@ -176,6 +192,7 @@ def parallel_for(*args, **kwargs) -> None:
     kwargs = dict(kwargs)
     convert_arrays(kwargs)
     handled_args: HandledArgs = handle_args(True, args)
+    written: List[DualView] = sync_dual_views(handled_args.workunit, kwargs)
 
     runtime_singleton.runtime.run_workunit(
         handled_args.name,
@@ -184,6 +201,9 @@ def parallel_for(*args, **kwargs) -> None:
         "for",
         **kwargs)
 
+    for dual_view in written:
+        dual_view.modify_device()
+
 
 def reduce_body(operation: str, *args, **kwargs) -> Union[float, int]:
     """
@@ -194,6 +214,15 @@ def reduce_body(operation: str, *args, **kwargs) -> Union[float, int]:
     """
 
     kwargs = dict(kwargs)
+    reducer: Optional[Union[type, Tuple[type, ...]]] = kwargs.pop("reducer", None) if operation == "reduce" else None
+    if isinstance(reducer, tuple):
+        # one per accumulator, pk.Acc keeping the sum
+        for r in reducer:
+            if not (isinstance(r, type) and issubclass(r, Acc)):
+                raise TypeError(f"ERROR: {r} is not a reducer, e.g. pk.Max, or pk.Acc")
+    elif reducer is not None and not (isinstance(reducer, type) and issubclass(reducer, Reducer)):
+        raise TypeError(f"ERROR: {reducer} is not a reducer, e.g. pk.Max")
+
     convert_arrays(kwargs)
     args_to_hash: List = []
     args_not_to_hash: Dict = {}
@@ -209,6 +238,7 @@ def reduce_body(operation: str, *args, **kwargs) -> Union[float, int]:
             break
 
     args_to_hash.append(operation)
+    args_to_hash.append(reducer)
 
     to_hash = frozenset(args_to_hash)
     cache_key: int = hash(to_hash)
@@ -219,14 +249,30 @@ def reduce_body(operation: str, *args, **kwargs) -> Union[float, int]:
         return func(**args)
 
     handled_args: HandledArgs = handle_args(True, args)
+    written: List[DualView] = sync_dual_views(handled_args.workunit, kwargs)
 
-    return runtime_singleton.runtime.run_workunit(
+    result = runtime_singleton.runtime.run_workunit(
         handled_args.name,
         handled_args.policy,
         handled_args.workunit,
         operation,
+        reducer=reducer,
         **kwargs)
 
+    for dual_view in written:
+        dual_view.modify_device()
+
+    if handled_args.view is not None:
+        # the result goes to a 0-D view, e.g. to be used as an input
+        # of another kernel without converting it to a Python scalar
+        if handled_args.view.size != 1:
+            raise ValueError(f"ERROR: the result of a {operation} can only be stored in a 0-D view, got shape {handled_args.view.shape}")
+        if isinstance(result, tuple):
+            raise ValueError(f"ERROR: the result of a {operation} with several values cannot be stored in a 0-D view")
+        handled_args.view.fill(result)
+
+    return result
+
 
 def parallel_reduce(*args, **kwargs) -> Union[float, int]:
     """
@@ -239,10 +285,17 @@ def parallel_reduce(*args, **kwargs) -> Union[float, int]:
             integer representing the number of threads
         :param workunit: the workunit to be run in parallel
         :param initial_value: (optional) the initial value of the
-            reduction
+            reduction, or a 0-D view the result is also stored in
 
     :param **kwargs: the keyword arguments passed to a standalone
-        workunit
+        workunit, and optionally reducer, e.g. pk.Max, to join the
+        values of the threads of an unannotated accumulator, whose
+        body updates it as the reducer does, or a tuple with one
+        reducer (or pk.Acc) per accumulator
+    :returns: the result, or a tuple of the members of the value of
+        reducers such as pk.MinLoc, e.g. (val, loc). A workunit with
+        several accumulators is run as a single reduction returning a
+        tuple with the result of each accumulator
     """
 
     return reduce_body("reduce", *args, **kwargs)
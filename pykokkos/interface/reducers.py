@@ -0,0 +1,91 @@
+from typing import Dict, List, Tuple, Type, TypeVar
+
+from .accumulator import Acc
+
+T = TypeVar("T")
+
+
+class Reducer(Acc[T]):
+    """
+    An accumulator that joins the values of the threads of a
+    parallel_reduce with the Kokkos reducer of the same name instead
+    of summing them. The accumulator of each thread starts at the
+    identity of the reducer, e.g. the lowest value for Max, and the
+    workunit updates it in place:
+
+        @pk.workunit
+        def peak(i: int, acc: pk.Max[pk.double], x: pk.View1D[pk.double]):
+            if x[i] > acc:
+                acc = x[i]
+    """
+
+    # the members of the Kokkos value type of the reducer, returned as a
+    # tuple by parallel_reduce, or () if the value is a scalar
+    fields: Tuple[str, ...] = ()
+
+    # the Kokkos value type when it is not a scalar
+    value_type: str = ""
+
+    # whether the value type also holds int64 locations
+    indexed: bool = False
+
+
+class Prod(Reducer[T]):
+    """Product of the values"""
+
+
+class Min(Reducer[T]):
+    """Minimum of the values"""
+
+
+class Max(Reducer[T]):
+    """Maximum of the values"""
+
+
+class LAnd(Reducer[T]):
+    """Logical and of the values"""
+
+
+class LOr(Reducer[T]):
+    """Logical or of the values"""
+
+
+class MinMax(Reducer[T]):
+    """Minimum and maximum of the values, in acc.min_val and acc.max_val"""
+
+    fields = ("min_val", "max_val")
+    value_type = "MinMaxScalar"
+
+
+class MinLoc(Reducer[T]):
+    """Minimum of the values and its location, in acc.val and acc.loc"""
+
+    fields = ("val", "loc")
+    value_type = "ValLocScalar"
+    indexed = True
+
+
+class MaxLoc(Reducer[T]):
+    """Maximum of the values and its location, in acc.val and acc.loc"""
+
+    fields = ("val", "loc")
+    value_type = "ValLocScalar"
+    indexed = True
+
+
+class MinMaxLoc(Reducer[T]):
+    """
+    Minimum and maximum of the values and their locations, in
+    acc.min_val, acc.max_val, acc.min_loc and acc.max_loc
+    """
+
+    fields = ("min_val", "max_val", "min_loc", "max_loc")
+    value_type = "MinMaxLocScalar"
+    indexed = True
+
+
+# maps the names used in annotations to the reducers
+reducer_types: List[Type[Reducer]] = [
+    Prod, Min, Max, LAnd, LOr, MinMax, MinLoc, MaxLoc, MinMaxLoc
+]
+reducers: Dict[str, Type[Reducer]] = {r.__name__: r for r in reducer_types}
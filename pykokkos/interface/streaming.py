@@ -0,0 +1,414 @@
+import operator
+import os
+import queue
+import threading
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional,
+    Tuple, Union
+)
+
+import numpy as np
+
+from pykokkos.runtime import runtime_singleton
+
+from .data_types import DataTypeClass
+from .execution_policy import RangePolicy
+from .parallel_dispatch import parallel_for, parallel_reduce
+from .views import ViewType, _get_np_dtype, from_numpy
+
+# default number of bytes per chunk when chunk_size is not given
+DEFAULT_CHUNK_BYTES: int = 64 << 20
+
+
+class ChunkStream:
+    """
+    Iterates over a source too large to be resident in memory in
+    chunks along its first dimension. The next chunk is read on a
+    background thread while the current one is being processed, so
+    that reading and computing overlap (double buffering).
+    """
+
+    def __init__(
+        self,
+        source: Union[str, os.PathLike, np.ndarray, ViewType, Iterable],
+        chunk_size: Optional[int] = None,
+        *,
+        dtype: Union[DataTypeClass, type, str] = np.float64,
+        row_shape: Tuple[int, ...] = (),
+        num_buffers: int = 2
+    ):
+        """
+        ChunkStream constructor
+
+        :param source: a path to a raw binary file, an array (e.g. an
+            np.memmap), a View, or an iterable yielding numpy arrays
+        :param chunk_size: the number of rows (entries along the first
+            dimension) per chunk. Ignored for iterables, whose chunks
+            are used as they come. Defaults to about 64MB per chunk
+        :param dtype: the data type of a file source
+        :param row_shape: the shape of one row of a file source, e.g.
+            (3,) for a file holding an (N, 3) array
+        :param num_buffers: the number of chunks in flight, i.e. the
+            one being processed plus those prefetched
+        """
+
+        if num_buffers < 2:
+            raise ValueError(f"ERROR: at least 2 buffers are needed for prefetching, got {num_buffers}")
+
+        resolved: Any = source
+        if isinstance(source, (str, os.PathLike)):
+            resolved = np.memmap(source, dtype=_get_np_dtype(dtype), mode="r").reshape((-1, *row_shape))
+        elif isinstance(source, ViewType):
+            resolved = getattr(source, "xp_array", source.data)
+
+        self.num_buffers: int = num_buffers
+        self.source: Any = resolved
+        # the source when it is an array, which is read in chunks of
+        # chunk_size rows into preallocated buffers
+        self.array: Optional[np.ndarray] = resolved if isinstance(resolved, np.ndarray) else None
+        self.is_array: bool = self.array is not None
+
+        self.buffers: List[np.ndarray] = []
+        self.views: List[ViewType] = []
+        self.chunk_size: Optional[int] = chunk_size
+        self.num_rows: int = 0
+
+        if self.array is not None:
+            shape: Tuple[int, ...] = self.array.shape
+            if len(shape) == 0:
+                raise ValueError("ERROR: cannot stream a 0-D array")
+            self.num_rows = shape[0]
+
+            np_dtype: np.dtype = _get_np_dtype(self.array.dtype)
+            row_nbytes: int = max(1, np_dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64)))
+            rows: int = chunk_size if chunk_size is not None else max(1, DEFAULT_CHUNK_BYTES // row_nbytes)
+            rows = min(rows, max(1, self.num_rows))
+
+            # Each buffer is wrapped by a single View for its whole
+            # lifetime so that repeated kernel launches hit the
+            # workunit cache
+            for _ in range(num_buffers):
+                buffer = np.empty((rows, *shape[1:]), dtype=np_dtype)
+                self.buffers.append(buffer)
+                self.views.append(from_numpy(buffer))
+
+            self.chunk_size = rows
+
+    def __len__(self) -> int:
+        """
+        Get the number of chunks of an array source
+
+        :returns: the number of chunks
+        """
+
+        if self.array is None or self.chunk_size is None:
+            raise TypeError("ERROR: the number of chunks of an iterable source is unknown")
+
+        return -(-self.num_rows // self.chunk_size)
+
+    def _read(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Read the source chunk by chunk
+
+        :returns: an iterator of (first row, chunk) tuples
+        """
+
+        if self.array is not None and self.chunk_size is not None:
+            for start in range(0, self.num_rows, self.chunk_size):
+                yield start, self.array[start:start + self.chunk_size]
+        else:
+            row: int = 0
+            for chunk in self.source:
+                yield row, chunk
+                row += len(chunk)
+
+    def _fill(self, index: int, chunk: Any) -> ViewType:
+        """
+        Copy a chunk into a buffer and get the View wrapping it
+
+        :param index: the index of the buffer to fill
+        :param chunk: the chunk read from the source
+        :returns: the View holding the chunk
+        """
+
+        if not self.is_array:
+            if isinstance(chunk, ViewType):
+                return chunk
+            return from_numpy(np.ascontiguousarray(chunk))
+
+        buffer: np.ndarray = self.buffers[index]
+        rows: int = chunk.shape[0]
+        # reading the chunk here is what pages a memmap in
+        np.copyto(buffer[:rows], chunk, casting="unsafe")
+
+        if rows == self.chunk_size:
+            return self.views[index]
+
+        return from_numpy(buffer[:rows])
+
+    def _produce(self, free: queue.Queue, ready: queue.Queue, stop: threading.Event) -> None:
+        """
+        Fill free buffers with the next chunks until the source is
+        exhausted, running on the background thread
+
+        :param free: the indices of the buffers that can be filled
+        :param ready: the filled chunks, followed by None at the end
+            or the exception raised while reading
+        :param stop: set when the consumer stops iterating early
+        """
+
+        try:
+            for start, chunk in self._read():
+                index: Optional[int] = None
+                while index is None:
+                    if stop.is_set():
+                        return
+                    try:
+                        index = free.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+
+                ready.put((start, self._fill(index, chunk), index))
+
+        except BaseException as e:
+            ready.put(e)
+            return
+
+        ready.put(None)
+
+    def __iter__(self) -> Iterator[Tuple[int, ViewType]]:
+        """
+        Iterate over the chunks. A chunk's View is only valid until
+        the next one is requested, as its buffer is then refilled.
+
+        :returns: an iterator of (first row, View) tuples
+        """
+
+        free: queue.Queue = queue.Queue()
+        ready: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        for index in range(self.num_buffers):
+            free.put(index)
+
+        producer = threading.Thread(target=self._produce, args=(free, ready, stop), daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = ready.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                start, view, index = item
+                yield start, view
+
+                # kernels may still be pending in the fusion trace, run
+                # them before their input gets overwritten
+                if "PK_FUSION" in os.environ:
+                    runtime = runtime_singleton.runtime
+                    assert runtime is not None
+                    runtime.flush_data(view)
+                free.put(index)
+        finally:
+            stop.set()
+            producer.join()
+
+
+def _get_stream(source: Any, chunk_size: Optional[int]) -> ChunkStream:
+    """
+    Wrap a source in a ChunkStream if it is not one already
+
+    :param source: the source passed to a stream_* function
+    :param chunk_size: the number of rows per chunk
+    :returns: the ChunkStream
+    """
+
+    if isinstance(source, ChunkStream):
+        return source
+
+    return ChunkStream(source, chunk_size)
+
+
+def _get_output_views(outputs: Optional[Dict[str, Any]], start: int, rows: int) -> Dict[str, ViewType]:
+    """
+    Get the Views over the rows of the outputs matching a chunk
+
+    :param outputs: maps workunit arguments to arrays with the same
+        number of rows as the source
+    :param start: the first row of the chunk
+    :param rows: the number of rows in the chunk
+    :returns: maps workunit arguments to Views
+    """
+
+    if outputs is None:
+        return {}
+
+    return {k: from_numpy(v[start:start + rows]) for k, v in outputs.items()}
+
+
+def _check_outputs(outputs: Optional[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Check that outputs can be written to chunk by chunk in place
+
+    :param outputs: maps workunit arguments to arrays or Views
+    :returns: maps workunit arguments to the host arrays
+    """
+
+    checked: Dict[str, np.ndarray] = {}
+    if outputs is None:
+        return checked
+
+    for k, v in outputs.items():
+        if isinstance(v, ViewType):
+            v = v.xp_array if hasattr(v, "xp_array") else v.data
+        if not isinstance(v, np.ndarray) or not v.flags["C_CONTIGUOUS"]:
+            raise ValueError(f"ERROR: output {k} must be a C-contiguous host array")
+        checked[k] = v
+
+    return checked
+
+
+def stream_for(
+    source: Any,
+    workunit: Callable,
+    *,
+    arg: str,
+    outputs: Optional[Dict[str, Any]] = None,
+    offset_arg: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    name: Optional[str] = None,
+    **kwargs
+) -> None:
+    """
+    Run a parallel for over every row of a source, one chunk at a time
+
+    :param source: a ChunkStream or anything accepted by ChunkStream
+    :param workunit: the workunit, run with a RangePolicy over the rows
+        of each chunk
+    :param arg: the name of the workunit argument receiving the chunk
+    :param outputs: maps workunit arguments to arrays (e.g. writable
+        memmaps) with the same number of rows as the source; each gets
+        the rows matching the chunk
+    :param offset_arg: the name of an int workunit argument receiving
+        the index of the first row of the chunk
+    :param chunk_size: the number of rows per chunk
+    :param name: the name of the kernel
+    :param **kwargs: the other arguments passed to the workunit
+    """
+
+    stream: ChunkStream = _get_stream(source, chunk_size)
+    checked: Dict[str, np.ndarray] = _check_outputs(outputs)
+
+    for start, view in stream:
+        rows: int = view.shape[0]
+        kwargs[arg] = view
+        kwargs.update(_get_output_views(checked, start, rows))
+        if offset_arg is not None:
+            kwargs[offset_arg] = start
+
+        parallel_for(name, RangePolicy(0, rows), workunit, **kwargs)
+
+
+def stream_reduce(
+    source: Any,
+    workunit: Callable,
+    *,
+    arg: str,
+    combine: Callable[[Any, Any], Any] = operator.add,
+    initial: Optional[Union[int, float]] = None,
+    offset_arg: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    name: Optional[str] = None,
+    **kwargs
+) -> Union[int, float]:
+    """
+    Run a parallel reduction over every row of a source, one chunk at
+    a time, and combine the partial results of the chunks
+
+    :param source: a ChunkStream or anything accepted by ChunkStream
+    :param workunit: the reduction workunit, run with a RangePolicy
+        over the rows of each chunk
+    :param arg: the name of the workunit argument receiving the chunk
+    :param combine: combines two partial results, e.g. operator.add
+        for sums or max for maxima
+    :param initial: (optional) the value the partial results are
+        combined into, required for an empty source
+    :param offset_arg: the name of an int workunit argument receiving
+        the index of the first row of the chunk
+    :param chunk_size: the number of rows per chunk
+    :param name: the name of the kernel
+    :param **kwargs: the other arguments passed to the workunit
+    :returns: the combined result
+    """
+
+    stream: ChunkStream = _get_stream(source, chunk_size)
+    result: Optional[Union[int, float]] = initial
+
+    for start, view in stream:
+        kwargs[arg] = view
+        if offset_arg is not None:
+            kwargs[offset_arg] = start
+
+        partial = parallel_reduce(name, RangePolicy(0, view.shape[0]), workunit, **kwargs)
+        result = partial if result is None else combine(result, partial)
+
+    if result is None:
+        raise ValueError("ERROR: cannot reduce an empty source without an initial value")
+
+    return result
+
+
+def stream_map(
+    source: Any,
+    func: Callable[[ViewType], Any],
+    *,
+    out: Optional[Any] = None,
+    combine: Optional[Callable[[Any, Any], Any]] = None,
+    chunk_size: Optional[int] = None
+) -> Any:
+    """
+    Apply a function built from pykokkos operations (e.g. a ufunc
+    pipeline such as lambda x: pk.exp(pk.negative(x))) to every chunk
+    of a source
+
+    :param source: a ChunkStream or anything accepted by ChunkStream
+    :param func: called with the View of each chunk
+    :param out: (optional) an array with the same number of rows as
+        the source that the results of the chunks are written to
+    :param combine: (optional) combines the results of two chunks,
+        for functions that reduce their chunk, e.g. pk.sum
+    :param chunk_size: the number of rows per chunk
+    :returns: out, or the combined result
+    """
+
+    if (out is None) == (combine is None):
+        raise ValueError("ERROR: exactly one of out and combine must be given")
+
+    stream: ChunkStream = _get_stream(source, chunk_size)
+    host_out: Optional[np.ndarray] = _check_outputs({"out": out})["out"] if out is not None else None
+    result: Any = None
+    has_result: bool = False
+
+    for start, view in stream:
+        chunk_result = func(view)
+
+        if host_out is not None:
+            rows: int = view.shape[0]
+            host_out[start:start + rows] = np.asarray(chunk_result)
+        elif has_result:
+            assert combine is not None
+            result = combine(result, chunk_result)
+        else:
+            result = chunk_result
+            has_result = True
+
+    if host_out is not None:
+        return out
+
+    if not has_result:
+        raise ValueError("ERROR: cannot combine the results of an empty source")
+
+    return result
@@ -1,13 +1,15 @@
 from __future__ import annotations
+import contextlib
 import ctypes
-import importlib
 import math
+import mmap
 from enum import Enum
 import os
 import sys
 from types import ModuleType
+import weakref
 from typing import (
-    Dict, Generic, Iterator, List, Optional,
+    Any, Dict, Generic, Iterator, List, Optional,
     Tuple, TypeVar, Union
 )
 
@@ -26,15 +28,134 @@ from .data_types import (
     uint8,
     uint16, uint32, uint64,
     double, float32, float64,
+    float16, bfloat16,
     complex64, complex128
 )
 from .data_types import float as pk_float
 from .layout import get_default_layout, Layout
+from .memory_stats import get_dtype_name, tracker as memory_tracker
 from .memory_space import get_default_memory_space, MemorySpace
 from .hierarchical import TeamMember
 
 ARRAY_REQ_ATTR = ["dtype", "data", "shape", "flags"]
 
+# maximum number of native subviews cached per View
+SUBVIEW_CACHE_SIZE: int = 256
+
+# factor by which the capacity of a View grows when it runs out
+VIEW_GROWTH_FACTOR: float = 2.0
+
+# all live Views, released before Kokkos is finalized
+_view_registry: weakref.WeakSet = weakref.WeakSet()
+
+# native view classes by (module, rank, dtype, space, layout, trait)
+_view_type_cache: Dict[Tuple, type] = {}
+
+
+def _get_view_type(kokkos_lib: ModuleType, rank: int, dtype: DataTypeClass, space: MemorySpace, layout: Layout, trait: Trait) -> type:
+    """
+    Get the native view class for the given template arguments,
+    resolving it through the bindings only once
+
+    :param kokkos_lib: the kokkos module holding the class
+    :param rank: the rank of the view
+    :param dtype: the data type of the view
+    :param space: the memory space of the view
+    :param layout: the layout of the view
+    :param trait: the memory trait of the view
+    :returns: the native view class
+    """
+
+    key: Tuple = (kokkos_lib, rank, dtype, space, layout, trait)
+    view_type: Optional[type] = _view_type_cache.get(key)
+    if view_type is None:
+        view_type = kokkos_lib.get_array_type(rank, dtype.value, space.value, layout.value, trait.value)
+        _view_type_cache[key] = view_type
+
+    return view_type
+
+
+def _get_native_data(native: Any, dtype: DataTypeClass) -> np.ndarray:
+    """
+    Get the numpy array over the memory of a native view
+
+    :param native: the native view
+    :param dtype: the data type of the view
+    :returns: the numpy array, reinterpreted as bfloat16 if numpy
+        only sees its raw bits
+    """
+
+    data: np.ndarray = np.asarray(native)
+    if dtype is bfloat16 and data.dtype != bfloat16.np_equiv:
+        data = data.view(bfloat16.np_equiv)
+
+    return data
+
+
+def _to_bfloat16_bits(value: Any) -> np.ndarray:
+    """
+    Round values to the raw bits of the nearest bfloat16, the upper
+    half of their float32 bits, for views whose data numpy only sees as
+    uint16
+
+    :param value: a scalar or array of values
+    :returns: the bits as uint16
+    """
+
+    floats: np.ndarray = np.asarray(value, dtype=np.float32)
+    bits: np.ndarray = floats.view(np.uint32).astype(np.uint64)
+
+    # round to nearest, ties to even, keeping NaNs quiet rather than
+    # rounding them to infinity
+    rounded: np.ndarray = (bits + 0x7FFF + ((bits >> 16) & 1)) >> 16
+    rounded = np.where(np.isnan(floats), (bits >> 16) | 0x40, rounded)
+
+    return rounded.astype(np.uint16)
+
+
+def _from_bfloat16_bits(bits: Any) -> Union[np.ndarray, np.float32]:
+    """
+    Convert the raw bits of bfloat16 values to float32
+
+    :param bits: a scalar or array of uint16 bits
+    :returns: the float32 values
+    """
+
+    return (np.asarray(bits, dtype=np.uint32) << 16).view(np.float32)
+
+
+def _is_full_key(key: Any) -> bool:
+    """
+    Whether an index selects every element, e.g. view[:] or view[...]
+
+    :param key: the index passed to __setitem__
+    :returns: True if the key is made of full slices and ellipses only
+    """
+
+    if not isinstance(key, tuple):
+        key = (key,)
+
+    return all(k is Ellipsis or (isinstance(k, slice) and k == slice(None)) for k in key)
+
+def _get_scalar_view(value: Union[bool, int, float]) -> "ViewType":
+    """
+    Wrap a Python scalar in a 0-D View, e.g. to compare a View to it.
+    Integers get the smallest type holding them, unsigned first.
+
+    :param value: the scalar
+    :returns: an unmanaged 0-D View holding the value
+    """
+
+    np_dtype: np.dtype
+    if isinstance(value, bool):
+        np_dtype = np.bool_
+    elif isinstance(value, int):
+        np_dtype = np.min_scalar_type(value)
+    else:
+        np_dtype = np.float64
+
+    return from_numpy(np.array(value, dtype=np_dtype))
+
 class Trait(Enum):
     Atomic = kokkos.Atomic
     TraitDefault = None
@@ -66,6 +187,8 @@ class ViewType:
     Base class of all view types. Implements methods needed for container objects and some Kokkos specific methods.
     """
 
+    __slots__ = ("data", "shape", "dtype", "space", "layout", "trait", "size", "ndim", "xp_array", "__weakref__")
+
     data: np.ndarray
     shape: Tuple[int]
     dtype: DataType
@@ -107,14 +230,135 @@ class ViewType:
         :param value: the scalar value
         """
 
+        if "PK_FUSION" in os.environ:
+            runtime_singleton.runtime.flush_data(self)
+
         if isinstance(value, (complex, complex64, complex128)):
             value = np.complex64(value.real, value.imag) if self.dtype is complex64 else np.complex128(value.real, value.imag)
+        elif self.trait is not Trait.Unmanaged and self.trait is not Trait.Atomic and not isinstance(self, Subview):
+            # Kokkos::deep_copy fills in parallel on the execution space
+            # of the view, so that each page is first touched by the
+            # thread that will use it (NUMA placement with OpenMP)
+            # the native bfloat16 fill converts Python floats
+            self.array.fill(float(value) if self.dtype is bfloat16 else self.data.dtype.type(value).item())
+            return
+
+        if self._holds_bfloat16_bits():
+            value = _to_bfloat16_bits(value)
 
         if self.trait is Trait.Unmanaged:
             self.xp_array.fill(value)
         else:
             self.data.fill(value)
 
+    def _holds_bfloat16_bits(self) -> bool:
+        """
+        Whether the data is bfloat16 whose raw bits numpy sees as uint16,
+        without ml_dtypes
+
+        :returns: True if the values have to be converted when written or read
+        """
+
+        return self.dtype is bfloat16 and self.data.dtype == np.uint16
+
+    def _host_array(self):
+        """
+        Get the array the bulk accessors work on, running the pending
+        kernels that use the View first
+
+        :returns: the wrapped numpy/cupy array for unmanaged views and
+            the numpy wrapper of the Kokkos allocation otherwise
+        """
+
+        if "PK_FUSION" in os.environ:
+            runtime_singleton.runtime.flush_data(self)
+
+        return self.xp_array if self.trait is Trait.Unmanaged else self.data
+
+    def read(self, indices: Any = ...) -> np.ndarray:
+        """
+        Read a block of elements at once, without the per-element
+        checks of the indexing operator
+
+        :param indices: any numpy index, e.g. a slice, a tuple of
+            slices or an integer array. Reads every element by default
+        :returns: a numpy array holding a copy of the elements
+        """
+
+        values = self._host_array()[indices]
+        if hasattr(values, "get"):
+            # cupy array
+            values = values.get()
+        if self._holds_bfloat16_bits():
+            return _from_bfloat16_bits(values)
+
+        return np.array(values, copy=True)
+
+    def write(self, indices: Any, values: Any) -> None:
+        """
+        Write a block of elements at once, without the per-element
+        checks of the indexing operator
+
+        :param indices: any numpy index, e.g. a slice, a tuple of
+            slices or an integer array
+        :param values: a scalar or an array broadcastable to the
+            selected elements
+        """
+
+        arr = self._host_array()
+        if self._holds_bfloat16_bits():
+            # the raw bits of Views of the same dtype are copied as they are
+            if isinstance(values, ViewType) and values._holds_bfloat16_bits():
+                values = values._host_array()
+            else:
+                values = _to_bfloat16_bits(values.read() if isinstance(values, ViewType) else values)
+
+        if hasattr(arr, "get"):
+            # cupy array
+            import cupy as cp
+            values = cp.asarray(values)
+        elif isinstance(values, ViewType):
+            values = values._host_array()
+
+        arr[indices] = values
+
+    @contextlib.contextmanager
+    def host_access(self, readonly: bool = False) -> Iterator[np.ndarray]:
+        """
+        Access the whole View as a numpy array, e.g. for host-side loops.
+        Pending kernels are run once on entry. Views in device memory
+        are copied to the host on entry and back on exit.
+
+        :param readonly: whether the array is only read, which makes it
+            non-writeable and skips copying it back
+        :returns: a context manager yielding the numpy array
+        """
+
+        arr = self._host_array()
+        is_device: bool = hasattr(arr, "get")
+        host: np.ndarray = arr.get() if is_device else arr
+
+        # bfloat16 bits are accessed as float32 values, which are
+        # converted back on exit
+        is_bits: bool = self._holds_bfloat16_bits()
+        if is_bits:
+            host = _from_bfloat16_bits(host)
+
+        if readonly:
+            host = host.view()
+            host.flags.writeable = False
+
+        try:
+            yield host
+        finally:
+            if not readonly and is_bits:
+                if is_device:
+                    arr.set(_to_bfloat16_bits(host))
+                else:
+                    arr[...] = _to_bfloat16_bits(host)
+            elif is_device and not readonly:
+                arr.set(host)
+
     def __getitem__(self, key: Union[int, TeamMember, slice, Tuple]) -> Union[int, float, Subview]:
         """
         Overloads the indexing operator accessing the View
@@ -127,7 +371,7 @@ class ViewType:
             runtime_singleton.runtime.flush_data(self)
 
         if self.shape == () and key == 0:
-            return self.data
+            return _from_bfloat16_bits(self.data) if self._holds_bfloat16_bits() else self.data
 
         if isinstance(key, int) or isinstance(key, TeamMember):
             if self.trait is Trait.Unmanaged:
@@ -135,7 +379,9 @@ class ViewType:
             else:
                 return_val = self.data[key]
 
-            if self.dtype is complex64:
+            if self._holds_bfloat16_bits():
+                return_val = _from_bfloat16_bits(return_val)
+            elif self.dtype is complex64:
                 return_val = complex64(return_val.real, return_val.imag)
             elif self.dtype is complex128:
                 return_val = complex128(return_val.real, return_val.imag)
@@ -158,12 +404,22 @@ class ViewType:
         :param value: the new value at the index.
         """
 
+        if _is_full_key(key) and isinstance(value, (int, float, complex, np.generic, complex64, complex128)):
+            self.fill(value)
+            return
+
         if "PK_FUSION" in os.environ:
             runtime_singleton.runtime.flush_data(self)
 
         if isinstance(value, (complex, complex64, complex128)):
             value = np.complex64(value.real, value.imag) if self.dtype is complex64 else np.complex128(value.real, value.imag)
 
+        if self.ndim == 0 and (key == 0 or _is_full_key(key)):
+            key = ...
+
+        if self._holds_bfloat16_bits() and not isinstance(value, ViewType):
+            value = _to_bfloat16_bits(value)
+
         if self.trait is Trait.Unmanaged:
             self.xp_array[key] = value
         else:
@@ -203,6 +459,8 @@ class ViewType:
             runtime_singleton.runtime.flush_data(self)
 
         if self.data.ndim > 0:
+            if self._holds_bfloat16_bits():
+                return (n for n in _from_bfloat16_bits(self._host_array()))
             if self.trait is Trait.Unmanaged:
                 return (n for n in self.xp_array)
             return (n for n in self.data)
@@ -220,6 +478,9 @@ class ViewType:
         if "PK_FUSION" in os.environ:
             runtime_singleton.runtime.flush_data(self)
 
+        if self._holds_bfloat16_bits():
+            return str(_from_bfloat16_bits(self._host_array()))
+
         if self.trait is Trait.Unmanaged:
             return str(self.xp_array)
 
@@ -232,6 +493,45 @@ class ViewType:
 
         return self
 
+    def _dlpack_source(self):
+        """
+        Get the array object whose memory backs this view, i.e. the
+        wrapped numpy/cupy array for unmanaged views and the numpy
+        wrapper of the Kokkos allocation otherwise
+
+        :returns: an array object implementing the DLPack protocol
+        """
+
+        if "PK_FUSION" in os.environ:
+            runtime_singleton.runtime.flush_data(self)
+
+        source = self.xp_array if self.trait is Trait.Unmanaged else self.data
+        if self.shape == () and source.shape != ():
+            # 0-D views are backed by a single element allocation
+            source = source.reshape(())
+
+        return source
+
+    def __dlpack__(self, **kwargs):
+        """
+        Export the view through the DLPack protocol without copying
+
+        :param kwargs: the keyword arguments of the DLPack protocol
+            (stream, max_version, dl_device, copy)
+        :returns: a PyCapsule containing the DLPack tensor
+        """
+
+        return self._dlpack_source().__dlpack__(**kwargs)
+
+    def __dlpack_device__(self) -> Tuple[int, int]:
+        """
+        Get the DLPack device type and id of the memory backing the view
+
+        :returns: a (device_type, device_id) tuple
+        """
+
+        return self._dlpack_source().__dlpack_device__()
+
 
     def _scalarfunc(self, func):
         if "PK_FUSION" in os.environ:
@@ -258,16 +558,61 @@ class ViewType:
         return self._scalarfunc(int)
 
 
+    def _inplace_ufunc(self, ufunc_name: str, other) -> "ViewType":
+        """
+        Apply a binary ufunc with this view as the left operand and the
+        output, which launches a single kernel and allocates nothing
+
+        :param ufunc_name: the name of the ufunc in pykokkos.lib.ufuncs
+        :param other: the right operand, a view or a scalar
+        :returns: this view
+        """
+
+        # avoid circular import with scoped import
+        from pykokkos.lib import ufuncs
+        getattr(ufuncs, ufunc_name)(self, other, out=self)
+
+        return self
+
+
+    def __iadd__(self, other):
+        return self._inplace_ufunc("add", other)
+
+
+    def __isub__(self, other):
+        return self._inplace_ufunc("subtract", other)
+
+
+    def __imul__(self, other):
+        return self._inplace_ufunc("multiply", other)
+
+
+    def __itruediv__(self, other):
+        return self._inplace_ufunc("divide", other)
+
+
+    def __ifloordiv__(self, other):
+        return self._inplace_ufunc("floor_divide", other)
+
+
+    def __ipow__(self, other):
+        return self._inplace_ufunc("power", other)
+
+
 class View(ViewType):
+    __slots__ = ("_array", "orig_array", "label", "capacity", "_storage_array", "_storage_data", "_subview_cache")
+
     def __init__(
         self,
-        shape: Union[List[int], Tuple[int]],
-        dtype: Union[DataTypeClass, type] = real,
+        shape: Union[List[int], Tuple[int, ...]],
+        dtype: Union[DataType, DataTypeClass, type] = real,
         space: MemorySpace = MemorySpace.MemorySpaceDefault,
         layout: Layout = Layout.LayoutDefault,
         trait: Trait = Trait.TraitDefault,
         array: Optional[np.ndarray] = None,
-        cp_array = None
+        cp_array = None,
+        initialize: bool = True,
+        label: str = ""
     ):
         """
         View constructor.
@@ -279,16 +624,46 @@ class View(ViewType):
         :param trait: the memory trait of the view
         :param array: the numpy array if trait is Unmanaged
         :param cp_array: the cupy array if trait is Unmanaged
+        :param initialize: whether to zero-fill the allocation. Passing
+            False skips the fill (Kokkos::WithoutInitializing), leaving
+            the contents undefined until they are written.
+        :param label: the label of the allocation, shown by
+            memory_stats() and Kokkos tools
+        """
+
+        self.label: str = label
+        self._init_view(shape, dtype, space, layout, trait, array, cp_array, initialize)
+        _view_registry.add(self)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, os.PathLike],
+        shape: Union[int, Tuple[int, ...]],
+        dtype: Union[DataTypeClass, type, str] = float64,
+        mode: str = "r",
+        offset: int = 0,
+        layout: Layout = Layout.LayoutRight
+    ) -> ViewType:
+        """
+        Create a View backed by a memory-mapped binary file (see
+        memmap())
+
+        :param path: the path of the file holding the raw array data
+        :param shape: the shape of the view
+        :param dtype: the data type of the view
+        :param mode: "r" for read-only or "r+" for read/write access
+        :param offset: the offset in bytes of the first element in the file
+        :param layout: the layout of the data in the file
+        :returns: an Unmanaged HostSpace View over the file contents
         """
 
-        self._init_view(shape, dtype, space, layout, trait, array, cp_array)
+        if mode not in {"r", "r+"}:
+            raise ValueError(f"ERROR: unsupported mode {mode!r}, expected 'r' or 'r+'")
 
-        try:
-            from pykokkos import _view_registry
+        order: str = "F" if layout is Layout.LayoutLeft else "C"
 
-            _view_registry.add(self)
-        except (ImportError, AttributeError):
-            pass
+        return memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape, order=order)
 
     def resize(self, dimension: int, size: int) -> None:
         """
@@ -305,6 +680,13 @@ class View(ViewType):
         if self.shape != () and self.shape[dimension] == size:
             return
 
+        if dimension == 0 and self._is_growable():
+            if size > self.capacity:
+                self._reallocate(max(size, math.ceil(self.capacity * VIEW_GROWTH_FACTOR)), size)
+            else:
+                self._set_extent(size)
+            return
+
         old_data: np.ndarray = self.data
 
         shape_list: List[int] = list(self.shape)
@@ -318,13 +700,155 @@ class View(ViewType):
         is_cpu: bool = self.space is MemorySpace.HostSpace
         kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
         self.array = kokkos_lib.array(
-            "", self.shape, None, None, self.dtype.value, self.space.value, self.layout.value, self.trait.value)
-        self.data = np.array(self.array, copy=False)
+            self.label, self.shape, None, None, self.dtype.value, self.space.value, self.layout.value, self.trait.value)
+        self.data = _get_native_data(self.array, self.dtype)
+        self._subview_cache.clear()
+        self._storage_array = self.array
+        self._storage_data = self.data
+        self.capacity = self.shape[0]
+        if memory_tracker.enabled:
+            self._record_allocation()
 
         smaller: np.ndarray = old_data if old_data.size < self.data.size else self.data
         data_slice = tuple([slice(0, i) for i in smaller.shape])
         self.data[data_slice] = old_data[data_slice]
 
+    def _record_allocation(self) -> None:
+        """
+        Record the allocation backing the View in the memory tracker
+        """
+
+        memory_tracker.record_allocation(
+            self._storage_array, self._storage_data.nbytes, self.space.name, get_dtype_name(self.dtype), self.label)
+
+    def _is_growable(self) -> bool:
+        """
+        Whether the first dimension can have spare capacity, which
+        requires the rows to be contiguous in memory
+
+        :returns: True if the View can grow without reallocating
+        """
+
+        return (self.trait is not Trait.Unmanaged and self.ndim > 0
+                and (self.ndim == 1 or self.layout is Layout.LayoutRight))
+
+    def _reallocate(self, capacity: int, size: int) -> None:
+        """
+        Move the View to a new allocation with room for capacity
+        entries along the first dimension, keeping the first size ones
+
+        :param capacity: the number of entries allocated
+        :param size: the logical extent of the first dimension
+        """
+
+        is_cpu: bool = self.space is MemorySpace.HostSpace
+        kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
+        view_type: type = _get_view_type(kokkos_lib, self.ndim, self.dtype, self.space, self.layout, self.trait)
+        storage_array = view_type(self.label, [capacity, *self.shape[1:]], False)
+        storage_data: np.ndarray = _get_native_data(storage_array, self.dtype)
+
+        kept: int = min(self.shape[0], size)
+        storage_data[:kept] = self.data[:kept]
+
+        self._storage_array = storage_array
+        self._storage_data = storage_data
+        if memory_tracker.enabled:
+            self._record_allocation()
+        self.capacity = capacity
+        self.shape = (kept, *self.shape[1:])
+        self._set_extent(size)
+
+    def _set_extent(self, size: int) -> None:
+        """
+        Set the logical extent of the first dimension within the
+        current capacity. Entries exposed by growing are zero-filled.
+
+        :param size: the new extent
+        """
+
+        self._storage_data[self.shape[0]:size] = 0
+
+        self.shape = (size, *self.shape[1:])
+        self.size = math.prod(self.shape)
+        self._subview_cache.clear()
+        self.data = self._storage_data[:size]
+
+        # the native view of a partial extent is only created when it is
+        # used (see array), so growing within the capacity stays O(1)
+        self._array = self._storage_array if size == self.capacity else None
+
+    @property
+    def array(self):
+        """
+        The native view of the View. Kernels see an unmanaged view of
+        the logical extent, of the same type as the full allocation,
+        created on first use when the extent is below the capacity
+        """
+
+        if self._array is None:
+            is_cpu: bool = self.space is MemorySpace.HostSpace
+            kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
+            self._array = kokkos_lib.array(self.data, dtype=self.dtype.value, space=self.space.value,
+                                           layout=self.layout.value, trait=self.trait.value)
+
+        return self._array
+
+    @array.setter
+    def array(self, array) -> None:
+        self._array = array
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Allocate room for at least capacity entries along the first
+        dimension, so that growing up to it does not reallocate
+
+        :param capacity: the number of entries to allocate
+        """
+
+        if not self._is_growable():
+            raise ValueError("ERROR: only managed 1D or LayoutRight Views can reserve capacity")
+
+        if capacity > self.capacity:
+            self._reallocate(capacity, self.shape[0])
+
+    def shrink_to_fit(self) -> None:
+        """
+        Release the unused capacity along the first dimension
+        """
+
+        if self.ndim > 0 and self.capacity > self.shape[0]:
+            self._reallocate(self.shape[0], self.shape[0])
+
+    def append(self, value) -> None:
+        """
+        Append an entry along the first dimension, growing the capacity
+        geometrically when it is exhausted
+
+        :param value: a scalar for 1D Views, otherwise an array with
+            the shape of one entry (shape[1:])
+        """
+
+        self.extend(np.expand_dims(np.asarray(value), 0))
+
+    def extend(self, values) -> None:
+        """
+        Append entries along the first dimension, growing the capacity
+        geometrically when it is exhausted
+
+        :param values: an array of shape (n, *shape[1:])
+        """
+
+        values = np.asarray(values)
+        if self.ndim == 0 or values.shape[1:] != self.shape[1:]:
+            raise ValueError(f"ERROR: cannot extend a View of shape {self.shape} with an array of shape {values.shape}")
+
+        if "PK_FUSION" in os.environ:
+            runtime_singleton.runtime.flush_data(self)
+
+        start: int = self.shape[0]
+        self.resize(0, start + values.shape[0])
+        self.data[start:] = values
+
     def set_precision(self, dtype: Union[DataTypeClass, type]) -> None:
         """
         Set the precision of the View, reallocating it
@@ -332,9 +856,12 @@ class View(ViewType):
         :param dtype: the data type of the view, either a pykokkos DataType or "int" or "float".
         """
 
-        old_data: np.ndarray = self.data
-        self._init_view(self.shape, dtype, self.space, self.layout, self.trait)
-        np.copyto(self.data, old_data, casting="unsafe")
+        old_data: np.ndarray = _from_bfloat16_bits(self.data) if self._holds_bfloat16_bits() else self.data
+        self._init_view(self.shape, dtype, self.space, self.layout, self.trait, initialize=False)
+        if self._holds_bfloat16_bits():
+            np.copyto(self.data, _to_bfloat16_bits(old_data))
+        else:
+            np.copyto(self.data, old_data, casting="unsafe")
 
     def _init_view(
         self,
@@ -344,7 +871,8 @@ class View(ViewType):
         layout: Layout = Layout.LayoutDefault,
         trait: Trait = Trait.TraitDefault,
         array: Optional[np.ndarray] = None,
-        cp_array = None
+        cp_array = None,
+        initialize: bool = True
     ) -> None:
         """
         Initialize the view
@@ -356,11 +884,13 @@ class View(ViewType):
         :param trait: the memory trait of the view
         :param array: the numpy array if trait is Unmanaged
         :param cp_array: the cupy array if trait is Unmanaged
+        :param initialize: whether to zero-fill a newly allocated view
         """
 
         self.shape: Tuple[int] = tuple(shape)
         self.size: int = math.prod(shape)
         self.ndim: int = len(shape)
+        self._subview_cache: Dict[Tuple, object] = {}
         self.dtype: Optional[DataType] = self._get_type(dtype)
         if self.dtype is None:
             sys.exit(f"ERROR: Invalid dtype {dtype}")
@@ -371,57 +901,72 @@ class View(ViewType):
         if layout is Layout.LayoutDefault:
             layout = get_default_layout(space)
 
+        is_unmanaged: bool = trait is Trait.Unmanaged
+
         # only allow CudaSpace/HIPSpace view for cupy arrays
-        if (space in {MemorySpace.CudaSpace, MemorySpace.HIPSpace}) and trait is not trait.Unmanaged:
+        if (space is MemorySpace.CudaSpace or space is MemorySpace.HIPSpace) and not is_unmanaged:
             space = MemorySpace.HostSpace
 
         self.space: MemorySpace = space
         self.layout: Layout = layout
         self.trait: Trait = trait
 
-        is_cpu: bool = self.space is MemorySpace.HostSpace
+        is_cpu: bool = space is MemorySpace.HostSpace
         kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
 
-        if self.dtype in {DataType.float, pk_float}:
+        dtype = self.dtype
+        if dtype is DataType.float or dtype is pk_float:
             self.dtype = float32
-        elif self.dtype in {DataType.double, double}:
+        elif dtype is DataType.double or dtype is double:
             self.dtype = float64
-        if trait is trait.Unmanaged:
-            if array is not None and array.ndim == 0:
-                # TODO: we don't really support 0-D under the hood--use
-                # NumPy/CuPy for now...
-                self.array = array
-                # For cupy arrays, store reference to xp_array
-                if cp_array is not None:
-                    self.xp_array = cp_array
-                else:
-                    self.xp_array = array
+        elif dtype is DataType.float16:
+            self.dtype = float16
+        elif dtype is DataType.bfloat16:
+            self.dtype = bfloat16
+
+        if is_unmanaged:
+            if array.dtype == np.bool_:
+                array = array.astype(np.uint8)
+            # 0-D views are backed by a single element native view, with
+            # data and xp_array reshaped to 0-D over the same memory
+            native_array: np.ndarray = array.reshape(1) if array.ndim == 0 else array
+            if self.dtype is bfloat16 and native_array.dtype != np.uint16 and native_array.dtype.itemsize == 2:
+                # the native view only knows the raw bits
+                native_array = native_array.view(np.uint16)
+            self.array = kokkos_lib.unmanaged_array(native_array, dtype=self.dtype.value, space=self.space.value, layout=self.layout.value)
+            # Store a reference here in case the array goes out of
+            # scope and gets garbage collected, which would
+            # invalidate the data. Currently, this happens when
+            # calling asarray()
+            self.orig_array = array
+
+            if cp_array is not None:
+                self.xp_array = cp_array
             else:
-                if array.dtype == np.bool_:
-                    array = array.astype(np.uint8)
-                self.array = kokkos_lib.unmanaged_array(array, dtype=self.dtype.value, space=self.space.value, layout=self.layout.value)
-                # Store a reference here in case the array goes out of
-                # scope and gets garbage collected, which would
-                # invalidate the data. Currently, this happens when
-                # calling asarray()
-                self.orig_array = array
-
-                if cp_array is not None:
-                    self.xp_array = cp_array
-                else:
-                    self.xp_array = array
-                
+                self.xp_array = array
+
         else:
-            if len(self.shape) == 0:
+            if self.ndim == 0:
                 shape = [1]
-            self.array = kokkos_lib.array("", shape, None, None, self.dtype.value, space.value, layout.value, trait.value)
-        
-        # For 0-D cupy arrays stored in self.array, get numpy version for self.data
-        if hasattr(self, 'array') and hasattr(self.array, 'get'):
-            # It's a cupy array, convert to numpy for self.data
-            self.data = self.array.get()
-        else:
-            self.data = np.array(self.array, copy=False)
+            view_type: type = _get_view_type(kokkos_lib, len(shape), self.dtype, space, layout, trait)
+            if initialize:
+                self.array = view_type(self.label, shape)
+            else:
+                # allocate with Kokkos::WithoutInitializing
+                self.array = view_type(self.label, shape, False)
+
+        self.data = _get_native_data(self.array, self.dtype)
+        if self.ndim == 0:
+            self.data = self.data.reshape(())
+
+        # the allocation backing the View and the number of entries it
+        # has room for along the first dimension (see reserve())
+        self._storage_array = self.array
+        self._storage_data = self.data
+        self.capacity: int = self.shape[0] if self.ndim > 0 else 0
+
+        if memory_tracker.enabled and not is_unmanaged:
+            self._record_allocation()
 
     def _get_type(self, dtype: Union[DataType, type]) -> Optional[DataType]:
         """
@@ -457,40 +1002,15 @@ class View(ViewType):
     def __eq__(self, other):
         # avoid circular import with scoped import
         from pykokkos.lib.ufuncs import equal
-        if isinstance(other, float):
-            new_other = pk.View((), dtype=pk.double)
-            new_other[:] = other
-        elif isinstance(other, bool):
-            new_other = pk.View((), dtype=pk.bool)
-            new_other[:] = other
-        elif isinstance(other, int):
-            if self.ndim == 0:
-                ret = pk.View((), dtype=pk.bool)
-                ret[:] = int(self) == other
-                return ret
-            if 0 <= other <= 255:
-                other_dtype = pk.uint8
-            elif 0 <= other <= 65535:
-                other_dtype = pk.uint16
-            elif 0 <= other <= 4294967295:
-                other_dtype = pk.uint32
-            elif 0 <= other <= 18446744073709551615:
-                other_dtype = pk.uint64
-            elif -128 <= other <= 127:
-                other_dtype = pk.int8
-            elif -32768 <= other <= 32767:
-                other_dtype = pk.int16
-            elif -2147483648 <= other <= 2147483647:
-                other_dtype = pk.int32
-            elif -9223372036854775808 <= other <= 9223372036854775807:
-                other_dtype = pk.int64
-            new_other = pk.View((), dtype=other_dtype)
-            new_other[:] = other
-        elif isinstance(other, pk.View):
-            new_other = other
-        else:
+        if isinstance(other, int) and not isinstance(other, bool) and self.ndim == 0:
+            ret = pk.View((), dtype=pk.bool)
+            ret[:] = int(self) == other
+            return ret
+        if isinstance(other, (bool, int, float)):
+            other = _get_scalar_view(other)
+        elif not isinstance(other, pk.View):
             raise ValueError("unexpected types!")
-        return equal(self, new_other)
+        return equal(self, other)
 
 
 
@@ -503,10 +1023,13 @@ class View(ViewType):
 
 
     def __index__(self) -> int:
-        return int(self.data[0])
+        return int(self.data.flat[0])
     
     
     def __array__(self, dtype=None):
+        if self._holds_bfloat16_bits():
+            return _from_bfloat16_bits(self.data)
+
         return self.data
 
 
@@ -534,8 +1057,16 @@ class Subview(ViewType):
     Subviews are passed to C++ as unmanaged views.
     This class contains the Python implementation of a subview. The user is not meant to call
     the constructor directly, instead they should slice the original View object.
+
+    Creating a Subview only slices the parent's numpy data; it is
+    described by its base view, offset, extents and strides. The
+    unmanaged native view is only created when the Subview is passed to
+    a kernel, and is shared by all Subviews of the same base view that
+    cover the same elements.
     """
 
+    __slots__ = ("parent_view", "base_view", "data_slice", "_array")
+
     def __init__(self, parent_view: Union[Subview, View], data_slice: Union[slice, Tuple]):
         """
         Subview constructor.
@@ -546,38 +1077,105 @@ class Subview(ViewType):
 
         self.parent_view: Union[Subview, View] = parent_view
         self.base_view: View = self._get_base_view(parent_view)
-
-        self.data: np.ndarray = parent_view.data[data_slice]
+        self.data_slice: Union[slice, Tuple] = data_slice
+
+        # a trailing ellipsis makes integer indices select a 0-D view
+        # of the element instead of a copy of it
+        array_slice: Tuple = data_slice if isinstance(data_slice, tuple) else (data_slice,)
+        if not any(k is Ellipsis for k in array_slice):
+            array_slice = (*array_slice, ...)
+        self.data: np.ndarray = parent_view.data[array_slice]
         self.dtype = parent_view.dtype
         if parent_view.trait is Trait.Unmanaged:
-            self.xp_array = parent_view.xp_array[data_slice]
-
-        is_cpu: bool = self.parent_view.space is MemorySpace.HostSpace
-        kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
+            self.xp_array = parent_view.xp_array[array_slice]
 
         self.space: MemorySpace = parent_view.space
         self.layout: Layout = parent_view.layout
         self.trait: Trait = parent_view.trait
 
-        if self.data is not None and self.data.ndim == 0:
-            # TODO: we don't really support 0-D under the hood--use
-            # NumPy for now...
-            self.array = self.data
-        else:
-            self.array = kokkos_lib.array(
-                self.data, dtype=parent_view.dtype.value, space=parent_view.space.value,
-                layout=parent_view.layout.value, trait=kokkos.Unmanaged)
+        self._array = None
+
         self.shape: Tuple[int] = self.data.shape
 
         if self.data.shape == (0,):
             self.data = np.array([], dtype=self.data.dtype)
             self.shape = ()
 
-        self.parent_slice: List[Union[int, slice]]
-        self.parent_slice = self._create_slice(data_slice)
         self.ndim = self.data.ndim
         self.size = self.data.size
 
+    @property
+    def offset(self) -> int:
+        """
+        The offset in elements of the first element of the Subview
+        from the first element of its base view
+        """
+
+        return (self.data.ctypes.data - self.base_view.data.ctypes.data) // self.data.itemsize
+
+    @property
+    def extents(self) -> Tuple[int, ...]:
+        """
+        The extents of the Subview
+        """
+
+        return self.shape
+
+    @property
+    def strides(self) -> Tuple[int, ...]:
+        """
+        The strides of the Subview in elements
+        """
+
+        return tuple(s // self.data.itemsize for s in self.data.strides)
+
+    @property
+    def array(self):
+        """
+        The native unmanaged view of the Subview, created on first use
+        """
+
+        if self._array is None:
+            self._array = self._get_native_view()
+
+        return self._array
+
+    def _get_native_view(self):
+        """
+        Get the unmanaged native view over the Subview's elements,
+        reusing the one cached on the base view if it exists
+
+        :returns: the native view
+        """
+
+        cache: Dict[Tuple, object] = self.base_view._subview_cache
+        key: Tuple = (self.data.ctypes.data, self.data.shape, self.data.strides)
+
+        native = cache.get(key)
+        if native is None:
+            is_cpu: bool = self.space is MemorySpace.HostSpace
+            kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
+            # 0-D Subviews are backed by a single element native view
+            native = kokkos_lib.array(
+                self.data.reshape(1) if self.data.ndim == 0 else self.data,
+                dtype=self.dtype.value, space=self.space.value,
+                layout=self.layout.value, trait=kokkos.Unmanaged)
+
+            if len(cache) >= SUBVIEW_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = native
+
+        return native
+
+    @property
+    def parent_slice(self) -> List[Union[int, slice]]:
+        """
+        The slice of the parent view as a list of integers and slices
+        without None values for start and stop
+        """
+
+        return self._create_slice(self.data_slice)
+
     def _create_slice(self, data_slice: Union[slice, Tuple]) -> List[Union[int, slice]]:
         """
         Transforms the slice into a list, removing all None values for start and stop
@@ -620,40 +1218,15 @@ class Subview(ViewType):
     def __eq__(self, other):
         # avoid circular import with scoped import
         from pykokkos.lib.ufuncs import equal
-        if isinstance(other, float):
-            new_other = pk.View((), dtype=pk.double)
-            new_other[:] = other
-        elif isinstance(other, bool):
-            new_other = pk.View((), dtype=pk.bool)
-            new_other[:] = other
-        elif isinstance(other, int):
-            if self.ndim == 0:
-                ret = pk.View((), dtype=pk.bool)
-                ret[:] = int(self) == other
-                return ret
-            if 0 <= other <= 255:
-                other_dtype = pk.uint8
-            elif 0 <= other <= 65535:
-                other_dtype = pk.uint16
-            elif 0 <= other <= 4294967295:
-                other_dtype = pk.uint32
-            elif 0 <= other <= 18446744073709551615:
-                other_dtype = pk.uint64
-            elif -128 <= other <= 127:
-                other_dtype = pk.int8
-            elif -32768 <= other <= 32767:
-                other_dtype = pk.int16
-            elif -2147483648 <= other <= 2147483647:
-                other_dtype = pk.int32
-            elif -9223372036854775808 <= other <= 9223372036854775807:
-                other_dtype = pk.int64
-            new_other = pk.View((), dtype=other_dtype)
-            new_other[:] = other
-        elif isinstance(other, pk.Subview):
-            new_other = other
-        else:
+        if isinstance(other, int) and not isinstance(other, bool) and self.ndim == 0:
+            ret = pk.View((), dtype=pk.bool)
+            ret[:] = int(self) == other
+            return ret
+        if isinstance(other, (bool, int, float)):
+            other = _get_scalar_view(other)
+        elif not isinstance(other, pk.Subview):
             raise ValueError("unexpected types!")
-        return equal(self, new_other)
+        return equal(self, other)
 
 
     def __add__(self, other):
@@ -676,7 +1249,7 @@ class Subview(ViewType):
         hash_value = hash(self.array)
         return hash_value
 
-def from_numpy(array: np.ndarray, space: Optional[MemorySpace] = None, layout: Optional[Layout] = None, cp_array = None) -> ViewType:
+def from_numpy(array: np.ndarray, space: Optional[MemorySpace] = None, layout: Optional[Layout] = None, cp_array = None, copy: bool = False) -> ViewType:
     """
     Create a PyKokkos View from a numpy array
 
@@ -684,7 +1257,11 @@ def from_numpy(array: np.ndarray, space: Optional[MemorySpace] = None, layout: O
     :param space: an optional argument for memory space (used by from_array)
     :param layout: an optional argument for layout (used by from_array)
     :param cp_array: the original cupy array (used by from_array)
-    :returns: a PyKokkos View wrapping the array
+    :param copy: whether to copy the array into a new View allocated
+        by Kokkos instead of wrapping it. The copy runs in parallel on
+        the execution space of the View, so that with OpenMP its pages
+        are placed on the NUMA nodes of the threads that use them.
+    :returns: a PyKokkos View wrapping (or holding a copy of) the array
     """
 
     dtype: DataTypeClass
@@ -717,6 +1294,11 @@ def from_numpy(array: np.ndarray, space: Optional[MemorySpace] = None, layout: O
         dtype = DataType.float # PyKokkos float
     elif np_dtype is np.float64:
         dtype = float64
+    elif np_dtype is np.float16:
+        dtype = float16
+    elif array.dtype.name == "bfloat16":
+        # e.g. ml_dtypes.bfloat16, as numpy has none
+        dtype = bfloat16
     elif np_dtype is np.bool_:
         dtype = uint8
     elif np_dtype is np.complex64:
@@ -726,6 +1308,10 @@ def from_numpy(array: np.ndarray, space: Optional[MemorySpace] = None, layout: O
     else:
         raise RuntimeError(f"ERROR: unsupported numpy datatype {np_dtype}")
 
+    if dtype in (float16, bfloat16) and array.dtype.itemsize != np.dtype(dtype.np_equiv).itemsize:
+        # 16-bit floats are stored as floats on backends without them
+        copy = True
+
     if layout is None and array.ndim > 1:
         if array.flags["F_CONTIGUOUS"]:
             layout = Layout.LayoutLeft
@@ -738,31 +1324,17 @@ def from_numpy(array: np.ndarray, space: Optional[MemorySpace] = None, layout: O
     if layout is None:
         layout = Layout.LayoutDefault
 
-    # TODO: pykokkos support for 0-D arrays?
-    # temporary/terrible hack here for array API testing..
-    if array.ndim == 0:
-        ret_list = ()
-        if np_dtype == np.bool_:
-            # For bool, convert to uint8
-            if cp_array is not None:
-                # Get the array module from cp_array's type
-                array_module = importlib.import_module(type(cp_array).__module__.split('.')[0])
-                scalar_val = 1 if array == 1 else 0
-                array = array_module.array(scalar_val, dtype=np.uint8)
-            else:
-                scalar_val = 1 if array == 1 else 0
-                array = np.array(scalar_val, dtype=np.uint8)
-        else:
-            # For other dtypes, recreate the array with proper dtype
-            if cp_array is not None:
-                # Get the array module from cp_array's type
-                array_module = importlib.import_module(type(cp_array).__module__.split('.')[0])
-                scalar_val = array.item()
-                array = array_module.array(scalar_val, dtype=np_dtype)
-            else:
-                array = np.array(array, dtype=np_dtype)
-    else:
-        ret_list = list((array.shape))
+    ret_list = list(array.shape)
+
+    if copy and cp_array is None:
+        view = View(ret_list, dtype, space=space, layout=layout, initialize=False)
+        order: str = "F" if view.layout is Layout.LayoutLeft else "C"
+        src: np.ndarray = np.asarray(array, dtype=view.data.dtype, order=order)
+        if src.dtype.name == "bfloat16":
+            # the native view only knows the raw bits
+            src = src.view(np.uint16)
+        view.array.copy_from(src.reshape(1) if src.ndim == 0 else src)
+        return view
 
     return View(ret_list, dtype, space=space, trait=Trait.Unmanaged, array=array, layout=layout, cp_array=cp_array)
 
@@ -779,22 +1351,6 @@ def from_array(array) -> ViewType:
     :param array: the numpy-like array
     """
 
-    # Handle 0-D arrays separately to avoid ctypes issues
-    if array.ndim == 0:
-        # For 0-D arrays, use the scalar value directly
-        scalar_val = array.item()
-        np_array = np.array(scalar_val, dtype=array.dtype.type)
-        
-        memory_space: MemorySpace
-        if km.get_gpu_framework() is pk.Cuda:
-            memory_space = MemorySpace.CudaSpace
-        elif km.get_gpu_framework() is pk.HIP:
-            memory_space = MemorySpace.HIPSpace
-        else:
-            memory_space = MemorySpace.HostSpace
-        
-        return from_numpy(np_array, memory_space, Layout.LayoutDefault, array)
-
     np_dtype = array.dtype.type
 
     if np_dtype is np.int8:
@@ -817,6 +1373,8 @@ def from_array(array) -> ViewType:
         ctype = ctypes.c_float
     elif np_dtype is np.float64:
         ctype = ctypes.c_double
+    elif np_dtype is np.float16:
+        ctype = ctypes.c_uint16
     elif np_dtype is np.bool_:
         ctype = ctypes.c_uint8
     elif np_dtype is np.complex64:
@@ -831,11 +1389,13 @@ def from_array(array) -> ViewType:
 
     ptr = array.data.ptr
     ptr = ctypes.cast(ptr, ctypes.POINTER(ctype))
-    np_array = np.ctypeslib.as_array(ptr, shape=array.shape)
+    # 0-D arrays are wrapped through their single element
+    np_array = np.ctypeslib.as_array(ptr, shape=array.shape or (1,)).reshape(array.shape)
 
-    if np_dtype in {np.complex64, np.complex128}:
-        # This sets the arrays dtype to numpy's complex number types.
-        # Without this the type would be np.void.
+    if np_dtype in {np.complex64, np.complex128, np.float16}:
+        # This sets the arrays dtype to numpy's complex number and
+        # half precision types. Without this the type would be np.void
+        # or np.uint16.
         np_array = np_array.view(np_dtype)
 
     # need to select the layout here since the np_array flags do not
@@ -851,9 +1411,136 @@ def from_array(array) -> ViewType:
         memory_space = MemorySpace.CudaSpace
     elif km.get_gpu_framework() is pk.HIP:
         memory_space = MemorySpace.HIPSpace
+    else:
+        memory_space = MemorySpace.HostSpace
 
     return from_numpy(np_array, memory_space, layout, array)
 
+class DLDeviceType(Enum):
+    """
+    Device types of the DLPack protocol that PyKokkos can import
+    """
+
+    kDLCPU = 1
+    kDLCUDA = 2
+    kDLCUDAHost = 3
+    kDLROCM = 10
+    kDLCUDAManaged = 13
+
+
+def from_dlpack(x, /, *, copy: Optional[bool] = None) -> ViewType:
+    """
+    Create a PyKokkos View sharing memory with any object implementing
+    the DLPack protocol (numpy, pytorch, jax, cupy, ...)
+
+    :param x: the object exporting __dlpack__ and __dlpack_device__
+    :param copy: None to copy only if the memory cannot be wrapped as is
+        (i.e. strides that are neither LayoutRight nor LayoutLeft), False
+        to never copy and True to always copy
+    :returns: a PyKokkos View wrapping the same memory as x
+    """
+
+    if not hasattr(x, "__dlpack__"):
+        raise TypeError(f"ERROR: {type(x)} does not implement the DLPack protocol")
+
+    device_type, _ = x.__dlpack_device__()
+    device_type = DLDeviceType(int(device_type))
+
+    xp: ModuleType
+    if device_type in {DLDeviceType.kDLCPU, DLDeviceType.kDLCUDAHost}:
+        xp = np
+    else:
+        import cupy
+        xp = cupy
+
+    arr = xp.from_dlpack(x)
+
+    # Kokkos views can only wrap LayoutRight/LayoutLeft memory
+    is_contiguous: bool = arr.flags["C_CONTIGUOUS"] or arr.flags["F_CONTIGUOUS"]
+    if copy or not is_contiguous:
+        if copy is False:
+            raise ValueError("ERROR: cannot import a non-contiguous array without copying")
+        arr = xp.array(arr, order="F" if arr.flags["F_CONTIGUOUS"] else "C", copy=True)
+
+    if xp is np:
+        return from_numpy(arr)
+
+    return from_array(arr)
+
+
+def _get_np_dtype(dtype: Union[DataTypeClass, type, str]) -> np.dtype:
+    """
+    Get the numpy dtype with the same memory representation as a View
+    of the given data type
+
+    :param dtype: a pykokkos type or anything accepted by np.dtype
+    :returns: the numpy dtype
+    """
+
+    np_dtype: np.dtype
+    if isinstance(dtype, type) and issubclass(dtype, DataTypeClass):
+        np_dtype = np.dtype(dtype.np_equiv)
+    else:
+        np_dtype = np.dtype(dtype)
+
+    if np_dtype == np.bool_:
+        # bool views are stored as uint8, so reinterpret the bytes
+        # instead of letting the conversion copy them
+        np_dtype = np.dtype(np.uint8)
+
+    return np_dtype
+
+
+def memmap(
+    filename,
+    dtype: Union[DataTypeClass, type, str] = float64,
+    mode: str = "r+",
+    offset: int = 0,
+    shape: Optional[Union[int, Tuple[int, ...]]] = None,
+    order: str = "C"
+) -> ViewType:
+    """
+    Create a PyKokkos View backed by a memory-mapped binary file, so
+    that kernels run over the file contents directly instead of over a
+    copy loaded into memory. Pages are read lazily by the OS and, for
+    writable modes, dirty pages are written back to the file.
+
+    :param filename: a path, an open file object or an existing
+        mmap.mmap buffer
+    :param dtype: the element type, either a pykokkos type or anything
+        accepted by np.dtype
+    :param mode: "r" (read-only), "r+" (read/write), "w+" (create or
+        overwrite) or "c" (copy-on-write), as for np.memmap. Kernels
+        must not write to a view mapped with "r"
+    :param offset: the offset in bytes of the first element in the file
+    :param shape: the shape of the view; None maps the whole file as
+        a 1D view
+    :param order: "C" for LayoutRight or "F" for LayoutLeft
+    :returns: an Unmanaged HostSpace View over the mapped memory
+    """
+
+    np_dtype: np.dtype = _get_np_dtype(dtype)
+
+    mapped: np.ndarray
+    if isinstance(filename, mmap.mmap):
+        count: int = -1 if shape is None else math.prod((shape,) if isinstance(shape, int) else shape)
+        mapped = np.frombuffer(filename, dtype=np_dtype, count=count, offset=offset)
+        if shape is not None:
+            mapped = mapped.reshape(shape, order=order)
+    else:
+        mapped = np.memmap(filename, dtype=np_dtype, mode=mode, offset=offset, shape=shape, order=order)
+
+    layout: Layout = Layout.LayoutLeft if order == "F" and mapped.ndim > 1 else Layout.LayoutRight
+    view: ViewType = from_numpy(mapped, MemorySpace.HostSpace, layout)
+
+    if not mapped.flags["WRITEABLE"]:
+        # the native view exports a writable buffer, but writing to a
+        # read-only mapping would fault, so fail on the host side instead
+        view.data.flags.writeable = False
+
+    return view
+
+
 def is_array(array) -> bool:
     """
     Check if an object conforms to enough numpy array standards to be treated as an array
@@ -903,17 +1590,24 @@ def asarray(obj, /, *, dtype=None, device=None, copy=None):
     # for now, let's cheat and use NumPy asarray() followed
     # by pykokkos from_numpy()
 
-    if not isinstance(obj, list) and obj in {pk.e, pk.pi, pk.inf, pk.nan}:
+    if isinstance(obj, float) and obj in {pk.e, pk.pi, pk.inf, pk.nan}:
         if dtype is None:
             dtype = pk.float64
         view = pk.View([1], dtype=dtype)
         view[:] = obj
         return view
+    if dtype is bfloat16 and np.dtype(dtype.np_equiv) == np.uint16:
+        # without ml_dtypes numpy has no bfloat16 to convert to, and
+        # the values are rounded to its raw bits when written
+        arr = np.asarray(obj, dtype=np.float32)
+        view = View(list(arr.shape), dtype=dtype, initialize=False)
+        view.write(..., arr)
+        return view
     if dtype is not None:
         arr = np.asarray(obj, dtype=dtype.np_equiv)
     else:
         arr = np.asarray(obj)
-    ret = from_numpy(arr)
+    ret = from_numpy(arr, copy=bool(copy))
     return ret
 
 
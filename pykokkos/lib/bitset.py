@@ -0,0 +1,285 @@
+from typing import Any, Tuple
+
+import numpy as np
+
+import pykokkos as pk
+
+# the number of bits per word, as in Kokkos::Bitset
+BITS_PER_WORD: int = 32
+
+# a word with all bits set
+ALL_BITS: int = 0xFFFFFFFF
+
+
+@pk.workunit
+def pack_bits(w: int, n: int, mask: pk.View1D[pk.uint8], words: pk.View1D[pk.uint32]):
+    word: pk.uint32 = 0
+    bit: pk.uint32 = 1
+    for b in range(32):
+        i: int = w * 32 + b
+        if i < n and mask[i] != 0:
+            word = word | bit
+        bit = bit << 1
+
+    words[w] = word
+
+
+@pk.workunit
+def unpack_bits(i: int, words: pk.View1D[pk.uint32], out: pk.View1D[pk.uint8]):
+    out[i] = (words[i >> 5] >> (i & 31)) & 1
+
+
+@pk.workunit
+def popcount_words(w: int, acc: pk.Acc[pk.int64], words: pk.View1D[pk.uint32]):
+    # SWAR popcount: count bits in pairs, nibbles, then bytes, and sum
+    # the four byte counts in the top byte with a multiplication
+    v: pk.uint32 = words[w]
+    v = v - ((v >> 1) & 0x55555555)
+    v = (v & 0x33333333) + ((v >> 2) & 0x33333333)
+    v = (v + (v >> 4)) & 0x0F0F0F0F
+    v = (v * 0x01010101) >> 24
+    acc += v
+
+
+@pk.workunit
+def and_words(w: int, a: pk.View1D[pk.uint32], b: pk.View1D[pk.uint32], out: pk.View1D[pk.uint32]):
+    out[w] = a[w] & b[w]
+
+
+@pk.workunit
+def or_words(w: int, a: pk.View1D[pk.uint32], b: pk.View1D[pk.uint32], out: pk.View1D[pk.uint32]):
+    out[w] = a[w] | b[w]
+
+
+@pk.workunit
+def xor_words(w: int, a: pk.View1D[pk.uint32], b: pk.View1D[pk.uint32], out: pk.View1D[pk.uint32]):
+    out[w] = a[w] ^ b[w]
+
+
+@pk.workunit
+def not_words(w: int, last_mask: pk.uint32, a: pk.View1D[pk.uint32], out: pk.View1D[pk.uint32]):
+    word: pk.uint32 = ~a[w]
+    # keep the bits past the end of the last word cleared
+    if w == out.extent(0) - 1:
+        word = word & last_mask
+    out[w] = word
+
+
+class BitView:
+    """
+    A one-dimensional array of booleans packed 32 to a word, modeled
+    on Kokkos::Bitset. It uses an eighth of the memory of a uint8 mask,
+    and logical operations and counting process a whole word at a
+    time. Bit i is bit i % 32 of words[i // 32]; the bits past the end
+    of the last word are always cleared.
+
+    A BitView passed to a workunit is replaced by its words, which the
+    workunit receives as a pk.View1D[pk.uint32]. A visited set can be
+    updated concurrently with
+    pk.atomic_fetch_or(visited, [i >> 5], bit << (i & 31)).
+    """
+
+    def __init__(self, size: int, value: bool = False):
+        """
+        BitView constructor
+
+        :param size: the number of bits
+        :param value: the initial value of every bit
+        """
+
+        if size < 0:
+            raise ValueError(f"ERROR: the size of a BitView must be non-negative, got {size}")
+
+        self.size: int = int(size)
+        num_words: int = -(-self.size // BITS_PER_WORD)
+        self.words: pk.View = pk.View([num_words], dtype=pk.uint32, initialize=not value)
+        if value:
+            self.fill(True)
+
+    @classmethod
+    def from_array(cls, mask: Any) -> "BitView":
+        """
+        Pack a boolean mask, e.g. the uint8 View returned by a logical
+        ufunc or a numpy bool array. Nonzero entries are true.
+
+        :param mask: a 1D View or array-like
+        :returns: the BitView
+        """
+
+        if not isinstance(mask, pk.ViewType):
+            arr: np.ndarray = np.asarray(mask)
+            if arr.dtype != np.uint8:
+                arr = arr != 0
+            mask = pk.array(np.ascontiguousarray(arr))
+
+        if len(mask.shape) != 1:
+            raise ValueError(f"ERROR: only 1D masks can be packed, got shape {mask.shape}")
+        if mask.dtype is not pk.uint8:
+            raise ValueError(f"ERROR: a View mask must hold uint8, got {mask.dtype}")
+
+        bits = cls(mask.shape[0])
+        num_words: int = bits.words.shape[0]
+        if num_words > 0:
+            pk.parallel_for("bitset_pack", num_words, pack_bits, n=bits.size, mask=mask, words=bits.words)
+
+        return bits
+
+    @property
+    def shape(self) -> Tuple[int]:
+        return (self.size,)
+
+    @property
+    def nbytes(self) -> int:
+        return self.words.shape[0] * BITS_PER_WORD // 8
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _last_mask(self) -> int:
+        """
+        Get the mask of the valid bits of the last word
+
+        :returns: the mask
+        """
+
+        tail: int = self.size % BITS_PER_WORD
+
+        return ALL_BITS if tail == 0 else (1 << tail) - 1
+
+    def _check_index(self, i: int) -> int:
+        if not -self.size <= i < self.size:
+            raise IndexError(f"ERROR: index {i} is out of bounds for a BitView of size {self.size}")
+
+        return i % self.size
+
+    def test(self, i: int) -> bool:
+        """
+        Get the value of a bit from the host
+
+        :param i: the index of the bit
+        :returns: the value of the bit
+        """
+
+        i = self._check_index(i)
+
+        return bool((int(self.words[i // BITS_PER_WORD]) >> (i % BITS_PER_WORD)) & 1)
+
+    def set(self, i: int) -> None:
+        """
+        Set a bit to true from the host
+
+        :param i: the index of the bit
+        """
+
+        i = self._check_index(i)
+        w: int = i // BITS_PER_WORD
+        self.words[w] = int(self.words[w]) | (1 << (i % BITS_PER_WORD))
+
+    def reset(self, i: int) -> None:
+        """
+        Set a bit to false from the host
+
+        :param i: the index of the bit
+        """
+
+        i = self._check_index(i)
+        w: int = i // BITS_PER_WORD
+        self.words[w] = int(self.words[w]) & ~(1 << (i % BITS_PER_WORD)) & ALL_BITS
+
+    def __getitem__(self, i: int) -> bool:
+        return self.test(i)
+
+    def __setitem__(self, i: int, value: bool) -> None:
+        if value:
+            self.set(i)
+        else:
+            self.reset(i)
+
+    def fill(self, value: bool) -> None:
+        """
+        Set every bit
+
+        :param value: the new value of the bits
+        """
+
+        num_words: int = self.words.shape[0]
+        if num_words == 0:
+            return
+
+        if not value:
+            self.words.fill(0)
+            return
+
+        self.words.fill(ALL_BITS)
+        self.words[num_words - 1] = self._last_mask()
+
+    def count(self) -> int:
+        """
+        Count the true bits with a parallel popcount of the words
+
+        :returns: the number of true bits
+        """
+
+        if self.words.shape[0] == 0:
+            return 0
+
+        return int(pk.parallel_reduce("bitset_count", self.words.shape[0], popcount_words, words=self.words))
+
+    def any(self) -> bool:
+        return self.count() > 0
+
+    def all(self) -> bool:
+        return self.count() == self.size
+
+    def to_view(self) -> pk.View:
+        """
+        Unpack to one uint8 per bit, the representation used by the
+        logical ufuncs
+
+        :returns: a 1D uint8 View of 0s and 1s
+        """
+
+        out = pk.View([self.size], dtype=pk.uint8, initialize=False)
+        if self.size > 0:
+            pk.parallel_for("bitset_unpack", self.size, unpack_bits, words=self.words, out=out)
+
+        return out
+
+    def _binary_op(self, other: "BitView", workunit, name: str) -> "BitView":
+        if not isinstance(other, BitView):
+            return NotImplemented
+        if other.size != self.size:
+            raise ValueError(f"ERROR: BitViews must have the same size, got {self.size} and {other.size}")
+
+        out = BitView(self.size)
+        if out.words.shape[0] > 0:
+            pk.parallel_for(name, out.words.shape[0], workunit, a=self.words, b=other.words, out=out.words)
+
+        return out
+
+    def __and__(self, other: "BitView") -> "BitView":
+        return self._binary_op(other, and_words, "bitset_and")
+
+    def __or__(self, other: "BitView") -> "BitView":
+        return self._binary_op(other, or_words, "bitset_or")
+
+    def __xor__(self, other: "BitView") -> "BitView":
+        return self._binary_op(other, xor_words, "bitset_xor")
+
+    def __invert__(self) -> "BitView":
+        out = BitView(self.size)
+        if out.words.shape[0] > 0:
+            pk.parallel_for("bitset_not", out.words.shape[0], not_words,
+                            last_mask=self._last_mask(), a=self.words, out=out.words)
+
+        return out
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        # bit i of a little-endian word is bit i % 8 of its byte i // 8
+        words: np.ndarray = np.asarray(self.words.read(), dtype="<u4")
+        bits: np.ndarray = np.unpackbits(words.view(np.uint8), count=self.size, bitorder="little")
+
+        return bits.astype(np.bool_ if dtype is None else dtype)
+
+    def __repr__(self) -> str:
+        return f"BitView(size={self.size})"
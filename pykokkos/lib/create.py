@@ -10,19 +10,35 @@ def zeros(shape, *, dtype=None, device=None):
         return pk.View([*shape], dtype=dtype)
 
 
+def empty(shape, *, dtype=None, device=None):
+    # the contents are left uninitialized (Kokkos::WithoutInitializing),
+    # so callers must write every element before reading it
+    if dtype is None:
+        dtype = pk.float64
+
+    if isinstance(shape, int):
+        return pk.View([shape], dtype=dtype, initialize=False)
+    else:
+        return pk.View([*shape], dtype=dtype, initialize=False)
+
+
+def empty_like(x, /, *, dtype=None, device=None):
+    if dtype is None:
+        dtype = x.dtype
+    return pk.View([*x.shape], dtype=dtype, initialize=False)
+
+
 def ones(shape, *, dtype=None, device=None):
     if dtype is None:
         # NumPy also defaults to a double for ones()
         dtype = pk.float64
-    view: pk.View = pk.View([*shape], dtype=dtype)
+    view: pk.View = empty(shape, dtype=dtype)
     view[:] = 1
     return view
 
 
 def ones_like(x, /, *, dtype=None, device=None):
-    if dtype is None:
-        dtype = x.dtype
-    view: pk.View = pk.View([*x.shape], dtype=dtype)
+    view: pk.View = empty_like(x, dtype=dtype)
     view[:] = 1
     return view
 
@@ -30,10 +46,8 @@ def ones_like(x, /, *, dtype=None, device=None):
 def zeros_like(x, /, *, dtype=None, device=None):
     if dtype is None:
         dtype = x.dtype
-    # NOTE: at the moment PyKokkos automatically
-    # zeros out allocated memory, but this may not
-    # always be the case if we want to support an
-    # efficient empty() implementation
+    # pk.View zeros out the allocation, see
+    # empty_like() for the uninitialized variant
     view: pk.View = pk.View([*x.shape], dtype=dtype)
     return view
 
@@ -41,18 +55,12 @@ def zeros_like(x, /, *, dtype=None, device=None):
 def full(shape, fill_value, *, dtype=None, device=None):
     if dtype is None:
         dtype = fill_value.dtype
-    try:
-        view: pk.View = pk.View([*shape], dtype=dtype)
-    except TypeError:
-        view: pk.View = pk.View([shape], dtype=dtype)
+    view: pk.View = empty(shape, dtype=dtype)
     view[:] = fill_value
     return view
 
 
 def full_like(x, /, fill_value, *, dtype=None, device=None):
-    if dtype is None:
-        dtype = x.dtype
-    shape = x.shape
-    view: pk.View = pk.View([*shape], dtype=dtype)
+    view: pk.View = empty_like(x, dtype=dtype)
     view[:] = fill_value
     return view
@@ -66,7 +66,15 @@ def finfo(type_or_arr):
     # so we can run the array API tests,
     # and effectively just copies return
     # values from the NumPy equivalent
-    if "float" in str(type_or_arr) and not "float64" in str(type_or_arr):
+    if "bfloat16" in str(type_or_arr):
+        return info_type_attrs(bits=16,
+                               min=-3.3895314e+38,
+                               max=3.3895314e+38)
+    elif "float16" in str(type_or_arr):
+        return info_type_attrs(bits=16,
+                               min=-65504.0,
+                               max=65504.0)
+    elif "float" in str(type_or_arr) and not "float64" in str(type_or_arr):
         return info_type_attrs(bits=32,
                                min=-3.4028235e+38,
                                max=3.4028235e+38,)
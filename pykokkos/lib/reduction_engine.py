@@ -0,0 +1,683 @@
+"""
+Generated axis reductions.
+
+A reduction over any axes of a View of any rank is described by the
+extents and strides of the kept and of the reduced dimensions, after
+merging the dimensions that are contiguous with each other. The
+workunits only depend on the reduction and the dtype, and are
+generated and cached like the ufunc kernels. Each output element is
+reduced by one thread, except for long axes with few outputs, whose
+elements are split between the threads of several teams and combined
+by a second kernel.
+
+mean is computed as a sum divided once by the number of elements. var
+and std are computed in a single pass with Welford's algorithm, whose
+partial results are merged with the formula of Chan et al. min, max
+and their positions are tracked like the MinLoc and MaxLoc reducers of
+Kokkos, keeping the first position of the extremum.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import pykokkos as pk
+from pykokkos.interface import Layout, Subview, ViewType
+from pykokkos.lib.ufunc_engine import (
+    ALL_DTYPES, FLOAT_DTYPES, HALF_DTYPES, TYPE_NAMES, LazyArray, copy_view,
+    format_module, get_dtype_name, get_flat_view, has_flat_memory, load_kernel
+)
+
+# the reduced length from which an axis is split between teams
+SPLIT_MIN_LENGTH: int = 4096
+
+# the number of elements each thread of a split reduction reduces at least
+PART_MIN_LENGTH: int = 1024
+
+# the number of parts of a split reduction each team reduces
+TEAM_PARTS: int = 32
+
+# the number of parts a split reduction aims for across all outputs
+TARGET_PARTS: int = 1024
+
+# the position of the first dimension in the meta View, which starts
+# with the offset, the number of kept and of reduced dimensions and
+# the number of elements reduced per output
+META_DIMS: int = 4
+
+
+@dataclass(frozen=True)
+class ReductionDef:
+    """
+    The definition of an axis reduction, which either sums the
+    elements, updates a running mean and sum of squared deviations
+    with Welford's algorithm, or tracks extrema and their positions.
+    finalize is the expression of the result in terms of {total} for
+    sums, or of {mean} and {m2} for Welford reductions, and of {count},
+    the number of elements.
+    """
+
+    name: str
+    finalize: str = ""
+    # whether to accumulate the mean and sum of squared deviations
+    # instead of the sum
+    welford: bool = False
+    # whether integer inputs give a float result
+    float_result: bool = True
+    # "min" or "max" for each extremum tracked, each giving a result
+    extrema: Tuple[str, ...] = ()
+    # whether the result is the position of the extremum in the
+    # reduced axes, in row-major order, instead of its value
+    indexed: bool = False
+
+    @property
+    def num_results(self) -> int:
+        return 1 if self.indexed or len(self.extrema) == 0 else len(self.extrema)
+
+
+reduction_defs: Dict[str, ReductionDef] = {d.name: d for d in [
+    ReductionDef("sum", "{total}", float_result=False),
+    ReductionDef("mean", "{total} / {count}"),
+    ReductionDef("var", "{m2} / ({count} - ddof)", welford=True),
+    ReductionDef("std", "sqrt({m2} / ({count} - ddof))", welford=True),
+    ReductionDef("max", extrema=("max",)),
+    ReductionDef("min", extrema=("min",)),
+    ReductionDef("minmax", extrema=("min", "max")),
+    ReductionDef("argmax", extrema=("max",), indexed=True),
+    ReductionDef("argmin", extrema=("min",), indexed=True),
+]}
+
+# the comparison an element must pass to replace an extremum
+EXTREMUM_OPS: Dict[str, str] = {"min": "<", "max": ">"}
+
+# maps (reduction, dtype, variant) to the generated workunit
+reduction_kernel_cache: Dict[Tuple[str, str, str], Callable] = {}
+
+
+def get_acc_dtype(defn: ReductionDef, dtype: str) -> str:
+    """
+    Get the dtype a reduction accumulates in: float64, or the 64-bit
+    integer of the same signedness for integer sums
+
+    :param defn: the definition of the reduction
+    :param dtype: the name of the dtype of the input
+    :returns: the name of the accumulation dtype
+    """
+
+    if len(defn.extrema) > 0:
+        # extrema are kept in the dtype of the input
+        return "float32" if dtype in HALF_DTYPES else dtype
+
+    if defn.float_result or dtype in FLOAT_DTYPES:
+        return "float64"
+
+    return "uint64" if dtype.startswith("uint") else "int64"
+
+
+def get_reduction_dtype(defn: ReductionDef, dtype: str) -> str:
+    """
+    Get the dtype of the result of a reduction: int64 for positions,
+    the dtype of float inputs and of extrema, and float64 or the
+    accumulation dtype for integer inputs
+
+    :param defn: the definition of the reduction
+    :param dtype: the name of the dtype of the input
+    :returns: the name of the result dtype
+    """
+
+    if defn.indexed:
+        return "int64"
+    if dtype in FLOAT_DTYPES or len(defn.extrema) > 0:
+        return dtype
+
+    return "float64" if defn.float_result else get_acc_dtype(defn, dtype)
+
+
+def normalize_axis(name: str, axis: Union[None, int, Sequence[int]], ndim: int) -> Tuple[int, ...]:
+    """
+    Get the sorted, non-negative axes a reduction reduces
+
+    :param name: the name of the reduction, for error messages
+    :param axis: None for all axes, an axis, or a sequence of axes
+    :param ndim: the rank of the View
+    :returns: the axes
+    """
+
+    if axis is None:
+        return tuple(range(ndim))
+
+    axes: Tuple = tuple(axis) if isinstance(axis, (tuple, list)) else (axis,)
+    normalized: List[int] = []
+    for a in axes:
+        if not isinstance(a, (int, np.integer)) or isinstance(a, bool):
+            raise TypeError(f"ERROR: {name}() axes must be integers, got {a!r}")
+        if not -max(ndim, 1) <= a < max(ndim, 1):
+            raise ValueError(f"ERROR: axis {a} is out of bounds for a View of {ndim} dimensions")
+        normalized.append(int(a) % max(ndim, 1))
+
+    if len(set(normalized)) != len(normalized):
+        raise ValueError(f"ERROR: {name}() got a repeated axis in {axis}")
+
+    return tuple(sorted(normalized))
+
+
+def merge_dims(dims: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge consecutive dimensions whose elements are contiguous with
+    each other, and drop those of extent 1, without changing the order
+    in which the elements are visited
+
+    :param dims: the (extent, stride) of each dimension, outermost first
+    :returns: the merged dimensions
+    """
+
+    merged: List[Tuple[int, int]] = []
+    for extent, stride in dims:
+        if extent == 1:
+            continue
+        if len(merged) > 0 and merged[-1][1] == extent * stride:
+            merged[-1] = (merged[-1][0] * extent, stride)
+        else:
+            merged.append((extent, stride))
+
+    return merged
+
+
+def get_meta(view: ViewType, axes: Tuple[int, ...], ordered: bool = False) -> List[int]:
+    """
+    Describe the elements each output of a reduction reduces. The
+    meta View holds the offset of the View in its base memory, the
+    number of kept and of reduced dimensions, the number of elements
+    reduced per output, then the (extent, stride) of each kept and
+    each reduced dimension. The reduced dimensions are sorted by
+    decreasing stride, since the order in which they are visited does
+    not change the result, so that the innermost loop has the smallest
+    stride, unless the positions of the elements matter.
+
+    :param view: the View
+    :param axes: the normalized reduced axes
+    :param ordered: whether to visit the reduced elements in row-major
+        order, so that their positions are their row-major indices
+    :returns: the contents of the meta View
+    """
+
+    itemsize: int = view.data.itemsize
+    dims: List[Tuple[int, int]] = [(n, s // itemsize) for n, s in zip(view.shape, view.data.strides)]
+
+    kept: List[Tuple[int, int]] = merge_dims([d for i, d in enumerate(dims) if i not in axes])
+    reduced: List[Tuple[int, int]] = [d for i, d in enumerate(dims) if i in axes]
+    if not ordered:
+        reduced = sorted(reduced, key=lambda d: abs(d[1]), reverse=True)
+    reduced = merge_dims(reduced)
+    if len(reduced) == 0:
+        reduced = [(1, 0)]
+
+    length: int = math.prod(n for n, _ in reduced)
+    meta: List[int] = [view.offset if isinstance(view, Subview) else 0, len(kept), len(reduced), length]
+    for extent, stride in kept + reduced:
+        meta += [extent, stride]
+
+    return meta
+
+
+def get_lines_output_base(index: str) -> List[str]:
+    """
+    Get the statements computing the position in the base memory of
+    the first element an output reduces
+
+    :param index: the name of the variable holding the output index
+    :returns: the statements, defining base
+    """
+
+    return [
+        "base: pk.int64 = meta[0]",
+        f"rem: pk.int64 = {index}",
+        "for k in range(meta[1]):",
+        f"    d: int = {META_DIMS} + 2 * (meta[1] - 1 - k)",
+        "    base += (rem % meta[d]) * meta[d + 1]",
+        "    rem = rem // meta[d]",
+    ]
+
+
+def get_register_type(defn: ReductionDef, dtype: str) -> str:
+    """
+    Get the annotation of the variables a reduction accumulates in
+
+    :param defn: the definition of the reduction
+    :param dtype: the name of the dtype of the input
+    :returns: the annotation, e.g. "pk.double"
+    """
+
+    return f"pk.{TYPE_NAMES[get_acc_dtype(defn, dtype)]}"
+
+
+def get_lines_init(defn: ReductionDef, dtype: str) -> List[str]:
+    """
+    Get the statements defining the variables a reduction accumulates
+    in. A position of -1 marks an extremum not found yet.
+
+    :param defn: the definition of the reduction
+    :param dtype: the name of the dtype of the input
+    :returns: the statements
+    """
+
+    if defn.welford:
+        return ["count: pk.double = 0", "mean: pk.double = 0", "m2: pk.double = 0"]
+
+    acc_type: str = get_register_type(defn, dtype)
+    if len(defn.extrema) == 0:
+        return [f"total: {acc_type} = 0"]
+
+    lines: List[str] = []
+    for e in range(len(defn.extrema)):
+        lines += [f"best{e}: {acc_type} = 0", f"at{e}: pk.int64 = -1"]
+
+    return lines
+
+
+def get_lines_update_extremum(op: str, e: int, value: str, position: str, found: str = "") -> List[str]:
+    """
+    Get the statements replacing an extremum by a value that is
+    further, or that is the first NaN, which propagates as in numpy
+
+    :param op: "min" or "max"
+    :param e: the number of the extremum
+    :param value: the expression of the value
+    :param position: the expression of the position of the value
+    :param found: an extra condition for the value to be considered
+    :returns: the statements
+    """
+
+    cmp: str = EXTREMUM_OPS[op]
+    lines: List[str] = [
+        f"if at{e} < 0 or {value} {cmp} best{e} or ({value} != {value} and best{e} == best{e}):",
+        f"    best{e} = {value}",
+        f"    at{e} = {position}",
+    ]
+
+    # a separate statement, since the translator does not keep the
+    # parentheses of a disjunction inside a conjunction
+    if found:
+        lines = [f"if {found}:"] + [f"    {line}" for line in lines]
+
+    return lines
+
+
+def get_lines_reduce_range(defn: ReductionDef, dtype: str, begin: str, end: str) -> List[str]:
+    """
+    Get the statements reducing the elements of an output between two
+    positions of the reduced dimensions. Elements are visited a row of
+    the innermost dimension at a time, so that the position of a row
+    is only recomputed once per row.
+
+    :param defn: the definition of the reduction
+    :param dtype: the name of the dtype of the input
+    :param begin: the expression of the first position
+    :param end: the expression of the position after the last
+    :returns: the statements, defining the variables of get_lines_init
+    """
+
+    load: str = "data[row + j * meta[inner + 1]]"
+    if dtype in HALF_DTYPES:
+        load = f"float({load})"
+
+    accumulate: List[str]
+    if defn.welford:
+        accumulate = [
+            f"x: pk.double = {load}",
+            "count += 1",
+            "delta: pk.double = x - mean",
+            "mean += delta / count",
+            "m2 += delta * (x - mean)",
+        ]
+    elif len(defn.extrema) > 0:
+        accumulate = [f"x: {get_register_type(defn, dtype)} = {load}"]
+        for e, op in enumerate(defn.extrema):
+            accumulate += get_lines_update_extremum(op, e, "x", "r + j - i")
+    else:
+        accumulate = [f"total += {load}"]
+
+    return get_lines_init(defn, dtype) + [
+        f"inner: int = {META_DIMS} + 2 * (meta[1] + meta[2] - 1)",
+        f"r: pk.int64 = {begin}",
+        f"while r < {end}:",
+        "    q: pk.int64 = r // meta[inner]",
+        "    i: int = r - q * meta[inner]",
+        "    row: pk.int64 = base",
+        "    for k in range(meta[2] - 1):",
+        f"        d: int = {META_DIMS} + 2 * (meta[1] + meta[2] - 2 - k)",
+        "        row += (q % meta[d]) * meta[d + 1]",
+        "        q = q // meta[d]",
+        "    stop: int = meta[inner]",
+        f"    if {end} - r + i < stop:",
+        f"        stop = {end} - r + i",
+        "    for j in range(i, stop):",
+        *[f"        {line}" for line in accumulate],
+        "    r += stop - i",
+    ]
+
+
+def get_partial_width(defn: ReductionDef) -> int:
+    """
+    Get the number of values each part of a split reduction writes to
+    partials
+
+    :param defn: the definition of the reduction
+    :returns: the number of values
+    """
+
+    if defn.welford:
+        return 3
+
+    return max(len(defn.extrema), 1)
+
+
+def get_lines_store_partials(defn: ReductionDef, index: str) -> List[str]:
+    """
+    Get the statements writing the result of a part of a split
+    reduction
+
+    :param defn: the definition of the reduction
+    :param index: the expression of the index of the part
+    :returns: the statements
+    """
+
+    if defn.welford:
+        return [
+            f"partials[({index}) * 3] = count",
+            f"partials[({index}) * 3 + 1] = mean",
+            f"partials[({index}) * 3 + 2] = m2",
+        ]
+
+    if len(defn.extrema) == 0:
+        return [f"partials[{index}] = total"]
+
+    width: int = len(defn.extrema)
+    lines: List[str] = []
+    for e in range(width):
+        lines += [f"partials[({index}) * {width} + {e}] = best{e}",
+                  f"indices[({index}) * {width} + {e}] = at{e}"]
+
+    return lines
+
+
+def get_lines_combine(defn: ReductionDef, dtype: str) -> List[str]:
+    """
+    Get the statements combining the partials of an output, in the
+    order of the parts, so that the first position of an extremum is
+    kept
+
+    :param defn: the definition of the reduction
+    :param dtype: the name of the dtype of the input
+    :returns: the statements, defining the variables of get_lines_init
+    """
+
+    lines: List[str] = get_lines_init(defn, dtype)
+    lines.append("for p in range(width):")
+
+    if defn.welford:
+        body: List[str] = [
+            "k: int = (tid * width + p) * 3",
+            "n: pk.double = partials[k]",
+            "if n > 0:",
+            "    delta: pk.double = partials[k + 1] - mean",
+            "    total: pk.double = count + n",
+            "    mean += delta * n / total",
+            "    m2 += partials[k + 2] + delta * delta * count * n / total",
+            "    count = total",
+        ]
+    elif len(defn.extrema) > 0:
+        body = []
+        num_extrema: int = len(defn.extrema)
+        for e, op in enumerate(defn.extrema):
+            body.append(f"k{e}: int = (tid * width + p) * {num_extrema} + {e}")
+            body += get_lines_update_extremum(op, e, f"partials[k{e}]", f"indices[k{e}]", f"indices[k{e}] >= 0")
+    else:
+        body = ["total += partials[tid * width + p]"]
+
+    return lines + [f"    {line}" for line in body]
+
+
+def get_output_names(defn: ReductionDef) -> List[str]:
+    """
+    Get the names of the output parameters of a reduction workunit
+
+    :param defn: the definition of the reduction
+    :returns: "out", or "out0", "out1", ... for several results
+    """
+
+    if defn.num_results == 1:
+        return ["out"]
+
+    return [f"out{e}" for e in range(defn.num_results)]
+
+
+def get_lines_output(defn: ReductionDef, index: str, count: str) -> List[str]:
+    """
+    Get the statements writing the results of an output
+
+    :param defn: the definition of the reduction
+    :param index: the expression of the index of the output
+    :param count: the expression of the number of elements
+    :returns: the statements
+    """
+
+    names: List[str] = get_output_names(defn)
+    if defn.indexed:
+        return [f"out[{index}] = at0"]
+    if len(defn.extrema) > 0:
+        return [f"{name}[{index}] = best{e}" for e, name in enumerate(names)]
+
+    result: str = defn.finalize.format(total="total", mean="mean", m2="m2", count=count)
+
+    return [f"out[{index}] = {result}"]
+
+
+def generate_reduction_source(defn: ReductionDef, dtype: str, variant: str) -> str:
+    """
+    Generate the source of a reduction workunit. The "direct" variant
+    reduces each output in one thread. The "split" variant runs on a
+    TeamPolicy whose teams each reduce a part of an output, split
+    further between their threads, and writes the result of each
+    thread to partials. The "combine" variant combines the partials
+    of each output.
+
+    :param defn: the definition of the reduction
+    :param dtype: the name of the dtype of the input
+    :param variant: "direct", "split" or "combine"
+    :returns: the source of a module defining the workunit
+    """
+
+    out_type: str = f"pk.{TYPE_NAMES[get_reduction_dtype(defn, dtype)]}"
+    outs: List[str] = [f"{name}: pk.View1D[{out_type}]" for name in get_output_names(defn)]
+    partials: List[str] = [f"partials: pk.View1D[pk.{TYPE_NAMES[get_acc_dtype(defn, dtype)]}]"]
+    if len(defn.extrema) > 0:
+        partials.append("indices: pk.View1D[pk.int64]")
+
+    params: List[str]
+    lines: List[str]
+    if variant == "direct":
+        params = ["tid: int", "meta: pk.View1D[pk.int64]", f"data: pk.View1D[pk.{TYPE_NAMES[dtype]}]", *outs]
+        lines = get_lines_output_base("tid")
+        lines += get_lines_reduce_range(defn, dtype, "0", "meta[3]")
+        lines += get_lines_output(defn, "tid", "meta[3]")
+
+    elif variant == "split":
+        params = ["team_member: pk.TeamMember", "meta: pk.View1D[pk.int64]",
+                  f"data: pk.View1D[pk.{TYPE_NAMES[dtype]}]", *partials, "splits: int", "parts: int"]
+        lines = [
+            "team: int = team_member.league_rank()",
+            *get_lines_output_base("team // splits"),
+            "length: pk.int64 = (meta[3] + splits * parts - 1) // (splits * parts)",
+            "",
+            "def reduce_part(p: int):",
+            "    begin: pk.int64 = ((team % splits) * parts + p) * length",
+            "    end: pk.int64 = begin + length",
+            "    if end > meta[3]:",
+            "        end = meta[3]",
+            *[f"    {line}" for line in get_lines_reduce_range(defn, dtype, "begin", "end")],
+            *[f"    {line}" for line in get_lines_store_partials(defn, "team * parts + p")],
+            "",
+            "pk.parallel_for(pk.TeamThreadRange(team_member, parts), reduce_part)",
+        ]
+
+    elif variant == "combine":
+        params = ["tid: int", *partials, *outs, "length: int", "width: int"]
+        lines = get_lines_combine(defn, dtype)
+        lines += get_lines_output(defn, "tid", "length")
+
+    else:
+        raise ValueError(f"ERROR: unknown reduction variant {variant}")
+
+    if defn.welford and variant != "split":
+        params.append("ddof: float")
+
+    return format_module(get_reduction_kernel_name(defn.name, dtype, variant), params, lines)
+
+
+def get_reduction_kernel_name(name: str, dtype: str, variant: str) -> str:
+    """
+    Get the name of a reduction workunit, e.g. "reduce_var_float32_split"
+
+    :param name: the name of the reduction
+    :param dtype: the name of the dtype of the input
+    :param variant: "direct", "split" or "combine"
+    :returns: the name
+    """
+
+    suffix: str = "" if variant == "direct" else f"_{variant}"
+
+    return f"reduce_{name}_{dtype}{suffix}"
+
+
+def get_reduction_kernel(name: str, dtype: str, variant: str) -> Callable:
+    """
+    Get a reduction workunit, generating it on first use
+
+    :param name: the name of the reduction
+    :param dtype: the name of the dtype of the input
+    :param variant: "direct", "split" or "combine"
+    :returns: the workunit
+    """
+
+    key: Tuple[str, str, str] = (name, dtype, variant)
+    kernel: Optional[Callable] = reduction_kernel_cache.get(key)
+    if kernel is None:
+        source: str = generate_reduction_source(reduction_defs[name], dtype, variant)
+        kernel = load_kernel(get_reduction_kernel_name(name, dtype, variant), source)
+        reduction_kernel_cache[key] = kernel
+
+    return kernel
+
+
+def get_splits(num_outputs: int, length: int) -> Tuple[int, int]:
+    """
+    Choose how to split the elements of each output between teams.
+    Axes are only split when they are long and the outputs are too
+    few to keep the device busy with one thread each.
+
+    :param num_outputs: the number of outputs
+    :param length: the number of elements reduced per output
+    :returns: the number of teams per output and of parts per team,
+        (1, 1) if the outputs are not split
+    """
+
+    if length < SPLIT_MIN_LENGTH or num_outputs >= TARGET_PARTS:
+        return 1, 1
+
+    num_parts: int = min(-(-length // PART_MIN_LENGTH), -(-TARGET_PARTS // num_outputs))
+    parts: int = min(num_parts, TEAM_PARTS)
+
+    return -(-num_parts // parts), parts
+
+
+def apply_reduction(
+    name: str,
+    view,
+    axis: Union[None, int, Sequence[int]] = None,
+    keepdims: bool = False,
+    ddof: float = 0,
+    profiler_name: Optional[str] = None
+):
+    """
+    Reduce a View along some of its axes
+
+    :param name: the name of the reduction, a key of reduction_defs
+    :param view: the View, of any rank
+    :param axis: None to reduce all axes, an axis, or a tuple of axes
+    :param keepdims: whether to keep the reduced axes with extent 1
+    :param ddof: for var and std, the number of elements subtracted
+        from the count in the denominator
+    :param profiler_name: the name of the kernels shown by Kokkos tools
+    :returns: a View of the kept axes, or a Python scalar if no axis is
+        kept and keepdims is False, or a tuple of them for minmax
+    """
+
+    defn: ReductionDef = reduction_defs[name]
+    if isinstance(view, LazyArray):
+        view = view.compute()
+    if not isinstance(view, ViewType):
+        raise TypeError(f"ERROR: {name}() expects a View, got {type(view)}")
+
+    dtype: str = get_dtype_name(view.dtype)
+    if dtype not in ALL_DTYPES:
+        raise TypeError(f"ERROR: {name}() does not support {dtype} Views")
+    if defn.indexed and axis is not None and not isinstance(axis, (int, np.integer)):
+        raise TypeError(f"ERROR: {name}() expects axis to be None or an int, got {type(axis)}")
+
+    shape: Tuple[int, ...] = tuple(view.shape)
+    axes: Tuple[int, ...] = normalize_axis(name, axis, len(shape))
+    out_shape: List[int] = []
+    for i, n in enumerate(shape):
+        if i not in axes:
+            out_shape.append(n)
+        elif keepdims:
+            out_shape.append(1)
+
+    out_dtype: str = get_reduction_dtype(defn, dtype)
+    out_class = view.dtype if out_dtype == dtype else getattr(pk, out_dtype)
+    outs: List = [pk.View(out_shape, dtype=out_class, layout=Layout.LayoutRight, initialize=False)
+                  for _ in range(defn.num_results)]
+    out_args: Dict = {n: get_flat_view(o) for n, o in zip(get_output_names(defn), outs)}
+
+    num_outputs: int = math.prod(out_shape)
+    if num_outputs > 0:
+        if not isinstance(view, Subview) and not has_flat_memory(view):
+            # e.g. a View wrapping a numpy slice, whose memory cannot
+            # be indexed as 1D
+            view = copy_view(view)
+        meta: List[int] = get_meta(view, axes, ordered=defn.indexed)
+        length: int = meta[3]
+        if length == 0 and len(defn.extrema) > 0:
+            raise ValueError(f"ERROR: {name}() of an empty sequence")
+
+        args: Dict = {"meta": pk.array(np.array(meta, dtype=np.int64)), "data": get_flat_view(view)}
+        welford: Dict = {"ddof": float(ddof)} if defn.welford else {}
+
+        splits, parts = get_splits(num_outputs, length)
+        if splits * parts == 1:
+            kernel: Callable = get_reduction_kernel(name, dtype, "direct")
+            pk.parallel_for(profiler_name, num_outputs, kernel, **args, **out_args, **welford)
+        else:
+            width: int = splits * parts
+            size: int = num_outputs * width * get_partial_width(defn)
+            partial_args: Dict = {"partials": pk.View([size], dtype=getattr(pk, get_acc_dtype(defn, dtype)),
+                                                      initialize=False)}
+            if len(defn.extrema) > 0:
+                partial_args["indices"] = pk.View([size], dtype=pk.int64, initialize=False)
+
+            kernel = get_reduction_kernel(name, dtype, "split")
+            policy = pk.TeamPolicy(num_outputs * splits, pk.AUTO)
+            pk.parallel_for(profiler_name, policy, kernel, splits=splits, parts=parts, **args, **partial_args)
+
+            kernel = get_reduction_kernel(name, dtype, "combine")
+            pk.parallel_for(profiler_name, num_outputs, kernel, length=length, width=width,
+                            **partial_args, **out_args, **welford)
+
+    results: List = outs
+    if len(out_shape) == 0:
+        results = [float(o) if out_dtype in FLOAT_DTYPES else int(o) for o in outs]
+
+    return results[0] if len(results) == 1 else tuple(results)
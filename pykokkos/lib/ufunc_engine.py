@@ -0,0 +1,1256 @@
+"""
+Generated elementwise ufunc kernels.
+
+Each ufunc is defined once, by a scalar expression over its inputs.
+The workunits applying it to Views of a given dtype and rank are
+generated as Python source the first time they are needed, written
+under pk_cpp so that the translator can parse them, and cached. Views
+whose elements are contiguous in their layout are indexed directly,
+and strided Subviews through the memory of their base view with
+explicit offsets and strides.
+"""
+
+import contextlib
+import hashlib
+import importlib.util
+import math
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import pykokkos as pk
+from pykokkos.bindings import kokkos
+from pykokkos.core.module_setup import BASE_DIR
+from pykokkos.interface import DataType, Layout, Subview, Trait, ViewType
+
+FLOAT_DTYPES: Tuple[str, ...] = ("float64", "float32", "float16", "bfloat16")
+INT_DTYPES: Tuple[str, ...] = (
+    "int8", "int16", "int32", "int64",
+    "uint8", "uint16", "uint32", "uint64",
+)
+ALL_DTYPES: Tuple[str, ...] = FLOAT_DTYPES + INT_DTYPES
+
+# 16-bit floats are loaded into and computed in float32
+HALF_DTYPES: Tuple[str, ...] = ("float16", "bfloat16")
+
+# the highest rank of a View both the translator (View1D to View7D)
+# and the pykokkos-base build, e.g. with -DENABLE_VIEW_RANKS=5, accept
+MAX_RANK: int = min(7, kokkos.max_concrete_rank)
+
+# the directory the generated workunits are written to
+GENERATED_DIR: str = os.path.join(BASE_DIR, "ufuncs")
+
+# maps dtype names to the names of the pykokkos types in annotations
+TYPE_NAMES: Dict[str, str] = {
+    "float64": "double",
+    "float32": "float",
+    **{dtype: dtype for dtype in ALL_DTYPES if dtype not in ("float64", "float32")},
+}
+
+
+@dataclass(frozen=True)
+class UfuncDef:
+    """
+    The definition of an elementwise ufunc. Expressions and bodies are
+    Python source in which {0}, {1}, ... are the input elements,
+    already converted to the compute type, and {out} is the output
+    element.
+    """
+
+    name: str
+    nin: int
+    expr: str
+    dtypes: Tuple[str, ...]
+    # used instead of expr for integer dtypes
+    int_expr: Optional[str] = None
+    # statements assigning {out}, used instead of expr when a single
+    # expression cannot be written without branching
+    body: Optional[str] = None
+    # used instead of body or expr for integer dtypes
+    int_body: Optional[str] = None
+    # whether the result is a truth value, stored in a bool View
+    predicate: bool = False
+
+    def has_body(self, dtype: str) -> bool:
+        """
+        Whether the output element is computed by statements rather
+        than by a single expression
+
+        :param dtype: the name of the dtype of the inputs
+        :returns: True if get_body returns a body
+        """
+
+        return self.body is not None or (dtype in INT_DTYPES and self.int_body is not None)
+
+    def get_body(self, dtype: str) -> str:
+        """
+        Get the statements computing the output element
+
+        :param dtype: the name of the dtype of the inputs
+        :returns: the statements, without indentation
+        """
+
+        if dtype in INT_DTYPES and self.int_body is not None:
+            return self.int_body
+        if self.body is not None:
+            return self.body
+
+        expr: str = self.expr
+        if dtype in INT_DTYPES and self.int_expr is not None:
+            expr = self.int_expr
+
+        return "{out} = " + expr
+
+
+SIGN_BODY: str = """\
+if {0} > 0:
+    {out} = 1
+elif {0} < 0:
+    {out} = -1
+else:
+    {out} = {0}"""
+
+# log(exp(a) + exp(b)) without overflowing for large inputs
+LOGADDEXP_BODY: str = """\
+if {0} == {1}:
+    {out} = {0} + log(2.0)
+else:
+    {out} = fmax({0}, {1}) + log1p(exp(-fabs({0} - {1})))"""
+
+LOGADDEXP2_BODY: str = """\
+if {0} == {1}:
+    {out} = {0} + 1
+else:
+    {out} = fmax({0}, {1}) + log1p(exp2(-fabs({0} - {1}))) / log(2.0)"""
+
+# integer division rounding toward negative infinity as in numpy, with
+# 0 for a zero divisor. {0} - {0} % {1} is a multiple of {1}, so the
+# quotient is exact in double for inputs below 2**53.
+FLOOR_DIVIDE_INT_BODY: str = """\
+if {1} == 0:
+    {out} = 0
+elif {0} % {1} != 0 and ({0} % {1} < 0) != ({1} < 0):
+    {out} = ({0} - {0} % {1}) / {1} - 1
+else:
+    {out} = ({0} - {0} % {1}) / {1}"""
+
+ufunc_defs: Dict[str, UfuncDef] = {d.name: d for d in [
+    # unary
+    UfuncDef("exp", 1, "exp({0})", FLOAT_DTYPES),
+    UfuncDef("exp2", 1, "exp2({0})", FLOAT_DTYPES),
+    UfuncDef("log", 1, "log({0})", FLOAT_DTYPES),
+    UfuncDef("log2", 1, "log2({0})", FLOAT_DTYPES),
+    UfuncDef("log10", 1, "log10({0})", FLOAT_DTYPES),
+    UfuncDef("log1p", 1, "log1p({0})", FLOAT_DTYPES),
+    UfuncDef("sqrt", 1, "sqrt({0})", FLOAT_DTYPES),
+    UfuncDef("sin", 1, "sin({0})", FLOAT_DTYPES),
+    UfuncDef("cos", 1, "cos({0})", FLOAT_DTYPES),
+    UfuncDef("tan", 1, "tan({0})", FLOAT_DTYPES),
+    UfuncDef("tanh", 1, "tanh({0})", FLOAT_DTYPES),
+    UfuncDef("reciprocal", 1, "1 / {0}", FLOAT_DTYPES),
+    UfuncDef("floor", 1, "floor({0})", ALL_DTYPES, int_expr="{0}"),
+    UfuncDef("ceil", 1, "ceil({0})", ALL_DTYPES, int_expr="{0}"),
+    UfuncDef("trunc", 1, "trunc({0})", ALL_DTYPES, int_expr="{0}"),
+    UfuncDef("round", 1, "round({0})", ALL_DTYPES, int_expr="{0}"),
+    UfuncDef("negative", 1, "-{0}", ALL_DTYPES),
+    UfuncDef("positive", 1, "{0}", ALL_DTYPES),
+    UfuncDef("square", 1, "{0} * {0}", ALL_DTYPES),
+    UfuncDef("sign", 1, "", ALL_DTYPES, body=SIGN_BODY),
+    UfuncDef("isnan", 1, "isnan({0})", ALL_DTYPES, int_expr="0", predicate=True),
+    UfuncDef("isinf", 1, "isinf({0})", ALL_DTYPES, int_expr="0", predicate=True),
+    UfuncDef("isfinite", 1, "isfinite({0})", ALL_DTYPES, int_expr="1", predicate=True),
+    UfuncDef("logical_not", 1, "{0} == 0", ALL_DTYPES, predicate=True),
+    # binary
+    UfuncDef("add", 2, "{0} + {1}", ALL_DTYPES),
+    UfuncDef("subtract", 2, "{0} - {1}", ALL_DTYPES),
+    UfuncDef("multiply", 2, "{0} * {1}", ALL_DTYPES),
+    UfuncDef("divide", 2, "{0} / {1}", FLOAT_DTYPES),
+    UfuncDef("floor_divide", 2, "floor({0} / {1})", ALL_DTYPES, int_body=FLOOR_DIVIDE_INT_BODY),
+    UfuncDef("power", 2, "pow({0}, {1})", ALL_DTYPES),
+    UfuncDef("fmod", 2, "fmod({0}, {1})", ALL_DTYPES, int_expr="{0} % {1}"),
+    UfuncDef("fmax", 2, "fmax({0}, {1})", FLOAT_DTYPES),
+    UfuncDef("fmin", 2, "fmin({0}, {1})", FLOAT_DTYPES),
+    UfuncDef("logaddexp", 2, "", FLOAT_DTYPES, body=LOGADDEXP_BODY),
+    UfuncDef("logaddexp2", 2, "", FLOAT_DTYPES, body=LOGADDEXP2_BODY),
+    UfuncDef("greater", 2, "{0} > {1}", ALL_DTYPES, predicate=True),
+    UfuncDef("greater_equal", 2, "{0} >= {1}", ALL_DTYPES, predicate=True),
+    UfuncDef("less", 2, "{0} < {1}", ALL_DTYPES, predicate=True),
+    UfuncDef("less_equal", 2, "{0} <= {1}", ALL_DTYPES, predicate=True),
+    UfuncDef("equal", 2, "{0} == {1}", ALL_DTYPES, predicate=True),
+    UfuncDef("not_equal", 2, "{0} != {1}", ALL_DTYPES, predicate=True),
+    UfuncDef("logical_and", 2, "{0} != 0 and {1} != 0", ALL_DTYPES, predicate=True),
+    UfuncDef("logical_or", 2, "{0} != 0 or {1} != 0", ALL_DTYPES, predicate=True),
+    UfuncDef("logical_xor", 2, "({0} != 0) != ({1} != 0)", ALL_DTYPES, predicate=True),
+]}
+
+# the dtypes of the inputs and of the output of a kernel
+Signature = Tuple[Tuple[str, ...], str]
+
+# maps (ufunc, signature, rank, strided, positions of the 0-D inputs)
+# to the generated workunit
+kernel_cache: Dict[Tuple[str, Signature, int, bool, Tuple[int, ...]], Callable] = {}
+
+
+def compute_dtype_name(dtype) -> str:
+    """
+    Compute the name a ufunc kernel uses for the dtype of a View
+
+    :param dtype: a DataTypeClass subclass or DataType member
+    :returns: the name, e.g. "float64"
+    """
+
+    name: str = dtype.name if isinstance(dtype, DataType) else dtype.__name__
+    if name == "double":
+        return "float64"
+    if name == "float":
+        return "float32"
+    if name == "bool":
+        return "uint8"
+
+    return name
+
+
+# maps the dtypes of Views, both DataTypeClass subclasses and DataType
+# members, to the names used by the kernels, so that dispatching does
+# not inspect the dtype on every call
+dtype_names: Dict[object, str] = {
+    **{member: compute_dtype_name(member) for member in DataType},
+    **{dtype: compute_dtype_name(dtype) for dtype in (
+        pk.int8, pk.int16, pk.int32, pk.int64,
+        pk.uint8, pk.uint16, pk.uint32, pk.uint64,
+        pk.float, pk.double, pk.float32, pk.float64,
+        pk.float16, pk.bfloat16, pk.bool,
+    )},
+}
+
+
+def get_dtype_name(dtype) -> str:
+    """
+    Get the name a ufunc kernel uses for the dtype of a View
+
+    :param dtype: a DataTypeClass subclass or DataType member
+    :returns: the name, e.g. "float64"
+    """
+
+    name: Optional[str] = dtype_names.get(dtype)
+    if name is None:
+        name = compute_dtype_name(dtype)
+        dtype_names[dtype] = name
+
+    return name
+
+
+def promote_types(a: str, b: str) -> str:
+    """
+    Get the dtype two dtypes promote to. Floats of the same kind and
+    integers of the same signedness promote to the wider one, as in
+    the array API standard, and the other mixtures follow numpy.
+    float16 and bfloat16, which numpy does not mix, promote to float32.
+
+    :param a: the name of a dtype
+    :param b: the name of another dtype
+    :returns: the name of the promoted dtype
+    """
+
+    if a == b:
+        return a
+
+    if "bfloat16" in (a, b):
+        other: str = b if a == "bfloat16" else a
+        if other == "float16":
+            return "float32"
+        # bfloat16 holds the integers float16 holds
+        promoted: str = promote_types(other, "float16")
+        return "bfloat16" if promoted == "float16" else promoted
+
+    return np.promote_types(a, b).name
+
+
+def get_compute_dtype(defn: UfuncDef, in_dtypes: Tuple[str, ...]) -> str:
+    """
+    Get the dtype a ufunc computes in for inputs of given dtypes, the
+    promoted dtype of the inputs, or the smallest float holding it
+    for ufuncs only defined on floats
+
+    :param defn: the definition of the ufunc
+    :param in_dtypes: the names of the dtypes of the inputs
+    :returns: the name of the compute dtype
+    """
+
+    dtype: str = in_dtypes[0]
+    for other in in_dtypes[1:]:
+        dtype = promote_types(dtype, other)
+
+    if dtype in INT_DTYPES and dtype not in defn.dtypes:
+        dtype = promote_types(dtype, "float16")
+
+    return dtype
+
+
+def get_result_dtype(defn: UfuncDef, in_dtypes: Tuple[str, ...]) -> str:
+    """
+    Get the dtype of the output a ufunc allocates
+
+    :param defn: the definition of the ufunc
+    :param in_dtypes: the names of the dtypes of the inputs
+    :returns: the name of the dtype
+    """
+
+    return "uint8" if defn.predicate else get_compute_dtype(defn, in_dtypes)
+
+
+def can_cast(from_dtype: str, to_dtype: str) -> bool:
+    """
+    Whether a result can be written to an output of another dtype,
+    following the "same_kind" casting of numpy ufuncs: within a kind,
+    or to a higher kind in the order unsigned, signed, float
+
+    :param from_dtype: the name of the dtype of the result
+    :param to_dtype: the name of the dtype of the output
+    :returns: True if the cast is allowed
+    """
+
+    def kind(dtype: str) -> int:
+        if dtype in FLOAT_DTYPES:
+            return 2
+        return 0 if dtype.startswith("uint") else 1
+
+    return kind(to_dtype) >= kind(from_dtype)
+
+
+def get_variant_suffix(strided: bool, scalars: Tuple[int, ...]) -> str:
+    """
+    Get the suffix of the name of a workunit telling its variant
+
+    :param strided: whether the workunit is the strided variant
+    :param scalars: the positions of the 0-D inputs of a contiguous
+        workunit
+    :returns: the suffix, e.g. "_strided" or "_s1"
+    """
+
+    if strided:
+        return "_strided"
+
+    return "".join(f"_s{k}" for k in scalars)
+
+
+def get_kernel_name(name: str, signature: Signature, rank: int, strided: bool, scalars: Tuple[int, ...] = ()) -> str:
+    in_dtypes, out_dtype = signature
+    # the dtype is only spelled out once when all operands share it
+    dtypes: List[str] = [in_dtypes[0]] if len(set(in_dtypes)) == 1 else list(in_dtypes)
+    if out_dtype != get_result_dtype(ufunc_defs[name], in_dtypes):
+        dtypes += ["to", out_dtype]
+
+    return f"{name}_{'_'.join(dtypes)}_{rank}d{get_variant_suffix(strided, scalars)}"
+
+
+def get_register_type(dtype: str) -> str:
+    """
+    Get the annotation of a variable holding a value of a dtype in a
+    kernel. 16-bit floats are held in float32.
+
+    :param dtype: the name of the dtype
+    :returns: the annotation, e.g. "pk.double"
+    """
+
+    return "pk.float" if dtype in HALF_DTYPES else f"pk.{TYPE_NAMES[dtype]}"
+
+
+def get_params(
+    in_dtypes: Tuple[str, ...],
+    out_dtype: str,
+    rank: int,
+    strided: bool,
+    scalars: Tuple[int, ...] = ()
+) -> List[str]:
+    """
+    Get the parameters of a generated workunit
+
+    :param in_dtypes: the names of the dtypes of the inputs
+    :param out_dtype: the name of the dtype of the output
+    :param rank: the rank of the Views
+    :param strided: whether the workunit is the strided variant
+    :param scalars: the positions of the 0-D inputs, which are backed
+        by a native View of one element
+    :returns: the parameters with their annotations
+    """
+
+    view_type: str = "pk.View1D" if strided else f"pk.View{rank}D"
+
+    params: List[str] = ["tid: int"]
+    if strided:
+        params.append("meta: pk.View1D[pk.int64]")
+    params += [f"in{k}: {'pk.View1D' if k in scalars else view_type}[pk.{TYPE_NAMES[dtype]}]"
+               for k, dtype in enumerate(in_dtypes)]
+    params.append(f"out: {view_type}[pk.{TYPE_NAMES[out_dtype]}]")
+
+    return params
+
+
+def get_index_lines(rank: int, strided: bool) -> Tuple[List[str], List[str]]:
+    """
+    Get the statements unraveling the thread index of a generated
+    workunit in row-major order
+
+    :param rank: the rank of the Views
+    :param strided: whether the workunit is the strided variant
+    :returns: the statements and the names of the indices
+    """
+
+    if rank == 1:
+        return [], ["tid"]
+
+    lines: List[str] = ["i: int = tid"]
+    for d in range(rank - 1, 0, -1):
+        extent: str = f"meta[{d}]" if strided else f"out.extent({d})"
+        lines.append(f"i{d}: int = i % {extent}")
+        lines.append(f"i = i // {extent}")
+    lines.append("i0: int = i")
+
+    return lines, [f"i{d}" for d in range(rank)]
+
+
+def get_subscript(indices: List[str], operand: int, strided: bool) -> str:
+    """
+    Get the subscript of an operand of a generated workunit
+
+    :param indices: the names of the indices
+    :param operand: the position of the operand, the output following
+        the inputs
+    :param strided: whether the workunit is the strided variant
+    :returns: the subscript, e.g. "[i0][i1]"
+    """
+
+    if not strided:
+        return "".join(f"[{i}]" for i in indices)
+
+    rank: int = len(indices)
+    start: int = rank + operand * (rank + 1)
+    terms: List[str] = [f"meta[{start}]"]
+    terms += [f"{i} * meta[{start + 1 + d}]" for d, i in enumerate(indices)]
+
+    return "[" + " + ".join(terms) + "]"
+
+
+def get_load(
+    in_dtypes: Tuple[str, ...],
+    k: int,
+    indices: List[str],
+    strided: bool,
+    scalars: Tuple[int, ...] = ()
+) -> str:
+    """
+    Get the expression reading an element of an input
+
+    :param in_dtypes: the names of the dtypes of the inputs
+    :param k: the position of the input
+    :param indices: the names of the indices
+    :param strided: whether the workunit is the strided variant
+    :param scalars: the positions of the 0-D inputs, whose only
+        element is read by every thread
+    :returns: the expression
+    """
+
+    subscript: str = "[0]" if k in scalars else get_subscript(indices, k, strided)
+    load: str = f"in{k}{subscript}"
+
+    return f"float({load})" if in_dtypes[k] in HALF_DTYPES else load
+
+
+def format_module(kernel_name: str, params: List[str], lines: List[str]) -> str:
+    """
+    Format the source of a module defining a generated workunit
+
+    :param kernel_name: the name of the workunit
+    :param params: the parameters of the workunit
+    :param lines: the statements of its body, without indentation
+    :returns: the source
+    """
+
+    return "\n".join([
+        "import pykokkos as pk",
+        "",
+        "",
+        "@pk.workunit",
+        f"def {kernel_name}({', '.join(params)}):",
+        *[f"    {line}" if line else "" for line in lines],
+        "",
+    ])
+
+
+def generate_source(
+    defn: UfuncDef,
+    signature: Signature,
+    rank: int,
+    strided: bool,
+    scalars: Tuple[int, ...] = ()
+) -> str:
+    """
+    Generate the source of the workunit applying a ufunc to Views of
+    given dtypes and rank. Each input is read at its own dtype and
+    converted to the compute dtype in registers. A contiguous kernel
+    takes the Views themselves, and reads the only element of 0-D
+    inputs, e.g. scalar operands. A strided kernel takes the 1D memory
+    of their base Views, and a meta View holding the extents followed
+    by the offset and strides of each input and of the output.
+
+    :param defn: the definition of the ufunc
+    :param signature: the names of the dtypes of the inputs and output
+    :param rank: the rank of the Views, between 1 and MAX_RANK
+    :param strided: whether to generate the strided variant
+    :param scalars: the positions of the 0-D inputs of a contiguous
+        variant
+    :returns: the source of a module defining the workunit
+    """
+
+    in_dtypes, out_dtype = signature
+    dtype: str = get_compute_dtype(defn, in_dtypes)
+    compute_type: str = get_register_type(dtype)
+
+    lines, indices = get_index_lines(rank, strided)
+    for k in range(defn.nin):
+        lines.append(f"x{k}: {compute_type} = {get_load(in_dtypes, k, indices, strided, scalars)}")
+
+    body: str = defn.get_body(dtype).format(
+        *[f"x{k}" for k in range(defn.nin)], out=f"out{get_subscript(indices, defn.nin, strided)}")
+    lines += body.splitlines()
+
+    kernel_name: str = get_kernel_name(defn.name, signature, rank, strided, scalars)
+
+    return format_module(kernel_name, get_params(in_dtypes, out_dtype, rank, strided, scalars), lines)
+
+
+def get_kernel(name: str, signature: Signature, rank: int, strided: bool, scalars: Tuple[int, ...] = ()) -> Callable:
+    """
+    Get the workunit applying a ufunc to Views of given dtypes and
+    rank, generating it on first use
+
+    :param name: the name of the ufunc
+    :param signature: the names of the dtypes of the inputs and output
+    :param rank: the rank of the Views
+    :param strided: whether to get the strided variant
+    :param scalars: the positions of the 0-D inputs of a contiguous
+        variant
+    :returns: the workunit
+    """
+
+    key: Tuple[str, Signature, int, bool, Tuple[int, ...]] = (name, signature, rank, strided, scalars)
+    if key in kernel_cache:
+        return kernel_cache[key]
+
+    source: str = generate_source(ufunc_defs[name], signature, rank, strided, scalars)
+    kernel: Callable = load_kernel(get_kernel_name(name, signature, rank, strided, scalars), source)
+    kernel_cache[key] = kernel
+
+    return kernel
+
+
+def load_kernel(kernel_name: str, source: str) -> Callable:
+    """
+    Write the source of a generated workunit under GENERATED_DIR and
+    import it
+
+    :param kernel_name: the name of the workunit
+    :param source: the source of the module defining it
+    :returns: the workunit
+    """
+
+    # the hash keeps kernels compiled from an older definition from
+    # being reused
+    digest: str = hashlib.md5(source.encode()).hexdigest()[:8]
+    path: str = os.path.abspath(os.path.join(GENERATED_DIR, f"{kernel_name}_{digest}.py"))
+    if not os.path.isfile(path):
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+        # write to a temporary file first so that concurrent processes
+        # never parse a partially written one
+        tmp_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(source)
+        os.replace(tmp_path, path)
+
+    spec = importlib.util.spec_from_file_location(f"pk_ufunc_{kernel_name}", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return getattr(module, kernel_name)
+
+
+def is_contiguous(view: ViewType) -> bool:
+    """
+    Whether the elements of a View are contiguous in its layout, so
+    that its native view can be indexed directly
+
+    :param view: the View or Subview
+    :returns: True if the View can be passed to a contiguous kernel
+    """
+
+    if not isinstance(view, Subview):
+        return True
+
+    flags = view.data.flags
+
+    return flags.f_contiguous if view.layout is Layout.LayoutLeft else flags.c_contiguous
+
+
+def has_flat_memory(view: ViewType) -> bool:
+    """
+    Whether the memory of the base View of a View is contiguous, which
+    is not the case of a View wrapping e.g. a numpy slice
+
+    :param view: the View or Subview
+    :returns: True if the memory can be indexed as 1D in place
+    """
+
+    base = view.base_view if isinstance(view, Subview) else view
+    flags = base.data.flags
+
+    return flags.c_contiguous or flags.f_contiguous
+
+
+def get_flat_view(view: ViewType) -> ViewType:
+    """
+    Get the 1D memory of the base View of a View, which a strided
+    kernel indexes with the offset and strides of the View
+
+    :param view: the View or Subview
+    :returns: an unmanaged 1D View
+    """
+
+    if not has_flat_memory(view):
+        # raveling would copy, and writes would be lost
+        raise ValueError("ERROR: the memory of the base View is not contiguous and cannot be indexed as 1D")
+
+    base = view.base_view if isinstance(view, Subview) else view
+    # ravel in memory order, so that offsets and strides measured
+    # from the base View's first element apply to both layouts
+    flat: np.ndarray = np.ravel(base.data, order="K")
+
+    return pk.View([flat.size], dtype=base.dtype, space=base.space,
+                   layout=base.layout, trait=Trait.Unmanaged, array=flat)
+
+
+def get_strided_args(operands: List[ViewType], shape: Tuple[int, ...]) -> Dict[str, ViewType]:
+    """
+    Get the arguments of a strided kernel. An operand of lower rank
+    or with an extent of 1 where the output's is larger is broadcast
+    by giving the corresponding dimensions a stride of 0, so that it
+    is read in place instead of being copied to the output shape.
+
+    :param operands: the inputs followed by the output
+    :param shape: the shape of the output
+    :returns: the meta View and the 1D memory of each base View, keyed
+        by the names of the kernel parameters
+    """
+
+    meta: List[int] = list(shape) if len(shape) > 0 else [1]
+    storages: List[ViewType] = []
+
+    for view in operands:
+        itemsize: int = view.data.itemsize
+
+        view_shape: Tuple[int, ...] = tuple(view.shape)
+        strides: List[int] = [0] * (len(shape) - len(view_shape))
+        strides += [0 if n == 1 else s // itemsize for n, s in zip(view_shape, view.data.strides)]
+
+        meta.append(view.offset if isinstance(view, Subview) else 0)
+        meta += strides if len(strides) > 0 else [0]
+        storages.append(get_flat_view(view))
+
+    args: Dict[str, ViewType] = {"meta": pk.array(np.array(meta, dtype=np.int64))}
+    for k, storage in enumerate(storages[:-1]):
+        args[f"in{k}"] = storage
+    args["out"] = storages[-1]
+
+    return args
+
+
+def overlaps(view: ViewType, out: ViewType, shape: Tuple[int, ...]) -> bool:
+    """
+    Whether reading an input while writing the output could read
+    elements already overwritten. An input that is the output, or that
+    reads exactly the element being written, is safe to update in
+    place. Any other overlap, e.g. a shifted slice of the output or a
+    row broadcast over it, is not.
+
+    :param view: the input View
+    :param out: the output View
+    :param shape: the shape of the output
+    :returns: True if the input must be copied first
+    """
+
+    if view is out:
+        return False
+
+    a = view.data
+    b = out.data
+    if not isinstance(a, np.ndarray) or not isinstance(b, np.ndarray):
+        # only the Views of a same allocation can be compared
+        base_a = view.base_view if isinstance(view, Subview) else view
+        base_b = out.base_view if isinstance(out, Subview) else out
+        return base_a is base_b
+
+    if not np.may_share_memory(a, b):
+        return False
+
+    a = np.broadcast_to(a, shape)
+
+    return a.__array_interface__["data"][0] != b.__array_interface__["data"][0] or a.strides != b.strides
+
+
+def get_scalar_view(value, dtype) -> ViewType:
+    """
+    Wrap a scalar operand in a 0-D View, which is broadcast to the
+    shape of the other operands
+
+    :param value: the scalar
+    :param dtype: the dtype of the View
+    :returns: the 0-D View
+    """
+
+    view = pk.View((), dtype=dtype, initialize=False)
+    if get_dtype_name(dtype) == "bfloat16" and view.data.dtype == np.uint16:
+        # without a numpy bfloat16 the View holds the raw bits, those
+        # of the float32 value rounded to nearest even
+        bits: int = int(np.array(value, dtype=np.float32).view(np.uint32))
+        value = (bits + 0x7FFF + ((bits >> 16) & 1)) >> 16
+    view.fill(value)
+
+    return view
+
+
+def get_broadcast_shape(name: str, shapes: List[Tuple[int, ...]]) -> Tuple[int, ...]:
+    """
+    Get the shape operands broadcast to, following the numpy rules
+
+    :param name: the name of the ufunc, for error messages
+    :param shapes: the shapes of the operands
+    :returns: the broadcast shape
+    """
+
+    shape: Tuple[int, ...] = shapes[0]
+    if all(s == shape for s in shapes[1:]):
+        return shape
+
+    try:
+        return tuple(np.broadcast_shapes(*shapes))
+    except ValueError:
+        raise ValueError(f"ERROR: {name}() operands could not be broadcast together with shapes {' '.join(map(str, shapes))}")
+
+
+def get_output(
+    name: str,
+    predicate: bool,
+    result_dtype: str,
+    shape: Tuple[int, ...],
+    out: Optional[ViewType],
+    views: List
+) -> Tuple[ViewType, str]:
+    """
+    Allocate the output of a ufunc, or check the one passed as out
+
+    :param name: the name of the ufunc, for error messages
+    :param predicate: whether the result is a truth value
+    :param result_dtype: the name of the dtype of the result
+    :param shape: the shape of the result
+    :param out: the output passed by the caller, if any
+    :param views: the inputs that are Views or LazyArrays, the first
+        of which gives the layout of an allocated output
+    :returns: the output and the name of its dtype
+    """
+
+    if len(shape) > MAX_RANK:
+        raise ValueError(f"ERROR: {name}() supports Views of up to {MAX_RANK} dimensions, got {len(shape)}")
+
+    if out is None:
+        out_class = pk.bool if predicate else next(
+            (v.dtype for v in views if get_dtype_name(v.dtype) == result_dtype), getattr(pk, result_dtype))
+        return pk.View(shape, dtype=out_class, layout=views[0].layout, initialize=False), result_dtype
+
+    if not isinstance(out, ViewType):
+        raise TypeError(f"ERROR: the output of {name}() must be a View, got {type(out)}")
+    if tuple(out.shape) != shape:
+        raise ValueError(f"ERROR: the output of {name}() must have shape {shape}, got {tuple(out.shape)}")
+
+    out_dtype: str = get_dtype_name(out.dtype)
+    # truth values can be stored in any dtype
+    if not predicate and not can_cast(result_dtype, out_dtype):
+        raise TypeError(f"ERROR: cannot cast the {result_dtype} result of {name}() to an output of dtype {out_dtype}")
+
+    return out, out_dtype
+
+
+def launch(
+    get: Callable[[int, bool, Tuple[int, ...]], Callable],
+    inputs: List[ViewType],
+    out: ViewType,
+    shape: Tuple[int, ...],
+    profiler_name: Optional[str]
+) -> None:
+    """
+    Run a generated elementwise workunit over the output
+
+    :param get: gets the workunit for a rank, for the contiguous or
+        strided variant, and for the positions of the 0-D inputs of a
+        contiguous variant
+    :param inputs: the input Views, broadcast to the output's shape
+    :param out: the output View
+    :param shape: the shape of the output
+    :param profiler_name: the name of the kernel shown by Kokkos tools
+    """
+
+    size: int = math.prod(shape)
+    if size == 0:
+        return
+
+    # inputs overlapping the output other than element for element are
+    # copied first, so that no element is read after being overwritten
+    inputs = [copy_view(v) if overlaps(v, out, shape) else v for v in inputs]
+
+    # 0-D inputs, e.g. scalar operands, are read at their only element
+    # by a contiguous kernel instead of being broadcast with strides
+    scalars: Tuple[int, ...] = ()
+    if len(shape) > 0:
+        scalars = tuple(k for k, v in enumerate(inputs) if len(v.shape) == 0)
+
+    operands: List[ViewType] = [*inputs, out]
+    broadcast: bool = any(tuple(v.shape) != shape for k, v in enumerate(operands) if k not in scalars)
+    strided: bool = broadcast or not all(is_contiguous(v) for v in operands)
+    kernel: Callable = get(max(len(shape), 1), strided, () if strided else scalars)
+
+    if not strided:
+        kwargs: Dict[str, ViewType] = {f"in{k}": view for k, view in enumerate(inputs)}
+        kwargs["out"] = out
+        pk.parallel_for(profiler_name, size, kernel, **kwargs)
+        return
+
+    # Views wrapping non-contiguous memory are read from a copy, and
+    # written through one, as their memory cannot be indexed as 1D
+    inputs = [v if isinstance(v, Subview) or has_flat_memory(v) else copy_view(v) for v in inputs]
+    result: ViewType = out
+    if not isinstance(out, Subview) and not has_flat_memory(out):
+        result = pk.View(shape, dtype=out.dtype, layout=out.layout, initialize=False)
+
+    pk.parallel_for(profiler_name, size, kernel, **get_strided_args([*inputs, result], shape))
+    if result is not out:
+        apply_ufunc("positive", result, out=out)
+
+
+def copy_view(view: ViewType) -> ViewType:
+    """
+    Copy a View to a new contiguous one
+
+    :param view: the View
+    :returns: the copy
+    """
+
+    out = pk.View(tuple(view.shape), dtype=view.dtype, layout=view.layout, initialize=False)
+
+    return apply_ufunc("positive", view, out=out)
+
+
+def apply_ufunc(
+    name: str,
+    *inputs,
+    out: Optional[ViewType] = None,
+    profiler_name: Optional[str] = None
+):
+    """
+    Apply an elementwise ufunc to Views. Operands of different shapes
+    are broadcast following the numpy rules. Operands of different
+    dtypes are read at their own dtype and promoted in the kernel, and
+    scalar operands take the dtype of the Views, unless a float is
+    combined with integer Views, which gives float64 as in numpy.
+
+    If lazy ufuncs are enabled and out is None, the ufunc is not run
+    but returned as a LazyArray. LazyArray inputs are fused into the
+    kernel of the ufunc.
+
+    :param name: the name of the ufunc, a key of ufunc_defs
+    :param inputs: the input Views, LazyArrays or scalars
+    :param out: the View the result is written to, allocated if None.
+        It may be one of the inputs, and results are cast to its dtype
+        within the same kind or to a higher one.
+    :param profiler_name: the name of the kernel shown by Kokkos tools
+    :returns: the output View, or a LazyArray
+    """
+
+    defn: UfuncDef = ufunc_defs[name]
+    if len(inputs) != defn.nin:
+        raise ValueError(f"ERROR: {name}() takes {defn.nin} inputs, got {len(inputs)}")
+
+    views: List = [v for v in inputs if isinstance(v, (ViewType, LazyArray))]
+    for value in inputs:
+        if not isinstance(value, (ViewType, LazyArray, int, float, np.generic)):
+            raise TypeError(f"ERROR: {name}() expects Views or scalars, got {type(value)}")
+    if len(views) == 0:
+        raise TypeError(f"ERROR: {name}() expects at least one View")
+
+    view_dtype: str = get_dtype_name(views[0].dtype)
+    for view in views[1:]:
+        view_dtype = promote_types(view_dtype, get_dtype_name(view.dtype))
+
+    # scalars are weakly typed, and only change the dtype of integer Views
+    scalar_dtype: str = view_dtype
+    if view_dtype in INT_DTYPES and any(isinstance(v, (float, np.floating)) for v in inputs):
+        scalar_dtype = "float64"
+
+    inputs = tuple(v if isinstance(v, (ViewType, LazyArray)) else get_scalar_view(v, getattr(pk, scalar_dtype)) for v in inputs)
+    in_dtypes: Tuple[str, ...] = tuple(get_dtype_name(v.dtype) for v in inputs)
+
+    dtype: str = get_compute_dtype(defn, in_dtypes)
+    if dtype not in defn.dtypes:
+        raise TypeError(f"ERROR: {name}() does not support {dtype} Views")
+
+    shape: Tuple[int, ...] = get_broadcast_shape(name, [tuple(v.shape) for v in inputs])
+    if any(isinstance(v, LazyArray) for v in inputs) or (lazy_state.enabled and out is None):
+        result = LazyArray(name, inputs, in_dtypes, shape)
+        if lazy_state.enabled and out is None:
+            return result
+        return result.compute(out=out, profiler_name=profiler_name)
+
+    if out is not None:
+        shape = get_broadcast_shape(name, [shape, tuple(out.shape)])
+    target, out_dtype = get_output(name, defn.predicate, get_result_dtype(defn, in_dtypes), shape, out, views)
+
+    signature: Signature = (in_dtypes, out_dtype)
+
+    def get(rank: int, strided: bool, scalars: Tuple[int, ...]) -> Callable:
+        kernel: Optional[Callable] = kernel_cache.get((name, signature, rank, strided, scalars))
+        if kernel is None:
+            kernel = get_kernel(name, signature, rank, strided, scalars)
+        return kernel
+
+    launch(get, list(inputs), target, shape, profiler_name)
+
+    return target
+
+
+class LazyState:
+    """
+    Whether ufuncs build LazyArrays instead of running
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+
+
+lazy_state = LazyState()
+
+
+def enable_lazy_ufuncs() -> None:
+    """
+    Make the elementwise ufuncs called without out return LazyArrays,
+    which are fused into one kernel when evaluated
+    """
+
+    lazy_state.enabled = True
+
+
+def disable_lazy_ufuncs() -> None:
+    """
+    Make the elementwise ufuncs run when they are called again. The
+    LazyArrays already built are still evaluated when used.
+    """
+
+    lazy_state.enabled = False
+
+
+@contextlib.contextmanager
+def lazy_ufuncs() -> Iterator[None]:
+    """
+    Enable lazy ufuncs within a with block
+    """
+
+    enabled: bool = lazy_state.enabled
+    lazy_state.enabled = True
+    try:
+        yield
+    finally:
+        lazy_state.enabled = enabled
+
+
+# one node of a fused expression: the ufunc and the names of the
+# variables holding its inputs, "x{k}" for the k-th input View and
+# "t{j}" for the result of the j-th node
+FusedNode = Tuple[str, Tuple[str, ...]]
+
+# maps (nodes, signature, rank, strided, positions of the 0-D inputs)
+# to the generated workunit
+fused_kernel_cache: Dict[Tuple[Tuple[FusedNode, ...], Signature, int, bool, Tuple[int, ...]], Callable] = {}
+
+
+class LazyArray:
+    """
+    The deferred result of an elementwise ufunc, a node of an
+    expression DAG whose leaves are Views. Evaluating it, with
+    compute() or by reading it on the host, runs the whole expression
+    as one generated kernel that reads each View once and writes only
+    the result, without the temporaries and launches of the
+    intermediate ufuncs. The kernel is cached by the structure of the
+    expression and the dtypes of the Views, not by their values.
+
+    A LazyArray passed to a workunit or to a reduction is evaluated
+    first. The Views are read when the expression is evaluated, so
+    writing to one of them before then changes the result.
+    """
+
+    __slots__ = ("name", "inputs", "in_dtypes", "shape", "dtype", "layout", "_result")
+
+    def __init__(self, name: str, inputs: Tuple, in_dtypes: Tuple[str, ...], shape: Tuple[int, ...]):
+        """
+        LazyArray constructor
+
+        :param name: the name of the ufunc
+        :param inputs: the input Views and LazyArrays
+        :param in_dtypes: the names of their dtypes
+        :param shape: the broadcast shape of the inputs
+        """
+
+        defn: UfuncDef = ufunc_defs[name]
+        views: List = [v for v in inputs if len(v.shape) > 0] or list(inputs)
+        result_dtype: str = get_result_dtype(defn, in_dtypes)
+
+        self.name: str = name
+        self.inputs: Tuple = inputs
+        self.in_dtypes: Tuple[str, ...] = in_dtypes
+        self.shape: Tuple[int, ...] = shape
+        self.dtype = pk.bool if defn.predicate else next(
+            (v.dtype for v in inputs if get_dtype_name(v.dtype) == result_dtype), getattr(pk, result_dtype))
+        self.layout: Layout = views[0].layout
+        self._result: Optional[ViewType] = None
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def rank(self) -> int:
+        return len(self.shape)
+
+    def compute(self, out: Optional[ViewType] = None, profiler_name: Optional[str] = None) -> ViewType:
+        """
+        Evaluate the expression with one fused kernel. The result is
+        kept, so that evaluating the LazyArray again, or an expression
+        using it, does not recompute it.
+
+        :param out: the View the result is written to, allocated if
+            None, following the rules of the out argument of ufuncs
+        :param profiler_name: the name of the kernel shown by Kokkos tools
+        :returns: the View holding the result
+        """
+
+        if out is None and self._result is not None:
+            return self._result
+
+        nodes, leaves = get_fused_plan(self)
+        in_dtypes: Tuple[str, ...] = tuple(get_dtype_name(v.dtype) for v in leaves)
+
+        shape: Tuple[int, ...] = self.shape
+        if out is not None:
+            shape = get_broadcast_shape(self.name, [shape, tuple(out.shape)])
+        predicate: bool = ufunc_defs[self.name].predicate
+        result, out_dtype = get_output(self.name, predicate, get_dtype_name(self.dtype), shape, out, [self])
+
+        signature: Signature = (in_dtypes, out_dtype)
+
+        def get(rank: int, strided: bool, scalars: Tuple[int, ...]) -> Callable:
+            return get_fused_kernel(nodes, signature, rank, strided, scalars)
+
+        launch(get, leaves, result, shape, profiler_name)
+
+        if out is None:
+            # the inputs are no longer needed, and can be freed
+            self._result = result
+            self.inputs = ()
+
+        return result
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        data: np.ndarray = np.asarray(self.compute())
+
+        return data if dtype is None else data.astype(dtype)
+
+    def __getitem__(self, key):
+        return self.compute()[key]
+
+    def __len__(self) -> int:
+        if len(self.shape) == 0:
+            raise TypeError("len() of unsized object")
+
+        return self.shape[0]
+
+    def __float__(self) -> float:
+        return float(self.compute())
+
+    def __int__(self) -> int:
+        return int(self.compute())
+
+    def __repr__(self) -> str:
+        state: str = "computed" if self._result is not None else "pending"
+
+        return f"LazyArray({self.name}, shape={self.shape}, dtype={get_dtype_name(self.dtype)}, {state})"
+
+
+def get_fused_plan(root: LazyArray) -> Tuple[Tuple[FusedNode, ...], List[ViewType]]:
+    """
+    Flatten the expression of a LazyArray. Nodes reached through
+    several paths are computed once, a View used several times is
+    read once, and LazyArrays already evaluated are read as Views.
+
+    :param root: the LazyArray
+    :returns: the nodes in the order they are computed, the last one
+        being the root, and the Views the expression reads
+    """
+
+    nodes: List[FusedNode] = []
+    leaves: List[ViewType] = []
+    names: Dict[int, str] = {}
+
+    def visit(value) -> str:
+        if isinstance(value, LazyArray) and value._result is not None:
+            value = value._result
+
+        name: Optional[str] = names.get(id(value))
+        if name is not None:
+            return name
+
+        if isinstance(value, LazyArray):
+            inputs: Tuple[str, ...] = tuple(visit(v) for v in value.inputs)
+            name = f"t{len(nodes)}"
+            nodes.append((value.name, inputs))
+        else:
+            name = f"x{len(leaves)}"
+            leaves.append(value)
+
+        names[id(value)] = name
+
+        return name
+
+    visit(root)
+
+    return tuple(nodes), leaves
+
+
+def get_fused_kernel_name(
+    nodes: Tuple[FusedNode, ...],
+    signature: Signature,
+    rank: int,
+    strided: bool,
+    scalars: Tuple[int, ...] = ()
+) -> str:
+    """
+    Get the name of the workunit evaluating a fused expression, made
+    of its last ufuncs and a hash of the whole expression, so that
+    the workunits of different expressions never collide
+
+    :param nodes: the nodes of the expression
+    :param signature: the names of the dtypes of the inputs and output
+    :param rank: the rank of the Views
+    :param strided: whether the workunit is the strided variant
+    :param scalars: the positions of the 0-D inputs of a contiguous
+        variant
+    :returns: the name
+    """
+
+    digest: str = hashlib.md5(repr((nodes, signature)).encode()).hexdigest()[:8]
+    suffix: str = get_variant_suffix(strided, scalars)
+
+    return f"fused_{'_'.join(name for name, _ in nodes[-3:])}_{digest}_{rank}d{suffix}"
+
+
+def generate_fused_source(
+    nodes: Tuple[FusedNode, ...],
+    signature: Signature,
+    rank: int,
+    strided: bool,
+    scalars: Tuple[int, ...] = ()
+) -> str:
+    """
+    Generate the source of the workunit evaluating a fused expression.
+    Each input is read once at its own dtype, and each node converts
+    its operands to its compute dtype in registers, as the ufunc would
+    on its own, but keeps its result in a register instead of a View.
+
+    :param nodes: the nodes of the expression, the last one being the
+        root
+    :param signature: the names of the dtypes of the inputs and output
+    :param rank: the rank of the Views, between 1 and MAX_RANK
+    :param strided: whether to generate the strided variant
+    :param scalars: the positions of the 0-D inputs of a contiguous
+        variant
+    :returns: the source of a module defining the workunit
+    """
+
+    in_dtypes, out_dtype = signature
+
+    lines, indices = get_index_lines(rank, strided)
+
+    # the dtype of the value each variable holds
+    dtypes: Dict[str, str] = {}
+    for k, in_dtype in enumerate(in_dtypes):
+        lines.append(f"x{k}: {get_register_type(in_dtype)} = {get_load(in_dtypes, k, indices, strided, scalars)}")
+        dtypes[f"x{k}"] = in_dtype
+
+    for j, (name, inputs) in enumerate(nodes):
+        defn: UfuncDef = ufunc_defs[name]
+        node_dtypes: Tuple[str, ...] = tuple(dtypes[v] for v in inputs)
+        dtype: str = get_compute_dtype(defn, node_dtypes)
+        compute_type: str = get_register_type(dtype)
+
+        args: List[str] = []
+        for i, v in enumerate(inputs):
+            if get_register_type(dtypes[v]) == compute_type:
+                args.append(v)
+            else:
+                lines.append(f"c{j}_{i}: {compute_type} = {v}")
+                args.append(f"c{j}_{i}")
+
+        result_type: str = "pk.uint8" if defn.predicate else compute_type
+        if not defn.has_body(dtype):
+            lines.append(defn.get_body(dtype).format(*args, out=f"t{j}: {result_type}"))
+        else:
+            lines.append(f"t{j}: {result_type} = 0")
+            lines += defn.get_body(dtype).format(*args, out=f"t{j}").splitlines()
+        dtypes[f"t{j}"] = get_result_dtype(defn, node_dtypes)
+
+    lines.append(f"out{get_subscript(indices, len(in_dtypes), strided)} = t{len(nodes) - 1}")
+
+    kernel_name: str = get_fused_kernel_name(nodes, signature, rank, strided, scalars)
+
+    return format_module(kernel_name, get_params(in_dtypes, out_dtype, rank, strided, scalars), lines)
+
+
+def get_fused_kernel(
+    nodes: Tuple[FusedNode, ...],
+    signature: Signature,
+    rank: int,
+    strided: bool,
+    scalars: Tuple[int, ...] = ()
+) -> Callable:
+    """
+    Get the workunit evaluating a fused expression, generating it on
+    first use
+
+    :param nodes: the nodes of the expression
+    :param signature: the names of the dtypes of the inputs and output
+    :param rank: the rank of the Views
+    :param strided: whether to get the strided variant
+    :param scalars: the positions of the 0-D inputs of a contiguous
+        variant
+    :returns: the workunit
+    """
+
+    key: Tuple[Tuple[FusedNode, ...], Signature, int, bool, Tuple[int, ...]] = (nodes, signature, rank, strided, scalars)
+    kernel: Optional[Callable] = fused_kernel_cache.get(key)
+    if kernel is None:
+        source: str = generate_fused_source(nodes, signature, rank, strided, scalars)
+        kernel = load_kernel(get_fused_kernel_name(nodes, signature, rank, strided, scalars), source)
+        fused_kernel_cache[key] = kernel
+
+    return kernel
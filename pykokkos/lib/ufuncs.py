@@ -6,20 +6,22 @@ from typing import Optional
 import numpy as np
 import pykokkos as pk
 from pykokkos.lib import ufunc_workunits
+from pykokkos.lib.bitset import BitView
+from pykokkos.lib.reduction_engine import apply_reduction
+from pykokkos.lib.ufunc_engine import apply_ufunc, get_dtype_name, HALF_DTYPES, INT_DTYPES, LazyArray
 from pykokkos.interface import ViewType
 
 kernel_dict = dict(getmembers(ufunc_workunits, isfunction))
 
-
-def _supported_types_check(dtype_str, supported_type_strings):
-    options = ""
-    for type_str in supported_type_strings:
-        options += f".*{type_str}.*|"
-    options = options[:-1]
-    prog = re.compile(f"({options})" )
-    result = prog.match(dtype_str)
-    if result is None:
-        raise NotImplementedError
+# maps (op, ndims, dtype name) to the workunits of ufunc_workunits,
+# whose names follow the pattern {op}_impl_{ndims}d_{dtype}
+kernel_table = {}
+for _kernel_name, _kernel in kernel_dict.items():
+    _match = re.fullmatch(r"(\w+)_impl_(\d+)d_(\w+)", _kernel_name)
+    if _match is not None:
+        _op, _ndims, _dtype_str = _match.groups()
+        _dtype_str = {"double": "float64", "float": "float32"}.get(_dtype_str, _dtype_str)
+        kernel_table[(_op, int(_ndims), _dtype_str)] = _kernel
 
 
 def _ufunc_kernel_dispatcher(profiler_name: Optional[str],
@@ -29,81 +31,15 @@ def _ufunc_kernel_dispatcher(profiler_name: Optional[str],
                              op,
                              sub_dispatcher,
                              **kwargs):
-    dtype_extractor = re.compile(r".*(?:dtype|data_types|DataType)\.(\w+)")
     if ndims == 0:
         ndims = 1
-    res = dtype_extractor.match(str(dtype))
-    dtype_str = res.group(1)
-    if dtype_str == "float32":
-        dtype_str = "float"
-    elif dtype_str == "float64":
-        dtype_str = "double"
-    function_name_str = f"{op}_impl_{ndims}d_{dtype_str}"
-    desired_workunit = kernel_dict[function_name_str]
+    desired_workunit = kernel_table[(op, ndims, get_dtype_name(dtype))]
     # call the kernel
     ret = sub_dispatcher(profiler_name, tid, desired_workunit, **kwargs)
     return ret
 
 
-def _broadcast_views(view1, view2):
-    # support broadcasting by using the same
-    # shape matching rules as NumPy
-    # TODO: determine if this can be done with
-    # more memory efficiency?
-    if view1.shape != view2.shape:
-        new_shape = np.broadcast_shapes(view1.shape, view2.shape)
-        view1_new = pk.View([*new_shape], dtype=view1.dtype)
-        view1_new[:] = view1
-        view1 = view1_new
-        view2_new = pk.View([*new_shape], dtype=view2.dtype)
-        view2_new[:] = view2
-        view2 = view2_new
-    return view1, view2
-
-
-def _typematch_views(view1, view2):
-    # very crude casting implementation
-    # for binary ufuncs
-    dtype1 = view1.dtype
-    dtype2 = view2.dtype
-    dtype_extractor = re.compile(r".*(?:data_types|DataType)\.(\w+)")
-    res1 = dtype_extractor.match(str(dtype1))
-    res2 = dtype_extractor.match(str(dtype2))
-    effective_dtype = dtype1
-    if res1 is not None and res2 is not None:
-        res1_dtype_str = res1.group(1)
-        res2_dtype_str = res2.group(1)
-        if res1_dtype_str == "double":
-            res1_dtype_str = "float64"
-        elif res1_dtype_str == "float":
-            res1_dtype_str = "float32"
-        if res2_dtype_str == "double":
-            res2_dtype_str = "float64"
-        elif res2_dtype_str == "float":
-            res2_dtype_str = "float32"
-        if res1_dtype_str == "bool" or res2_dtype_str == "bool":
-            res1_dtype_str = "uint8"
-            dtype1 = pk.uint8
-            res2_dtype_str = "uint8"
-            dtype2 = pk.uint8
-        if (("int" in res1_dtype_str and "int" in res2_dtype_str) or
-            ("float" in res1_dtype_str and "float" in res2_dtype_str)):
-            dtype_1_width = int(res1_dtype_str.split("t")[1])
-            dtype_2_width = int(res2_dtype_str.split("t")[1])
-            if dtype_1_width >= dtype_2_width:
-                effective_dtype = dtype1
-                view2_new = pk.View([*view2.shape], dtype=effective_dtype)
-                view2_new[:] = view2.data
-                view2 = view2_new
-            else:
-                effective_dtype = dtype2
-                view1_new = pk.View([*view1.shape], dtype=effective_dtype)
-                view1_new[:] = view1.data
-                view1 = view1_new
-    return view1, view2, effective_dtype
-
-
-def reciprocal(view, profiler_name: Optional[str] = None):
+def reciprocal(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the reciprocal of the argument, element-wise.
 
@@ -111,6 +47,9 @@ def reciprocal(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -123,42 +62,15 @@ def reciprocal(view, profiler_name: Optional[str] = None):
         This function is not designed to work with integers.
 
     """
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=view.shape[0],
-                             dtype=view.dtype.value,
-                             ndims=len(view.shape),
-                             op="reciprocal",
-                             sub_dispatcher=pk.parallel_for,
-                             view=view)
-    # NOTE: pretty awkward to both return the view
-    # and operate on it in place; the former is closer
-    # to NumPy semantics
-    return view
-
-
-@pk.workunit
-def log_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = log(view[tid]) # type: ignore
-
-
-@pk.workunit
-def log_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log(view[tid][i]) # type: ignore
+    if out is None and isinstance(view, ViewType):
+        # NOTE: pretty awkward to both return the view
+        # and operate on it in place; the former is closer
+        # to NumPy semantics
+        out = view
+    return apply_ufunc("reciprocal", view, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def log_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = log(view[tid]) # type: ignore
-
-
-@pk.workunit
-def log_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log(view[tid][i]) # type: ignore
-
-
-def log(view, profiler_name: Optional[str] = None):
+def log(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Natural logarithm, element-wise.
 
@@ -166,6 +78,9 @@ def log(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -173,55 +88,13 @@ def log(view, profiler_name: Optional[str] = None):
         Output view.
 
     """
-    if not isinstance(view, pk.ViewType):
+    if not isinstance(view, (pk.ViewType, LazyArray)):
         return math.log(view)
 
-    if len(view.shape) > 2:
-        raise NotImplementedError("log() ufunc only supports up to 2D views")
-
-    out = pk.View(view.shape, view.dtype)
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        if view.shape == ():
-            # NOTE: is this really worth sending to a kernel?
-            pk.parallel_for(profiler_name, 1, log_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(profiler_name, view.shape[0], log_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(profiler_name, view.shape[0], log_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        if view.shape == ():
-            # NOTE: is this really worth sending to a kernel?
-            pk.parallel_for(profiler_name, 1, log_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(profiler_name, view.shape[0], log_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(profiler_name, view.shape[0], log_impl_2d_float, view=view, out=out)
-    return out
-
-
-@pk.workunit
-def sqrt_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = sqrt(view[tid]) # type: ignore
-
-
-@pk.workunit
-def sqrt_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = sqrt(view[tid][i]) # type: ignore
-
-
-@pk.workunit
-def sqrt_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = sqrt(view[tid]) # type: ignore
+    return apply_ufunc("log", view, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def sqrt_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = sqrt(view[tid][i]) # type: ignore
-
-
-def sqrt(view):
+def sqrt(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the non-negative square root of the argument, element-wise.
 
@@ -229,6 +102,9 @@ def sqrt(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -243,51 +119,13 @@ def sqrt(view):
     """
     if isinstance(view, (np.integer, np.floating)):
         return math.sqrt(view)
+
     # TODO: support complex types when they
     # are available in pykokkos?
-    if len(view.shape) > 2:
-        raise NotImplementedError("only up to 2D views currently supported for sqrt() ufunc.")
-    out = pk.View(view.shape, view.dtype)
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, sqrt_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sqrt_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sqrt_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, sqrt_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sqrt_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sqrt_impl_2d_float, view=view, out=out)
-    return out
-
-
-@pk.workunit
-def log2_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = log2(view[tid]) # type: ignore
+    return apply_ufunc("sqrt", view, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def log2_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log2(view[tid][i]) # type: ignore
-
-
-@pk.workunit
-def log2_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = log2(view[tid]) # type: ignore
-
-
-@pk.workunit
-def log2_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log2(view[tid][i]) # type: ignore
-
-
-def log2(view):
+def log2(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Base-2 logarithm, element-wise.
 
@@ -295,6 +133,9 @@ def log2(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -302,51 +143,10 @@ def log2(view):
         Output view.
 
     """
-    if len(view.shape) > 2:
-        raise NotImplementedError("log2() ufunc only supports up to 2D views")
-    out = pk.View(view.shape, view.dtype)
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        if view.shape == ():
-            # NOTE: is this really worth sending to a kernel?
-            pk.parallel_for(1, log2_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], log2_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], log2_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        if view.shape == ():
-            # NOTE: is this really worth sending to a kernel?
-            pk.parallel_for(1, log2_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], log2_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], log2_impl_2d_float, view=view, out=out)
-    return out
-
-
-@pk.workunit
-def log10_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = log10(view[tid]) # type: ignore
-
-
-@pk.workunit
-def log10_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log10(view[tid][i]) # type: ignore
+    return apply_ufunc("log2", view, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def log10_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = log10(view[tid]) # type: ignore
-
-
-@pk.workunit
-def log10_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log10(view[tid][i]) # type: ignore
-
-
-def log10(view):
+def log10(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Base-10 logarithm, element-wise.
 
@@ -354,6 +154,9 @@ def log10(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -361,51 +164,10 @@ def log10(view):
         Output view.
 
     """
-    if view.size == 0:
-        return view
-    out = pk.View(view.shape, view.dtype)
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        if view.shape == ():
-            # NOTE: is this really worth sending to a kernel?
-            pk.parallel_for(1, log10_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], log10_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], log10_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        if view.shape == ():
-            # NOTE: is this really worth sending to a kernel?
-            pk.parallel_for(1, log10_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], log10_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], log10_impl_2d_float, view=view, out=out)
-    return out
-
-
-@pk.workunit
-def log1p_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = log1p(view[tid]) # type: ignore
-
-
-@pk.workunit
-def log1p_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = log1p(view[tid]) # type: ignore
-
-
-@pk.workunit
-def log1p_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log1p(view[tid][i]) # type: ignore
-
-
-@pk.workunit
-def log1p_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)): # type: ignore
-        out[tid][i] = log1p(view[tid][i]) # type: ignore
+    return apply_ufunc("log10", view, out=out, profiler_name=profiler_name)
 
 
-def log1p(view):
+def log1p(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the natural logarithm of one plus the input array, element-wise.
 
@@ -413,6 +175,9 @@ def log1p(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -420,443 +185,14 @@ def log1p(view):
         Output view.
 
     """
-    if view.size == 0:
-        return view
-    out = pk.View(view.shape, view.dtype)
-    if len(view.shape) > 2:
-        raise NotImplementedError("log1p() ufunc only supports up to 2D views")
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, log1p_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], log1p_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], log1p_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, log1p_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], log1p_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], log1p_impl_2d_float, view=view, out=out)
-    return out
-
-
-@pk.workunit
-def sign_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_uint8(tid: int, view: pk.View1D[pk.uint8], out: pk.View1D[pk.uint8]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_int8(tid: int, view: pk.View1D[pk.int8], out: pk.View1D[pk.int8]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-
-@pk.workunit
-def sign_impl_2d_int8(tid: int, view: pk.View2D[pk.int8], out: pk.View2D[pk.int8]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-@pk.workunit
-def sign_impl_2d_uint8(tid: int, view: pk.View2D[pk.uint8], out: pk.View2D[pk.uint8]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_uint16(tid: int, view: pk.View1D[pk.uint16], out: pk.View1D[pk.uint16]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-@pk.workunit
-def sign_impl_2d_uint16(tid: int, view: pk.View2D[pk.uint16], out: pk.View2D[pk.uint16]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-@pk.workunit
-def sign_impl_1d_uint32(tid: int, view: pk.View1D[pk.uint32], out: pk.View1D[pk.uint32]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-@pk.workunit
-def sign_impl_2d_uint32(tid: int, view: pk.View2D[pk.uint32], out: pk.View2D[pk.uint32]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_uint64(tid: int, view: pk.View1D[pk.uint64], out: pk.View1D[pk.uint64]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-@pk.workunit
-def sign_impl_2d_uint64(tid: int, view: pk.View2D[pk.uint64], out: pk.View2D[pk.uint64]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_int16(tid: int, view: pk.View1D[pk.int16], out: pk.View1D[pk.int16]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-@pk.workunit
-def sign_impl_2d_int16(tid: int, view: pk.View2D[pk.int16], out: pk.View2D[pk.int16]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_int32(tid: int, view: pk.View1D[pk.int32], out: pk.View1D[pk.int32]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-@pk.workunit
-def sign_impl_2d_int32(tid: int, view: pk.View2D[pk.int32], out: pk.View2D[pk.int32]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
+    return apply_ufunc("log1p", view, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def sign_impl_1d_int64(tid: int, view: pk.View1D[pk.int64], out: pk.View1D[pk.int64]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-@pk.workunit
-def sign_impl_2d_int64(tid: int, view: pk.View2D[pk.int64], out: pk.View2D[pk.int64]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-@pk.workunit
-def sign_impl_1d_uint64(tid: int, view: pk.View1D[pk.uint64], out: pk.View1D[pk.uint64]):
-    if view[tid] > 0:
-        out[tid] = 1
-    elif view[tid] == 0:
-        out[tid] = 0
-    elif view[tid] < 0:
-        out[tid] = -1
-    else:
-        out[tid] = nan("")
-
-@pk.workunit
-def sign_impl_2d_uint64(tid: int, view: pk.View2D[pk.uint64], out: pk.View2D[pk.uint64]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-@pk.workunit
-def sign_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-@pk.workunit
-def sign_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)): # type: ignore
-        if view[tid][i] > 0:
-            out[tid][i] = 1
-        elif view[tid][i] == 0:
-            out[tid][i] = 0
-        elif view[tid][i] < 0:
-            out[tid][i] = -1
-        else:
-            out[tid][i] = nan("")
-
-
-def sign(view):
-    out = pk.View(view.shape, view.dtype)
-    if len(view.shape) > 2:
-        raise NotImplementedError("only up to 2D views currently supported for sign() ufunc.")
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.double)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_double,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.float)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_float,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_float, view=view, out=out)
-    elif "uint32" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.uint32)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_uint32,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_uint32, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_uint32, view=view, out=out)
-    elif "uint16" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.uint16)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_uint16,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_uint16, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_uint16, view=view, out=out)
-    elif "int16" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.int16)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_int16,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_int16, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_int16, view=view, out=out)
-    elif "int32" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.int32)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_int32,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_int32, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_int32, view=view, out=out)
-    elif "uint64" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.uint64)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_uint64,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_uint64, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_uint64, view=view, out=out)
-    elif "int64" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.int64)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_int64,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_int64, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_int64, view=view, out=out)
-    elif "uint8" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.uint8)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_uint8,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_uint8, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_uint8, view=view, out=out)
-    elif "int8" in view.dtype.__name__:
-        if view.shape == ():
-            new_view = pk.View([1], dtype=pk.int8)
-            new_view[:] = view
-            pk.parallel_for(1,
-                            sign_impl_1d_int8,
-                            view=new_view,
-                            out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], sign_impl_1d_int8, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], sign_impl_2d_int8, view=view, out=out)
-    return out
-
-
-@pk.workunit
-def add_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double], ):
-    out[tid] = viewA[tid] + viewB[tid % viewB.extent(0)]
-
-
-@pk.workunit
-def add_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = viewA[tid] + viewB[tid]
-
-@pk.workunit
-def add_impl_2d_1d(tid, viewA, viewB, out):
-    for i in range(viewA.extent(1)):
-        out[tid][i] = viewA[tid][i] + viewB[i % viewB.extent(0)]
-
-@pk.workunit
-def add_impl_2d_2d(tid, viewA, viewB, out):
-    r_idx : int = tid / viewA.extent(1)
-    c_idx : int = tid - r_idx * viewA.extent(1)
-    out[r_idx][c_idx] = viewA[r_idx][c_idx] + viewB[r_idx][c_idx]
+def sign(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
+    return apply_ufunc("sign", view, out=out, profiler_name=profiler_name)
 
 
-def add(viewA, viewB, profiler_name: Optional[str] = None):
+def add(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Sums positionally corresponding elements
     of viewA with elements of viewB
@@ -867,6 +203,9 @@ def add(viewA, viewB, profiler_name: Optional[str] = None):
             Input view.
     viewB : pykokkos view or scalar
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -874,106 +213,10 @@ def add(viewA, viewB, profiler_name: Optional[str] = None):
            Output view.
 
     """
-    if not isinstance(viewB, pk.ViewType):
-        view_temp = pk.View([1], pk.double)
-        view_temp[0] = viewB
-        viewB = view_temp
-
-    if len(viewA.shape) > 2 or len(viewB.shape) > 2:
-        raise NotImplementedError("only 2D views currently supported for add() ufunc.")
-    
-    if viewA.rank() == 2 and viewB.rank() == 2 and viewA.shape != viewB.shape:
-        raise RuntimeError("2D views must have the same shape for add ufunc. Mismatch: {} and {}".format(viewA.shape, viewB.shape))
-
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        if viewA.rank() == 1 and viewB.rank() == 1:
-            out = pk.View([viewA.shape[0]], pk.double)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0],
-                add_impl_1d_double,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        elif viewA.rank() == 2 and viewB.rank() == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0] * viewA.shape[1],
-                add_impl_2d_2d,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        else:
-            larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
-            smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.double)
-            pk.parallel_for(
-                profiler_name,
-                larger.shape[0],
-                add_impl_2d_1d,
-                viewA=larger,
-                viewB=smaller,
-                out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        if viewA.rank() == 1 and viewB.rank() == 1:
-            out = pk.View([viewA.shape[0]], pk.float)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0],
-                add_impl_1d_float,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        elif viewB.rank() == 2 and viewB.rank() == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0] * viewA.shape[1],
-                add_impl_2d_2d,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        else:
-            larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
-            smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.float)
-            pk.parallel_for(
-                profiler_name,
-                larger.shape[0],
-                add_impl_2d_1d,
-                viewA=larger,
-                viewB=smaller,
-                out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
+    return apply_ufunc("add", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def multiply_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = viewA[tid] * viewB[tid % viewB.extent(0)]
-
-
-@pk.workunit
-def multiply_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = viewA[tid] * viewB[tid]
-
-
-@pk.workunit
-def multiply_impl_2d_with_1d(tid, viewA, viewB, out):
-    r_idx : int = tid / viewA.extent(1)
-    c_idx : int = tid - r_idx * viewA.extent(1)
-    out[r_idx][c_idx] = viewA[r_idx][c_idx] * viewB[r_idx % viewB.extent(0)]
-
-@pk.workunit
-def multiply_impl_2d_with_2d(tid, viewA, viewB, out):
-    r_idx : int = tid / viewA.extent(1)
-    c_idx : int = tid - r_idx * viewA.extent(1)
-    out[r_idx][c_idx] = viewA[r_idx][c_idx] * viewB[r_idx][c_idx]
-
-def multiply(viewA, viewB, profiler_name: Optional[str] = None):
+def multiply(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Multiplies positionally corresponding elements
     of viewA with elements of viewB
@@ -984,6 +227,9 @@ def multiply(viewA, viewB, profiler_name: Optional[str] = None):
             Input view.
     viewB : pykokkos view or scalar
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -991,82 +237,7 @@ def multiply(viewA, viewB, profiler_name: Optional[str] = None):
            Output view.
 
     """
-
-    if not isinstance(viewB, pk.ViewType):
-        view_temp = pk.View([1], pk.double)
-        view_temp[0] = viewB
-        viewB = view_temp
-
-    if len(viewA.shape) > 2 or len(viewB.shape) > 2:
-        raise NotImplementedError("only 2D views currently supported for mulitply() ufunc.")
-
-    if viewA.rank() == 2 and viewB.rank() == 2 and viewA.shape != viewB.shape:
-        raise RuntimeError("2D views must have the same shape for add ufunc. Mismatch: {} and {}".format(viewA.shape, viewB.shape))
-
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        if len(viewA.shape) == 1 and len(viewB.shape) == 1:
-            out = pk.View([viewA.shape[0]], pk.double)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0],
-                multiply_impl_1d_double,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        elif len(viewA.shape) == 2 and len(viewB.shape) == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0] * viewA.shape[1],
-                multiply_impl_2d_with_2d,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        else:
-            larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
-            smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.double)
-            pk.parallel_for(
-                profiler_name,
-                larger.shape[0] * larger.shape[1],
-                multiply_impl_2d_with_1d,
-                viewA=larger,
-                viewB=smaller,
-                out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        if len(viewA.shape) == 1 and len(viewB.shape) == 1:
-            out = pk.View([viewA.shape[0]], pk.float)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0],
-                multiply_impl_1d_float,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        elif len(viewA.shape) == 2 and len(viewB.shape) == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
-            pk.parallel_for(
-                profiler_name,
-                viewA.shape[0] * viewA.shape[1],
-                multiply_impl_2d_with_2d,
-                viewA=viewA,
-                viewB=viewB,
-                out=out)
-        else:
-            larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
-            smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.float)
-            pk.parallel_for(
-                profiler_name,
-                larger.shape[0] * larger.shape[1],
-                multiply_impl_2d_with_1d,
-                viewA=larger,
-                viewB=smaller,
-                out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
+    return apply_ufunc("multiply", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
 def check_broadcastable_impl(viewA, viewB):
@@ -1103,30 +274,6 @@ def check_broadcastable_impl(viewA, viewB):
     
     return True
 
-@pk.workunit
-def stretch_fill_impl_scalar_into_1d(tid, scalar, viewOut):
-        viewOut[tid] = scalar
-
-@pk.workunit
-def stretch_fill_impl_scalar_into_2d(tid, cols, scalar, viewOut):
-    for i in range(cols):
-        viewOut[tid][i] = scalar
-    
-@pk.workunit
-def stretch_fill_impl_1d_into_2d(tid, cols, viewIn, viewOut):
-    for i in range(cols):
-        viewOut[tid][i] = viewIn[i]
-
-@pk.workunit
-def stretch_fill_impl_2d(tid, inner_its, col_wise, viewIn, viewOut):
-    for i in range(inner_its):
-        if col_wise:
-            viewOut[i][tid] = viewIn[i][0]
-        else:
-            viewOut[tid][i] = viewIn[0][i]
-
-        
-
 def broadcast_view(val, viewB):
     """
     Broadcasts val onto viewB, returns the "stretched" version of viewA
@@ -1144,79 +291,23 @@ def broadcast_view(val, viewB):
            Broadcasted version of viewA.
 
     """
-    if len(viewB.shape) > 2:
-        raise NotImplementedError("Broadcasting is only supported upto 2D views")
-
-    is_view = False
-    if isinstance(val, ViewType):
-        for dim in val.shape:
-            if dim != 1:
-                is_view = True
-        
-        if not is_view:
-            val = val[0] if len(val.shape) == 1 else val[0][0]
-
-    if is_view:
-        is_first_small = len(val.shape) < len(viewB.shape) or ((len(val.shape) == len(viewB.shape)) and val.shape < viewB.shape)
-        if not check_broadcastable_impl(val, viewB) or not is_first_small:
-            raise ValueError("Incompatible broadcast")
-        if not val.dtype == viewB.dtype: 
-            raise ValueError("Broadcastable views must have same dtypes")
-
-    out = pk.View(viewB.shape, viewB.dtype)
-
-    if is_view:
-        # if both 2D
-        if len(val.shape) == 2: #viewB must be 2 because of the val.shape < viewB.shape check
-            # figure which orientation is val (row or col)
-            col_wise = 1 if val.shape[1] == 1 else 0
-            inner_its = viewB.shape[0] if col_wise else viewB.shape[1]
-            outer_its = viewB.shape[1] if col_wise else viewB.shape[0]
-            pk.parallel_for(outer_its, stretch_fill_impl_2d, inner_its=inner_its, col_wise=col_wise, viewIn=val, viewOut=out)
-        else: # 1d to 2D
-            pk.parallel_for(out.shape[0], stretch_fill_impl_1d_into_2d, cols=viewB.shape[1], viewIn=val, viewOut=out)
-            
+    if not isinstance(val, ViewType):
+        out = pk.View(viewB.shape, viewB.dtype, initialize=False)
+        out.fill(val)
         return out
 
-    # scalar
+    if val.shape != viewB.shape and not check_broadcastable_impl(val, viewB):
+        raise ValueError("Incompatible broadcast")
+    if not val.dtype == viewB.dtype:
+        raise ValueError("Broadcastable views must have same dtypes")
 
-    if len(viewB.shape) == 1:
-        out_1d = pk.View(viewB.shape)
-        pk.parallel_for(viewB.shape[0], stretch_fill_impl_scalar_into_1d, scalar=val, viewOut=out_1d)
-        return out_1d
-
-    # else 2d
-    pk.parallel_for(out.shape[0], stretch_fill_impl_scalar_into_2d, cols=out.shape[1], scalar=val, viewOut=out)
-    return out
+    return apply_ufunc("positive", val, out=pk.View(viewB.shape, viewB.dtype, initialize=False))
 
 
-@pk.workunit
-def subtract_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = viewA[tid] - viewB[tid]
-
-@pk.workunit
-def subtract_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = viewA[tid] - viewB[tid]
-
-@pk.workunit
-def subtract_impl_2d(tid, cols, viewA, viewB, viewOut):
-    for i in range(cols):
-        viewOut[tid][i] = viewA[tid][i] - viewB[tid][i]
-
-@pk.workunit
-def subtract_impl_scalar_1d(tid, viewA, scalar, viewOut):
-    viewOut[tid] = viewA[tid] - scalar
-
-@pk.workunit
-def subtract_impl_scalar_2d(tid, cols, viewA, scalar, viewOut):
-    for i in range(cols):
-        viewOut[tid][i] = viewA[tid][i] - scalar
-    
-
-def subtract(viewA, valB, profiler_name: Optional[str] = None):
-    """
-    Subtracts positionally corresponding elements
-    of viewA with elements of viewB
+def subtract(viewA, valB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
+    """
+    Subtracts positionally corresponding elements
+    of viewA with elements of viewB
 
     Parameters
     ----------
@@ -1224,6 +315,9 @@ def subtract(viewA, valB, profiler_name: Optional[str] = None):
             Input view.
     valB : pykokkos view or scalar
             Input view or scalar value.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -1231,127 +325,8 @@ def subtract(viewA, valB, profiler_name: Optional[str] = None):
            Output view.
 
     """
+    return apply_ufunc("subtract", viewA, valB, out=out, profiler_name=profiler_name)
 
-    is_scalar = True
-    if isinstance(valB, ViewType):
-        # if this is a single valued view1D or view2D just count that as a scalar
-        for dim in valB.shape:
-            if dim != 1:
-                is_scalar = False
-        
-        if is_scalar:
-            valB = valB[0] if len(valB.shape) == 1 else valB[0][0]
-
-    if len(viewA.shape) > 2 or (not is_scalar and len(valB.shape) > 2):
-        raise NotImplementedError("only 1D and 2D views currently supported for subtract() ufunc.")
-
-    if not is_scalar:
-
-        if viewA.shape != valB.shape and not check_broadcastable_impl(viewA, valB): # if shape is not same check compatibility
-            raise ValueError("Views must be broadcastable")
-
-        # check if size is same otherwise broadcast and fix
-        if len(viewA.shape) < len(valB.shape) or (len(viewA.shape) == len(valB.shape) and viewA.shape < valB.shape):
-            viewA = broadcast_view(viewA, valB)
-        elif len(valB.shape) < len(viewA.shape) or (len(viewA.shape) == len(valB.shape) and valB.shape < viewA.shape):
-            valB = broadcast_view(valB, viewA)
-
-        if viewA.dtype.__name__ == "float64" and valB.dtype.__name__ == "float64":
-
-            if len(viewA.shape) == 1:
-                out = pk.View(viewA.shape, pk.double)
-                pk.parallel_for(
-                    profiler_name,
-                    viewA.shape[0],
-                    subtract_impl_1d_double,
-                    viewA=viewA,
-                    viewB=valB,
-                    out=out)
-
-            if len(viewA.shape) == 2:
-                out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
-                pk.parallel_for(
-                    profiler_name,
-                    viewA.shape[0],
-                    subtract_impl_2d,
-                    cols=viewA.shape[1],
-                    viewA=viewA,
-                    viewB=valB,
-                    viewOut=out)
-
-        elif viewA.dtype.__name__ == "float32" and valB.dtype.__name__ == "float32":
-
-            if len(viewA.shape) == 1:
-                out = pk.View(viewA.shape, pk.float)
-                pk.parallel_for(
-                    profiler_name,
-                    viewA.shape[0],
-                    subtract_impl_1d_float,
-                    viewA=viewA,
-                    viewB=valB,
-                    out=out)
-
-            if len(viewA.shape) == 2:
-                out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
-                pk.parallel_for(
-                    profiler_name,
-                    viewA.shape[0],
-                    subtract_impl_2d,
-                    cols=viewA.shape[1],
-                    viewA=viewA,
-                    viewB=valB,
-                    viewOut=out)
-        else:
-            raise RuntimeError("Incompatible Types")
-        
-        return out
-    
-
-    # is scalar subtract -----------------------
-    if len(viewA.shape) == 1: # 1D
-        out = None
-        if viewA.dtype.__name__ == "float64":
-            out = pk.View(viewA.shape, pk.double)
-        if viewA.dtype.__name__ == "float32":
-            out = pk.View(viewA.shape, pk.float)
-        
-        if out is None: raise RuntimeError("Incompatible Types")
-
-        pk.parallel_for(profiler_name,
-                        viewA.shape[0], 
-                        subtract_impl_scalar_1d, 
-                        viewA=viewA, 
-                        scalar=valB, 
-                        viewOut=out)
-    
-    if len(viewA.shape) == 2: # 2D
-        out = None
-        if viewA.dtype.__name__ == "float64":
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
-        if viewA.dtype.__name__ == "float32":
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
-        
-        if out is None: raise RuntimeError("Incompatible Types")
-        pk.parallel_for(profiler_name,
-                        viewA.shape[0], 
-                        subtract_impl_scalar_2d, 
-                        cols=viewA.shape[1], 
-                        viewA=viewA, 
-                        scalar=valB, 
-                        viewOut=out)
-
-    return out
-
-@pk.workunit
-def copyto_impl_2d(tid, viewA, viewB):
-    r_idx : int = tid / viewA.extent(1)
-    c_idx : int = tid - r_idx * viewA.extent(1)
-
-    viewA[r_idx][c_idx] = viewB[r_idx][c_idx]
-
-@pk.workunit
-def copyto_impl_1d(tid, viewA, viewB):
-    viewA[tid] = viewB[tid]
 
 def copyto(viewA, viewB, profiler_name: Optional[str] = None):
     '''
@@ -1373,24 +348,12 @@ def copyto(viewA, viewB, profiler_name: Optional[str] = None):
         raise ValueError("copyto: Cannot copy to a non-view type")
     if not isinstance(viewB, ViewType):
         raise ValueError("copyto: Cannot copy from a non-view type")
-    if viewA.shape != viewB.shape:
-        if not check_broadcastable_impl(viewA, viewB): # if shape is not same check compatibility
-            raise ValueError("copyto: Views must be broadcastable or of the same size. {} against {}".format(viewA.shape, viewB.shape))
-        # check if size is same otherwise broadcast and fix
-        viewA = broadcast_view(viewB, viewA)
+    if viewA.shape != viewB.shape and not check_broadcastable_impl(viewA, viewB):
+        raise ValueError("copyto: Views must be broadcastable or of the same size. {} against {}".format(viewA.shape, viewB.shape))
 
-    # implementation constraint, for now
-    if viewA.rank() > 2:
-        raise NotImplementedError("copyto: This version of Pykokkos only supports copyto upto 2D views")
-
-    if viewA.rank() == 1:
-        pk.parallel_for(profiler_name, viewA.shape[0], copyto_impl_1d, viewA=viewA, viewB=viewB)
-
-    else:   
-        outRows = viewA.shape[0]
-        outCols = viewA.shape[1] 
-        totalThreads = outRows * outCols
-        pk.parallel_for(profiler_name, totalThreads, copyto_impl_2d, viewA=viewA, viewB=viewB)
+    # viewB is broadcast in place onto viewA and converted in the
+    # kernel if the dtypes differ
+    apply_ufunc("positive", viewB, out=viewA, profiler_name=profiler_name)
 
 @pk.workunit
 def np_matmul_impl_2d_2d(tid, cols, vec_length, viewA, viewB, viewOut):
@@ -1539,13 +502,35 @@ def matmul(viewA, viewB, profiler_name: Optional[str] = None):
 
     return _ufunc_kernel_dispatcher(profiler_name=profiler_name,
                                     tid=viewA.shape[0],
-                                    dtype=viewA.dtype.value,
+                                    dtype=viewA.dtype,
                                     ndims=1,
                                     op="matmul",
                                     sub_dispatcher=pk.parallel_reduce,
                                     viewA=viewA,
                                     viewB=viewB)
 
+# float16 and bfloat16 dot products accumulate in float32
+
+
+@pk.workunit
+def dot_impl_1d_float16(tid: int, acc: pk.Acc[pk.float], viewA: pk.View1D[pk.float16], viewB: pk.View1D[pk.float16]):
+    acc += float(viewA[tid]) * float(viewB[tid])
+
+
+@pk.workunit
+def dot_impl_1d_bfloat16(tid: int, acc: pk.Acc[pk.float], viewA: pk.View1D[pk.bfloat16], viewB: pk.View1D[pk.bfloat16]):
+    acc += float(viewA[tid]) * float(viewB[tid])
+
+
+def _is_half(viewA, viewB) -> bool:
+    """
+    Whether both operands are Views of the same 16-bit float type
+    """
+
+    return (isinstance(viewA, ViewType) and isinstance(viewB, ViewType)
+            and viewA.dtype.__name__ in HALF_DTYPES and viewB.dtype is viewA.dtype)
+
+
 @pk.workunit
 def dot_impl_1d_double(tid: int, acc: pk.Acc[pk.double], viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double]):
     acc += viewA[tid] * viewB[tid]
@@ -1577,6 +562,10 @@ def dot(viewA, viewB):
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("only 1D views supported for dot() ufunc.")
 
+    if _is_half(viewA, viewB):
+        kernel = dot_impl_1d_float16 if viewA.dtype.__name__ == "float16" else dot_impl_1d_bfloat16
+        return pk.parallel_reduce(viewA.shape[0], kernel, viewA=viewA, viewB=viewB)
+
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
         out = pk.parallel_reduce(
                 viewA.shape[0],
@@ -1594,23 +583,7 @@ def dot(viewA, viewB):
         raise RuntimeError("Incompatible Types")
     return out
 
-@pk.workunit
-def divide_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = viewA[tid] / viewB[tid % viewB.extent(0)]
-
-
-@pk.workunit
-def divide_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = viewA[tid] / viewB[tid]
-
-
-@pk.workunit
-def divide_impl_2d_1d_double(tid: int, viewA: pk.View2D[pk.double], viewB: pk.View1D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(viewA.extent(1)):
-        out[tid][i] = viewA[tid][i] / viewB[i % viewB.extent(0)]
-
-
-def divide(viewA, viewB, profiler_name: Optional[str] = None):
+def divide(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Divides positionally corresponding elements
     of viewA with elements of viewB
@@ -1621,6 +594,9 @@ def divide(viewA, viewB, profiler_name: Optional[str] = None):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -1628,55 +604,10 @@ def divide(viewA, viewB, profiler_name: Optional[str] = None):
            Output view.
 
     """
-    if not isinstance(viewB, pk.ViewType) and not isinstance(viewB, pk.ViewType):
-        view_temp = pk.View([1], pk.double)
-        view_temp[0] = viewB
-        viewB = view_temp
-
-    if viewA.rank() == 2:
-        out = pk.View(viewA.shape, pk.double)
-        pk.parallel_for(
-            profiler_name,
-            viewA.shape[0],
-            divide_impl_2d_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
-        pk.parallel_for(
-            profiler_name,
-            viewA.shape[0],
-            divide_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
-        pk.parallel_for(
-            profiler_name,
-            viewA.shape[0],
-            divide_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
+    return apply_ufunc("divide", viewA, viewB, out=out, profiler_name=profiler_name)
 
-@pk.workunit
-def negative_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = view[tid] * -1
-
-
-@pk.workunit
-def negative_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = view[tid] * -1
 
-def negative(view, profiler_name: Optional[str] = None):
+def negative(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise negative of the view
 
@@ -1684,6 +615,9 @@ def negative(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -1691,20 +625,10 @@ def negative(view, profiler_name: Optional[str] = None):
            Output view.
 
     """
-    if len(view.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for negative() ufunc.")
-    if view.dtype.__name__ == "float64":
-        out = pk.View([view.shape[0]], pk.double)
-        pk.parallel_for(profiler_name, view.shape[0], negative_impl_1d_double, view=view, out=out)
-    elif view.dtype.__name__ == "float32":
-        out = pk.View([view.shape[0]], pk.float)
-        pk.parallel_for(profiler_name, view.shape[0], negative_impl_1d_float, view=view, out=out)
-    else:
-        raise NotImplementedError
-    return out
+    return apply_ufunc("negative", view, out=out, profiler_name=profiler_name)
 
 
-def positive(view):
+def positive(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise positive of the view;
     Essentially returns a copy of the view
@@ -1713,6 +637,9 @@ def positive(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -1720,35 +647,10 @@ def positive(view):
            Output view.
 
     """
-    if view.shape == ():
-        out = pk.View((), dtype=view.dtype)
-    else:
-        out = pk.View([*view.shape], dtype=view.dtype)
-    out[...] = view
-    return out
-
-
-@pk.workunit
-def power_impl_scalar_double(tid:int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = pow(viewA[0], viewB[tid])
+    return apply_ufunc("positive", view, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def power_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = pow(viewA[tid], viewB[tid])
-
-
-@pk.workunit
-def power_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = pow(viewA[tid], viewB[tid])
-
-@pk.workunit
-def power_impl_2d_double(tid: int, viewA: pk.View2D[pk.double], viewB: pk.View1D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(viewA.extent(1)):
-        out[tid][i] = pow(viewA[tid][i], viewB[i % viewB.extent(0)])
-
-
-def power(viewA, viewB):
+def power(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Returns a view with each val in viewA raised
     to the positionally corresponding power in viewB
@@ -1759,6 +661,9 @@ def power(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -1766,64 +671,10 @@ def power(viewA, viewB):
            Output view.
 
     """
-    if not isinstance(viewB, pk.ViewType):
-        view_temp = pk.View([1], pk.double)
-        view_temp[0] = viewB
-        viewB = view_temp
-
-    if isinstance(viewA, int):
-        view_temp = pk.View([1], pk.double)
-        view_temp[0] = viewA
-        viewA = view_temp
-
-        out = pk.View([viewB.shape[0]], pk.double)
-        pk.parallel_for(
-            viewB.shape[0],
-            power_impl_scalar_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    elif viewA.rank() == 2:
-        out = pk.View(viewA.shape, pk.double)
-        pk.parallel_for(
-            viewA.shape[0],
-            power_impl_2d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    elif viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
-        pk.parallel_for(
-            viewA.shape[0],
-            power_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
-        pk.parallel_for(
-            viewA.shape[0],
-            power_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
-
-@pk.workunit
-def fmod_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = fmod(viewA[tid], viewB[tid])
+    return apply_ufunc("power", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def fmod_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = fmod(viewA[tid], viewB[tid])
-
-
-def fmod(viewA, viewB):
+def fmod(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise remainder of division when element of viewA is
     divided by positionally corresponding element of viewB
@@ -1834,6 +685,9 @@ def fmod(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -1841,141 +695,10 @@ def fmod(viewA, viewB):
            Output view.
 
     """
+    return apply_ufunc("fmod", viewA, viewB, out=out, profiler_name=profiler_name)
 
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("fmod() ufunc only supports 1D views")
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
-        pk.parallel_for(
-            viewA.shape[0],
-            fmod_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
-        pk.parallel_for(
-            viewA.shape[0],
-            fmod_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
-
-@pk.workunit
-def square_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_uint8(tid: int, view: pk.View1D[pk.uint8], out: pk.View1D[pk.uint8]):
-    out[tid] = view[tid] * view[tid]
 
-
-@pk.workunit
-def square_impl_2d_uint8(tid: int, view: pk.View2D[pk.uint8], out: pk.View2D[pk.uint8]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_uint16(tid: int, view: pk.View1D[pk.uint16], out: pk.View1D[pk.uint16]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_uint16(tid: int, view: pk.View2D[pk.uint16], out: pk.View2D[pk.uint16]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_uint32(tid: int, view: pk.View1D[pk.uint32], out: pk.View1D[pk.uint32]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_uint32(tid: int, view: pk.View2D[pk.uint32], out: pk.View2D[pk.uint32]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_uint64(tid: int, view: pk.View1D[pk.uint64], out: pk.View1D[pk.uint64]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_uint64(tid: int, view: pk.View2D[pk.uint64], out: pk.View2D[pk.uint64]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_int8(tid: int, view: pk.View1D[pk.int8], out: pk.View1D[pk.int8]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_int8(tid: int, view: pk.View2D[pk.int8], out: pk.View2D[pk.int8]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_int16(tid: int, view: pk.View1D[pk.int16], out: pk.View1D[pk.int16]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_int16(tid: int, view: pk.View2D[pk.int16], out: pk.View2D[pk.int16]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_int32(tid: int, view: pk.View1D[pk.int32], out: pk.View1D[pk.int32]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_int32(tid: int, view: pk.View2D[pk.int32], out: pk.View2D[pk.int32]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-
-@pk.workunit
-def square_impl_1d_int64(tid: int, view: pk.View1D[pk.int64], out: pk.View1D[pk.int64]):
-    out[tid] = view[tid] * view[tid]
-
-
-@pk.workunit
-def square_impl_2d_int64(tid: int, view: pk.View2D[pk.int64], out: pk.View2D[pk.int64]):
-    for i in range(view.extent(1)):
-        out[tid][i] = view[tid][i] * view[tid][i]
-
-def square(view):
+def square(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Squares argument element-wise
 
@@ -1983,6 +706,9 @@ def square(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -1990,95 +716,10 @@ def square(view):
            Output view.
 
     """
-    if len(view.shape) > 2:
-        raise NotImplementedError("only up to 2D views currently supported for square() ufunc.")
-    out = pk.View(view.shape, view.dtype)
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_float, view=view, out=out)
-    elif "uint8" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_uint8, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_uint8, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_uint8, view=view, out=out)
-    elif "uint16" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_uint16, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_uint16, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_uint16, view=view, out=out)
-    elif "uint32" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_uint32, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_uint32, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_uint32, view=view, out=out)
-    elif "uint64" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_uint64, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_uint64, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_uint64, view=view, out=out)
-    elif "int8" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_int8, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_int8, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_int8, view=view, out=out)
-    elif "int16" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_int16, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_int16, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_int16, view=view, out=out)
-    elif "int32" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_int32, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_int32, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_int32, view=view, out=out)
-    elif "int64" in view.dtype.__name__:
-        if view.shape == ():
-            pk.parallel_for(1, square_impl_1d_int64, view=view, out=out)
-        elif len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], square_impl_1d_int64, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], square_impl_2d_int64, view=view, out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
-
-@pk.workunit
-def greater_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.uint8]):
-    out[tid] = viewA[tid] > viewB[tid]
+    return apply_ufunc("square", view, out=out, profiler_name=profiler_name)
 
 
-@pk.workunit
-def greater_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.uint8]):
-    out[tid] = viewA[tid] > viewB[tid]
-
-
-def greater(viewA, viewB):
+def greater(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the truth value of viewA > viewB element-wise.
 
@@ -2088,6 +729,9 @@ def greater(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2095,40 +739,10 @@ def greater(viewA, viewB):
            Output view.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("greater() ufunc only supports 1D views")
-    out = pk.View([viewA.shape[0]], pk.uint8)
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        pk.parallel_for(
-            viewA.shape[0],
-            greater_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
+    return apply_ufunc("greater", viewA, viewB, out=out, profiler_name=profiler_name)
 
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        pk.parallel_for(
-            viewA.shape[0],
-            greater_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
-
-@pk.workunit
-def logaddexp_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double],):
-    out[tid] = log(exp(viewA[tid]) + exp(viewB[tid]))
 
-
-@pk.workunit
-def logaddexp_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float],):
-    out[tid] = log(exp(viewA[tid]) + exp(viewB[tid]))
-
-
-def logaddexp(viewA, viewB):
+def logaddexp(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return a view with log(exp(a) + exp(b)) calculate for
     positionally corresponding elements in viewA and viewB
@@ -2139,6 +753,9 @@ def logaddexp(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2146,30 +763,9 @@ def logaddexp(viewA, viewB):
            Output view.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for logaddexp() ufunc.")
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
-        pk.parallel_for(
-            viewA.shape[0],
-            logaddexp_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
-        pk.parallel_for(
-            viewA.shape[0],
-            logaddexp_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
+    return apply_ufunc("logaddexp", viewA, viewB, out=out, profiler_name=profiler_name)
 
-def true_divide(viewA, viewB):
+def true_divide(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     true_divide is an alias of divide
 
@@ -2179,6 +775,9 @@ def true_divide(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2187,20 +786,10 @@ def true_divide(viewA, viewB):
 
     """
 
-    return divide(viewA, viewB)
-
-
-@pk.workunit
-def logaddexp2_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double],):
-    out[tid] = log2(pow(2, viewA[tid]) + pow(2, viewB[tid]))
-
-
-@pk.workunit
-def logaddexp2_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float],):
-    out[tid] = log2(pow(2, viewA[tid]) + pow(2, viewB[tid]))
+    return divide(viewA, viewB, profiler_name=profiler_name, out=out)
 
 
-def logaddexp2(viewA, viewB):
+def logaddexp2(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return a view with log(pow(2, a) + pow(2, b)) calculated for
     positionally corresponding elements in viewA and viewB
@@ -2211,6 +800,9 @@ def logaddexp2(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2218,41 +810,10 @@ def logaddexp2(viewA, viewB):
            Output view.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for logaddexp2() ufunc.")
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
-        pk.parallel_for(
-            viewA.shape[0],
-            logaddexp2_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
+    return apply_ufunc("logaddexp2", viewA, viewB, out=out, profiler_name=profiler_name)
 
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
-        pk.parallel_for(
-            viewA.shape[0],
-            logaddexp2_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
 
-
-@pk.workunit
-def floor_divide_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = viewA[tid] // viewB[tid]
-
-
-@pk.workunit
-def floor_divide_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = viewA[tid] // viewB[tid]
-
-
-def floor_divide(viewA, viewB):
+def floor_divide(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Divides positionally corresponding elements
     of viewA with elements of viewB and floors the result
@@ -2263,6 +824,9 @@ def floor_divide(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2270,88 +834,31 @@ def floor_divide(viewA, viewB):
            Output view.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for floor_divide() ufunc.")
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
-        pk.parallel_for(
-            viewA.shape[0],
-            floor_divide_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
-        pk.parallel_for(
-            viewA.shape[0],
-            floor_divide_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
+    return apply_ufunc("floor_divide", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-def sin(view, profiler_name: Optional[str] = None):
+def sin(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise trigonometric sine of the view
 
-    Parameters
-    ----------
-    view : pykokkos view
-           Input view.
-
-    Returns
-    -------
-    out : pykokkos view
-           Output view.
-
-    """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    if ndims > 2:
-        raise NotImplementedError("sin() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=dtype)
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="sin",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
-
-
-@pk.workunit
-def cos_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = cos(view[tid])
-
-
-@pk.workunit
-def cos_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.double]):
-    for i in range(view.extent(1)):
-        out[tid][i] = cos(view[tid][i])
-
-
-@pk.workunit
-def cos_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = cos(view[tid])
+    Parameters
+    ----------
+    view : pykokkos view
+           Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
+    Returns
+    -------
+    out : pykokkos view
+           Output view.
 
-@pk.workunit
-def cos_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.float]):
-    for i in range(view.extent(1)):
-        out[tid][i] = cos(view[tid][i])
+    """
+    return apply_ufunc("sin", view, out=out, profiler_name=profiler_name)
 
 
-def cos(view):
+def cos(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise trigonometric cosine of the view
 
@@ -2359,6 +866,9 @@ def cos(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2366,26 +876,10 @@ def cos(view):
            Output view.
 
     """
-    if len(view.shape) > 2:
-        raise NotImplementedError("only up to 2D views currently supported for cos() ufunc.")
-    if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        out = pk.View([*view.shape], dtype=pk.float64)
-        if len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], cos_impl_1d_double, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], cos_impl_2d_double, view=view, out=out)
-    elif "float" in view.dtype.__name__:
-        out = pk.View([*view.shape], dtype=pk.float32)
-        if len(view.shape) == 1:
-            pk.parallel_for(view.shape[0], cos_impl_1d_float, view=view, out=out)
-        elif len(view.shape) == 2:
-            pk.parallel_for(view.shape[0], cos_impl_2d_float, view=view, out=out)
-    else:
-        raise NotImplementedError
-    return out
+    return apply_ufunc("cos", view, out=out, profiler_name=profiler_name)
 
 
-def tan(view, profiler_name: Optional[str] = None):
+def tan(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise tangent of the view
 
@@ -2393,6 +887,9 @@ def tan(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2400,37 +897,10 @@ def tan(view, profiler_name: Optional[str] = None):
            Output view.
 
     """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    if ndims > 2:
-        raise NotImplementedError("tan() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=dtype)
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="tan",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
-
+    return apply_ufunc("tan", view, out=out, profiler_name=profiler_name)
 
-@pk.workunit
-def logical_and_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.uint8]):
-    out[tid] = viewA[tid] and viewB[tid]
-
-
-@pk.workunit
-def logical_and_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.uint8]):
-    out[tid] = viewA[tid] and viewB[tid]
 
-
-def logical_and(viewA, viewB):
+def logical_and(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the element-wise truth value of viewA AND viewB.
 
@@ -2440,47 +910,24 @@ def logical_and(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
     out : pykokkos view (uint8)
-           Output view.
+           Output view, or a BitView if both inputs are BitViews.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for logical_and() ufunc.")
-    out = pk.View([viewA.shape[0]], pk.uint8)
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        pk.parallel_for(
-            viewA.shape[0],
-            logical_and_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        pk.parallel_for(
-            viewA.shape[0],
-            logical_and_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
+    if isinstance(viewA, BitView) and isinstance(viewB, BitView) and out is None:
+        # a word at a time
+        return viewA & viewB
 
-@pk.workunit
-def logical_or_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.uint8]):
-    out[tid] = viewA[tid] or viewB[tid]
-
-
-@pk.workunit
-def logical_or_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.uint8]):
-    out[tid] = viewA[tid] or viewB[tid]
+    return apply_ufunc("logical_and", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-def logical_or(viewA, viewB):
+def logical_or(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the element-wise truth value of viewA OR viewB.
 
@@ -2490,47 +937,24 @@ def logical_or(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
     out : pykokkos view (uint8)
-           Output view.
+           Output view, or a BitView if both inputs are BitViews.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for logical_or() ufunc.")
-    out = pk.View([viewA.shape[0]], pk.uint8)
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        pk.parallel_for(
-            viewA.shape[0],
-            logical_or_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        pk.parallel_for(
-            viewA.shape[0],
-            logical_or_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
-
-@pk.workunit
-def logical_xor_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.uint8]):
-    out[tid] = bool(viewA[tid]) ^ bool(viewB[tid])
-
+    if isinstance(viewA, BitView) and isinstance(viewB, BitView) and out is None:
+        # a word at a time
+        return viewA | viewB
 
-@pk.workunit
-def logical_xor_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.uint8]):
-    out[tid] = bool(viewA[tid]) ^ bool(viewB[tid])
+    return apply_ufunc("logical_or", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-def logical_xor(viewA, viewB):
+def logical_xor(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the element-wise truth value of viewA XOR viewB.
 
@@ -2540,47 +964,24 @@ def logical_xor(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
     out : pykokkos view (uint8)
-           Output view.
+           Output view, or a BitView if both inputs are BitViews.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for logical_xor() ufunc.")
-    out = pk.View([viewA.shape[0]], pk.uint8)
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        pk.parallel_for(
-            viewA.shape[0],
-            logical_xor_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        pk.parallel_for(
-            viewA.shape[0],
-            logical_xor_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
-
-
-@pk.workunit
-def logical_not_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.uint8]):
-    out[tid] = not view[tid]
+    if isinstance(viewA, BitView) and isinstance(viewB, BitView) and out is None:
+        # a word at a time
+        return viewA ^ viewB
 
-
-@pk.workunit
-def logical_not_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.uint8]):
-    out[tid] = not view[tid]
+    return apply_ufunc("logical_xor", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-def logical_not(view):
+def logical_not(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise logical_not of the view.
 
@@ -2588,85 +989,109 @@ def logical_not(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
     out : pykokkos view (uint8)
-           Output view.
+           Output view, or a BitView if the input is a BitView.
 
     """
-    if len(view.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for logical_not() ufunc.")
-    out = pk.View([view.shape[0]], pk.uint8)
-    if view.dtype.__name__ == "float64":
-        pk.parallel_for(view.shape[0], logical_not_impl_1d_double, view=view, out=out)
-    elif view.dtype.__name__ == "float32":
-        pk.parallel_for(view.shape[0], logical_not_impl_1d_float, view=view, out=out)
-    return out
+    if isinstance(view, BitView) and out is None:
+        return ~view
+
+    return apply_ufunc("logical_not", view, out=out, profiler_name=profiler_name)
 
 
 @pk.workunit
-def fmax_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = fmax(viewA[tid], viewB[tid])
+def where_impl_1d(tid: int, condition: pk.View1D[pk.uint8], viewA, viewB, out):
+    if condition[tid] != 0:
+        out[tid] = viewA[tid]
+    else:
+        out[tid] = viewB[tid]
 
 
 @pk.workunit
-def fmax_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = fmax(viewA[tid], viewB[tid])
+def where_impl_1d_bits(tid: int, condition: pk.View1D[pk.uint32], viewA, viewB, out):
+    if ((condition[tid >> 5] >> (tid & 31)) & 1) != 0:
+        out[tid] = viewA[tid]
+    else:
+        out[tid] = viewB[tid]
 
 
-def fmax(viewA, viewB):
+def where(condition, viewA, viewB):
     """
-    Return the element-wise fmax.
+    Return elements chosen from viewA where condition is true and from
+    viewB elsewhere.
 
     Parameters
     ----------
+    condition : pykokkos view (uint8) or BitView
+            The mask, e.g. the output of a logical ufunc.
     viewA : pykokkos view
-            Input view.
+            Values where condition is true.
     viewB : pykokkos view
-            Input view.
+            Values where condition is false.
 
     Returns
     -------
     out : pykokkos view
-           Output view.
+           Output view, with the dtype of the inputs.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("fmax() ufunc only supports 1D views")
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+    if len(condition.shape) > 1 or len(viewA.shape) > 1 or len(viewB.shape) > 1:
+        raise NotImplementedError("only 1D views currently supported for where() ufunc.")
+    if not condition.shape[0] == viewA.shape[0] == viewB.shape[0]:
+        raise ValueError("ERROR: condition, viewA and viewB must have the same shape")
+    if viewA.dtype.__name__ != viewB.dtype.__name__:
+        raise RuntimeError("Incompatible Types")
+
+    out = pk.View([viewA.shape[0]], viewA.dtype)
+    if isinstance(condition, BitView):
         pk.parallel_for(
             viewA.shape[0],
-            fmax_impl_1d_double,
+            where_impl_1d_bits,
+            condition=condition.words,
             viewA=viewA,
             viewB=viewB,
             out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+    else:
         pk.parallel_for(
             viewA.shape[0],
-            fmax_impl_1d_float,
+            where_impl_1d,
+            condition=condition,
             viewA=viewA,
             viewB=viewB,
             out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
     return out
 
 
-@pk.workunit
-def fmin_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = fmin(viewA[tid], viewB[tid])
+def fmax(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
+    """
+    Return the element-wise fmax.
 
+    Parameters
+    ----------
+    viewA : pykokkos view
+            Input view.
+    viewB : pykokkos view
+            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
-@pk.workunit
-def fmin_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = fmin(viewA[tid], viewB[tid])
+    Returns
+    -------
+    out : pykokkos view
+           Output view.
+
+    """
+    return apply_ufunc("fmax", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-def fmin(viewA, viewB):
+def fmin(viewA, viewB, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Return the element-wise fmin.
 
@@ -2676,6 +1101,9 @@ def fmin(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2683,31 +1111,10 @@ def fmin(viewA, viewB):
            Output view.
 
     """
-    if len(viewA.shape) > 1 or len(viewB.shape) > 1:
-        raise NotImplementedError("fmax() ufunc only supports 1D views")
-    if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
-        pk.parallel_for(
-            viewA.shape[0],
-            fmin_impl_1d_double,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-
-    elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
-        pk.parallel_for(
-            viewA.shape[0],
-            fmin_impl_1d_float,
-            viewA=viewA,
-            viewB=viewB,
-            out=out)
-    else:
-        raise RuntimeError("Incompatible Types")
-    return out
+    return apply_ufunc("fmin", viewA, viewB, out=out, profiler_name=profiler_name)
 
 
-def exp(view, profiler_name: Optional[str] = None):
+def exp(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise exp of the view.
 
@@ -2715,6 +1122,9 @@ def exp(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2722,39 +1132,10 @@ def exp(view, profiler_name: Optional[str] = None):
            Output view.
 
     """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    if ndims > 2:
-        raise NotImplementedError("exp() ufunc only supports up to 2D views")
-    if view.size == 0:
-        return view
-    out = pk.View([*view.shape], dtype=dtype)
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="exp",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
-
-
-@pk.workunit
-def exp2_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = pow(2, view[tid])
-
-
-@pk.workunit
-def exp2_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
-    out[tid] = pow(2, view[tid])
+    return apply_ufunc("exp", view, out=out, profiler_name=profiler_name)
 
 
-def exp2(view):
+def exp2(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Element-wise 2**x of the view.
 
@@ -2762,6 +1143,9 @@ def exp2(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -2769,29 +1153,55 @@ def exp2(view):
            Output view.
 
     """
-    if len(view.shape) > 1:
-        raise NotImplementedError("only 1D views currently supported for exp2() ufunc.")
-    if view.dtype.__name__ == "float64":
-        out = pk.View([view.shape[0]], pk.double)
-        pk.parallel_for(view.shape[0], exp2_impl_1d_double, view=view, out=out)
-    elif view.dtype.__name__ == "float32":
-        out = pk.View([view.shape[0]], pk.float)
-        pk.parallel_for(view.shape[0], exp2_impl_1d_float, view=view, out=out)
-    else:
-        raise NotImplementedError
-    return out
+    return apply_ufunc("exp2", view, out=out, profiler_name=profiler_name)
 
 
-# TODO: Implement parallel max reduction with index
-def argmax(view, axis=None):
-    if isinstance(axis, pk.ViewType):
-        raise NotImplementedError
+def argmax(view, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False):
+    """
+    Indices of the maximum values of a view along an axis. The first
+    occurrence is returned in case of ties, and the first NaN if any.
 
-    res = np.argmax(view, axis=axis)
-    view = pk.View(res.shape, pk.int32)
-    view[:] = res
+    Parameters
+    ----------
+    view : pykokkos view
+           Input view, of any rank.
+    axis : int, optional
+           Axis to search. By default, the index is into the view
+           flattened in row-major order.
+    keepdims : bool, optional
+           Whether to keep the searched axis with extent 1.
 
-    return view
+    Returns
+    -------
+    y : pykokkos view or int
+        Output view of int64 indices, or an int if no axis is kept.
+
+    """
+    return apply_reduction("argmax", view, axis, keepdims, profiler_name=profiler_name)
+
+
+def argmin(view, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False):
+    """
+    Indices of the minimum values of a view along an axis. The first
+    occurrence is returned in case of ties, and the first NaN if any.
+
+    Parameters
+    ----------
+    view : pykokkos view
+           Input view, of any rank.
+    axis : int, optional
+           Axis to search. By default, the index is into the view
+           flattened in row-major order.
+    keepdims : bool, optional
+           Whether to keep the searched axis with extent 1.
+
+    Returns
+    -------
+    y : pykokkos view or int
+        Output view of int64 indices, or an int if no axis is kept.
+
+    """
+    return apply_reduction("argmin", view, axis, keepdims, profiler_name=profiler_name)
 
 # TODO: Implement parallel sorting + filtering 
 def unique(view):
@@ -2801,94 +1211,78 @@ def unique(view):
 
     return view
 
-@pk.workunit
-def var_impl_2d_axis0_double(tid: int, view: pk.View2D[pk.double], view_mean:pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = 0
-    for i in range(view.extent(0)):
-        out[tid] += (pow(view[i][tid] - view_mean[tid], 2)) / view.extent(0)
-
-
-@pk.workunit
-def var_imple_2d_axis1_double(tid: int, view: pk.View2D[pk.double], view_mean:pk.View1D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = 0
-    for i in range(view.extent(1)):
-        out[tid] += (pow(view[tid][i] - view_mean[tid], 2)) / view.extent(1)
+def var(view, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False, ddof: float = 0):
+    """
+    Variance of the elements of a view over the given axes, computed
+    in a single pass with Welford's algorithm.
 
-@pk.workunit
-def var_impl_1d(tid, acc, view, mean):
-    acc += pow(view[tid] - mean, 2) / view.extent(0)
+    Parameters
+    ----------
+    view : pykokkos view
+           Input view, of any rank.
+    axis : int or tuple of ints, optional
+           Axes to reduce. All axes are reduced by default.
+    keepdims : bool, optional
+           Whether to keep the reduced axes with extent 1.
+    ddof : number, optional
+           Subtracted from the number of elements in the divisor.
+           The population variance is returned by default.
 
-def var(view, axis=None, profiler_name: Optional[str] = None): # population
-    if isinstance(axis, pk.ViewType):
-        raise NotImplementedError
+    Returns
+    -------
+    y : pykokkos view or scalar
+        Output view of the kept axes, or a scalar if no axis is kept.
 
-    if view.rank() > 2:
-        raise NotImplementedError("Current version of Pykokkos only supports variance for upto 2D views")
-    
-    if view.rank() == 2: # legacy code
-        if view.dtype.__name__ == "float64":
-            if axis == 0:
-                view_mean = mean(view, 0, profiler_name)
-                out = pk.View([view.shape[1]], pk.double)
-                pk.parallel_for(profiler_name, view.shape[1], var_impl_2d_axis0_double, view=view, view_mean=view_mean, out=out)
-                return out
-            else:
-                view_mean = mean(view, 1, profiler_name)
-                out = pk.View([view.shape[0]], pk.double)
-                pk.parallel_for(profiler_name, view.shape[0], var_imple_2d_axis1_double, view=view, view_mean=view_mean, out=out)
-                return out
-        else:
-            raise RuntimeError("Incompatible Types")
-    elif view.rank() == 1: # newer impl
-        mean_val = mean(view, profiler_name)
-        return pk.parallel_reduce(profiler_name, view.shape[0], var_impl_1d, view=view, mean=mean_val)
-    else:
-        raise RuntimeError("Unexpected view of shape {}".format(view.shape))
+    """
+    return apply_reduction("var", view, axis, keepdims, ddof, profiler_name)
 
 
-@pk.workunit
-def mean_impl_1d_axis0_double(tid: int, view: pk.View2D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = 0
-    for i in range(view.extent(0)):
-        out[tid] += (view[i][tid] / view.extent(0))
+def std(view, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False, ddof: float = 0):
+    """
+    Standard deviation of the elements of a view over the given axes,
+    computed in a single pass with Welford's algorithm.
 
+    Parameters
+    ----------
+    view : pykokkos view
+           Input view, of any rank.
+    axis : int or tuple of ints, optional
+           Axes to reduce. All axes are reduced by default.
+    keepdims : bool, optional
+           Whether to keep the reduced axes with extent 1.
+    ddof : number, optional
+           Subtracted from the number of elements in the divisor.
 
-@pk.workunit
-def mean_impl_1d_axis1_double(tid: int, view: pk.View2D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = 0
-    for i in range(view.extent(1)):
-        out[tid] += (view[tid][i] / view.extent(1))
+    Returns
+    -------
+    y : pykokkos view or scalar
+        Output view of the kept axes, or a scalar if no axis is kept.
 
-@pk.workunit
-def mean_impl_1d(tid, acc, view):
-    acc += view[tid] / view.extent(0)
+    """
+    return apply_reduction("std", view, axis, keepdims, ddof, profiler_name)
 
-def mean(view, axis=None, profiler_name: Optional[str] = None):
-    if isinstance(axis, pk.ViewType):
-        raise NotImplementedError
 
-    if view.rank() > 2:
-        raise NotImplementedError("Current version of Pykokkos only supports variance for upto 2D views")
+def mean(view, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False):
+    """
+    Arithmetic mean of the elements of a view over the given axes.
 
-    if view.rank() == 2:
-        if view.dtype.__name__ == "float64": # legacy
-            if axis == 0:
-                out = pk.View([view.shape[1]], pk.double)
-                pk.parallel_for(profiler_name, view.shape[1], mean_impl_1d_axis0_double, view=view, out=out)
-                return out
-            else:
-                out = pk.View([view.shape[0]], pk.double)
-                pk.parallel_for(profiler_name, view.shape[0], mean_impl_1d_axis1_double, view=view, out=out)
-
-                return out
-        else:
-            raise RuntimeError("Incompatible Types")
+    Parameters
+    ----------
+    view : pykokkos view
+           Input view, of any rank.
+    axis : int or tuple of ints, optional
+           Axes to reduce. All axes are reduced by default.
+    keepdims : bool, optional
+           Whether to keep the reduced axes with extent 1.
 
-    elif view.rank() == 1:
-        return pk.parallel_reduce(profiler_name, view.shape[0], mean_impl_1d, view=view)
-    else:
-        raise RuntimeError("Unexpected view of shape {}".format(view.shape))
+    Returns
+    -------
+    y : pykokkos view or scalar
+        Output view of the kept axes, or a scalar if no axis is kept.
+        Integer views give float64 means.
 
+    """
+    return apply_reduction("mean", view, axis, keepdims, profiler_name=profiler_name)
 
 
 @pk.workunit
@@ -2901,7 +1295,7 @@ def in1d_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[
 
 def in1d(viewA, viewB):
     if viewA.dtype.__name__ == "float64":
-        out = pk.View(viewA.shape, pk.int8)
+        out = pk.View(viewA.shape, pk.int8, initialize=False)
         pk.parallel_for(
             viewA.shape[0],
             in1d_impl_1d_double,
@@ -2926,7 +1320,7 @@ def transpose(view):
 
     if view.rank() == 2:
         if view.dtype.__name__ == "float64":
-            out = pk.View(view.shape[::-1], pk.double)
+            out = pk.View(view.shape[::-1], pk.double, initialize=False)
             pk.parallel_for(view.shape[0], transpose_impl_2d_double, view=view, out=out)
             return out
     
@@ -2955,7 +1349,7 @@ def hstack(viewA, viewB):
 
     if viewA.rank() == 2 and viewB.rank() == 2:
         if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-            out = pk.View([viewA.shape[0], viewA.shape[1] * 2], pk.double)
+            out = pk.View([viewA.shape[0], viewA.shape[1] * 2], pk.double, initialize=False)
             pk.parallel_for(
                 out.shape[0],
                 hstack_impl_2d_double,
@@ -2966,7 +1360,7 @@ def hstack(viewA, viewB):
             raise RuntimeError("hstack supports 2D views of type double only")
     elif viewA.rank() == 1 and viewB.rank() == 1:
         if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-            out = pk.View([viewA.shape[0] + viewB.shape[0]], pk.double)
+            out = pk.View([viewA.shape[0] + viewB.shape[0]], pk.double, initialize=False)
             pk.parallel_for(
                 out.shape[0],
                 hstack_impl_1d_double,
@@ -2986,67 +1380,42 @@ def index_impl_1d_double(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D
     out[tid] = viewA[viewB[tid]]
 
 
+@pk.workunit
+def index_impl_1d_double_int64(tid: int, viewA: pk.View1D[pk.double], viewB: pk.View1D[pk.int64], out: pk.View1D[pk.double]):
+    out[tid] = viewA[viewB[tid]]
+
+
 def index(viewA, viewB):
     if viewB.dtype == pk.int32:
-        out = pk.View(viewB.shape, pk.double)
+        out = pk.View(viewB.shape, pk.double, initialize=False)
         pk.parallel_for(
             viewB.shape[0],
             index_impl_1d_double,
             viewA=viewA,
             viewB=viewB,
             out=out)
+    elif viewB.dtype == pk.int64:
+        out = pk.View(viewB.shape, pk.double, initialize=False)
+        pk.parallel_for(
+            viewB.shape[0],
+            index_impl_1d_double_int64,
+            viewA=viewA,
+            viewB=viewB,
+            out=out)
     else:
         raise RuntimeError("Incompatible Types")
     return out
 
 
-def isnan(view, profiler_name: Optional[str] = None):
-    dtype = view.dtype
-    ndims = len(view.shape)
-    if ndims > 2:
-        raise NotImplementedError("isnan() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=pk.bool)
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    if view.ndim == 0:
-        new_view = pk.View([1], dtype=view.dtype)
-        new_view[0] = view
-        view = new_view
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="isnan",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+def isnan(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
+    return apply_ufunc("isnan", view, out=out, profiler_name=profiler_name)
 
 
-def isinf(view, profiler_name: Optional[str] = None):
-    dtype = view.dtype
-    ndims = len(view.shape)
-    if ndims > 2:
-        raise NotImplementedError("isinf() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=pk.bool)
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="isinf",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+def isinf(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
+    return apply_ufunc("isinf", view, out=out, profiler_name=profiler_name)
 
 
-def equal(view1, view2, profiler_name: Optional[str] = None):
+def equal(view1, view2, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Computes the truth value of ``view1_i`` == ``view2_i`` for each element
     ``x1_i`` of the input view ``view1`` with the respective element ``x2_i``
@@ -3060,76 +1429,27 @@ def equal(view1, view2, profiler_name: Optional[str] = None):
     view2 : pykokkos view
             Input view. May have any data type, but must be shape-compatible
             with ``view1`` via broadcasting.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
     out : pykokkos view (bool)
            Output view.
     """
-    if view1.size == 0 and view2.size == 0:
+    if view1.size == 0 and view2.size == 0 and out is None:
         ret =  pk.View((), dtype=pk.bool)
         ret[...] = 1
         return ret
-    view1, view2 = _broadcast_views(view1, view2)
-    dtype1 = view1.dtype
-    dtype2 = view2.dtype
-    view1, view2, effective_dtype = _typematch_views(view1, view2)
-    ndims = len(view1.shape)
-    if ndims > 5:
-        raise NotImplementedError("equal() ufunc only supports up to 5D views")
-    out = pk.View([*view1.shape], dtype=pk.bool)
-    if view1.shape == ():
-        tid = 1
-    else:
-        tid = view1.shape[0]
-    if isinstance(view1, pk.Subview):
-        new_view = pk.View((), dtype=view1.dtype)
-        new_view[:] = view1.data
-        view1 = new_view
-    if isinstance(view2, pk.Subview):
-        new_view = pk.View((), dtype=view2.dtype)
-        new_view[:] = view2.data
-        view2 = new_view
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=effective_dtype,
-                             ndims=ndims,
-                             op="equal",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view1=view1,
-                             view2=view2)
-    return out
+    return apply_ufunc("equal", view1, view2, out=out, profiler_name=profiler_name)
 
 
-def isfinite(view, profiler_name: Optional[str] = None):
-    dtype = view.dtype
-    ndims = len(view.shape)
-    if ndims > 2:
-        raise NotImplementedError("isfinite() ufunc only supports up to 2D views")
-    if view.size == 0:
-        out = pk.View(view.shape, dtype=pk.bool)
-        return out
-    out = pk.View([*view.shape], dtype=pk.bool)
-    if view.shape == ():
-        new_view = pk.View([1], dtype=dtype)
-        new_view[:] = view
-        view = new_view
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="isfinite",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+def isfinite(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
+    return apply_ufunc("isfinite", view, out=out, profiler_name=profiler_name)
 
 
-def round(view, profiler_name: Optional[str] = None):
+def round(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Rounds each element of the input view to the nearest integer-valued number.
 
@@ -3137,6 +1457,9 @@ def round(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -3150,34 +1473,16 @@ def round(view, profiler_name: Optional[str] = None):
     If view element ``i`` is already integer-valued, the result is ``i``.
 
     """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    dtype_str = str(dtype)
-    if "int" in dtype_str:
+    if get_dtype_name(view.dtype) in INT_DTYPES:
         # special case defined in API std
-        return view
-    out = pk.View(view.shape, dtype=dtype)
-    if ndims > 3:
-        raise NotImplementedError("only up to 3D views currently supported for round() ufunc.")
-        
-    _supported_types_check(dtype_str, {"double", "float64", "float"})
+        if out is None:
+            return view
+        return apply_ufunc("positive", view, out=out, profiler_name=profiler_name)
 
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="round",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+    return apply_ufunc("round", view, out=out, profiler_name=profiler_name)
 
 
-def trunc(view, profiler_name: Optional[str] = None):
+def trunc(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Rounds each element ``i`` of the input view to the integer-valued number
     that is closest to but no greater than ``i``.
@@ -3186,6 +1491,9 @@ def trunc(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -3199,34 +1507,16 @@ def trunc(view, profiler_name: Optional[str] = None):
     If view element ``i`` is already integer-valued, the result is ``i``.
 
     """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    dtype_str = str(dtype)
-    if "int" in dtype_str:
+    if get_dtype_name(view.dtype) in INT_DTYPES:
         # special case defined in API std
-        return view
-    out = pk.View(view.shape, dtype=dtype)
-    if ndims > 3:
-        raise NotImplementedError("only up to 3D views currently supported for trunc() ufunc.")
-
-    _supported_types_check(dtype_str, {"double", "float64", "float"})
+        if out is None:
+            return view
+        return apply_ufunc("positive", view, out=out, profiler_name=profiler_name)
 
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="trunc",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+    return apply_ufunc("trunc", view, out=out, profiler_name=profiler_name)
 
 
-def ceil(view, profiler_name: Optional[str] = None):
+def ceil(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Rounds each element of the input view to the smallest (i.e., closest to -infinity)
     integer-valued number that is not less than a given element.
@@ -3235,6 +1525,9 @@ def ceil(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -3248,34 +1541,16 @@ def ceil(view, profiler_name: Optional[str] = None):
     If view element ``i`` is already integer-valued, the result is ``i``.
 
     """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    dtype_str = str(dtype)
-    if "int" in dtype_str:
+    if get_dtype_name(view.dtype) in INT_DTYPES:
         # special case defined in API std
-        return view
-    out = pk.View(view.shape, dtype=dtype)
-    if ndims > 3:
-        raise NotImplementedError("only up to 3D views currently supported for ceil() ufunc.")
-
-    _supported_types_check(dtype_str, {"double", "float64", "float"})
+        if out is None:
+            return view
+        return apply_ufunc("positive", view, out=out, profiler_name=profiler_name)
 
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="ceil",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+    return apply_ufunc("ceil", view, out=out, profiler_name=profiler_name)
 
 
-def floor(view, profiler_name: Optional[str] = None):
+def floor(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Rounds each element of the input view to the greatest (i.e., closest to +infinity)
     integer-valued number that is not greater than a given element.
@@ -3284,6 +1559,9 @@ def floor(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -3297,34 +1575,16 @@ def floor(view, profiler_name: Optional[str] = None):
     If view element ``i`` is already integer-valued, the result is ``i``.
 
     """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    dtype_str = str(dtype)
-    if "int" in dtype_str:
+    if get_dtype_name(view.dtype) in INT_DTYPES:
         # special case defined in API std
-        return view
-    out = pk.View(view.shape, dtype=dtype)
-    if ndims > 3:
-        raise NotImplementedError("only up to 3D views currently supported for floor() ufunc.")
-
-    _supported_types_check(dtype_str, {"double", "float64", "float"})
+        if out is None:
+            return view
+        return apply_ufunc("positive", view, out=out, profiler_name=profiler_name)
 
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="floor",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+    return apply_ufunc("floor", view, out=out, profiler_name=profiler_name)
 
 
-def tanh(view, profiler_name: Optional[str] = None):
+def tanh(view, profiler_name: Optional[str] = None, out: Optional[ViewType] = None):
     """
     Calculates an approximation to the hyperbolic tangent for each element x_i of the input view.
 
@@ -3332,6 +1592,9 @@ def tanh(view, profiler_name: Optional[str] = None):
     ----------
     view : pykokkos view
             Input view whose elements each represent a hyperbolic angle. Should have a floating-point data type.
+    out : pykokkos view, optional
+            View the result is written to. A new view is allocated
+            by default.
 
     Returns
     -------
@@ -3339,21 +1602,4 @@ def tanh(view, profiler_name: Optional[str] = None):
         A view containing the hyperbolic tangent of each element in the input view. The returned view must
         have a floating-point data type determined by type promotion rules.
     """
-    dtype = view.dtype
-    ndims = len(view.shape)
-    if ndims > 2:
-        raise NotImplementedError("tanh() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=dtype)
-    if view.shape == ():
-        tid = 1
-    else:
-        tid = view.shape[0]
-    _ufunc_kernel_dispatcher(profiler_name=profiler_name,
-                             tid=tid,
-                             dtype=dtype,
-                             ndims=ndims,
-                             op="tanh",
-                             sub_dispatcher=pk.parallel_for,
-                             out=out,
-                             view=view)
-    return out
+    return apply_ufunc("tanh", view, out=out, profiler_name=profiler_name)
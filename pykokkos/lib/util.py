@@ -1,5 +1,6 @@
 from typing import Optional
 import pykokkos as pk
+from pykokkos.lib.reduction_engine import apply_reduction
 
 import numpy as np
 
@@ -18,44 +19,65 @@ def any(x, /, *, axis=None, keepdims=False):
     return pk.View(pk.array(np.any(x)))
 
 
-@pk.workunit
-def sum_impl_1d_double(tid: int, acc: pk.Acc[pk.double], viewA: pk.View1D[pk.double]):
-    acc += viewA[tid]
+def sum(viewA, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False):
+    """
+    Sum of the elements of a View over the given axes
 
+    :param viewA: the View, of any rank
+    :param axis: None to sum all elements, an axis, or a tuple of axes
+    :param profiler_name: the name of the kernels shown by Kokkos tools
+    :param keepdims: whether to keep the summed axes with extent 1
+    :returns: a View of the kept axes, or a scalar if no axis is kept;
+        integers are summed in 64 bits
+    """
 
-@pk.workunit
-def sum_axis0_impl_1d_double(tid: int, viewA: pk.View2D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = 0
-    for i in range(viewA.extent(0)):
-        out[tid] += viewA[i][tid]
+    return apply_reduction("sum", viewA, axis, keepdims, profiler_name=profiler_name)
 
 
-@pk.workunit
-def sum_axis1_impl_1d_double(tid: int, viewA: pk.View2D[pk.double], out: pk.View1D[pk.double]):
-    out[tid] = 0
-    for i in range(viewA.extent(1)):
-        out[tid] += viewA[tid][i]
-
-
-def sum(viewA, axis=None, profiler_name: Optional[str] = None):
-    if axis is not None:
-        if axis == 0:
-            out = pk.View([viewA.shape[1]], pk.double)
-            pk.parallel_for(profiler_name, viewA.shape[1], sum_axis0_impl_1d_double, viewA=viewA, out=out)
-            return out
-        else:
-            out = pk.View([viewA.shape[0]], pk.double)
-            pk.parallel_for(profiler_name, viewA.shape[0], sum_axis1_impl_1d_double, viewA=viewA, out=out)
-
-            return out
-
-
-    if viewA.dtype.__name__ == "float64":
-        return pk.parallel_reduce(
-            profiler_name,
-            viewA.shape[0],
-            sum_impl_1d_double,
-            viewA=viewA)
+def max(viewA, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False):
+    """
+    Maximum of the elements of a View over the given axes. NaN
+    propagates as in numpy.
+
+    :param viewA: the View, of any rank
+    :param axis: None to reduce all elements, an axis, or a tuple of axes
+    :param profiler_name: the name of the kernels shown by Kokkos tools
+    :param keepdims: whether to keep the reduced axes with extent 1
+    :returns: a View of the kept axes, or a scalar if no axis is kept
+    """
+
+    return apply_reduction("max", viewA, axis, keepdims, profiler_name=profiler_name)
+
+
+def min(viewA, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False):
+    """
+    Minimum of the elements of a View over the given axes. NaN
+    propagates as in numpy.
+
+    :param viewA: the View, of any rank
+    :param axis: None to reduce all elements, an axis, or a tuple of axes
+    :param profiler_name: the name of the kernels shown by Kokkos tools
+    :param keepdims: whether to keep the reduced axes with extent 1
+    :returns: a View of the kept axes, or a scalar if no axis is kept
+    """
+
+    return apply_reduction("min", viewA, axis, keepdims, profiler_name=profiler_name)
+
+
+def minmax(viewA, axis=None, profiler_name: Optional[str] = None, keepdims: bool = False):
+    """
+    Minimum and maximum of the elements of a View over the given axes,
+    found in a single pass
+
+    :param viewA: the View, of any rank
+    :param axis: None to reduce all elements, an axis, or a tuple of axes
+    :param profiler_name: the name of the kernels shown by Kokkos tools
+    :param keepdims: whether to keep the reduced axes with extent 1
+    :returns: a tuple of the minimum and the maximum, each a View of the
+        kept axes or a scalar if no axis is kept
+    """
+
+    return apply_reduction("minmax", viewA, axis, keepdims, profiler_name=profiler_name)
 
 
 def find_max(viewA):
@@ -0,0 +1,3 @@
+from .containers import CooMatrix, CsrMatrix
+from .spgemm import spgemm
+from .spmv import spmv
@@ -0,0 +1,292 @@
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+import pykokkos as pk
+
+# the only index type of the sparse containers, which matches the
+# default index type of scipy.sparse for all but the largest matrices
+INDEX_NP_DTYPE = np.int32
+
+# the value types the sparse kernels support
+VALUE_NP_DTYPES: Tuple[type, ...] = (np.float64, np.float32)
+
+
+def as_index_view(indices: Any, name: str) -> pk.ViewType:
+    """
+    Get a View holding sparse indices, wrapping the input without a
+    copy if it already holds 32-bit integers
+
+    :param indices: a View or array-like of integers
+    :param name: the name of the argument, for error messages
+    :returns: a 1D int32 View
+    """
+
+    if isinstance(indices, pk.ViewType):
+        if indices.dtype is not pk.int32:
+            raise ValueError(f"ERROR: {name} must hold int32 indices, got {indices.dtype}")
+        return indices
+
+    arr: np.ndarray = np.asarray(indices)
+    if arr.ndim != 1:
+        raise ValueError(f"ERROR: {name} must be 1D, got shape {arr.shape}")
+
+    if arr.dtype != INDEX_NP_DTYPE:
+        if arr.size > 0 and arr.max() > np.iinfo(INDEX_NP_DTYPE).max:
+            raise ValueError(f"ERROR: {name} does not fit in int32 indices")
+        arr = arr.astype(INDEX_NP_DTYPE)
+
+    return pk.array(np.ascontiguousarray(arr))
+
+
+def as_value_view(values: Any, name: str) -> pk.ViewType:
+    """
+    Get a View holding sparse values or a dense vector, wrapping the
+    input without a copy if it is contiguous and of a supported type
+
+    :param values: a View or array-like of numbers
+    :param name: the name of the argument, for error messages
+    :returns: a 1D float64 or float32 View
+    """
+
+    if isinstance(values, pk.ViewType):
+        if values.dtype not in {pk.float64, pk.float32}:
+            raise ValueError(f"ERROR: {name} must hold float64 or float32 values, got {values.dtype}")
+        return values
+
+    arr: np.ndarray = np.asarray(values)
+    if arr.ndim != 1:
+        raise ValueError(f"ERROR: {name} must be 1D, got shape {arr.shape}")
+
+    if arr.dtype.type not in VALUE_NP_DTYPES:
+        arr = arr.astype(np.float64)
+
+    return pk.array(np.ascontiguousarray(arr))
+
+
+class CsrMatrix:
+    """
+    A sparse matrix in compressed sparse row format, modeled on
+    KokkosSparse::CrsMatrix. The column indices and values of row i are
+    entries[row_map[i]:row_map[i + 1]] and values[row_map[i]:row_map[i + 1]].
+    Column indices need not be sorted and may repeat, in which case
+    the values are summed.
+    """
+
+    def __init__(
+        self,
+        values: Any,
+        entries: Any,
+        row_map: Any,
+        shape: Tuple[int, int]
+    ):
+        """
+        CsrMatrix constructor. Arrays are wrapped without a copy when
+        they already have the right type.
+
+        :param values: the nonzero values, float64 or float32
+        :param entries: the column index of each value
+        :param row_map: the offset of each row in entries and values,
+            followed by the number of nonzeros
+        :param shape: the (rows, columns) of the matrix
+        """
+
+        self.values: pk.ViewType = as_value_view(values, "values")
+        self.entries: pk.ViewType = as_index_view(entries, "entries")
+        self.row_map: pk.ViewType = as_index_view(row_map, "row_map")
+        self.shape: Tuple[int, int] = (int(shape[0]), int(shape[1]))
+
+        if self.row_map.shape[0] != self.shape[0] + 1:
+            raise ValueError(f"ERROR: row_map must have {self.shape[0] + 1} entries, got {self.row_map.shape[0]}")
+        if self.entries.shape[0] != self.values.shape[0]:
+            raise ValueError(f"ERROR: entries and values must have the same length, got {self.entries.shape[0]} and {self.values.shape[0]}")
+
+    @classmethod
+    def from_scipy(cls, matrix: Any) -> "CsrMatrix":
+        """
+        Create a CsrMatrix from a scipy.sparse matrix or array. CSR
+        inputs with int32 indices and float64/float32 values are
+        wrapped without a copy, other formats are converted first.
+
+        :param matrix: the scipy.sparse matrix
+        :returns: the CsrMatrix
+        """
+
+        if matrix.format != "csr":
+            matrix = matrix.tocsr()
+
+        return cls(matrix.data, matrix.indices, matrix.indptr, matrix.shape)
+
+    @classmethod
+    def from_dense(cls, dense: Any) -> "CsrMatrix":
+        """
+        Create a CsrMatrix holding the nonzeros of a dense matrix
+
+        :param dense: a 2D array-like
+        :returns: the CsrMatrix
+        """
+
+        dense = np.asarray(dense)
+        if dense.ndim != 2:
+            raise ValueError(f"ERROR: expected a 2D array, got shape {dense.shape}")
+
+        rows, cols = np.nonzero(dense)
+        row_map = np.zeros(dense.shape[0] + 1, dtype=INDEX_NP_DTYPE)
+        np.cumsum(np.bincount(rows, minlength=dense.shape[0]), out=row_map[1:])
+
+        return cls(dense[rows, cols], cols, row_map, dense.shape)
+
+    @property
+    def num_rows(self) -> int:
+        return self.shape[0]
+
+    @property
+    def num_cols(self) -> int:
+        return self.shape[1]
+
+    @property
+    def nnz(self) -> int:
+        return self.values.shape[0]
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    def to_scipy(self) -> Any:
+        """
+        Get a scipy.sparse.csr_array sharing the memory of the matrix
+
+        :returns: the scipy.sparse array
+        """
+
+        import scipy.sparse
+
+        return scipy.sparse.csr_array(
+            (np.asarray(self.values), np.asarray(self.entries), np.asarray(self.row_map)), shape=self.shape)
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Get the matrix as a dense numpy array
+
+        :returns: the dense array
+        """
+
+        row_map: np.ndarray = self.row_map.read()
+        dense = np.zeros(self.shape, dtype=self.values.data.dtype)
+        rows = np.repeat(np.arange(self.num_rows), np.diff(row_map))
+        np.add.at(dense, (rows, self.entries.read()), self.values.read())
+
+        return dense
+
+    def __matmul__(self, other: Any) -> Union[pk.ViewType, "CsrMatrix"]:
+        # avoid circular import with scoped import
+        from .spgemm import spgemm
+        from .spmv import spmv
+
+        if isinstance(other, CsrMatrix):
+            return spgemm(self, other)
+
+        return spmv(self, other)
+
+    def __repr__(self) -> str:
+        return f"CsrMatrix(shape={self.shape}, nnz={self.nnz}, dtype={self.dtype.__name__})"
+
+
+class CooMatrix:
+    """
+    A sparse matrix in coordinate format: value k is at row rows[k]
+    and column cols[k]. Duplicate coordinates are summed.
+    """
+
+    def __init__(
+        self,
+        values: Any,
+        rows: Any,
+        cols: Any,
+        shape: Tuple[int, int]
+    ):
+        """
+        CooMatrix constructor. Arrays are wrapped without a copy when
+        they already have the right type.
+
+        :param values: the nonzero values, float64 or float32
+        :param rows: the row index of each value
+        :param cols: the column index of each value
+        :param shape: the (rows, columns) of the matrix
+        """
+
+        self.values: pk.ViewType = as_value_view(values, "values")
+        self.rows: pk.ViewType = as_index_view(rows, "rows")
+        self.cols: pk.ViewType = as_index_view(cols, "cols")
+        self.shape: Tuple[int, int] = (int(shape[0]), int(shape[1]))
+
+        if not self.rows.shape[0] == self.cols.shape[0] == self.values.shape[0]:
+            raise ValueError("ERROR: rows, cols and values must have the same length")
+
+    @classmethod
+    def from_scipy(cls, matrix: Any) -> "CooMatrix":
+        """
+        Create a CooMatrix from a scipy.sparse matrix or array. COO
+        inputs with int32 indices and float64/float32 values are
+        wrapped without a copy, other formats are converted first.
+
+        :param matrix: the scipy.sparse matrix
+        :returns: the CooMatrix
+        """
+
+        if matrix.format != "coo":
+            matrix = matrix.tocoo()
+
+        return cls(matrix.data, matrix.row, matrix.col, matrix.shape)
+
+    @property
+    def num_rows(self) -> int:
+        return self.shape[0]
+
+    @property
+    def num_cols(self) -> int:
+        return self.shape[1]
+
+    @property
+    def nnz(self) -> int:
+        return self.values.shape[0]
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    def to_csr(self) -> CsrMatrix:
+        """
+        Convert to compressed sparse row format with a stable counting
+        sort by row, keeping duplicates
+
+        :returns: the CsrMatrix
+        """
+
+        rows: np.ndarray = self.rows.read()
+        order: np.ndarray = np.argsort(rows, kind="stable")
+        row_map = np.zeros(self.num_rows + 1, dtype=INDEX_NP_DTYPE)
+        np.cumsum(np.bincount(rows, minlength=self.num_rows), out=row_map[1:])
+
+        return CsrMatrix(self.values.read()[order], self.cols.read()[order], row_map, self.shape)
+
+    def to_scipy(self) -> Any:
+        """
+        Get a scipy.sparse.coo_array sharing the memory of the matrix
+
+        :returns: the scipy.sparse array
+        """
+
+        import scipy.sparse
+
+        return scipy.sparse.coo_array(
+            (np.asarray(self.values), (np.asarray(self.rows), np.asarray(self.cols))), shape=self.shape)
+
+    def __matmul__(self, other: Any) -> pk.ViewType:
+        # avoid circular import with scoped import
+        from .spmv import spmv
+
+        return spmv(self, other)
+
+    def __repr__(self) -> str:
+        return f"CooMatrix(shape={self.shape}, nnz={self.nnz}, dtype={self.dtype.__name__})"
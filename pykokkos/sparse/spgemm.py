@@ -0,0 +1,174 @@
+import pykokkos as pk
+
+from .containers import CsrMatrix
+
+
+@pk.workunit
+def spgemm_row_bound(
+    i: int,
+    a_row_map: pk.View1D[pk.int32], a_entries: pk.View1D[pk.int32],
+    b_row_map: pk.View1D[pk.int32], bounds: pk.View1D[pk.int32]
+):
+    # the number of products in row i of A @ B, an upper bound on its nonzeros
+    bound: int = 0
+    for k in range(a_row_map[i], a_row_map[i + 1]):
+        j: int = a_entries[k]
+        bound += b_row_map[j + 1] - b_row_map[j]
+
+    bounds[i] = bound
+
+
+@pk.workunit
+def spgemm_offsets(
+    i: int, acc: pk.Acc[int], last_pass: bool,
+    counts: pk.View1D[pk.int32], offsets: pk.View1D[pk.int32]
+):
+    acc += counts[i]
+    if last_pass:
+        offsets[i + 1] = acc
+
+
+@pk.workunit
+def spgemm_expand_row(
+    i: int,
+    a_row_map: pk.View1D[pk.int32], a_entries: pk.View1D[pk.int32], a_values,
+    b_row_map: pk.View1D[pk.int32], b_entries: pk.View1D[pk.int32], b_values,
+    bound_offsets: pk.View1D[pk.int32], tmp_entries: pk.View1D[pk.int32], tmp_values,
+    counts: pk.View1D[pk.int32]
+):
+    # expand the products of row i into its slot of the temporaries
+    start: int = bound_offsets[i]
+    end: int = start
+    for ka in range(a_row_map[i], a_row_map[i + 1]):
+        j: int = a_entries[ka]
+        a_ij: float = a_values[ka]
+        for kb in range(b_row_map[j], b_row_map[j + 1]):
+            tmp_entries[end] = b_entries[kb]
+            tmp_values[end] = a_ij * b_values[kb]
+            end += 1
+
+    # sort them by column with an in-place heapsort, so that dense rows
+    # take O(n log n) for n products. The first n // 2 steps build a
+    # max-heap, each following one swaps its largest column to the end
+    # of the heap and shrinks it.
+    n: int = end - start
+    half: int = n // 2
+    for step in range(half + n - 1):
+        root: int = 0
+        size: int = n
+        if step < half:
+            root = half - 1 - step
+        else:
+            size = n - 1 - (step - half)
+            last_col: int = tmp_entries[start + size]
+            last_value: float = tmp_values[start + size]
+            tmp_entries[start + size] = tmp_entries[start]
+            tmp_values[start + size] = tmp_values[start]
+            tmp_entries[start] = last_col
+            tmp_values[start] = last_value
+
+        # sift the root down to restore the heap
+        child: int = 2 * root + 1
+        while child < size:
+            if child + 1 < size and tmp_entries[start + child + 1] > tmp_entries[start + child]:
+                child += 1
+            if tmp_entries[start + root] >= tmp_entries[start + child]:
+                break
+            root_col: int = tmp_entries[start + root]
+            root_value: float = tmp_values[start + root]
+            tmp_entries[start + root] = tmp_entries[start + child]
+            tmp_values[start + root] = tmp_values[start + child]
+            tmp_entries[start + child] = root_col
+            tmp_values[start + child] = root_value
+            root = child
+            child = 2 * root + 1
+
+    # compress products with the same column to the start of the slot
+    count: int = 0
+    for p in range(start, end):
+        if count > 0 and tmp_entries[start + count - 1] == tmp_entries[p]:
+            tmp_values[start + count - 1] += tmp_values[p]
+        else:
+            tmp_entries[start + count] = tmp_entries[p]
+            tmp_values[start + count] = tmp_values[p]
+            count += 1
+
+    counts[i] = count
+
+
+@pk.workunit
+def spgemm_compress_row(
+    i: int,
+    bound_offsets: pk.View1D[pk.int32], tmp_entries: pk.View1D[pk.int32], tmp_values,
+    row_map: pk.View1D[pk.int32], entries: pk.View1D[pk.int32], values
+):
+    start: int = bound_offsets[i]
+    offset: int = row_map[i]
+    for k in range(row_map[i + 1] - offset):
+        entries[offset + k] = tmp_entries[start + k]
+        values[offset + k] = tmp_values[start + k]
+
+
+def row_offsets(counts: pk.ViewType, name: str) -> pk.View:
+    """
+    Get the offsets of rows from their lengths with a parallel scan
+
+    :param counts: the length of each row
+    :param name: the name of the kernel
+    :returns: a View holding 0 followed by the running sums of counts
+    """
+
+    num_rows: int = counts.shape[0]
+    offsets = pk.View([num_rows + 1], dtype=pk.int32)
+    pk.parallel_scan(name, num_rows, spgemm_offsets, counts=counts, offsets=offsets)
+
+    return offsets
+
+
+def spgemm(A: CsrMatrix, B: CsrMatrix) -> CsrMatrix:
+    """
+    Sparse matrix-matrix multiplication C = A @ B with the
+    expand-sort-compress algorithm: the products of each row of C are
+    expanded into a slot sized by an upper bound, sorted by column and
+    merged in place, then compressed into the rows of C. Each row is
+    computed by one thread, so the temporaries hold one entry per
+    product (i.e. per flop).
+
+    :param A: the left matrix
+    :param B: the right matrix
+    :returns: C, with sorted column indices and no duplicates
+    """
+
+    if A.num_cols != B.num_rows:
+        raise ValueError(f"ERROR: cannot multiply matrices of shape {A.shape} and {B.shape}")
+    if A.dtype is not B.dtype:
+        raise ValueError(f"ERROR: A and B must have the same dtype, got {A.dtype} and {B.dtype}")
+
+    num_rows: int = A.num_rows
+
+    bounds = pk.View([num_rows], dtype=pk.int32, initialize=False)
+    pk.parallel_for("spgemm_bound", num_rows, spgemm_row_bound,
+                    a_row_map=A.row_map, a_entries=A.entries, b_row_map=B.row_map, bounds=bounds)
+    bound_offsets = row_offsets(bounds, "spgemm_bound_offsets")
+
+    num_products: int = int(bound_offsets[num_rows])
+    tmp_entries = pk.View([num_products], dtype=pk.int32, initialize=False)
+    tmp_values = pk.View([num_products], dtype=A.dtype, initialize=False)
+
+    # the row lengths of C once duplicates are merged, reusing bounds
+    counts = bounds
+    pk.parallel_for("spgemm_expand", num_rows, spgemm_expand_row,
+                    a_row_map=A.row_map, a_entries=A.entries, a_values=A.values,
+                    b_row_map=B.row_map, b_entries=B.entries, b_values=B.values,
+                    bound_offsets=bound_offsets, tmp_entries=tmp_entries, tmp_values=tmp_values,
+                    counts=counts)
+    row_map = row_offsets(counts, "spgemm_offsets")
+
+    nnz: int = int(row_map[num_rows])
+    entries = pk.View([nnz], dtype=pk.int32, initialize=False)
+    values = pk.View([nnz], dtype=A.dtype, initialize=False)
+    pk.parallel_for("spgemm_compress", num_rows, spgemm_compress_row,
+                    bound_offsets=bound_offsets, tmp_entries=tmp_entries, tmp_values=tmp_values,
+                    row_map=row_map, entries=entries, values=values)
+
+    return CsrMatrix(values, entries, row_map, (num_rows, B.num_cols))
@@ -0,0 +1,157 @@
+from typing import Any, Optional, Union
+
+import pykokkos as pk
+
+from .containers import CooMatrix, CsrMatrix, as_value_view
+
+# the average number of nonzeros per row from which the team variant
+# is used by default, as shorter rows leave most of a team idle
+TEAM_SPMV_MIN_ROW_LENGTH: int = 16
+
+
+@pk.workunit
+def csr_spmv_row(
+    i: int, alpha: float, beta: float,
+    row_map: pk.View1D[pk.int32], entries: pk.View1D[pk.int32],
+    values, x, y
+):
+    total: float = 0.0
+    for k in range(row_map[i], row_map[i + 1]):
+        total += values[k] * x[entries[k]]
+
+    # beta == 0 overwrites y, which may be uninitialized
+    if beta == 0:
+        y[i] = alpha * total
+    else:
+        y[i] = beta * y[i] + alpha * total
+
+
+@pk.workunit
+def csr_spmv_team(
+    team_member: pk.TeamMember, alpha: float, beta: float,
+    row_map: pk.View1D[pk.int32], entries: pk.View1D[pk.int32],
+    values, x, y
+):
+    i: int = team_member.league_rank()
+    start: int = row_map[i]
+    length: int = row_map[i + 1] - start
+
+    def row_reduce(k: int, row_acc: pk.Acc[float]):
+        row_acc += values[start + k] * x[entries[start + k]]
+
+    total: float = pk.parallel_reduce(
+        pk.TeamThreadRange(team_member, length), row_reduce)
+
+    def single_closure():
+        if beta == 0:
+            y[i] = alpha * total
+        else:
+            y[i] = beta * y[i] + alpha * total
+
+    pk.single(pk.PerTeam(team_member), single_closure)
+
+
+@pk.workunit
+def scale_vector(i: int, beta: float, y):
+    if beta == 0:
+        y[i] = 0
+    else:
+        y[i] = beta * y[i]
+
+
+@pk.workunit
+def csr_spmv_transpose_row(
+    i: int, alpha: float,
+    row_map: pk.View1D[pk.int32], entries: pk.View1D[pk.int32],
+    values, x, y
+):
+    # row i of A scatters into y, so rows updating the same entry race
+    x_i: float = alpha * x[i]
+    for k in range(row_map[i], row_map[i + 1]):
+        pk.atomic_add(y, [entries[k]], values[k] * x_i)
+
+
+@pk.workunit
+def coo_spmv_entry(
+    k: int, alpha: float,
+    rows: pk.View1D[pk.int32], cols: pk.View1D[pk.int32],
+    values, x, y
+):
+    pk.atomic_add(y, [rows[k]], alpha * values[k] * x[cols[k]])
+
+
+def spmv(
+    A: Union[CsrMatrix, CooMatrix],
+    x: Any,
+    y: Optional[pk.ViewType] = None,
+    alpha: float = 1.0,
+    beta: float = 0.0,
+    mode: str = "N",
+    algorithm: str = "auto"
+) -> pk.ViewType:
+    """
+    Sparse matrix-vector multiplication y = alpha * op(A) @ x + beta * y,
+    modeled on KokkosSparse::spmv
+
+    :param A: the sparse matrix
+    :param x: the dense input vector, a View or array-like
+    :param y: (optional) the output View, updated in place. A new View
+        is allocated (and beta ignored) if it is not given
+    :param alpha: the factor of op(A) @ x
+    :param beta: the factor of y. With beta == 0, y is overwritten
+        even if it holds NaNs, as in BLAS
+    :param mode: "N" for op(A) = A or "T" for its transpose
+    :param algorithm: for CSR matrices with mode "N", "row" to compute
+        one row per thread, "team" to compute one row per team with
+        the row's products reduced across the team's threads, or "auto"
+        to pick "team" when rows hold at least TEAM_SPMV_MIN_ROW_LENGTH
+        nonzeros on average
+    :returns: y
+    """
+
+    if mode not in {"N", "T"}:
+        raise ValueError(f"ERROR: mode must be \"N\" or \"T\", got {mode}")
+    if algorithm not in {"auto", "row", "team"}:
+        raise ValueError(f"ERROR: algorithm must be \"auto\", \"row\" or \"team\", got {algorithm}")
+
+    num_rows, num_cols = A.shape if mode == "N" else A.shape[::-1]
+
+    x = as_value_view(x, "x")
+    if x.shape[0] != num_cols:
+        raise ValueError(f"ERROR: x must have {num_cols} entries, got {x.shape[0]}")
+
+    if y is None:
+        y = pk.View([num_rows], dtype=A.dtype, initialize=False)
+        beta = 0.0
+    elif y.shape != (num_rows,):
+        raise ValueError(f"ERROR: y must have shape ({num_rows},), got {y.shape}")
+
+    alpha = float(alpha)
+    beta = float(beta)
+
+    if isinstance(A, CooMatrix) or mode == "T":
+        # both scatter into y with atomics after scaling it by beta
+        pk.parallel_for("sparse_scale", num_rows, scale_vector, beta=beta, y=y)
+
+        if isinstance(A, CooMatrix):
+            rows, cols = (A.rows, A.cols) if mode == "N" else (A.cols, A.rows)
+            pk.parallel_for("coo_spmv", A.nnz, coo_spmv_entry,
+                            alpha=alpha, rows=rows, cols=cols, values=A.values, x=x, y=y)
+        else:
+            pk.parallel_for("csr_spmv_transpose", A.num_rows, csr_spmv_transpose_row,
+                            alpha=alpha, row_map=A.row_map, entries=A.entries, values=A.values, x=x, y=y)
+
+        return y
+
+    if algorithm == "auto":
+        use_team: bool = A.nnz >= TEAM_SPMV_MIN_ROW_LENGTH * max(1, A.num_rows)
+        algorithm = "team" if use_team else "row"
+
+    if algorithm == "team":
+        pk.parallel_for("csr_spmv_team", pk.TeamPolicy(A.num_rows, pk.AUTO), csr_spmv_team,
+                        alpha=alpha, beta=beta, row_map=A.row_map, entries=A.entries, values=A.values, x=x, y=y)
+    else:
+        pk.parallel_for("csr_spmv", A.num_rows, csr_spmv_row,
+                        alpha=alpha, beta=beta, row_map=A.row_map, entries=A.entries, values=A.values, x=x, y=y)
+
+    return y
@@ -0,0 +1,94 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+import pykokkos as pk
+
+
+def random_mask(size, seed=0):
+    return np.random.default_rng(seed).random(size) < 0.4
+
+
+def test_bitset_host_access():
+    bits = pk.BitView(70)
+    assert bits.words.shape == (3,)
+    assert bits.nbytes == 12
+
+    bits.set(0)
+    bits[33] = True
+    bits.set(-1)
+    assert bits.test(0) and bits[33] and bits[69]
+    assert not bits.test(1)
+
+    bits.reset(33)
+    assert not bits[33]
+
+    expected = np.zeros(70, dtype=np.bool_)
+    expected[[0, 69]] = True
+    assert_array_equal(np.asarray(bits), expected)
+
+    with pytest.raises(IndexError):
+        bits.test(70)
+
+
+def test_bitset_fill_clears_tail():
+    bits = pk.BitView(40, value=True)
+    assert int(bits.words[1]) == 0xFF
+    assert np.asarray(bits).all()
+
+    bits.fill(False)
+    assert not np.asarray(bits).any()
+
+
+@pytest.mark.parametrize("size", [0, 31, 32, 1000])
+def test_bitset_pack_count(size):
+    mask = random_mask(size)
+    bits = pk.BitView.from_array(mask)
+    assert len(bits) == size
+    assert_array_equal(np.asarray(bits), mask)
+    assert bits.count() == np.count_nonzero(mask)
+    assert_array_equal(np.asarray(bits.to_view()), mask.astype(np.uint8))
+
+
+def test_bitset_logical_ops():
+    a = random_mask(100, seed=1)
+    b = random_mask(100, seed=2)
+    bits_a = pk.BitView.from_array(a)
+    bits_b = pk.BitView.from_array(b)
+
+    assert_array_equal(np.asarray(bits_a & bits_b), a & b)
+    assert_array_equal(np.asarray(pk.logical_or(bits_a, bits_b)), a | b)
+    assert_array_equal(np.asarray(pk.logical_xor(bits_a, bits_b)), a ^ b)
+
+    inverted = pk.logical_not(bits_a)
+    assert_array_equal(np.asarray(inverted), ~a)
+    # the bits past the end stay cleared
+    assert inverted.count() == 100 - np.count_nonzero(a)
+
+    with pytest.raises(ValueError):
+        bits_a & pk.BitView(99)
+
+
+@pytest.mark.parametrize("packed", [True, False])
+def test_where(packed):
+    mask = random_mask(50)
+    a = np.arange(50.0)
+    b = -np.arange(50.0)
+    condition = pk.BitView.from_array(mask) if packed else pk.array(mask)
+
+    out = pk.where(condition, pk.array(a), pk.array(b))
+    assert_array_equal(np.asarray(out), np.where(mask, a, b))
+
+
+@pk.workunit
+def mark_multiples(i: int, k: int, visited: pk.View1D[pk.uint32]):
+    if i % k == 0:
+        bit: pk.uint32 = 1
+        pk.atomic_fetch_or(visited, [i >> 5], bit << (i & 31))
+
+
+def test_bitset_workunit_atomic():
+    visited = pk.BitView(200)
+    pk.parallel_for(200, mark_multiples, k=3, visited=visited)
+
+    assert_array_equal(np.asarray(visited), np.arange(200) % 3 == 0)
@@ -0,0 +1,60 @@
+import numpy as np
+from numpy.testing import assert_equal
+
+import pykokkos as pk
+
+
+@pk.workunit
+def read_only(i: int, acc: pk.Acc[pk.double], x: pk.View1D[pk.double]):
+    acc += x[i]
+
+
+@pk.workunit
+def write(i: int, x: pk.View1D[pk.double], y: pk.View1D[pk.double]):
+    y[i] = x[i] + 1
+
+
+def test_dual_view_host_space():
+    view = pk.DualView([10], pk.double, space=pk.HostSpace)
+    assert view.is_shared()
+    assert view.shape == (10,)
+    assert view.view_host() is view.view_device()
+
+    view[3] = 2.0
+    assert view.need_sync_device()
+    assert not view.need_sync_host()
+
+    view.sync_device()
+    assert not view.need_sync_device()
+    assert view[3] == 2.0
+
+    view.modify_device()
+    assert view.need_sync_host()
+    view.clear_sync_state()
+    assert not view.need_sync_host()
+
+
+def test_dual_view_kernel_marks_written():
+    x = pk.DualView([10], pk.double)
+    y = pk.DualView([10], pk.double)
+    x.view_host().fill(1.0)
+    x.modify_host()
+
+    pk.parallel_for(10, write, x=x, y=y)
+    assert not x.need_sync_device()
+    assert not x.need_sync_host()
+    assert y.need_sync_host()
+    assert_equal(np.asarray(y), np.full(10, 2.0))
+    assert not y.need_sync_host()
+
+    assert pk.parallel_reduce(10, read_only, x=y) == 20.0
+    assert not y.need_sync_host()
+
+
+def test_dual_view_host_access():
+    dual = pk.DualView([4], pk.double)
+    with dual.host_access() as arr:
+        arr[:] = np.arange(4.0)
+
+    assert dual.modified_host
+    assert_equal(dual.h_view.read(), np.arange(4.0))
@@ -0,0 +1,94 @@
+import gc
+
+import pytest
+
+import pykokkos as pk
+
+
+@pytest.fixture
+def tracking():
+    gc.collect()
+    pk.enable_memory_tracking(record_sites=True)
+    yield
+    pk.disable_memory_tracking()
+
+
+def test_memory_stats_untracked():
+    gc.collect()
+    before = pk.memory_stats()
+    assert before["peak_bytes"] is None
+    assert "by_site" not in before
+
+    view = pk.View([100], pk.double, label="untracked")
+    stats = pk.memory_stats()
+    assert stats["current_bytes"] == before["current_bytes"] + 800
+    assert stats["current_count"] == before["current_count"] + 1
+    assert stats["by_label"]["untracked"] == 800
+    del view
+
+
+def test_memory_stats_peak(tracking):
+    a = pk.View([1000], pk.double, label="a")
+    b = pk.View([1000], pk.int32, label="b")
+    stats = pk.memory_stats()
+    assert stats["current_bytes"] == 12000
+    assert stats["peak_bytes"] == 12000
+    assert stats["num_allocations"] == 2
+    assert stats["by_dtype"] == {"float64": 8000, "int32": 4000}
+    assert stats["by_label"] == {"a": 8000, "b": 4000}
+    assert all(site.startswith(__file__) for site in stats["by_site"])
+
+    del a
+    gc.collect()
+    stats = pk.memory_stats()
+    assert stats["current_bytes"] == 4000
+    assert stats["peak_bytes"] == 12000
+    assert stats["num_frees"] == 1
+
+    pk.reset_peak_memory()
+    assert pk.memory_stats()["peak_bytes"] == 4000
+
+    # unmanaged views do not own their memory
+    pk.array(b.data)
+    assert pk.memory_stats()["current_count"] == 1
+
+
+def test_memory_stats_free_while_locked(tracking):
+    from pykokkos.interface.memory_stats import tracker
+
+    view = pk.View([10], pk.double)
+    # garbage collection can free a View while an allocation holds the
+    # lock on the same thread
+    with tracker.lock:
+        del view
+        gc.collect()
+
+    stats = pk.memory_stats()
+    assert stats["current_bytes"] == 0
+    assert stats["num_frees"] == 1
+
+
+def test_memory_stats_resize(tracking):
+    view = pk.View([10], pk.double)
+    view.resize(0, 20)
+    gc.collect()
+    stats = pk.memory_stats()
+    assert stats["num_allocations"] == 2
+    assert stats["current_bytes"] == view.capacity * 8
+
+
+def test_memory_snapshot_diff(tracking):
+    old = pk.memory_snapshot()
+    kept = [pk.View([50], pk.double, label="leak") for _ in range(3)]
+    pk.View([1000], pk.double, label="temporary")
+    gc.collect()
+
+    diff = pk.memory_snapshot().diff(old)
+    assert len(diff) == 1
+    assert diff[0].label == "leak"
+    assert diff[0].count_diff == 3
+    assert diff[0].nbytes_diff == 1200
+
+    stats = pk.memory_snapshot().statistics()
+    assert stats[0].nbytes == 1200
+    del kept
@@ -88,5 +88,268 @@ def test_squaresum_types(series_max, dtype):
     actual = ss_instance.total
     assert_allclose(actual, expected)
 
+@pk.workunit
+def peak(i: int, acc: pk.Max[pk.double], x: pk.View1D[pk.double]):
+    if x[i] > acc:
+        acc = x[i]
+
+
+@pk.workunit
+def lowest(i: int, acc: pk.Min[pk.double], x: pk.View1D[pk.double]):
+    if x[i] < acc:
+        acc = x[i]
+
+
+@pk.workunit
+def product(i: int, acc: pk.Prod[pk.double], x: pk.View1D[pk.double]):
+    acc *= x[i]
+
+
+@pk.workunit
+def all_positive(i: int, acc: pk.LAnd[pk.int32], x: pk.View1D[pk.double]):
+    acc = acc and x[i] > 0
+
+
+@pk.workunit
+def any_positive(i: int, acc: pk.LOr[pk.int32], x: pk.View1D[pk.double]):
+    acc = acc or x[i] > 0
+
+
+@pk.workunit
+def lowest_loc(i: int, acc: pk.MinLoc[pk.double], x: pk.View1D[pk.double]):
+    if x[i] < acc.val:
+        acc.val = x[i]
+        acc.loc = i
+
+
+@pk.workunit
+def peak_loc(i: int, acc: pk.MaxLoc[pk.double], x: pk.View1D[pk.double]):
+    if x[i] > acc.val:
+        acc.val = x[i]
+        acc.loc = i
+
+
+@pk.workunit
+def extrema_loc(i: int, acc: pk.MinMaxLoc[pk.double], x: pk.View1D[pk.double]):
+    if x[i] < acc.min_val:
+        acc.min_val = x[i]
+        acc.min_loc = i
+    if x[i] > acc.max_val:
+        acc.max_val = x[i]
+        acc.max_loc = i
+
+
+@pk.workunit
+def extrema(i: int, acc: pk.MinMax[pk.double], x: pk.View1D[pk.double]):
+    if x[i] < acc.min_val:
+        acc.min_val = x[i]
+    if x[i] > acc.max_val:
+        acc.max_val = x[i]
+
+
+@pk.workunit
+def total(i: int, acc: pk.Acc[pk.double], x: pk.View1D[pk.double]):
+    acc += x[i]
+
+
+@pk.workunit
+def untyped_peak(i, acc, x):
+    if x[i] > acc:
+        acc = x[i]
+
+
+@pk.workunit
+def untyped_lowest_loc(i, acc, x):
+    if x[i] < acc.val:
+        acc.val = x[i]
+        acc.loc = i
+
+
+@pk.workunit
+def moments(i, total, squares, x):
+    total += x[i]
+    squares += x[i] * x[i]
+
+
+@pk.workunit
+def total_and_peak(i, total, peak, x):
+    total += x[i]
+    if x[i] > peak:
+        peak = x[i]
+
+
+@pk.workunit
+def summary(i: int, total: pk.Acc[pk.double], lowest: pk.Min[pk.double], peak: pk.MaxLoc[pk.double],
+            x: pk.View1D[pk.double]):
+    total += x[i]
+    if x[i] < lowest:
+        lowest = x[i]
+    if x[i] > peak.val:
+        peak.val = x[i]
+        peak.loc = i
+
+
+@pk.workunit
+def row_peaks(team_member: pk.TeamMember, x: pk.View2D[pk.double], out: pk.View1D[pk.double]):
+    j: int = team_member.league_rank()
+
+    def row_peak(k: int, acc: pk.Max[pk.double]):
+        if x[j][k] > acc:
+            acc = x[j][k]
+
+    best: float = pk.parallel_reduce(pk.TeamThreadRange(team_member, x.extent(1)), row_peak)
+    out[j] = best
+
+
+@pk.workunit
+def row_lowest_locs(team_member: pk.TeamMember, x: pk.View2D[pk.double], out: pk.View1D[pk.int64]):
+    j: int = team_member.league_rank()
+
+    def row_lowest_loc(k: int, acc: pk.MinLoc[pk.double]):
+        if x[j][k] < acc.val:
+            acc.val = x[j][k]
+            acc.loc = k
+
+    best: pk.MinLoc[pk.double] = pk.parallel_reduce(pk.TeamThreadRange(team_member, x.extent(1)), row_lowest_loc)
+    out[j] = best.loc
+
+
+@pk.workload
+class Peak:
+    def __init__(self, x):
+        self.N: int = x.shape[0]
+        self.x: pk.View1D[pk.double] = x
+        self.result: pk.double = 0
+
+    @pk.main
+    def run(self):
+        self.result = pk.parallel_reduce(self.N, self.peak)
+
+    @pk.workunit
+    def peak(self, i: int, acc: pk.Max[pk.double]):
+        if self.x[i] > acc:
+            acc = self.x[i]
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).uniform(-5.0, 5.0, 100)
+
+
+@pytest.mark.parametrize("workunit, expected", [
+        (peak, np.max),
+        (lowest, np.min),
+        (product, np.prod),
+        (all_positive, lambda x: int(np.all(x > 0))),
+        (any_positive, lambda x: int(np.any(x > 0))),
+])
+def test_reducers(workunit, expected, values):
+    x = pk.array(values)
+    assert_allclose(pk.parallel_reduce(values.size, workunit, x=x), expected(values))
+
+
+def test_location_reducers(values):
+    x = pk.array(values)
+
+    assert pk.parallel_reduce(values.size, lowest_loc, x=x) == (values.min(), values.argmin())
+    assert pk.parallel_reduce(values.size, peak_loc, x=x) == (values.max(), values.argmax())
+    assert pk.parallel_reduce(values.size, extrema, x=x) == (values.min(), values.max())
+    assert pk.parallel_reduce(values.size, extrema_loc, x=x) == (
+        values.min(), values.max(), values.argmin(), values.argmax())
+
+
+def test_reducer_call_site(values):
+    x = pk.array(values)
+
+    # the unannotated accumulators are updated as the reducers do
+    assert_allclose(pk.parallel_reduce(values.size, untyped_peak, x=x, reducer=pk.Max), values.max())
+    assert pk.parallel_reduce(values.size, untyped_lowest_loc, x=x, reducer=pk.MinLoc) == (
+        values.min(), values.argmin())
+
+
+def test_reducer_nested(values):
+    x = pk.array(values.reshape(10, 10))
+    peaks = pk.View([10], pk.double)
+    locs = pk.View([10], pk.int64)
+
+    pk.parallel_for(pk.TeamPolicy(10, pk.AUTO), row_peaks, x=x, out=peaks)
+    pk.parallel_for(pk.TeamPolicy(10, pk.AUTO), row_lowest_locs, x=x, out=locs)
+    assert_allclose(peaks, values.reshape(10, 10).max(axis=1))
+    assert_allclose(locs, values.reshape(10, 10).argmin(axis=1))
+
+
+def test_reducer_workload(values):
+    workload = Peak(pk.array(values))
+    pk.execute(pk.ExecutionSpace.Default, workload)
+    assert_allclose(workload.result, values.max())
+
+
+def test_reducer_errors(values):
+    x = pk.array(values)
+
+    with pytest.raises(TypeError):
+        pk.parallel_reduce(values.size, total, x=x, reducer=max)
+    with pytest.raises(TypeError):
+        # the accumulator is annotated with another reducer
+        pk.parallel_reduce(values.size, peak, x=x, reducer=pk.Min)
+    with pytest.raises(TypeError):
+        # the body of an accumulator annotated with pk.Acc is a sum
+        pk.parallel_reduce(values.size, total, x=x, reducer=pk.Max)
+
+
+def test_multiple_accumulators(values):
+    x = pk.array(values)
+
+    total, squares = pk.parallel_reduce(values.size, moments, x=x)
+    assert_allclose(total, values.sum())
+    assert_allclose(squares, (values * values).sum())
+
+    total, lowest, (peak, at) = pk.parallel_reduce(values.size, summary, x=x)
+    assert_allclose(total, values.sum())
+    assert (lowest, peak, at) == (values.min(), values.max(), values.argmax())
+
+
+def test_multiple_accumulators_reducer(values):
+    x = pk.array(values)
+
+    total, peak = pk.parallel_reduce(values.size, total_and_peak, x=x, reducer=(pk.Acc, pk.Max))
+    assert_allclose(total, values.sum())
+    assert_allclose(peak, values.max())
+
+    with pytest.raises(TypeError):
+        pk.parallel_reduce(values.size, total_and_peak, x=x, reducer=pk.Max)
+    with pytest.raises(TypeError):
+        pk.parallel_reduce(values.size, total_and_peak, x=x, reducer=(pk.Acc, max))
+
+
+def test_reducer_translation():
+    import ast
+    from pykokkos.core.type_inference.args_type_inference import get_type_str
+    from pykokkos.core.visitors.visitors_util import get_reducer
+
+    def annotation(source):
+        return ast.parse(source).body[0].value
+
+    assert get_reducer(annotation("pk.Max[pk.double]"), "pk") == ("Max", "Kokkos::Max<double>")
+    assert get_reducer(annotation("pk.MinLoc[pk.float]"), "pk") == ("MinLoc", "Kokkos::MinLoc<float,int64_t>")
+    assert get_reducer(annotation("pk.Acc[pk.double]"), "pk") is None
+
+    assert get_type_str(pk.Max[pk.int64]) == "Max:int64"
+    assert get_type_str(pk.MinMaxLoc[pk.float64]) == "MinMaxLoc:double"
+
+
+def test_count_accumulators():
+    import ast
+    from pykokkos.core.type_inference.args_type_inference import count_accumulators
+
+    params = ast.parse("def f(i, total, squares: pk.Max[pk.double], x, n: int): pass").body[0].args.args
+    assert count_accumulators(params, 1, {"x": None, "n": 1}) == 2
+
+    # the passed parameters end the accumulators
+    params = ast.parse("def f(i, a, b, c, x): pass").body[0].args.args
+    assert count_accumulators(params, 1, {"x": None}) == 3
+    assert count_accumulators(params, 1, {"c": None, "x": None}) == 2
+
+
 if __name__ == '__main__':
     unittest.main()
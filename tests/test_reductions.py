@@ -0,0 +1,190 @@
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+import pykokkos as pk
+
+
+@pytest.mark.parametrize("pk_reduction, np_reduction", [
+        (pk.sum, np.sum),
+        (pk.mean, np.mean),
+        (pk.var, np.var),
+        (pk.std, np.std),
+])
+@pytest.mark.parametrize("axis", [None, 0, 1, 2, -1, (0, 2), (1, 2), (0, 1, 2)])
+@pytest.mark.parametrize("keepdims", [False, True])
+def test_reduction_axes(pk_reduction, np_reduction, axis, keepdims):
+    arr = np.random.default_rng(0).random((3, 4, 5))
+
+    expected = np_reduction(arr, axis=axis, keepdims=keepdims)
+    actual = pk_reduction(pk.array(arr), axis=axis, keepdims=keepdims)
+    assert np.shape(actual) == np.shape(expected)
+    assert_allclose(actual, expected)
+
+
+@pytest.mark.parametrize("pk_reduction, np_reduction", [
+        (pk.sum, np.sum),
+        (pk.mean, np.mean),
+        (pk.var, np.var),
+])
+@pytest.mark.parametrize("dtype", [np.float32, np.int32, np.uint8, np.int64])
+def test_reduction_dtypes(pk_reduction, np_reduction, dtype):
+    arr = np.arange(60).reshape(6, 10).astype(dtype)
+
+    expected = np_reduction(arr, axis=0)
+    actual = pk_reduction(pk.array(arr), axis=0)
+    assert np.asarray(actual).dtype == expected.dtype
+    assert_allclose(actual, expected, rtol=1e-6)
+
+
+def test_reduction_strided_subview():
+    arr = np.arange(80, dtype=np.float64).reshape(8, 10)
+    view = pk.array(arr)
+
+    assert_allclose(pk.sum(view[1:7, 2:9], axis=1), arr[1:7, 2:9].sum(axis=1))
+    assert_allclose(pk.mean(view[::2, :], axis=0), arr[::2, :].mean(axis=0))
+
+
+def test_reduction_long_axis():
+    # long axes with few outputs are split between teams
+    arr = np.random.default_rng(1).normal(1e4, 1.0, size=(3, 20000))
+    view = pk.array(arr)
+
+    assert_allclose(pk.sum(view, axis=1), arr.sum(axis=1))
+    assert_allclose(pk.var(view, axis=1), arr.var(axis=1), rtol=1e-9)
+    assert_allclose(pk.std(view), arr.std(), rtol=1e-9)
+    assert_allclose(pk.var(view, axis=1, ddof=1), arr.var(axis=1, ddof=1), rtol=1e-9)
+
+
+def test_reduction_normalize_axis():
+    from pykokkos.lib.reduction_engine import normalize_axis
+
+    assert normalize_axis("sum", None, 3) == (0, 1, 2)
+    assert normalize_axis("sum", -1, 3) == (2,)
+    assert normalize_axis("sum", (2, 0), 3) == (0, 2)
+
+    with pytest.raises(ValueError):
+        normalize_axis("sum", 3, 3)
+    with pytest.raises(ValueError):
+        normalize_axis("sum", (0, -3), 3)
+    with pytest.raises(TypeError):
+        normalize_axis("sum", 0.5, 3)
+
+
+def test_reduction_meta():
+    from pykokkos.lib.reduction_engine import get_meta
+
+    view = pk.array(np.zeros((2, 3, 4)))
+
+    # offset, kept and reduced dimensions, elements per output, then
+    # the (extent, stride) of each dimension
+    assert get_meta(view, (0, 1, 2)) == [0, 0, 1, 24, 24, 1]
+    assert get_meta(view, (1, 2)) == [0, 1, 1, 12, 2, 12, 12, 1]
+    assert get_meta(view, (0, 2)) == [0, 1, 2, 8, 3, 4, 2, 12, 4, 1]
+    assert get_meta(view[:, 1:3, :], (2,)) == [4, 2, 1, 4, 2, 12, 2, 4, 4, 1]
+
+
+def test_reduction_splits():
+    from pykokkos.lib.reduction_engine import get_splits, TARGET_PARTS, TEAM_PARTS
+
+    assert get_splits(100, 1000) == (1, 1)
+    assert get_splits(TARGET_PARTS, 10 ** 6) == (1, 1)
+
+    splits, parts = get_splits(1, 10 ** 6)
+    assert parts == TEAM_PARTS
+    assert splits * parts <= 10 ** 6 // 1000
+
+
+def test_generated_reduction_source():
+    from pykokkos.lib.reduction_engine import generate_reduction_source, reduction_defs
+
+    source = generate_reduction_source(reduction_defs["var"], "float32", "direct")
+    assert "def reduce_var_float32(" in source
+    assert "delta: pk.double = x - mean" in source
+    assert "out[tid] = m2 / (meta[3] - ddof)" in source
+
+    source = generate_reduction_source(reduction_defs["sum"], "int32", "split")
+    assert "team_member: pk.TeamMember" in source
+    assert "partials: pk.View1D[pk.int64]" in source
+    assert "pk.TeamThreadRange(team_member, parts)" in source
+
+
+@pytest.mark.parametrize("pk_reduction, np_reduction", [
+        (pk.max, np.max),
+        (pk.min, np.min),
+        (pk.argmax, np.argmax),
+        (pk.argmin, np.argmin),
+])
+@pytest.mark.parametrize("axis", [None, 0, 1, -1])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int32, np.uint8])
+def test_extremum_reductions(pk_reduction, np_reduction, axis, dtype):
+    # ties make the first occurrence observable
+    arr = np.random.default_rng(2).integers(0, 20, size=(6, 9)).astype(dtype)
+
+    expected = np_reduction(arr, axis=axis)
+    actual = pk_reduction(pk.array(arr), axis=axis)
+    assert np.shape(actual) == np.shape(expected)
+    assert np.asarray(actual).dtype == (np.int64 if np_reduction in (np.argmax, np.argmin) else expected.dtype)
+    assert_allclose(actual, expected)
+
+
+def test_extremum_reductions_nan():
+    arr = np.array([[1.0, np.nan, 3.0, np.nan], [4.0, 2.0, 5.0, 0.0]])
+    view = pk.array(arr)
+
+    assert_allclose(pk.max(view, axis=1), np.max(arr, axis=1))
+    assert_allclose(pk.min(view, axis=1), np.min(arr, axis=1))
+    assert_allclose(pk.argmax(view, axis=1), np.argmax(arr, axis=1))
+    assert_allclose(pk.argmin(view, axis=1), np.argmin(arr, axis=1))
+
+
+def test_extremum_reductions_long_axis():
+    # the first occurrence is kept across the parts of a split axis
+    arr = np.zeros((2, 30000))
+    arr[0, [7000, 9000, 25000]] = 5.0
+    arr[1, [12000, 29999]] = -3.0
+    view = pk.array(arr)
+
+    assert_allclose(pk.argmax(view, axis=1), np.argmax(arr, axis=1))
+    assert_allclose(pk.argmin(view, axis=1), np.argmin(arr, axis=1))
+    assert pk.argmax(view) == np.argmax(arr)
+    assert pk.max(view) == 5.0
+
+    low, high = pk.minmax(view, axis=1)
+    assert_allclose(low, arr.min(axis=1))
+    assert_allclose(high, arr.max(axis=1))
+
+
+def test_extremum_reductions_strided_subview():
+    arr = np.random.default_rng(3).random((6, 8, 5))
+    view = pk.array(arr)
+
+    # positions are row-major in the reduced axes of the subview
+    assert_allclose(pk.argmax(view[1:5, ::2, :]), np.argmax(arr[1:5, ::2, :]))
+    assert_allclose(pk.argmin(view[:, 2:7, 1:4], axis=0, keepdims=True),
+                    np.argmin(arr[:, 2:7, 1:4], axis=0, keepdims=True))
+    assert pk.minmax(view) == (arr.min(), arr.max())
+
+
+def test_extremum_reductions_errors():
+    with pytest.raises(ValueError):
+        pk.max(pk.array(np.zeros((3, 0))), axis=1)
+    with pytest.raises(TypeError):
+        pk.argmax(pk.array(np.zeros((3, 4))), axis=(0, 1))
+
+    # reducing an empty axis is fine when there are no outputs
+    assert np.shape(pk.max(pk.array(np.zeros((0, 4))), axis=1)) == (0,)
+
+
+def test_generated_extremum_source():
+    from pykokkos.lib.reduction_engine import generate_reduction_source, reduction_defs
+
+    source = generate_reduction_source(reduction_defs["argmax"], "float64", "direct")
+    assert "at0: pk.int64 = -1" in source
+    assert "if at0 < 0 or x > best0 or (x != x and best0 == best0):" in source
+    assert "out[tid] = at0" in source
+
+    source = generate_reduction_source(reduction_defs["minmax"], "float16", "combine")
+    assert "partials: pk.View1D[pk.float]" in source
+    assert "indices: pk.View1D[pk.int64]" in source
+    assert "out0[tid] = best0" in source and "out1[tid] = best1" in source
@@ -0,0 +1,153 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pytest
+
+import pykokkos as pk
+from pykokkos.sparse import CooMatrix, CsrMatrix, spgemm, spmv
+
+
+def random_dense(rows, cols, density=0.3, dtype=np.float64, seed=0):
+    rng = np.random.default_rng(seed)
+    dense = rng.random((rows, cols)).astype(dtype)
+    dense[rng.random((rows, cols)) > density] = 0
+
+    return dense
+
+
+def test_csr_from_dense():
+    dense = random_dense(7, 5)
+    A = CsrMatrix.from_dense(dense)
+    assert A.shape == (7, 5)
+    assert A.nnz == np.count_nonzero(dense)
+    assert A.dtype is pk.float64
+    assert A.row_map.dtype is pk.int32
+    assert_array_equal(A.to_dense(), dense)
+
+
+def test_csr_wraps_int32_without_copy():
+    values = np.array([1.0, 2.0, 3.0])
+    entries = np.array([0, 2, 1], dtype=np.int32)
+    row_map = np.array([0, 2, 3], dtype=np.int32)
+    A = CsrMatrix(values, entries, row_map, (2, 3))
+
+    entries[0] = 1
+    assert A.entries[0] == 1
+    assert_array_equal(A.to_dense(), [[0, 1.0, 2.0], [0, 3.0, 0]])
+
+
+def test_csr_casts_int64_indices():
+    A = CsrMatrix([1.0, 2.0], np.array([1, 0], dtype=np.int64), np.array([0, 1, 2], dtype=np.int64), (2, 2))
+    assert A.entries.dtype is pk.int32
+    assert_array_equal(A.to_dense(), [[0, 1.0], [2.0, 0]])
+
+
+def test_csr_invalid():
+    with pytest.raises(ValueError):
+        CsrMatrix([1.0], [0], [0, 1], (2, 2))
+    with pytest.raises(ValueError):
+        CsrMatrix([1.0, 2.0], [0], [0, 1], (1, 2))
+
+
+def test_coo_to_csr_keeps_duplicates():
+    A = CooMatrix([1.0, 2.0, 3.0, 4.0], [1, 0, 1, 1], [2, 1, 0, 2], (2, 3))
+    csr = A.to_csr()
+    assert_array_equal(csr.row_map.read(), [0, 1, 4])
+    assert_array_equal(csr.to_dense(), [[0, 2.0, 0], [3.0, 0, 5.0]])
+
+
+@pytest.mark.parametrize("algorithm", ["row", "team"])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_spmv(algorithm, dtype):
+    dense = random_dense(40, 30, dtype=dtype)
+    x = np.arange(30, dtype=dtype)
+    A = CsrMatrix.from_dense(dense)
+
+    y = spmv(A, x, algorithm=algorithm)
+    assert_allclose(np.asarray(y), dense @ x, rtol=1e-5)
+
+
+def test_spmv_alpha_beta():
+    dense = random_dense(20, 20)
+    x = np.ones(20)
+    y = pk.array(np.arange(20.0))
+    A = CsrMatrix.from_dense(dense)
+
+    spmv(A, x, y, alpha=2.0, beta=0.5)
+    assert_allclose(np.asarray(y), 2.0 * dense @ x + 0.5 * np.arange(20.0))
+
+
+def test_spmv_beta_zero_overwrites_nan():
+    dense = random_dense(10, 10)
+    y = pk.array(np.full(10, np.nan))
+
+    spmv(CsrMatrix.from_dense(dense), np.ones(10), y)
+    assert_allclose(np.asarray(y), dense.sum(axis=1))
+
+
+def test_spmv_transpose():
+    dense = random_dense(25, 15)
+    x = np.arange(25.0)
+
+    y = spmv(CsrMatrix.from_dense(dense), x, mode="T", alpha=3.0)
+    assert_allclose(np.asarray(y), 3.0 * dense.T @ x)
+
+
+def test_spmv_coo():
+    A = CooMatrix([1.0, 2.0, 3.0, 4.0], [1, 0, 1, 1], [2, 1, 0, 2], (2, 3))
+    y = A @ np.array([1.0, 10.0, 100.0])
+    assert_allclose(np.asarray(y), [20.0, 503.0])
+
+
+def test_spmv_invalid():
+    A = CsrMatrix.from_dense(np.eye(3))
+    with pytest.raises(ValueError):
+        spmv(A, np.ones(3), mode="C")
+    with pytest.raises(ValueError):
+        spmv(A, np.ones(3), algorithm="merge")
+    with pytest.raises(ValueError):
+        spmv(A, np.ones(4))
+
+
+def test_spgemm():
+    a = random_dense(30, 20, seed=1)
+    b = random_dense(20, 25, seed=2)
+
+    C = spgemm(CsrMatrix.from_dense(a), CsrMatrix.from_dense(b))
+    assert C.shape == (30, 25)
+    assert_allclose(C.to_dense(), a @ b)
+
+    # columns are sorted and merged within each row
+    row_map = C.row_map.read()
+    entries = C.entries.read()
+    for i in range(C.num_rows):
+        assert np.all(np.diff(entries[row_map[i]:row_map[i + 1]]) > 0)
+
+
+def test_spgemm_dense_rows():
+    # each row of C has 40 * 300 products to sort
+    a = random_dense(4, 40, density=1.0, seed=3)
+    b = random_dense(40, 300, density=1.0, seed=4)
+
+    C = spgemm(CsrMatrix.from_dense(a), CsrMatrix.from_dense(b))
+    assert C.nnz == 4 * 300
+    assert_allclose(C.to_dense(), a @ b)
+
+
+def test_spgemm_shape_mismatch():
+    with pytest.raises(ValueError):
+        spgemm(CsrMatrix.from_dense(np.eye(3)), CsrMatrix.from_dense(np.eye(4)))
+
+
+def test_from_scipy():
+    scipy_sparse = pytest.importorskip("scipy.sparse")
+
+    a = scipy_sparse.random(50, 40, density=0.1, format="csr", dtype=np.float64, random_state=0)
+    a.indices = a.indices.astype(np.int32)
+    a.indptr = a.indptr.astype(np.int32)
+    A = CsrMatrix.from_scipy(a)
+    assert np.shares_memory(np.asarray(A.values), a.data)
+
+    x = np.arange(40.0)
+    assert_allclose(np.asarray(A @ x), a @ x)
+    assert_allclose((A @ CsrMatrix.from_scipy(a.T)).to_dense(), (a @ a.T).toarray())
+    assert_allclose(CooMatrix.from_scipy(a.tocoo()).to_scipy().toarray(), a.toarray())
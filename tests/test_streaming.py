@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_equal
+
+import pykokkos as pk
+
+
+@pk.workunit
+def sum_chunk(i: int, acc: pk.Acc[pk.double], x: pk.View1D[pk.double]):
+    acc += x[i]
+
+
+@pk.workunit
+def scale_chunk(i: int, x: pk.View1D[pk.double], y: pk.View1D[pk.double], factor: float):
+    y[i] = x[i] * factor
+
+
+@pk.workunit
+def global_index(i: int, x: pk.View1D[pk.double], y: pk.View1D[pk.double], offset: int):
+    y[i] = offset + i
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000])
+def test_chunk_stream_array(chunk_size):
+    source = np.arange(100, dtype=np.float64).reshape(50, 2)
+    stream = pk.ChunkStream(source, chunk_size)
+
+    seen = []
+    for start, view in stream:
+        assert view.shape[1:] == (2,)
+        assert_equal(view, source[start:start + view.shape[0]])
+        seen.append(start)
+
+    assert len(seen) == len(stream)
+    assert seen == list(range(0, 50, min(chunk_size, 50)))
+
+
+def test_chunk_stream_file(tmp_path):
+    path = tmp_path / "data.bin"
+    expected = np.arange(30, dtype=np.int32).reshape(10, 3)
+    expected.tofile(path)
+
+    stream = pk.ChunkStream(path, 4, dtype=pk.int32, row_shape=(3,))
+    chunks = [view.data.copy() for _, view in stream]
+    assert_equal(np.concatenate(chunks), expected)
+
+
+def test_chunk_stream_generator():
+    stream = pk.ChunkStream(np.full(n, n, dtype=np.float64) for n in (3, 1, 5))
+    starts = [(start, view.shape[0]) for start, view in stream]
+    assert starts == [(0, 3), (3, 1), (4, 5)]
+
+
+def test_chunk_stream_error():
+    def chunks():
+        yield np.zeros(2)
+        raise OSError("read failed")
+
+    with pytest.raises(OSError):
+        for _ in pk.ChunkStream(chunks()):
+            pass
+
+
+def test_chunk_stream_early_exit():
+    stream = pk.ChunkStream(np.zeros(100), 10)
+    for start, _ in stream:
+        if start == 20:
+            break
+    # the stream can be iterated again from the start
+    assert [start for start, _ in stream][:2] == [0, 10]
+
+
+@pytest.mark.parametrize("chunk_size", [16, 100, 1000])
+def test_stream_reduce(tmp_path, chunk_size):
+    path = tmp_path / "data.bin"
+    expected = np.random.default_rng(0).random(1000)
+    expected.tofile(path)
+
+    source = pk.memmap(path, dtype=pk.double, mode="r")
+    result = pk.stream_reduce(source, sum_chunk, arg="x", chunk_size=chunk_size)
+    assert_allclose(result, expected.sum())
+
+    result = pk.stream_reduce(source, sum_chunk, arg="x", chunk_size=chunk_size, combine=max)
+    assert_allclose(result, max(expected[i:i + chunk_size].sum() for i in range(0, 1000, chunk_size)))
+
+
+def test_stream_reduce_empty():
+    assert pk.stream_reduce(np.zeros(0), sum_chunk, arg="x", initial=0.0) == 0.0
+    with pytest.raises(ValueError):
+        pk.stream_reduce(np.zeros(0), sum_chunk, arg="x")
+
+
+def test_stream_for(tmp_path):
+    x = np.arange(250, dtype=np.float64)
+    y = np.memmap(tmp_path / "out.bin", dtype=np.float64, mode="w+", shape=(250,))
+
+    pk.stream_for(x, scale_chunk, arg="x", outputs={"y": y}, chunk_size=64, factor=2.0)
+    assert_allclose(y, 2.0 * x)
+
+    pk.stream_for(x, global_index, arg="x", outputs={"y": y}, offset_arg="offset", chunk_size=64)
+    assert_allclose(y, x)
+
+
+def test_stream_map():
+    x = np.linspace(0, 1, 300)
+    out = np.empty_like(x)
+
+    assert pk.stream_map(x, lambda v: pk.exp(pk.negative(v)), out=out, chunk_size=50) is out
+    assert_allclose(out, np.exp(-x))
+
+    result = pk.stream_map(x, pk.sum, combine=lambda a, b: a + b, chunk_size=50)
+    assert_allclose(result, x.sum())
+
+    with pytest.raises(ValueError):
+        pk.stream_map(x, pk.sum)
@@ -768,3 +768,538 @@ def test_rounding_dtype_preservation(input_dtype, pk_ufunc, shape):
     view = pk.View(shape, input_dtype)
     actual_dtype = pk_ufunc(view).dtype
     assert actual_dtype.value == input_dtype.value
+
+
+@pytest.mark.parametrize("pk_ufunc, numpy_ufunc", [
+        (pk.add, np.add),
+        (pk.subtract, np.subtract),
+        (pk.multiply, np.multiply),
+        (pk.divide, np.divide),
+])
+def test_half_precision_ufuncs(pk_ufunc, numpy_ufunc):
+    rng = default_rng(123)
+    a = rng.random(100).astype(np.float16) + np.float16(0.5)
+    b = rng.random(100).astype(np.float16) + np.float16(0.5)
+
+    actual = pk_ufunc(pk.array(a), pk.array(b))
+    assert actual.dtype is pk.float16
+    # computed in float32 and rounded once to float16
+    expected = numpy_ufunc(a.astype(np.float32), b.astype(np.float32)).astype(np.float16)
+    assert_allclose(actual, expected)
+
+
+def test_half_precision_dot():
+    rng = default_rng(123)
+    a = rng.random(4096).astype(np.float16)
+    b = rng.random(4096).astype(np.float16)
+
+    # accumulating in float16 would lose most of the precision of a
+    # sum of this size
+    actual = pk.dot(pk.array(a), pk.array(b))
+    assert_allclose(actual, np.dot(a.astype(np.float32), b.astype(np.float32)), rtol=1e-4)
+
+
+@pytest.mark.parametrize("rank", [1, 3, 7])
+@pytest.mark.parametrize("strided", [False, True])
+def test_generated_ufunc_source(rank, strided):
+    from pykokkos.lib.ufunc_engine import generate_source, ufunc_defs
+
+    source = generate_source(ufunc_defs["add"], (("float32", "float32"), "float32"), rank, strided)
+    compile(source, "<ufunc>", "exec")
+    assert "import pykokkos as pk" in source
+    if strided:
+        assert "meta: pk.View1D[pk.int64]" in source
+        assert "in0: pk.View1D[pk.float]" in source
+    else:
+        assert f"in0: pk.View{rank}D[pk.float]" in source
+
+
+def test_generated_ufunc_source_half():
+    from pykokkos.lib.ufunc_engine import generate_source, ufunc_defs
+
+    # 16-bit inputs are loaded into float32
+    source = generate_source(ufunc_defs["exp"], (("bfloat16",), "bfloat16"), 2, False)
+    assert "pk.View2D[pk.bfloat16]" in source
+    assert "x0: pk.float = float(" in source
+
+
+@pytest.mark.parametrize("pk_ufunc, numpy_ufunc", [
+        (pk.exp, np.exp),
+        (pk.sqrt, np.sqrt),
+        (pk.negative, np.negative),
+        (pk.square, np.square),
+])
+@pytest.mark.parametrize("shape", [
+        [2, 3, 4], [1, 2, 1, 2, 2], [1, 2, 1, 2, 1, 2, 2],
+])
+def test_ufunc_high_rank(pk_ufunc, numpy_ufunc, shape):
+    from pykokkos.lib.ufunc_engine import MAX_RANK
+
+    if len(shape) > MAX_RANK:
+        pytest.skip(f"pykokkos-base is built with Views of up to {MAX_RANK} dimensions")
+
+    rng = default_rng(123)
+    arr = rng.random(shape)
+
+    actual = pk_ufunc(pk.array(arr))
+    assert actual.shape == tuple(shape)
+    assert_allclose(actual, numpy_ufunc(arr))
+
+
+@pytest.mark.parametrize("pk_dtype, np_dtype", [
+        (pk.int32, np.int32),
+        (pk.int64, np.int64),
+        (pk.uint8, np.uint8),
+])
+def test_ufunc_integer_dtypes(pk_dtype, np_dtype):
+    arr = np.arange(24, dtype=np_dtype).reshape(2, 3, 4)
+
+    actual = pk.square(pk.array(arr))
+    assert actual.dtype is pk_dtype
+    assert_allclose(actual, np.square(arr))
+
+
+@pytest.mark.parametrize("pk_dtype, np_dtype", [
+        (pk.int8, np.int8),
+        (pk.int32, np.int32),
+        (pk.int64, np.int64),
+])
+def test_floor_divide_signed_integers(pk_dtype, np_dtype):
+    a = np.array([-7, 7, -7, 7, -6, 6, 0, -1, 5], dtype=np_dtype)
+    b = np.array([2, -2, -2, 2, 3, -3, 4, 3, 0], dtype=np_dtype)
+
+    # rounds toward negative infinity, and gives 0 for a zero divisor
+    actual = pk.floor_divide(pk.array(a), pk.array(b))
+    assert actual.dtype is pk_dtype
+    with np.errstate(divide="ignore"):
+        assert_allclose(actual, np.floor_divide(a, b))
+    assert_allclose(pk.floor_divide(pk.array(a), -3), np.floor_divide(a, np_dtype(-3)))
+
+
+def test_generated_floor_divide_source():
+    from pykokkos.lib.ufunc_engine import generate_source, ufunc_defs
+
+    source = generate_source(ufunc_defs["floor_divide"], (("int64", "int64"), "int64"), 1, False)
+    compile(source, "<ufunc>", "exec")
+    assert "if x1 == 0:" in source
+    assert "floor(" not in source
+
+
+def test_ufunc_strided_subview():
+    rng = default_rng(123)
+    a = rng.random((6, 8))
+    b = rng.random((6, 8))
+
+    view_a = pk.array(a)
+    view_b = pk.array(b)
+    actual = pk.add(view_a[1:5, 2:7], view_b[1:5, 2:7])
+    assert_allclose(actual, a[1:5, 2:7] + b[1:5, 2:7])
+    assert_allclose(pk.exp(view_a[:, 3]), np.exp(a[:, 3]))
+
+
+def test_generated_ufunc_source_scalar():
+    from pykokkos.lib.ufunc_engine import generate_source, get_kernel_name, ufunc_defs
+
+    # a 0-D input is read at its only element by a contiguous kernel
+    signature = (("float64", "float64"), "float64")
+    source = generate_source(ufunc_defs["add"], signature, 2, False, (1,))
+    assert "in0: pk.View2D[pk.double]" in source
+    assert "in1: pk.View1D[pk.double]" in source
+    assert "x1: pk.double = in1[0]" in source
+    assert get_kernel_name("add", signature, 2, False, (1,)) == "add_float64_2d_s1"
+
+
+def test_ufunc_scalar_contiguous():
+    from pykokkos.lib.ufunc_engine import get_scalar_view, launch
+
+    class Launched(Exception):
+        pass
+
+    variants = []
+
+    def get(rank, strided, scalars):
+        variants.append((rank, strided, scalars))
+        raise Launched
+
+    # only the shapes of the operands that are not 0-D select the
+    # strided kernel
+    view = pk.View([3, 4], pk.double)
+    out = pk.View([3, 4], pk.double)
+    with pytest.raises(Launched):
+        launch(get, [get_scalar_view(2.0, pk.double), view], out, (3, 4), None)
+    with pytest.raises(Launched):
+        launch(get, [view[:, 1:3], get_scalar_view(2.0, pk.double)], out[:, :2], (3, 2), None)
+    assert variants == [(2, False, (0,)), (2, True, ())]
+
+    actual = pk.add(pk.array(np.ones((3, 4))), 2.0)
+    assert_allclose(actual, np.full((3, 4), 3.0))
+    assert_allclose(pk.subtract(1, pk.array(np.arange(4.0))), 1 - np.arange(4.0))
+
+
+def test_ufunc_non_contiguous_memory():
+    from pykokkos.lib.ufunc_engine import get_flat_view
+
+    # a View wrapping a numpy slice cannot be raveled in place
+    a = np.arange(24, dtype=np.float64).reshape(4, 6)
+    with pytest.raises(ValueError, match="not contiguous"):
+        get_flat_view(pk.array(a[:, ::2]))
+
+    row = np.arange(3, dtype=np.float64)
+    assert_allclose(pk.add(pk.array(a[:, ::2]), pk.array(row)), a[:, ::2] + row)
+
+    out = np.zeros((4, 6))
+    pk.add(pk.array(a[:, ::2]), pk.array(row), out=pk.array(out[:, ::2]))
+    assert_allclose(out[:, ::2], a[:, ::2] + row)
+    assert_allclose(out[:, 1::2], 0)
+
+
+def test_ufunc_rank_too_high():
+    from pykokkos.lib.ufunc_engine import MAX_RANK, get_output
+
+    # checked before allocating, as the View could not be created
+    with pytest.raises(ValueError, match="dimensions"):
+        get_output("exp", False, "float64", (1,) * (MAX_RANK + 1), None, [])
+
+
+@pytest.mark.parametrize("dtype, expected", [
+        (pk.double, "float64"),
+        (pk.float64, "float64"),
+        (pk.float, "float32"),
+        (pk.float32, "float32"),
+        (pk.DataType.double, "float64"),
+        (pk.DataType.float, "float32"),
+        (pk.bool, "uint8"),
+        (pk.int16, "int16"),
+        (pk.bfloat16, "bfloat16"),
+])
+def test_ufunc_dtype_names(dtype, expected):
+    from pykokkos.lib.ufunc_engine import get_dtype_name
+
+    assert get_dtype_name(dtype) == expected
+
+
+def test_ufunc_kernel_table():
+    from pykokkos.lib.ufuncs import kernel_table
+
+    assert kernel_table[("matmul", 1, "float64")].__name__ == "matmul_impl_1d_double"
+    assert kernel_table[("matmul", 1, "float32")].__name__ == "matmul_impl_1d_float"
+
+
+@pytest.mark.parametrize("pk_ufunc, numpy_ufunc", [
+        (pk.add, np.add),
+        (pk.subtract, np.subtract),
+        (pk.multiply, np.multiply),
+        (pk.divide, np.divide),
+        (pk.power, np.power),
+        (pk.fmax, np.fmax),
+        (pk.greater, np.greater),
+])
+@pytest.mark.parametrize("shape_a, shape_b", [
+        ((6, 5), (5,)),
+        ((6, 1), (1, 5)),
+        ((2, 3, 4), (3, 1)),
+        ((4,), ()),
+])
+def test_ufunc_broadcast(pk_ufunc, numpy_ufunc, shape_a, shape_b):
+    rng = default_rng(123)
+    a = rng.random(shape_a) + 0.5
+    b = rng.random(shape_b) + 0.5
+
+    actual = pk_ufunc(pk.array(a), pk.array(b))
+    assert actual.shape == np.broadcast_shapes(shape_a, shape_b)
+    assert_allclose(actual, numpy_ufunc(a, b))
+
+
+@pytest.mark.parametrize("pk_dtype, numpy_dtype", [
+        (pk.double, np.float64),
+        (pk.float, np.float32),
+        (pk.int32, np.int32),
+])
+def test_ufunc_scalar_operand(pk_dtype, numpy_dtype):
+    arr = np.arange(12, dtype=numpy_dtype).reshape(3, 4)
+
+    actual = pk.add(pk.array(arr), 3)
+    assert actual.dtype is pk_dtype
+    assert_allclose(actual, arr + 3)
+    assert_allclose(pk.power(2, pk.array(arr.astype(np.float64))), np.power(2.0, arr))
+
+
+def test_ufunc_broadcast_strides():
+    from pykokkos.lib.ufunc_engine import get_strided_args
+
+    # a row broadcast over the rows of a matrix is read in place, with
+    # a stride of 0 along the broadcast dimension
+    row = pk.array(np.arange(5, dtype=np.float64))
+    column = pk.array(np.arange(3, dtype=np.float64).reshape(3, 1))
+    out = pk.View([3, 5], pk.double)
+    args = get_strided_args([row, column, out], (3, 5))
+
+    assert list(args["meta"].data) == [3, 5, 0, 0, 1, 0, 1, 0, 0, 5, 1]
+    assert args["in0"].shape == (5,)
+    assert args["in1"].shape == (3,)
+
+
+def test_ufunc_broadcast_incompatible():
+    viewA = pk.View([3, 4], pk.double)
+    viewB = pk.View([3], pk.double)
+    with pytest.raises(ValueError, match="broadcast"):
+        pk.add(viewA, viewB)
+
+
+def test_broadcast_view_3d():
+    arr = np.arange(4, dtype=np.float64)
+    actual = pk.broadcast_view(pk.array(arr), pk.View([2, 3, 4], pk.double))
+    assert_allclose(actual, np.broadcast_to(arr, (2, 3, 4)))
+
+
+@pytest.mark.parametrize("a, b, expected", [
+        ("float32", "float64", "float64"),
+        ("int8", "int32", "int32"),
+        ("uint8", "uint32", "uint32"),
+        ("uint8", "int8", "int16"),
+        ("int32", "float32", "float64"),
+        ("int8", "float16", "float16"),
+        ("float16", "bfloat16", "float32"),
+        ("int8", "bfloat16", "bfloat16"),
+        ("int16", "bfloat16", "float32"),
+        ("bfloat16", "float64", "float64"),
+])
+def test_ufunc_promote_types(a, b, expected):
+    from pykokkos.lib.ufunc_engine import promote_types
+
+    assert promote_types(a, b) == expected
+    assert promote_types(b, a) == expected
+
+
+def test_generated_ufunc_source_mixed():
+    from pykokkos.lib.ufunc_engine import generate_source, get_kernel_name, ufunc_defs
+
+    # each input is read at its own dtype and converted in registers
+    signature = (("float32", "float64"), "float64")
+    source = generate_source(ufunc_defs["add"], signature, 1, False)
+    assert "in0: pk.View1D[pk.float]" in source
+    assert "in1: pk.View1D[pk.double]" in source
+    assert "x0: pk.double = in0[tid]" in source
+    assert get_kernel_name("add", signature, 1, False) == "add_float32_float64_1d"
+    assert get_kernel_name("add", (("int32", "int32"), "int32"), 2, True) == "add_int32_2d_strided"
+
+
+@pytest.mark.parametrize("pk_ufunc, numpy_ufunc", [
+        (pk.add, np.add),
+        (pk.multiply, np.multiply),
+        (pk.divide, np.divide),
+        (pk.greater, np.greater),
+        (pk.equal, np.equal),
+])
+@pytest.mark.parametrize("dtype_a, dtype_b", [
+        (np.float32, np.float64),
+        (np.int32, np.float64),
+        (np.int8, np.int64),
+        (np.uint8, np.int16),
+])
+def test_ufunc_mixed_dtypes(pk_ufunc, numpy_ufunc, dtype_a, dtype_b):
+    a = np.arange(1, 13).reshape(3, 4).astype(dtype_a)
+    b = np.arange(12, 0, -1).reshape(3, 4).astype(dtype_b)
+
+    expected = numpy_ufunc(a, b)
+    actual = pk_ufunc(pk.array(a), pk.array(b))
+    assert np.asarray(actual).dtype == (np.uint8 if expected.dtype == np.bool_ else expected.dtype)
+    assert_allclose(actual, expected, rtol=1e-6)
+
+
+def test_ufunc_int_to_float():
+    arr = np.arange(10, dtype=np.int32)
+
+    actual = pk.sqrt(pk.array(arr))
+    assert actual.dtype is pk.float64
+    assert_allclose(actual, np.sqrt(arr))
+
+    actual = pk.multiply(pk.array(arr), 0.5)
+    assert actual.dtype is pk.float64
+    assert_allclose(actual, arr * 0.5)
+
+
+def test_ufunc_out():
+    a = np.arange(12, dtype=np.float64).reshape(3, 4)
+    b = np.arange(12, 0, -1, dtype=np.float64).reshape(3, 4)
+    view_a = pk.array(a)
+    view_b = pk.array(b)
+
+    out = pk.View([3, 4], dtype=pk.float64)
+    result = pk.add(view_a, view_b, out=out)
+    assert result is out
+    assert_allclose(out, a + b)
+
+    # the result is converted to the dtype of the output
+    out = pk.View([3, 4], dtype=pk.float32)
+    pk.multiply(view_a, view_b, out=out)
+    assert out.dtype is pk.float32
+    assert_allclose(out, a * b)
+
+    out = pk.View([3, 4], dtype=pk.uint8)
+    pk.greater(view_a, view_b, out=out)
+    assert_allclose(out, a > b)
+
+    out = pk.View([3, 4], dtype=pk.float64)
+    assert pk.true_divide(view_a, view_b, out=out) is out
+    assert_allclose(out, a / b)
+
+
+def test_ufunc_out_errors():
+    view = pk.array(np.arange(6, dtype=np.float64))
+
+    with pytest.raises(TypeError, match="cannot cast"):
+        pk.sqrt(view, out=pk.View([6], dtype=pk.int32))
+
+    with pytest.raises(ValueError):
+        pk.add(view, view, out=pk.View([5], dtype=pk.float64))
+
+
+def test_ufunc_inplace_operators():
+    a = np.arange(1, 13, dtype=np.float64).reshape(3, 4)
+    b = np.arange(4, dtype=np.float64) + 1
+    view = pk.array(a.copy())
+    row = pk.array(b)
+
+    view += 1.0
+    view *= row
+    view -= row
+    view /= 2.0
+    view **= 2
+    view //= row
+
+    expected = a.copy()
+    expected += 1.0
+    expected *= b
+    expected -= b
+    expected /= 2.0
+    expected **= 2
+    expected //= b
+    assert_allclose(view, expected)
+
+
+def test_ufunc_inplace_overlap():
+    a = np.arange(10, dtype=np.float64)
+    view = pk.array(a.copy())
+
+    # the input is read before any element of the output is written
+    pk.add(view[:-1], view[1:], out=view[1:])
+    expected = a.copy()
+    expected[1:] = a[:-1] + a[1:]
+    assert_allclose(view, expected)
+
+
+def test_ufunc_overlaps():
+    from pykokkos.lib.ufunc_engine import overlaps
+
+    view = pk.array(np.arange(12, dtype=np.float64).reshape(3, 4))
+    other = pk.array(np.arange(12, dtype=np.float64).reshape(3, 4))
+
+    assert not overlaps(view, view, (3, 4))
+    assert not overlaps(other, view, (3, 4))
+    assert overlaps(view[0:1, :], view, (3, 4))
+    assert overlaps(view[:, :3], view[:, 1:], (3, 3))
+
+
+@pytest.mark.parametrize("from_dtype, to_dtype, expected", [
+        ("float64", "float32", True),
+        ("int32", "float16", True),
+        ("uint8", "int8", True),
+        ("int64", "int8", True),
+        ("float32", "int64", False),
+        ("int16", "uint32", False),
+])
+def test_ufunc_can_cast(from_dtype, to_dtype, expected):
+    from pykokkos.lib.ufunc_engine import can_cast
+
+    assert can_cast(from_dtype, to_dtype) == expected
+
+
+def test_copyto_mixed_dtypes():
+    a = np.zeros((3, 4), dtype=np.float64)
+    b = np.arange(4, dtype=np.int32)
+    view = pk.array(a)
+
+    pk.copyto(view, pk.array(b))
+    assert_allclose(view, np.broadcast_to(b, (3, 4)))
+
+
+def test_lazy_ufuncs_build_expressions():
+    a = pk.array(np.arange(6, dtype=np.float64))
+    b = pk.array(np.arange(6, dtype=np.float32))
+
+    with pk.lazy_ufuncs():
+        product = pk.multiply(a, b)
+        result = pk.add(product, pk.exp(product))
+        assert isinstance(result, pk.LazyArray)
+        assert result.shape == (6,)
+        assert result.dtype is pk.float64
+
+    from pykokkos.lib.ufunc_engine import lazy_state
+    assert not lazy_state.enabled
+
+
+def test_lazy_ufuncs_fused_plan():
+    from pykokkos.lib.ufunc_engine import get_fused_plan
+
+    a = pk.array(np.arange(6, dtype=np.float64))
+    b = pk.array(np.arange(6, dtype=np.float64))
+    c = pk.array(np.arange(6, dtype=np.float64))
+
+    with pk.lazy_ufuncs():
+        product = pk.multiply(a, b)
+        result = pk.add(product, pk.multiply(product, a))
+        other = pk.add(pk.multiply(c, b), pk.multiply(pk.multiply(c, b), c))
+
+    # the shared node is computed once and each View read once
+    nodes, leaves = get_fused_plan(result)
+    assert nodes == (
+        ("multiply", ("x0", "x1")),
+        ("multiply", ("t0", "x0")),
+        ("add", ("t0", "t1")),
+    )
+    assert leaves[0] is a and leaves[1] is b
+
+    # kernels are keyed by structure, not by the Views
+    other_nodes, other_leaves = get_fused_plan(other)
+    assert other_nodes[-1] == ("add", ("t0", "t2"))
+    assert other_leaves == [c, b]
+
+
+def test_generated_fused_source():
+    from pykokkos.lib.ufunc_engine import generate_fused_source
+
+    nodes = (("multiply", ("x0", "x1")), ("exp", ("x2",)), ("add", ("t0", "t1")))
+    signature = (("float32", "float64", "int32"), "float64")
+    source = generate_fused_source(nodes, signature, 1, False)
+
+    # one workunit reading each input once and writing only the result
+    assert source.count("@pk.workunit") == 1
+    assert "x0: pk.float = in0[tid]" in source
+    assert "c0_0: pk.double = x0" in source
+    assert "t1: pk.double = exp(c1_0)" in source
+    assert "out[tid] = t2" in source
+
+
+def test_lazy_ufuncs_compute():
+    a = np.arange(1, 13, dtype=np.float64).reshape(3, 4)
+    b = np.arange(4, dtype=np.float32)
+    c = np.arange(12, dtype=np.int32).reshape(3, 4)
+    view_a = pk.array(a)
+    view_b = pk.array(b)
+    view_c = pk.array(c)
+
+    with pk.lazy_ufuncs():
+        result = pk.add(pk.multiply(view_a, view_b), pk.exp(view_c))
+        mask = pk.greater(result, 10.0)
+
+    expected = a * b + np.exp(c)
+    assert_allclose(result, expected)
+    assert isinstance(result.compute(), pk.View)
+    assert result.compute() is result.compute()
+    assert_allclose(mask, expected > 10.0)
+
+    out = pk.View([3, 4], dtype=pk.float32)
+    with pk.lazy_ufuncs():
+        pk.sqrt(pk.add(view_a, view_a)).compute(out=out)
+    assert_allclose(out, np.sqrt(a + a), rtol=1e-6)
@@ -416,5 +416,302 @@ def test_result_type_unsupported(pk_dtype, pk_dtype2):
         pk.result_type(pk_dtype, pk_dtype2)
 
 
+@pytest.mark.parametrize("shape", [5, (3, 4), [2, 3, 4]])
+@pytest.mark.parametrize("pk_dtype", [pk.int32, pk.float32, pk.float64])
+def test_empty(shape, pk_dtype):
+    # contents are undefined, so only check the
+    # metadata and that the view is writable
+    view = pk.empty(shape, dtype=pk_dtype)
+    expected_shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    assert view.shape == expected_shape
+    assert view.dtype == pk_dtype
+    view[:] = 7
+    assert_equal(view, np.full(expected_shape, 7, dtype=pk_dtype.np_equiv))
+
+    like = pk.empty_like(view)
+    assert like.shape == view.shape
+    assert like.dtype == view.dtype
+
+
+def test_uninitialized_view_ones_full():
+    view = pk.View([10], pk.double, initialize=False)
+    view.fill(2.5)
+    assert_allclose(view, np.full(10, 2.5))
+    assert_allclose(pk.ones((4, 3)), np.ones((4, 3)))
+    assert_allclose(pk.full(6, 3.0, dtype=pk.double), np.full(6, 3.0))
+
+
+def test_dlpack_export_shares_memory():
+    view = pk.View([4, 3], pk.double)
+    arr = np.from_dlpack(view)
+    assert arr.shape == (4, 3)
+    arr[1, 2] = 5.0
+    assert view[1][2] == 5.0
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_dlpack_import_shares_memory(order):
+    arr = np.zeros((5, 2), dtype=np.float32, order=order)
+    view = pk.from_dlpack(arr)
+    expected_layout = pk.LayoutLeft if order == "F" else pk.LayoutRight
+    assert view.layout is expected_layout
+    assert view.shape == (5, 2)
+    arr[4, 1] = 2.0
+    assert view[4][1] == 2.0
+
+
+def test_dlpack_import_strided():
+    arr = np.arange(20, dtype=np.int64).reshape(4, 5)[:, ::2]
+    with pytest.raises(ValueError):
+        pk.from_dlpack(arr, copy=False)
+    view = pk.from_dlpack(arr)
+    assert_equal(view, arr)
+
+
+
+@pytest.mark.parametrize("layout", [pk.LayoutRight, pk.LayoutLeft])
+def test_view_from_file(tmp_path, layout):
+    order = "F" if layout is pk.LayoutLeft else "C"
+    expected = np.arange(24, dtype=np.float64).reshape((4, 6), order=order)
+    path = tmp_path / "data.bin"
+    expected.ravel(order="K").tofile(path)
+
+    view = pk.View.from_file(path, (4, 6), pk.double, layout=layout)
+    assert view.shape == (4, 6)
+    assert view.layout is layout
+    assert_equal(view, expected)
+
+    with pytest.raises(ValueError):
+        view[0][0] = 1.0
+
+
+def test_view_from_file_read_write(tmp_path):
+    path = tmp_path / "data.bin"
+    np.zeros(10, dtype=np.int32).tofile(path)
+
+    view = pk.View.from_file(path, 10, pk.int32, mode="r+")
+    view[3] = 7
+    view.xp_array.flush()
+    assert_equal(np.fromfile(path, dtype=np.int32)[3], 7)
+
+
+def test_memmap(tmp_path):
+    path = tmp_path / "out.bin"
+    view = pk.memmap(path, dtype=pk.double, mode="w+", shape=(8,))
+    view[:] = 2.0
+    view.xp_array.flush()
+    assert_equal(np.fromfile(path, dtype=np.float64), np.full(8, 2.0))
+
+    whole = pk.memmap(path, dtype=np.float64, mode="r", offset=16)
+    assert whole.shape == (6,)
+    assert_equal(whole, np.full(6, 2.0))
+
+
+
+def test_subview_lazy_native_view():
+    view = pk.View([6, 4], pk.double)
+    view.data[:] = np.arange(24).reshape(6, 4)
+
+    row = view[2:3, 1:4]
+    assert row._array is None
+    assert row.base_view is view
+    assert row.offset == 9
+    assert row.extents == (1, 3)
+    assert row.strides == (4, 1)
+    assert_equal(row.data, [[9, 10, 11]])
+
+    # the native view is created once per range of elements and shared
+    native = row.array
+    assert view[2:3, 1:4].array is native
+    assert view[0:6, 0:4][2:3, 1:4].array is native
+    assert view[3:4, 1:4].array is not native
+
+
+
+def test_view_resize_capacity():
+    view = pk.View([4, 3], pk.double)
+    view.data[:] = 1.0
+
+    view.resize(0, 5)
+    assert view.shape == (5, 3)
+    assert view.capacity == 8
+    assert_equal(view.data, np.vstack([np.ones((4, 3)), np.zeros((1, 3))]))
+
+    # shrinking and growing within the capacity keeps the allocation
+    array = view._storage_array
+    view.resize(0, 2)
+    view.resize(0, 7)
+    assert view._storage_array is array
+    assert view.shape == (7, 3)
+    assert_equal(view.data[:2], np.ones((2, 3)))
+    assert_equal(view.data[2:], np.zeros((5, 3)))
+
+    view.resize(0, 8)
+    assert view.array is array
+
+    view.shrink_to_fit()
+    assert view.capacity == 8
+    view.resize(0, 3)
+    view.shrink_to_fit()
+    assert view.capacity == 3
+    assert_equal(view.data, np.vstack([np.ones((2, 3)), np.zeros((1, 3))]))
+
+
+def test_view_append_extend():
+    view = pk.View([0], pk.int32)
+    for i in range(100):
+        view.append(i)
+    assert view.shape == (100,)
+    assert view.capacity == 128
+    assert_equal(view.data, np.arange(100))
+
+    view.extend(np.arange(100, 150))
+    assert_equal(view.data, np.arange(150))
+
+    view2D = pk.View([1, 2], pk.double)
+    view2D.reserve(10)
+    assert view2D.capacity == 10
+    array = view2D._storage_array
+    view2D.append([1.0, 2.0])
+    view2D.extend(np.ones((3, 2)))
+    assert view2D._storage_array is array
+    assert_equal(view2D.data, [[0, 0], [1, 2], [1, 1], [1, 1], [1, 1]])
+
+    # the native view of the logical extent is only created on use
+    assert view2D._array is None
+    native = view2D.array
+    assert view2D.array is native
+    view2D.append([3.0, 4.0])
+    assert view2D._array is None
+    assert view2D.array is not native
+
+    with pytest.raises(ValueError):
+        view2D.append([1.0, 2.0, 3.0])
+
+
+def test_view_fill_parallel():
+    view = pk.View([4, 3], dtype=pk.int32, initialize=False)
+    view.fill(7.9)
+    assert_equal(view, np.full((4, 3), 7, dtype=np.int32))
+
+    view[:] = 2
+    assert_equal(view, np.full((4, 3), 2, dtype=np.int32))
+
+    view[1:, ...] = 5
+    expected = np.full((4, 3), 5, dtype=np.int32)
+    expected[0] = 2
+    assert_equal(view, expected)
+
+    full = pk.full((5,), np.float32(1.5), dtype=pk.float32)
+    assert_equal(full, np.full(5, 1.5, dtype=np.float32))
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_asarray_copy(order):
+    arr = np.asfortranarray(np.arange(12.0).reshape(3, 4)) if order == "F" else np.arange(12.0).reshape(3, 4)
+    view = pk.asarray(arr, copy=True)
+    assert view.trait is not pk.Trait.Unmanaged
+    assert_equal(view, arr)
+
+    arr[0, 0] = -1
+    assert view[0, 0] == 0
+
+
+def test_view_0d_native():
+    view = pk.View((), dtype=pk.double)
+    assert view.shape == () and view.data.shape == ()
+    assert not isinstance(view.array, np.ndarray)
+    view[:] = 2.5
+    assert float(view) == 2.5
+
+    arr = np.array(3, dtype=np.int32)
+    wrapped = pk.array(arr)
+    assert not isinstance(wrapped.array, np.ndarray)
+    arr[...] = 4
+    assert int(wrapped) == 4
+
+    parent = pk.View([2, 3], dtype=pk.int32)
+    parent[1, 2] = 6
+    sub = pk.Subview(parent, (1, 2))
+    assert sub.shape == ()
+    assert not isinstance(sub.array, np.ndarray)
+    assert_equal(np.asarray(sub.array), [6])
+    sub[:] = 9
+    assert parent.data[1, 2] == 9
+    assert (sub == 9)
+
+
+def test_view_bulk_access():
+    view = pk.View([4, 3], dtype=pk.double)
+    view.write((slice(1, 3), slice(None)), np.arange(6.0).reshape(2, 3))
+    view.write(([0, 3], [0, 2]), 7.0)
+
+    expected = np.zeros((4, 3))
+    expected[1:3] = np.arange(6.0).reshape(2, 3)
+    expected[0, 0] = expected[3, 2] = 7.0
+    assert_equal(view.read(), expected)
+
+    block = view.read((slice(1, 3), 0))
+    assert_equal(block, [0.0, 3.0])
+    block[0] = -1.0
+    assert view.data[1, 0] == 0.0
+
+    with view.host_access() as arr:
+        arr[:, 1] += 1.0
+    assert_equal(view.read((slice(None), 1)), expected[:, 1] + 1.0)
+
+    with view.host_access(readonly=True) as arr:
+        with pytest.raises(ValueError):
+            arr[0, 0] = 1.0
+
+
+def test_view_half_precision():
+    view = pk.View([5], dtype=pk.float16)
+    assert view.dtype is pk.float16
+    view[1] = 1.5
+    assert view[1] == 1.5
+
+    arr = np.linspace(-2, 2, 8, dtype=np.float16)
+    wrapped = pk.array(arr)
+    assert wrapped.dtype is pk.float16
+    assert_equal(np.asarray(wrapped.data), arr)
+
+    bf16 = pk.View([3], dtype=pk.bfloat16)
+    assert bf16.dtype is pk.bfloat16
+    bf16.fill(1.5)
+    assert bf16[0] == 1.5
+    bf16[1] = -2.25
+    # rounded to the nearest bfloat16, ties to even
+    bf16[2] = 3.0078125
+    assert [float(bf16[i]) for i in range(3)] == [1.5, -2.25, 3.0]
+
+    full = pk.full([2], 0.375, dtype=pk.bfloat16)
+    assert [float(full[i]) for i in range(2)] == [0.375, 0.375]
+
+    # the host accessors see values, whether or not numpy has bfloat16
+    expected = np.array([1.5, -2.25, 3.0])
+    assert_equal(np.asarray(bf16).astype(np.float64), expected)
+    assert_equal(bf16.read().astype(np.float64), expected)
+    assert [float(x) for x in bf16] == [1.5, -2.25, 3.0]
+    assert "-2.25" in str(bf16)
+    bf16.write(slice(0, 2), [0.5, 4.0])
+    with bf16.host_access() as host:
+        assert_equal(host[:2].astype(np.float64), [0.5, 4.0])
+        host[2] = -1.0
+    assert float(bf16[2]) == -1.0
+
+    converted = pk.asarray([1.0, 0.25], dtype=pk.bfloat16)
+    assert converted.dtype is pk.bfloat16
+    assert_equal(np.asarray(converted).astype(np.float64), [1.0, 0.25])
+
+    bf16.set_precision(pk.float32)
+    assert_equal(bf16.read(), np.array([0.5, 4.0, -1.0], dtype=np.float32))
+    bf16.set_precision(pk.bfloat16)
+    assert_equal(np.asarray(bf16).astype(np.float64), [0.5, 4.0, -1.0])
+
+    assert pk.finfo(pk.float16).max == 65504.0
+    assert pk.finfo(pk.bfloat16).max > pk.finfo(pk.float32).max / 2
+
+
 if __name__ == '__main__':
     unittest.main()